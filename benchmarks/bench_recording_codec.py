@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+기록 포맷/코덱 벤치마크
+
+서보 분해능으로 양자화된 조인트 궤적(이동 구간 + 정지 구간 + 1스텝 잡음)을 만들어
+기존 JSON(indent=2), 원시 .rec, 압축 .rec(zlib/lzma)로 저장하고
+파일 크기/압축률, 쓰기 시간, 전체 디코딩 시간과 처리량, 양자화 오차를 비교합니다.
+
+사용법:
+    python benchmarks/bench_recording_codec.py --minutes 60 --rate 100
+    python benchmarks/bench_recording_codec.py --minutes 10 --skip-json
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rosota_copilot.recording import MappedRecording, RecordingReader, RecordingWriter  # noqa: E402
+from rosota_copilot.recording.codec import STEPS_PER_DEGREE  # noqa: E402
+
+
+def _trajectory(minutes: float, rate: float, num_joints: int, seed: int = 0):
+	"""이동/정지가 섞인 궤적 (도 단위, 서보 스텝으로 양자화)"""
+	rng = np.random.default_rng(seed)
+	rows = int(minutes * 60 * rate)
+	timestamps = np.arange(rows) / rate + rng.normal(0.0, 50e-6, rows)
+	timestamps.sort()
+	# 1~4초 길이 구간마다 새 목표로 부드럽게 이동하거나 멈춰 있음
+	positions = np.empty((rows, num_joints))
+	current = rng.uniform(-90, 90, num_joints)
+	row = 0
+	while row < rows:
+		length = min(rows - row, int(rng.uniform(1.0, 4.0) * rate))
+		if rng.random() < 0.4:
+			segment = np.repeat(current[None, :], length, axis=0)
+		else:
+			target = np.clip(current + rng.normal(0, 30, num_joints), -150, 150)
+			phase = (1 - np.cos(np.linspace(0, np.pi, length))) / 2
+			segment = current + (target - current) * phase[:, None]
+			current = target
+		positions[row:row + length] = segment
+		row += length
+	steps = np.round(positions * STEPS_PER_DEGREE) + rng.integers(-1, 2, positions.shape) * (rng.random(positions.shape) < 0.1)
+	return timestamps, (steps / STEPS_PER_DEGREE).astype(np.float32)
+
+
+def _write_rec(path: Path, timestamps, positions, compression, chunk_rows: int) -> float:
+	started = time.perf_counter()
+	writer = RecordingWriter(path, positions.shape[1], {"mode": "manual"}, chunk_rows=chunk_rows, fsync=False, compression=compression)
+	writer.append_block(timestamps, positions)
+	writer.close()
+	return time.perf_counter() - started
+
+
+def _write_json(path: Path, timestamps, positions) -> float:
+	started = time.perf_counter()
+	data = [{"timestamp": t, "joint_positions": p} for t, p in zip(timestamps.tolist(), positions.astype(float).tolist())]
+	with open(path, "w", encoding="utf-8") as f:
+		json.dump({"metadata": {"mode": "manual"}, "data": data}, f, indent=2)
+	return time.perf_counter() - started
+
+
+def _best_of(repeat: int, fn) -> float:
+	best = float("inf")
+	for _ in range(repeat):
+		started = time.perf_counter()
+		fn()
+		best = min(best, time.perf_counter() - started)
+	return best
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--minutes", type=float, default=60.0, help="기록 길이 (분)")
+	parser.add_argument("--rate", type=float, default=100.0, help="샘플링 주기 (Hz)")
+	parser.add_argument("--joints", type=int, default=6)
+	parser.add_argument("--chunk-rows", type=int, default=256)
+	parser.add_argument("--repeat", type=int, default=3, help="디코딩 반복 횟수 (최솟값 사용)")
+	parser.add_argument("--skip-json", action="store_true", help="JSON 저장/로드 생략 (긴 기록에서 느림)")
+	args = parser.parse_args()
+
+	timestamps, positions = _trajectory(args.minutes, args.rate, args.joints)
+	rows = len(timestamps)
+	raw_bytes = timestamps.nbytes + positions.nbytes
+	print(f"rows={rows} joints={args.joints} duration={args.minutes:.0f}min rate={args.rate:.0f}Hz raw_columns={raw_bytes / 1e6:.1f}MB")
+	print(f"{'format':<10}{'size_MB':>10}{'vs_json':>10}{'vs_raw':>10}{'write_s':>10}{'decode_s':>10}{'Mrows/s':>10}{'MB/s':>10}{'max_err':>10}")
+
+	with tempfile.TemporaryDirectory() as tmp:
+		tmp_dir = Path(tmp)
+		json_size = None
+		if not args.skip_json:
+			path = tmp_dir / "record.json"
+			write_s = _write_json(path, timestamps, positions)
+			json_size = path.stat().st_size
+
+			def load_json():
+				with open(path, "r", encoding="utf-8") as f:
+					data = json.load(f)["data"]
+				np.array([entry["joint_positions"] for entry in data], dtype=np.float32)
+
+			decode_s = _best_of(1, load_json)
+			print(
+				f"{'json':<10}{json_size / 1e6:>10.2f}{1.0:>10.1f}{raw_bytes / json_size:>10.2f}{write_s:>10.2f}"
+				f"{decode_s:>10.3f}{rows / decode_s / 1e6:>10.2f}{raw_bytes / decode_s / 1e6:>10.0f}{0.0:>10.4f}"
+			)
+
+		for compression in (None, "zlib", "lzma"):
+			name = compression or "raw"
+			path = tmp_dir / f"record_{name}.rec"
+			write_s = _write_rec(path, timestamps, positions, compression, args.chunk_rows)
+			size = path.stat().st_size
+			decode_s = _best_of(args.repeat, lambda: RecordingReader(path).read_all())
+			decoded = RecordingReader(path).read_all()
+			error = float(np.max(np.abs(decoded["positions"] - positions)))
+			vs_json = f"{json_size / size:>10.1f}" if json_size else f"{'-':>10}"
+			print(
+				f"{name:<10}{size / 1e6:>10.2f}{vs_json}{raw_bytes / size:>10.2f}{write_s:>10.2f}"
+				f"{decode_s:>10.3f}{rows / decode_s / 1e6:>10.2f}{raw_bytes / decode_s / 1e6:>10.0f}{error:>10.4f}"
+			)
+
+			# 스크러버 패턴: 임의 시각 frame_at (압축 기록은 청크 디코딩 포함)
+			with MappedRecording(path) as mapped:
+				probes = np.random.default_rng(1).uniform(0, timestamps[-1], 2000)
+				seek_s = _best_of(1, lambda: [mapped.frame_at(t) for t in probes])
+			print(f"{'':<10}frame_at: {seek_s / len(probes) * 1e6:.1f}us/call (random seek)")
+
+
+if __name__ == "__main__":
+	main()
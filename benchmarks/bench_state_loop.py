@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+상태 브로드캐스트 루프 벤치마크
+
+느리거나 타임아웃되는 시리얼 버스를 흉내 낸 get_state()를 주입하고,
+서버가 동작하는 동안 GET /api/health 응답 지연을 측정합니다.
+
+- threaded: 현재 구조 (StatePublisher 스레드가 버스를 읽음)
+- inline:   이전 구조 재현 (이벤트 루프 안에서 get_state()를 직접 호출)
+
+사용법:
+    python benchmarks/bench_state_loop.py --bus-delay 0.15 --requests 200
+    python benchmarks/bench_state_loop.py --bus-delay 1.0 --timeout
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _free_port() -> int:
+	with socket.socket() as s:
+		s.bind(("127.0.0.1", 0))
+		return s.getsockname()[1]
+
+
+def _install_slow_bus(server, delay: float, timeout: bool) -> None:
+	"""robot_adapter를 '연결됨' 상태로 만들고 get_state()를 느리게 만듦"""
+	adapter = server.robot_adapter
+
+	def slow_get_state():
+		time.sleep(delay)
+		if timeout:
+			raise ConnectionError("Read failed due to communication error (simulated timeout)")
+		return {
+			"connected": True,
+			"joint_positions": [0.0] * 6,
+			"joint_names": adapter.JOINT_NAMES,
+			"joint_limits": [limits.copy() for limits in adapter.joint_limits],
+		}
+
+	adapter.connected = True
+	adapter.connection_info = {"port": "/dev/null", "baudrate": adapter.baudrate}
+	adapter.get_state = slow_get_state
+	# 구독 클라이언트가 없어도 발행 스레드가 폴링하도록 수요 등록
+	server.state_publisher.acquire("benchmark")
+
+
+def _build_app(server, mode: str):
+	star = server.asgi()
+	# 자동 연결 스캔은 측정에 방해되므로 비활성화
+	server.auto_connect_robot = _noop_async
+
+	if mode == "inline":
+		# 이전 구조: 발행 스레드를 쓰지 않고 루프 안에서 직접 버스 읽기
+		server.state_publisher.start = lambda: None
+		interval = 1.0 / server.DEFAULT_CONFIG["robot"]["state_update_rate"]
+
+		async def inline_loop():
+			while True:
+				try:
+					state = server.robot_adapter.get_state()
+					await server.sio.emit("state:update", state)
+				except Exception:
+					pass
+				await asyncio.sleep(interval)
+
+		async def start_inline():
+			asyncio.create_task(inline_loop())
+
+		star.router.on_startup.append(start_inline)
+	return star
+
+
+async def _noop_async(*args, **kwargs):
+	return None
+
+
+def _measure(url: str, count: int, spacing: float):
+	latencies = []
+	for _ in range(count):
+		started = time.perf_counter()
+		with urllib.request.urlopen(url, timeout=30) as res:
+			res.read()
+		latencies.append((time.perf_counter() - started) * 1000.0)
+		time.sleep(spacing)
+	return latencies
+
+
+def _report(label: str, latencies):
+	latencies = sorted(latencies)
+	p = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+	print(
+		f"{label:<10} n={len(latencies):<4} "
+		f"p50={statistics.median(latencies):7.2f}ms  "
+		f"p95={p(0.95):7.2f}ms  p99={p(0.99):7.2f}ms  max={latencies[-1]:7.2f}ms"
+	)
+
+
+def run(mode: str, args) -> None:
+	import uvicorn
+	from rosota_copilot import server
+
+	_install_slow_bus(server, args.bus_delay, args.timeout)
+	port = _free_port()
+	config = uvicorn.Config(_build_app(server, mode), host="127.0.0.1", port=port, log_level="warning")
+	uv = uvicorn.Server(config)
+	thread = threading.Thread(target=uv.run, daemon=True)
+	thread.start()
+	while not uv.started:
+		time.sleep(0.05)
+
+	try:
+		time.sleep(args.warmup)
+		latencies = _measure(f"http://127.0.0.1:{port}/api/health", args.requests, args.spacing)
+		_report(mode, latencies)
+	finally:
+		uv.should_exit = True
+		thread.join(timeout=5)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--mode", choices=["both", "threaded", "inline"], default="both")
+	parser.add_argument("--bus-delay", type=float, default=0.15, help="get_state() 1회 소요 시간 (초)")
+	parser.add_argument("--timeout", action="store_true", help="get_state()가 지연 후 ConnectionError를 발생")
+	parser.add_argument("--requests", type=int, default=200)
+	parser.add_argument("--spacing", type=float, default=0.01, help="요청 간격 (초)")
+	parser.add_argument("--warmup", type=float, default=0.5)
+	args = parser.parse_args()
+
+	if args.mode == "both":
+		print(
+			f"bus_delay={args.bus_delay * 1000:.0f}ms timeout={args.timeout} "
+			f"(HTTP latency should stay flat in threaded mode)"
+		)
+	if args.mode != "both":
+		run(args.mode, args)
+		return
+
+	# 각 모드는 전역 서버 상태를 바꾸므로 별도 프로세스로 실행
+	import subprocess
+	for mode in ("threaded", "inline"):
+		subprocess.run([sys.executable, __file__, *sys.argv[1:], "--mode", mode], check=True)
+
+
+if __name__ == "__main__":
+	main()
@@ -7,7 +7,6 @@ import os
 import sys
 import webbrowser
 import threading
-import time
 from pathlib import Path
 
 # loguru 초기화 (PyInstaller 환경에서 포매터 오류 방지)
@@ -135,10 +134,11 @@ os.environ['ROSOTA_TEMPLATES_DIR'] = str(templates_dir)
 os.environ['ROSOTA_STATIC_DIR'] = str(static_dir)
 os.environ['ROSOTA_RESOURCES_DIR'] = str(resources_dir)
 
-def open_browser():
-    """서버 시작 후 브라우저 자동 열기"""
-    time.sleep(2)  # 서버 시작 대기
-    url = "http://localhost:8000"
+def open_browser(url, ready_event, timeout=60.0):
+    """서버가 리스닝을 시작하면 바로 브라우저 열기"""
+    if not ready_event.wait(timeout):
+        print(f"⚠️  서버가 {timeout:.0f}초 안에 시작되지 않았습니다. 수동으로 {url} 에 접속하세요.")
+        return
     print(f"\n🌐 브라우저를 열고 있습니다: {url}")
     try:
         webbrowser.open(url)
@@ -146,8 +146,44 @@ def open_browser():
         print(f"⚠️  브라우저를 자동으로 열 수 없습니다: {e}")
         print(f"   수동으로 {url} 에 접속하세요.")
 
-def main():
+
+def make_server(config, ready_event, profiler=None):
+    """리스닝 소켓이 열린 직후 ready_event를 세우는 uvicorn 서버"""
+    import uvicorn
+
+    class ReadyServer(uvicorn.Server):
+        async def startup(self, sockets=None):
+            await super().startup(sockets=sockets)
+            if self.started:
+                if profiler is not None:
+                    profiler.mark("listening")
+                    print(profiler.report())
+                    profiler.uninstall()
+                ready_event.set()
+
+    return ReadyServer(config)
+
+def main(argv=None):
     """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="rosota_copilot")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        default=os.environ.get("ROSOTA_PROFILE_STARTUP", "0") == "1",
+        help="import/초기화 시간 보고 (리스닝 시작 시 출력)",
+    )
+    parser.add_argument("--no-browser", action="store_true", help="브라우저 자동 열기 비활성화")
+    # 패키징된 앱은 OS가 추가 인자(-psn_... 등)를 붙일 수 있으므로 모르는 인자는 무시
+    args, _unknown = parser.parse_known_args(argv)
+
+    profiler = None
+    if args.profile_startup:
+        from rosota_copilot.observability.startup import StartupProfiler
+        profiler = StartupProfiler()
+        profiler.install()
+
     # GUI 앱으로 실행되는 경우 콘솔 출력 최소화
     # py2app 또는 PyInstaller로 패키징된 경우
     is_gui_app = getattr(sys, 'frozen', False)
@@ -162,30 +198,49 @@ def main():
         print(f"정적 파일: {static_dir}")
         print("=" * 60)
     
-    # 브라우저 자동 열기 (백그라운드 스레드)
-    browser_thread = threading.Thread(target=open_browser, daemon=True)
-    browser_thread.start()
-    
-    # 서버 시작
-    import uvicorn
-    from rosota_copilot.server import asgi
-    
     host = os.environ.get("HOST", "127.0.0.1")  # 기본값을 localhost로 변경
     port = int(os.environ.get("PORT", "8000"))
     
+    # 브라우저 자동 열기 (백그라운드 스레드, 서버가 리스닝을 시작하면 즉시)
+    ready_event = threading.Event()
+    if not args.no_browser:
+        browser_host = "localhost" if host in ("0.0.0.0", "::") else host
+        browser_thread = threading.Thread(
+            target=open_browser, args=(f"http://{browser_host}:{port}", ready_event), daemon=True
+        )
+        browser_thread.start()
+    
+    # 서버 시작 (하드웨어 모듈은 처음 사용할 때 import)
+    if profiler is not None:
+        with profiler.phase("import uvicorn"):
+            import uvicorn
+        with profiler.phase("import rosota_copilot.server"):
+            from rosota_copilot.server import asgi
+        profiler.check_lazy()
+    else:
+        import uvicorn
+        from rosota_copilot.server import asgi
+    
+    def app_factory():
+        if profiler is None:
+            return asgi()
+        with profiler.phase("create ASGI app"):
+            return asgi()
+    
     if not is_gui_app:
         print(f"\n🚀 서버 시작 중...")
         print(f"   주소: http://{host}:{port}")
         print(f"   종료: Ctrl+C\n")
     
     try:
-        uvicorn.run(
-            asgi,
+        config = uvicorn.Config(
+            app_factory,
             host=host,
             port=port,
             log_level="info" if not is_gui_app else "warning",  # GUI 앱에서는 로그 최소화
             factory=True
         )
+        make_server(config, ready_event, profiler).run()
     except KeyboardInterrupt:
         if not is_gui_app:
             print("\n\n서버를 종료합니다...")
@@ -204,5 +259,8 @@ def main():
         sys.exit(1)
 
 if __name__ == '__main__':
+    # 패키징된 앱에서 자식 프로세스(ROSOTA_BUS_SUBPROCESS=1의 버스 프로세스)를 띄울 수 있도록
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
 
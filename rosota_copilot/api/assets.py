@@ -0,0 +1,238 @@
+"""
+대시보드 index/정적 파일 서빙 (메모리 캐시 + 사전 압축 + ETag/304 + 캐시 버스팅 URL)
+
+- 파일은 한 번 읽어 해시/압축본(gzip, brotli 패키지가 있으면 br)을 메모리에 보관
+- index.html의 /static/... 참조를 내용 해시가 들어간 URL(/static/js/dashboard.<hash>.js)로 바꿔 제공
+  - 해시 URL: Cache-Control: immutable (1년) - 내용이 바뀌면 URL이 바뀜
+  - index.html / 해시 없는 URL: no-cache + ETag (재검증 시 304)
+- dev_mode: 요청마다 mtime을 확인해 바뀐 파일만 다시 읽음 (템플릿/JS 수정 즉시 반영)
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+	import brotli  # 선택 의존성
+except ImportError:
+	brotli = None
+
+# 압축할 텍스트 형식
+COMPRESSIBLE_TYPES = (
+	"text/",
+	"application/javascript",
+	"application/json",
+	"image/svg+xml",
+)
+_MEDIA_TYPES = {
+	".js": "application/javascript",
+	".mjs": "application/javascript",
+	".css": "text/css",
+	".html": "text/html",
+	".json": "application/json",
+	".svg": "image/svg+xml",
+	".map": "application/json",
+}
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+MIN_COMPRESS_SIZE = 512  # 이보다 작으면 압축 이득이 거의 없음
+
+# /static/js/dashboard.0123456789ab.js -> (js/dashboard, 0123456789ab, .js)
+_HASHED_NAME = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{12})(?P<ext>\.[^./]+)$")
+_STATIC_REF = re.compile(r'(?P<attr>src|href)="/static/(?P<path>[^"?#]+)"')
+
+
+def _media_type(path: str) -> str:
+	ext = os.path.splitext(path)[1].lower()
+	return _MEDIA_TYPES.get(ext) or mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+class Asset:
+	"""메모리에 올린 파일 하나 (원본 + 압축본)"""
+
+	__slots__ = ("path", "media_type", "mtime", "digest", "body", "encoded")
+
+	def __init__(self, path: str, body: bytes, mtime: float):
+		self.path = path
+		self.media_type = _media_type(path)
+		self.mtime = mtime
+		self.body = body
+		self.digest = hashlib.sha256(body).hexdigest()[:12]
+		self.encoded: Dict[str, bytes] = {}
+		if len(body) >= MIN_COMPRESS_SIZE and self.media_type.startswith(COMPRESSIBLE_TYPES):
+			self.encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+			if brotli is not None:
+				self.encoded["br"] = brotli.compress(body, quality=11)
+
+	def etag(self, encoding: Optional[str]) -> str:
+		return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+	def etags(self) -> Iterable[str]:
+		yield self.etag(None)
+		for encoding in self.encoded:
+			yield self.etag(encoding)
+
+	def negotiate(self, accept_encoding: str) -> Tuple[Optional[str], bytes]:
+		"""Accept-Encoding에 맞는 (인코딩, 본문) - br > gzip > 원본"""
+		accepted = {part.split(";")[0].strip() for part in accept_encoding.lower().split(",")}
+		for encoding in ("br", "gzip"):
+			if encoding in self.encoded and encoding in accepted:
+				return encoding, self.encoded[encoding]
+		return None, self.body
+
+
+class AssetPipeline:
+	"""
+	정적 파일/index 템플릿 캐시
+
+	Args:
+		static_dir: /static으로 제공할 디렉토리
+		index_paths: index.html 후보 경로 (처음 존재하는 파일 사용)
+		dev_mode: True면 요청마다 mtime 확인 후 변경된 파일 다시 읽기
+	"""
+
+	def __init__(self, static_dir: str, index_paths: Iterable[str], dev_mode: bool = False):
+		self.static_dir = os.path.abspath(static_dir)
+		self.index_paths = list(index_paths)
+		self.dev_mode = dev_mode
+		self._assets: Dict[str, Asset] = {}
+		self._index: Optional[Asset] = None
+		self._index_sources: Dict[str, float] = {}  # index 생성에 쓰인 파일 -> mtime
+		self._lock = threading.Lock()
+
+	# ---- 로드 ----
+
+	def preload(self) -> None:
+		"""정적 파일 전체와 index를 읽고 압축 (서버 시작 시 executor에서 호출)"""
+		for root, _dirs, files in os.walk(self.static_dir):
+			for name in files:
+				rel = os.path.relpath(os.path.join(root, name), self.static_dir).replace(os.sep, "/")
+				self.get_asset(rel)
+		self.get_index()
+
+	def _read(self, full_path: str, rel: str) -> Optional[Asset]:
+		try:
+			mtime = os.path.getmtime(full_path)
+			with open(full_path, "rb") as f:
+				return Asset(rel, f.read(), mtime)
+		except OSError:
+			return None
+
+	def _resolve(self, rel: str) -> Optional[str]:
+		"""static_dir 밖으로 나가는 경로는 거부"""
+		full_path = os.path.abspath(os.path.join(self.static_dir, rel))
+		if not full_path.startswith(self.static_dir + os.sep) or not os.path.isfile(full_path):
+			return None
+		return full_path
+
+	def _stale(self, asset: Asset) -> bool:
+		full_path = os.path.join(self.static_dir, asset.path)
+		try:
+			return os.path.getmtime(full_path) != asset.mtime
+		except OSError:
+			return True
+
+	def get_asset(self, rel: str) -> Optional[Asset]:
+		asset = self._assets.get(rel)
+		if asset is not None and not (self.dev_mode and self._stale(asset)):
+			return asset
+		full_path = self._resolve(rel)
+		if full_path is None:
+			return None
+		with self._lock:
+			asset = self._assets.get(rel)
+			if asset is None or (self.dev_mode and self._stale(asset)):
+				asset = self._read(full_path, rel)
+				if asset is not None:
+					self._assets[rel] = asset
+		return asset
+
+	def asset_url(self, rel: str) -> str:
+		"""캐시 버스팅 URL (/static/js/dashboard.<hash>.js), 파일이 없으면 원래 URL"""
+		asset = self.get_asset(rel)
+		if asset is None:
+			return f"/static/{rel}"
+		stem, ext = os.path.splitext(rel)
+		return f"/static/{stem}.{asset.digest}{ext}"
+
+	def _index_stale(self) -> bool:
+		for path, mtime in self._index_sources.items():
+			try:
+				if os.path.getmtime(path) != mtime:
+					return True
+			except OSError:
+				return True
+		return False
+
+	def get_index(self) -> Optional[Asset]:
+		index = self._index
+		if index is not None and not (self.dev_mode and self._index_stale()):
+			return index
+		with self._lock:
+			index_path = next((p for p in self.index_paths if os.path.exists(p)), None)
+			if index_path is None:
+				return None
+			with open(index_path, "r", encoding="utf-8") as f:
+				html = f.read()
+			sources = {index_path: os.path.getmtime(index_path)}
+		# /static 참조를 해시 URL로 교체 (get_asset이 락을 잡으므로 락 밖에서)
+		referenced = []
+
+		def rewrite(match):
+			referenced.append(match.group("path"))
+			return f'{match.group("attr")}="{self.asset_url(match.group("path"))}"'
+
+		html = _STATIC_REF.sub(rewrite, html)
+		for rel in referenced:
+			asset = self._assets.get(rel)
+			if asset is not None:
+				sources[os.path.join(self.static_dir, rel)] = asset.mtime
+		index = Asset("index.html", html.encode("utf-8"), sources[index_path])
+		with self._lock:
+			self._index = index
+			self._index_sources = sources
+		return index
+
+	# ---- 응답 ----
+
+	@staticmethod
+	def _respond(request: Request, asset: Asset, cache_control: str) -> Response:
+		encoding, body = asset.negotiate(request.headers.get("accept-encoding", ""))
+		headers = {
+			"ETag": asset.etag(encoding),
+			"Cache-Control": cache_control,
+			"Vary": "Accept-Encoding",
+		}
+		if_none_match = request.headers.get("if-none-match")
+		if if_none_match:
+			candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+			if "*" in candidates or candidates.intersection(asset.etags()):
+				return Response(status_code=304, headers=headers)
+		if encoding:
+			headers["Content-Encoding"] = encoding
+		return Response(body, media_type=asset.media_type, headers=headers)
+
+	def index_response(self, request: Request) -> Response:
+		index = self.get_index()
+		if index is None:
+			return Response("index.html not found", status_code=404)
+		return self._respond(request, index, REVALIDATE_CACHE)
+
+	def static_response(self, path: str, request: Request) -> Response:
+		match = _HASHED_NAME.match(path)
+		if match:
+			asset = self.get_asset(match.group("stem") + match.group("ext"))
+			if asset is not None:
+				# 해시가 다르면 (구버전 index 캐시) 현재 내용을 재검증 모드로 제공
+				immutable = asset.digest == match.group("hash")
+				return self._respond(request, asset, IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE)
+		asset = self.get_asset(path)
+		if asset is None:
+			return Response("Not Found", status_code=404)
+		return self._respond(request, asset, REVALIDATE_CACHE)
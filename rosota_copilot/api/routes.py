@@ -1,11 +1,9 @@
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 from typing import Optional, List
-import numpy as np
-from ..config import CALIBRATION_DIR
-from ..robot.usb_scanner import detect_robot_port, scan_serial_ports
+from ..config import CALIBRATION_DIR, PROGRAM_DIR, RECORD_DIR
+from ..robot.usb_scanner import detect_robot_port, probe_ports, scan_serial_ports
 from ..robot.motor_setup import SetupStatus
-import serial.tools.list_ports
 
 api_router = APIRouter()
 
@@ -56,7 +54,11 @@ async def connect_robot(req: ConnectRequest, request: Request):
 		host = req.host
 		baud = req.baudrate or 115200
 		if not port and not host:
-			port = detect_robot_port()
+			# 핸드셰이크 탐색은 포트를 여는 블로킹 I/O이므로 executor에서 실행
+			# 이미 연결된 포트는 열면 사용 중인 버스와 충돌하므로 제외 (/ports/probe와 동일)
+			import asyncio
+			exclude = [robot_adapter.port] if robot_adapter.connected and robot_adapter.port else []
+			port = await asyncio.get_running_loop().run_in_executor(None, lambda: detect_robot_port(exclude=exclude))
 			if not port:
 				return {
 					"ok": False,
@@ -155,12 +157,7 @@ async def calibration_wizard_reset(request: Request):
 	"""캘리브레이션 마법사 리셋"""
 	try:
 		calibration_manager = request.app.state.calibration_manager
-		calibration_manager.calibration_current_step = 0
-		calibration_manager.joint_min_positions = [None] * 6
-		calibration_manager.joint_max_positions = [None] * 6
-		calibration_manager.realtime_min_positions = [None] * 6
-		calibration_manager.realtime_max_positions = [None] * 6
-		calibration_manager.current_joint_index = 0
+		calibration_manager.reset_wizard()
 		return {"ok": True, "message": "Calibration wizard reset"}
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=str(e))
@@ -210,65 +207,15 @@ async def calibration_record_max(request: Request):
 
 @api_router.get("/calibration/wizard/realtime")
 async def calibration_realtime(request: Request):
-	"""실시간 조인트 위치 및 min/max 정보 조회"""
+	"""
+	실시간 조인트 위치 및 min/max 정보 조회 (마법사 시작 시 초기 표시용)
+	이후 갱신은 calibration:realtime Socket.IO 이벤트로 푸시되며, 이 요청도 버스를 읽지 않음
+	"""
 	try:
 		calibration_manager = request.app.state.calibration_manager
-		status = calibration_manager.update_realtime_positions()
-		
-		# 프론트엔드가 기대하는 형식으로 변환
-		robot_adapter = request.app.state.robot_adapter
-		joint_names = []
-		if hasattr(robot_adapter, 'MOTORS') and isinstance(robot_adapter.MOTORS, dict):
-			joint_names = list(robot_adapter.MOTORS.keys())
-		elif hasattr(robot_adapter, 'JOINT_NAMES'):
-			joint_names = robot_adapter.JOINT_NAMES
-		else:
-			joint_names = ["shoulder_pan", "shoulder_lift", "elbow", "wrist_1", "wrist_2", "gripper"]
-		
-		# get_state()는 이미 도(degree) 단위로 반환함
-		# calibration.py의 update_realtime_positions()에서 get_state()를 호출하므로
-		# positions, min_positions, max_positions 모두 도 단위임
-		# 따라서 변환 불필요
-		import math
-		realtime_current_positions = []
-		if "positions" in status:
-			# positions는 이미 도 단위 (get_state()에서 도로 반환)
-			realtime_current_positions = [float(p) if p is not None else None for p in status["positions"]]
-		else:
-			realtime_current_positions = [float(p) if p is not None else None for p in status.get("realtime_positions", [0.0] * 6)]
-		
-		# min/max도 이미 도 단위 (get_state()에서 도로 반환)
-		realtime_min_positions = []
-		if "min_positions" in status:
-			realtime_min_positions = [float(p) if p is not None else None for p in status["min_positions"]]
-		else:
-			realtime_min_positions = [float(p) if p is not None else None for p in status.get("realtime_min", [None] * 6)]
-		
-		realtime_max_positions = []
-		if "max_positions" in status:
-			realtime_max_positions = [float(p) if p is not None else None for p in status["max_positions"]]
-		else:
-			realtime_max_positions = [float(p) if p is not None else None for p in status.get("realtime_max", [None] * 6)]
-		
-		# recorded_min/max는 record_joint_min/max에서 설정되는데,
-		# get_state()에서 도 단위로 받으므로 이미 도 단위임
-		recorded_min = [float(p) if p is not None else None for p in status.get("recorded_min", [None] * 6)]
-		recorded_max = [float(p) if p is not None else None for p in status.get("recorded_max", [None] * 6)]
-		
-		# 프론트엔드 형식으로 변환
-		formatted_status = {
-			"current_joint_index": status.get("current_joint_index", 0),
-			"joint_names": joint_names,
-			"realtime_current_positions": realtime_current_positions,
-			"realtime_min_positions": realtime_min_positions,
-			"realtime_max_positions": realtime_max_positions,
-			"recorded_min": recorded_min,
-			"recorded_max": recorded_max
-		}
-		
 		return {
 			"ok": True,
-			"status": formatted_status
+			"status": calibration_manager.update_realtime_positions()
 		}
 	except Exception as e:
 		import traceback
@@ -314,7 +261,16 @@ async def get_state(request: Request):
 	try:
 		robot_adapter = request.app.state.robot_adapter
 		keyboard_controller = request.app.state.keyboard_controller
-		state = robot_adapter.get_state()
+		state_publisher = request.app.state.state_publisher
+		snapshot = state_publisher.latest
+		if state_publisher.active and snapshot is not None and snapshot.age() < 2 * state_publisher.interval:
+			# 발행 스레드가 읽어둔 최신 스냅샷 사용 (버스 읽기 없음)
+			state = snapshot.to_payload()
+		else:
+			# 폴링 중이 아니면 (구독자 없음) 이벤트 루프를 막지 않도록 executor에서 직접 읽기
+			import asyncio
+			loop = asyncio.get_event_loop()
+			state = await loop.run_in_executor(None, robot_adapter.get_state)
 		control_status = keyboard_controller.get_status()
 		return {
 			**state,
@@ -344,36 +300,62 @@ async def get_voltage(request: Request):
 			"ok": True,
 			"detected_voltage": voltage,
 			"motor_voltages": voltages,
-			"average_voltage": float(np.mean(voltages)) if voltages else None
+			"average_voltage": sum(voltages) / len(voltages) if voltages else None
 		}
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=str(e))
 
 
+def _check_motion_allowed(request: Request, exclusive: bool = False) -> None:
+	"""
+	로봇을 움직이는 요청 공통 검사 (모든 이동 진입점이 같은 기준 사용)
+	E-Stop 중이거나 홈 이동/재생이 로봇을 소유하고 있으면 409,
+	exclusive=True(홈 이동/재생 시작)면 조그/속도 명령으로 움직이는 중이어도 409
+	"""
+	keyboard_controller = request.app.state.keyboard_controller
+	if keyboard_controller.estop_active:
+		raise HTTPException(status_code=409, detail="E-Stop active")
+	owner = keyboard_controller.motion_owner()
+	if owner is not None:
+		raise HTTPException(status_code=409, detail=f"{owner} in progress")
+	if exclusive and keyboard_controller.motion_active:
+		raise HTTPException(status_code=409, detail="Stop jogging first")
+
+
 @api_router.post("/calibration/home")
 async def calibration_home(request: Request):
-	"""홈 포지션으로 이동"""
+	"""
+	홈 포지션으로 동기화 이동 시작 (백그라운드에서 실행, 즉시 반환)
+	진행 상황은 calibration:home Socket.IO 이벤트 / GET /calibration/home/status로 확인
+	"""
+	robot_adapter = request.app.state.robot_adapter
+	calibration_manager = request.app.state.calibration_manager
+	if not robot_adapter.connected:
+		raise HTTPException(status_code=400, detail="Robot not connected")
+	_check_motion_allowed(request, exclusive=True)
+	
+	# 버스 I/O(현재 위치 읽기/토크/스트리밍)는 모두 홈 이동 스레드에서 수행
 	try:
-		robot_adapter = request.app.state.robot_adapter
-		calibration_manager = request.app.state.calibration_manager
-		if not robot_adapter.connected:
-			raise HTTPException(status_code=400, detail="Robot not connected")
-		
-		# 비동기로 실행 (블로킹 방지)
-		import asyncio
-		loop = asyncio.get_event_loop()
-		success = await loop.run_in_executor(None, calibration_manager.home)
-		
-		if success:
-			return {"ok": True, "message": "Home movement completed successfully"}
-		else:
-			raise HTTPException(status_code=500, detail="Home movement failed")
-	except HTTPException:
-		raise
-	except Exception as e:
-		import traceback
-		traceback.print_exc()
-		raise HTTPException(status_code=500, detail=str(e))
+		homing = calibration_manager.start_home()
+	except RuntimeError as e:
+		raise HTTPException(status_code=409, detail=str(e))
+	return {"ok": True, "message": "Home movement started", "status": homing.status()}
+
+
+@api_router.post("/calibration/home/cancel")
+async def calibration_home_cancel(request: Request):
+	"""진행 중인 홈 이동 취소 (현재 위치에서 정지)"""
+	calibration_manager = request.app.state.calibration_manager
+	if not calibration_manager.cancel_home():
+		raise HTTPException(status_code=409, detail="Homing is not in progress")
+	return {"ok": True, "message": "Home movement cancelled"}
+
+
+@api_router.get("/calibration/home/status")
+async def calibration_home_status(request: Request):
+	"""홈 이동 진행 상황 (실행 중이거나 마지막으로 실행한 이동, 없으면 null)"""
+	homing = request.app.state.calibration_manager.homing
+	return {"ok": True, "status": homing.status() if homing is not None else None}
 
 
 @api_router.post("/calibration/zero")
@@ -474,6 +456,22 @@ async def list_ports():
 	return {"ok": True, "ports": scan_serial_ports()}
 
 
+@api_router.get("/ports/probe")
+async def probe_robot_ports(request: Request):
+	"""후보 포트를 병렬로 열어 모터가 실제로 응답하는 포트 목록 반환 (응답 모터 수 순)"""
+	import asyncio
+	robot_adapter = request.app.state.robot_adapter
+	# 이미 연결된 포트는 버스가 열고 있으므로 제외
+	exclude = [robot_adapter.port] if robot_adapter.connected and robot_adapter.port else []
+	try:
+		verified = await asyncio.get_running_loop().run_in_executor(
+			None, lambda: probe_ports(motors=robot_adapter.MOTORS, exclude=exclude)
+		)
+	except ImportError as e:
+		raise HTTPException(status_code=500, detail=f"scservo_sdk not available: {e}")
+	return {"ok": True, "ports": verified}
+
+
 class JointMoveRequest(BaseModel):
 	joint_index: int
 	delta_deg: float
@@ -491,6 +489,7 @@ async def joint_move(req: JointMoveRequest, request: Request):
 		robot_adapter = request.app.state.robot_adapter
 		if not robot_adapter.connected:
 			raise HTTPException(status_code=400, detail="Robot not connected")
+		_check_motion_allowed(request)
 		ok = robot_adapter.move_joint_delta(req.joint_index, req.delta_deg)
 		if not ok:
 			raise HTTPException(status_code=400, detail="Move rejected (limits or connection)")
@@ -508,6 +507,7 @@ async def joint_set(req: JointSetRequest, request: Request):
 		robot_adapter = request.app.state.robot_adapter
 		if not robot_adapter.connected:
 			raise HTTPException(status_code=400, detail="Robot not connected")
+		_check_motion_allowed(request)
 		state = robot_adapter.get_state()
 		current = state.get("joint_positions", [0.0] * 6)
 		if req.joint_index < 0 or req.joint_index >= len(current):
@@ -560,8 +560,425 @@ async def control_status(request: Request):
 		raise HTTPException(status_code=500, detail=str(e))
 
 
+@api_router.get("/control/traces")
+async def control_traces(request: Request, limit: int = 50):
+	"""키 입력 지연 추적: 구간별 히스토그램 요약 + 최근 트레이스"""
+	command_tracer = request.app.state.command_tracer
+	return {
+		"ok": True,
+		"summary": command_tracer.summary(),
+		"traces": command_tracer.recent(max(1, min(limit, 500))),
+	}
+
+
+@api_router.post("/control/traces/reset")
+async def control_traces_reset(request: Request):
+	"""지연 추적 히스토그램/최근 트레이스 초기화"""
+	request.app.state.command_tracer.reset()
+	return {"ok": True}
+
+
+# ========== Recording API ==========
+
+class RecordStartRequest(BaseModel):
+	mode: str = "manual"  # "manual" or "keyboard"
+	rate_hz: Optional[float] = None  # 캡처 주기 (30~200Hz, 기본은 설정값)
+
+
+def _record_path(filename: str):
+	"""기록 디렉토리 안의 파일만 허용"""
+	path = (RECORD_DIR / filename).resolve()
+	if path.parent != RECORD_DIR.resolve() or not path.name.startswith("record_"):
+		raise HTTPException(status_code=400, detail="Invalid record filename")
+	if not path.is_file():
+		raise HTTPException(status_code=404, detail="Record not found")
+	return path
+
+
+@api_router.post("/record/start")
+async def record_start(req: RecordStartRequest, request: Request):
+	"""기록 시작 (캡처 스레드가 고정 주기로 조인트 위치 샘플링, 초기 상태 읽기/파일 생성은 executor에서)"""
+	import asyncio
+	from functools import partial
+	from ..robot.recorder import RecordMode
+
+	recorder = request.app.state.recorder
+	try:
+		mode = RecordMode(req.mode)
+	except ValueError:
+		raise HTTPException(status_code=400, detail=f"Invalid record mode: {req.mode}")
+	if recorder.is_recording:
+		raise HTTPException(status_code=409, detail="Already recording")
+	if not request.app.state.robot_adapter.connected:
+		raise HTTPException(status_code=400, detail="Robot not connected")
+	started = await asyncio.get_running_loop().run_in_executor(
+		None, partial(recorder.start_record, mode, rate_hz=req.rate_hz)
+	)
+	if not started:
+		if recorder.is_recording:
+			# 동시에 들어온 다른 시작 요청이 먼저 시작함
+			raise HTTPException(status_code=409, detail="Already recording")
+		raise HTTPException(status_code=500, detail="Failed to start recording")
+	return {"ok": True, "status": recorder.get_status()}
+
+
+@api_router.post("/record/stop")
+async def record_stop(request: Request):
+	"""기록 중지 및 저장 (남은 샘플 쓰기/푸터 추가는 executor에서)"""
+	import asyncio
+
+	recorder = request.app.state.recorder
+	if not recorder.is_recording:
+		raise HTTPException(status_code=400, detail="Not recording")
+	filepath = await asyncio.get_running_loop().run_in_executor(None, recorder.stop_record)
+	return {
+		"ok": filepath is not None,
+		"filename": filepath.name if filepath else None,
+		"status": recorder.get_status(),
+	}
+
+
+@api_router.post("/record/discard")
+async def record_discard(request: Request):
+	"""현재 기록 버리기"""
+	request.app.state.recorder.discard_record()
+	return {"ok": True}
+
+
+@api_router.get("/record/status")
+async def record_status(request: Request):
+	"""기록 상태 + 캡처 통계 (샘플 수, 놓친 틱, 지터)"""
+	return {"ok": True, "status": request.app.state.recorder.get_status()}
+
+
+@api_router.get("/records")
+async def records_list(
+	request: Request,
+	offset: int = 0,
+	limit: int = 50,
+	sort: str = "created_at",
+	order: str = "desc",
+	mode: Optional[str] = None,
+	min_duration: Optional[float] = None,
+	max_duration: Optional[float] = None,
+	since: Optional[str] = None,
+	until: Optional[str] = None,
+):
+	"""저장된 기록 목록 (카탈로그 기반 페이지 조회, since/until은 ISO 날짜/시각)"""
+	import asyncio
+	from functools import partial
+
+	recorder = request.app.state.recorder
+	query = partial(
+		recorder.query_records,
+		offset=max(0, offset),
+		limit=max(1, min(limit, 500)),
+		sort=sort,
+		descending=order != "asc",
+		mode=mode,
+		min_duration=min_duration,
+		max_duration=max_duration,
+		since=since,
+		until=until,
+	)
+	try:
+		result = await asyncio.get_running_loop().run_in_executor(None, query)
+	except ValueError as e:
+		raise HTTPException(status_code=400, detail=str(e))
+	return {"ok": True, "offset": max(0, offset), **result}
+
+
+@api_router.delete("/records/{filename}")
+async def records_delete(filename: str, request: Request):
+	"""기록 파일 삭제"""
+	recorder = request.app.state.recorder
+	path = _record_path(filename)
+	if recorder.is_recording and recorder.current_record_path == path:
+		raise HTTPException(status_code=409, detail="Record is being written")
+	if not recorder.delete_record(path):
+		raise HTTPException(status_code=500, detail="Failed to delete record")
+	return {"ok": True}
+
+
+def _open_mapped(request: Request, filename: str):
+	path = _record_path(filename)
+	try:
+		return request.app.state.recorder.open_mapped(path)
+	except ValueError as e:
+		raise HTTPException(status_code=400, detail=str(e))
+
+
+def _column_list(values) -> list:
+	"""numpy 배열 -> JSON 리스트 (float32 표현 오차는 소수점 6자리로 반올림, NaN은 null)"""
+	import numpy as np
+
+	values = np.round(np.asarray(values, dtype=np.float64), 6)
+	if not np.isnan(values).any():
+		return values.tolist()
+	return np.where(np.isnan(values), None, values).tolist()
+
+
+@api_router.get("/records/{filename}/frame")
+async def records_frame(filename: str, request: Request, t: float, interpolate: bool = True):
+	"""기록 시각 t의 프레임 (메모리 맵 - 파일 전체를 읽지 않음)"""
+	mapped = _open_mapped(request, filename)
+	frame = mapped.frame_at(t, interpolate=interpolate)
+	if frame is None:
+		raise HTTPException(status_code=404, detail="Record is empty")
+	return {"ok": True, "frame": {name: _column_list(values) for name, values in frame.items()}}
+
+
+@api_router.get("/records/{filename}/slice")
+async def records_slice(
+	filename: str,
+	request: Request,
+	t0: Optional[float] = None,
+	t1: Optional[float] = None,
+	columns: Optional[str] = None,
+	max_points: int = 2000,
+):
+	"""기록 시각 구간 [t0, t1]의 행 (columns는 쉼표 구분, 행이 max_points보다 많으면 일정 간격으로 솎아냄)"""
+	import asyncio
+
+	mapped = _open_mapped(request, filename)
+	names = columns.split(",") if columns else list(mapped.columns)
+	unknown = [name for name in names if name not in mapped.columns]
+	if unknown:
+		raise HTTPException(status_code=400, detail=f"Unknown columns: {', '.join(unknown)}")
+	start = mapped.start_time if t0 is None else t0
+	end = mapped.end_time if t1 is None else t1
+
+	def read():
+		rows = mapped.slice(start, end, names)
+		step = max(1, -(-len(rows["timestamp"]) // max(1, max_points)))
+		return step, {name: _column_list(values[::step]) for name, values in rows.items()}
+
+	step, rows = await asyncio.get_running_loop().run_in_executor(None, read)
+	return {
+		"ok": True,
+		"start_time": mapped.start_time,
+		"end_time": mapped.end_time,
+		"num_rows": mapped.num_rows,
+		"step": step,
+		"rows": rows,
+	}
+
+
+@api_router.get("/records/{filename}/preview")
+async def records_preview(filename: str, request: Request, width: Optional[int] = None):
+	"""기록 미리보기 - 요약 통계 + 차트 폭(width, 구간 수)에 맞는 조인트별 min/max/mean (width 없으면 통계만)"""
+	import asyncio
+	from functools import partial
+
+	path = _record_path(filename)
+	recorder = request.app.state.recorder
+	if recorder.is_recording and recorder.current_record_path == path:
+		raise HTTPException(status_code=409, detail="Record is being written")
+	width = None if width is None else max(1, min(width, 4096))
+	try:
+		preview = await asyncio.get_running_loop().run_in_executor(None, partial(recorder.get_preview, path, width))
+	except ValueError as e:
+		raise HTTPException(status_code=500, detail=str(e))
+	return {"ok": True, **preview}
+
+
+class DatasetExportRequest(BaseModel):
+	name: str = "rosota"
+	filenames: Optional[List[str]] = None  # None이면 전체 기록
+	fps: Optional[int] = None
+	task: Optional[str] = None
+	workers: Optional[int] = None
+	force: bool = False
+
+
+@api_router.post("/datasets/export")
+async def datasets_export(req: DatasetExportRequest, request: Request):
+	"""기록들을 LeRobot 형식 데이터셋(data/datasets/<name>)으로 내보내기 (프로세스 풀, 증분)"""
+	import asyncio
+	from functools import partial
+	from pathlib import Path
+
+	if not req.name or Path(req.name).name != req.name or req.name in (".", ".."):
+		raise HTTPException(status_code=400, detail="Invalid dataset name")
+	recorder = request.app.state.recorder
+	filepaths = [_record_path(filename) for filename in req.filenames] if req.filenames is not None else None
+	export = partial(
+		recorder.export_dataset,
+		req.name,
+		filepaths,
+		fps=req.fps,
+		task=req.task,
+		workers=req.workers,
+		force=req.force,
+	)
+	try:
+		summary = await asyncio.get_running_loop().run_in_executor(None, export)
+	except (RuntimeError, ValueError) as e:
+		raise HTTPException(status_code=400, detail=str(e))
+	return {"ok": True, **summary}
+
+
+class SimplifyRequest(BaseModel):
+	tolerance: float = 0.5  # 키프레임 보간 허용 오차 (도)
+	rate_hz: Optional[float] = None  # 단순화 전 재샘플링 주기
+	stationary_tolerance: float = 0.1  # 정지로 보는 행간 변화 (도)
+	max_pause: float = 0.5  # 중간 정지 구간 최대 길이 (초)
+	save: bool = True
+
+
+@api_router.post("/records/{filename}/simplify")
+async def records_simplify(filename: str, req: SimplifyRequest, request: Request):
+	"""기록을 키프레임 프로그램으로 단순화 (정지 구간 단축 + 재샘플링 + RDP, 오차/감소율 보고)"""
+	import asyncio
+	from functools import partial
+	from pathlib import Path
+
+	path = _record_path(filename)
+	if req.tolerance <= 0 or (req.rate_hz is not None and req.rate_hz <= 0) or req.max_pause < 0:
+		raise HTTPException(status_code=400, detail="Invalid simplify options")
+	run = partial(
+		request.app.state.recorder.simplify_record,
+		path,
+		save=req.save,
+		tolerance=req.tolerance,
+		rate_hz=req.rate_hz,
+		stationary_tolerance=req.stationary_tolerance,
+		max_pause=req.max_pause,
+	)
+	try:
+		report = await asyncio.get_running_loop().run_in_executor(None, run)
+	except ValueError as e:
+		raise HTTPException(status_code=400, detail=str(e))
+	if "program" in report:
+		report["program"] = Path(report["program"]).name
+	return {"ok": True, "report": report}
+
+
+@api_router.get("/programs")
+async def programs_list(request: Request):
+	"""저장된 키프레임 프로그램 목록"""
+	import asyncio
+
+	programs = await asyncio.get_running_loop().run_in_executor(None, request.app.state.recorder.list_programs)
+	return {"ok": True, "programs": programs}
+
+
+def _program_path(filename: str):
+	"""프로그램 디렉토리 안의 파일만 허용"""
+	from ..recording.simplify import PROGRAM_SUFFIX
+
+	path = (PROGRAM_DIR / filename).resolve()
+	if path.parent != PROGRAM_DIR.resolve() or not path.name.endswith(PROGRAM_SUFFIX):
+		raise HTTPException(status_code=400, detail="Invalid program filename")
+	if not path.is_file():
+		raise HTTPException(status_code=404, detail="Program not found")
+	return path
+
+
+class ReplayStartRequest(BaseModel):
+	filename: Optional[str] = None  # 기록 파일
+	program: Optional[str] = None  # 또는 키프레임 프로그램 파일
+	speed: float = 1.0
+	loop: bool = False
+	start_time: float = 0.0  # 기록 시각 (초)
+
+
+class ReplaySeekRequest(BaseModel):
+	time: float  # 기록 시각 (초)
+
+
+class ReplaySpeedRequest(BaseModel):
+	speed: float
+
+
+def _replay_engine(request: Request):
+	engine = request.app.state.recorder.replay_engine
+	if engine is None or not engine.running:
+		raise HTTPException(status_code=400, detail="Not replaying")
+	return engine
+
+
+@api_router.post("/replay/start")
+async def replay_start(req: ReplayStartRequest, request: Request):
+	"""기록 재생 시작 (보간한 궤적을 절대 시각 기준으로 일괄 전송)"""
+	import asyncio
+	from functools import partial
+
+	recorder = request.app.state.recorder
+	if (req.filename is None) == (req.program is None):
+		raise HTTPException(status_code=400, detail="Specify either filename or program")
+	path = _record_path(req.filename) if req.filename is not None else _program_path(req.program)
+	if not request.app.state.robot_adapter.connected:
+		raise HTTPException(status_code=400, detail="Robot not connected")
+	_check_motion_allowed(request, exclusive=True)
+	# 첫 await 전에 소유권 선점 - 파일을 로딩하는 동안에도 홈 이동/조그가 끼어들지 않음
+	if not recorder.claim_replay():
+		raise HTTPException(status_code=409, detail="Replay in progress")
+	start = partial(recorder.replay, path, speed=req.speed, loop=req.loop, start_time=req.start_time, claimed=True)
+	if not await asyncio.get_running_loop().run_in_executor(None, start):
+		raise HTTPException(status_code=500, detail="Failed to start replay")
+	return {"ok": True, "replay": recorder.replay_engine.status()}
+
+
+@api_router.post("/replay/stop")
+async def replay_stop(request: Request):
+	"""재생 중지"""
+	import asyncio
+
+	recorder = request.app.state.recorder
+	await asyncio.get_running_loop().run_in_executor(None, recorder.stop_replay)
+	return {"ok": True}
+
+
+@api_router.post("/replay/pause")
+async def replay_pause(request: Request):
+	engine = _replay_engine(request)
+	engine.pause()
+	return {"ok": True, "replay": engine.status()}
+
+
+@api_router.post("/replay/resume")
+async def replay_resume(request: Request):
+	engine = _replay_engine(request)
+	engine.resume()
+	return {"ok": True, "replay": engine.status()}
+
+
+@api_router.post("/replay/seek")
+async def replay_seek(req: ReplaySeekRequest, request: Request):
+	"""재생 위치 이동 (멀면 램프 이동 후 이어서 재생)"""
+	import asyncio
+
+	engine = _replay_engine(request)
+	await asyncio.get_running_loop().run_in_executor(None, engine.seek, req.time)
+	return {"ok": True, "replay": engine.status()}
+
+
+@api_router.post("/replay/speed")
+async def replay_speed(req: ReplaySpeedRequest, request: Request):
+	engine = _replay_engine(request)
+	engine.set_speed(req.speed)
+	return {"ok": True, "replay": engine.status()}
+
+
+@api_router.get("/replay/status")
+async def replay_status(request: Request):
+	"""재생 상태 + 타이밍 (틱 지연 분포, 놓친 틱, 쓰기 실패)"""
+	engine = request.app.state.recorder.replay_engine
+	return {"ok": True, "replay": engine.status() if engine is not None else None}
+
+
 # ========== Motor Setup API ==========
 
+def _motor_setup_manager(request: Request):
+	"""모터 설정 관리자 (첫 사용 시 생성 - 서버 시작 시점에는 만들지 않음)"""
+	manager = getattr(request.app.state, "motor_setup_manager", None)
+	if manager is None:
+		from ..robot.motor_setup import MotorSetupManager
+		manager = request.app.state.motor_setup_manager = MotorSetupManager()
+	return manager
+
+
 class FindPortRequest(BaseModel):
 	ports_before: List[str]
 
@@ -592,7 +1009,7 @@ class CheckMotorIdRequest(BaseModel):
 async def find_port(req: FindPortRequest, request: Request):
 	"""포트 찾기 (LeRobot 방식: 연결 전후 비교 또는 PID 기반)"""
 	try:
-		motor_setup_manager = request.app.state.motor_setup_manager
+		motor_setup_manager = _motor_setup_manager(request)
 		
 		# 먼저 PID 기반으로 찾기 시도 (USB 케이블 분리 불필요)
 		port = motor_setup_manager.find_port_by_pid()
@@ -636,7 +1053,7 @@ async def find_port(req: FindPortRequest, request: Request):
 async def configure_motor(req: ConfigureMotorRequest, request: Request):
 	"""단일 모터 설정"""
 	try:
-		motor_setup_manager = request.app.state.motor_setup_manager
+		motor_setup_manager = _motor_setup_manager(request)
 		baudrate = req.baudrate or motor_setup_manager.BAUDRATE
 		
 		# 비동기로 실행
@@ -675,7 +1092,7 @@ async def configure_motor(req: ConfigureMotorRequest, request: Request):
 async def reset_motor(req: ResetMotorRequest, request: Request):
 	"""모터 ID 리셋 (기본값으로 초기화)"""
 	try:
-		motor_setup_manager = request.app.state.motor_setup_manager
+		motor_setup_manager = _motor_setup_manager(request)
 		baudrate = req.baudrate or motor_setup_manager.BAUDRATE
 		
 		# 비동기로 실행
@@ -714,7 +1131,7 @@ async def reset_motor(req: ResetMotorRequest, request: Request):
 async def check_motor_id(req: CheckMotorIdRequest, request: Request):
 	"""연결된 모터의 ID 확인"""
 	try:
-		motor_setup_manager = request.app.state.motor_setup_manager
+		motor_setup_manager = _motor_setup_manager(request)
 		baudrate = req.baudrate or motor_setup_manager.BAUDRATE
 		
 		# 비동기로 실행
@@ -757,7 +1174,7 @@ async def setup_start(req: SetupStartRequest, request: Request):
 		if robot_adapter.connected:
 			robot_adapter.disconnect()
 		
-		motor_setup_manager = request.app.state.motor_setup_manager
+		motor_setup_manager = _motor_setup_manager(request)
 		motor_setup_manager.reset()
 		motor_setup_manager.robot_type = req.robot_type
 		motor_setup_manager.status = SetupStatus.IDLE
@@ -776,7 +1193,7 @@ async def setup_start(req: SetupStartRequest, request: Request):
 async def setup_status(request: Request):
 	"""모터 설정 상태 조회"""
 	try:
-		motor_setup_manager = request.app.state.motor_setup_manager
+		motor_setup_manager = _motor_setup_manager(request)
 		status = motor_setup_manager.get_status()
 		
 		# 모터 설정 완료 여부 확인 (6개 모터 모두 설정되었는지)
@@ -866,7 +1283,7 @@ async def calibration_status(request: Request):
 async def setup_reset(request: Request):
 	"""모터 설정 초기화"""
 	try:
-		motor_setup_manager = request.app.state.motor_setup_manager
+		motor_setup_manager = _motor_setup_manager(request)
 		motor_setup_manager.reset()
 		return {
 			"ok": True,
@@ -880,6 +1297,7 @@ async def setup_reset(request: Request):
 async def get_ports_before():
 	"""포트 찾기 전 포트 목록 반환"""
 	try:
+		import serial.tools.list_ports
 		ports = [p.device for p in serial.tools.list_ports.comports()]
 		return {
 			"ok": True,
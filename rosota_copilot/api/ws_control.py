@@ -0,0 +1,155 @@
+"""
+저지연 제어용 raw WebSocket 엔드포인트 (/ws/control)
+
+Socket.IO(엔진 패킷 + JSON 이벤트 래핑)를 거치지 않고 바이너리 프레임을 바로 주고받습니다.
+포맷은 streaming/control_codec.py 참고.
+
+- 속도/정지 명령: 조그 루프(KeyboardController)에 즉시 전달, hold 시간 안에 갱신되지 않으면 정지
+- 위치 명령: latest-wins - 버스 쓰기 중에 들어온 명령은 최신 것 하나만 남기고 나머지는 SUPERSEDED로 응답
+- 모든 명령에 ack 전송 (client_ts를 그대로 돌려주므로 클라이언트가 RTT/버스 지연을 측정 가능)
+
+Socket.IO 대시보드와 동시에 사용할 수 있습니다 (상태 스트리밍은 계속 Socket.IO).
+"""
+import asyncio
+import time
+from typing import Optional
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from ..config import DEFAULT_CONFIG
+from ..streaming.control_codec import (
+	KIND_POSITION,
+	KIND_STOP,
+	STATUS_MALFORMED,
+	STATUS_NOT_CONNECTED,
+	STATUS_OK,
+	STATUS_REJECTED,
+	STATUS_SUPERSEDED,
+	ControlCommand,
+	decode_command,
+	encode_ack,
+)
+
+ws_router = APIRouter()
+
+# 속도 명령 유지 시간 (초) - 클라이언트는 이보다 짧은 주기로 속도 명령을 다시 보내야 계속 움직임
+VELOCITY_HOLD = 0.25
+
+
+class _ControlSession:
+	"""WebSocket 연결 하나의 상태 (위치 명령 pending 슬롯 + 버스 쓰기 태스크)"""
+
+	def __init__(self, websocket: WebSocket, robot_adapter, keyboard_controller):
+		self.websocket = websocket
+		self.robot = robot_adapter
+		self.keyboard = keyboard_controller
+		self.max_velocity = float(DEFAULT_CONFIG["limits"]["max_joint_velocity"])
+		self._send_lock = asyncio.Lock()
+		self._pending: Optional[tuple] = None  # (ControlCommand, server_recv)
+		self._pending_event = asyncio.Event()
+		self._writer_task: Optional[asyncio.Task] = None
+
+	async def send_ack(self, command: ControlCommand, status: int, server_recv: float, bus_write: float = 0.0):
+		data = encode_ack(command.kind, status, command.seq, command.client_ts, server_recv, bus_write)
+		async with self._send_lock:
+			await self.websocket.send_bytes(data)
+
+	async def handle(self, data: bytes, server_recv: float):
+		try:
+			command = decode_command(data)
+		except ValueError:
+			async with self._send_lock:
+				await self.websocket.send_bytes(encode_ack(0, STATUS_MALFORMED, 0, 0.0, server_recv))
+			return
+
+		if any(not 0 <= j < len(self.robot.JOINT_NAMES) for j in command.values):
+			# 없는 조인트 - 같은 명령의 다른 조인트도 적용하지 않음
+			await self.send_ack(command, STATUS_REJECTED, server_recv)
+			return
+
+		if command.kind == KIND_POSITION:
+			if self._position_blocked():
+				# E-Stop 또는 홈 이동/재생 중 - 해제될 때까지 위치 명령 거부
+				await self.send_ack(command, STATUS_REJECTED, server_recv)
+				return
+			self._submit_position(command, server_recv)
+			return
+
+		# 속도/정지: 조그 루프가 다음 틱에 반영 (버스 쓰기는 조그 루프가 담당)
+		if command.kind == KIND_STOP:
+			velocities = {}
+		else:
+			limit = self.max_velocity
+			velocities = {j: max(-limit, min(limit, v)) for j, v in command.values.items()}
+		if not self.robot.connected:
+			status = STATUS_NOT_CONNECTED
+		elif self.keyboard.set_velocity(velocities, hold=VELOCITY_HOLD, owner=self):
+			status = STATUS_OK
+		else:
+			status = STATUS_REJECTED
+		await self.send_ack(command, status, server_recv)
+
+	def _position_blocked(self) -> bool:
+		return self.keyboard.estop_active or self.keyboard.motion_owner() is not None
+
+	def _submit_position(self, command: ControlCommand, server_recv: float):
+		replaced = self._pending
+		self._pending = (command, server_recv)
+		self._pending_event.set()
+		if replaced is not None:
+			asyncio.create_task(self.send_ack(replaced[0], STATUS_SUPERSEDED, replaced[1]))
+		if self._writer_task is None:
+			self._writer_task = asyncio.create_task(self._position_writer())
+
+	async def _position_writer(self):
+		"""pending 위치 명령을 하나씩 버스에 쓰기 (쓰는 동안 들어온 명령은 최신 것만 남음)"""
+		loop = asyncio.get_running_loop()
+		while True:
+			await self._pending_event.wait()
+			self._pending_event.clear()
+			pending, self._pending = self._pending, None
+			if pending is None:
+				continue
+			command, server_recv = pending
+			if not self.robot.connected:
+				await self.send_ack(command, STATUS_NOT_CONNECTED, server_recv)
+				continue
+			if self._position_blocked():
+				# 대기 중에 E-Stop/홈 이동/재생이 시작됨 - 쓰지 않음
+				await self.send_ack(command, STATUS_REJECTED, server_recv)
+				continue
+			try:
+				ok = await loop.run_in_executor(None, self.robot.move_joints_absolute, command.values)
+			except Exception as e:
+				print(f"[WS Control] Position command error: {e}")
+				ok = False
+			bus_write = time.time()
+			await self.send_ack(command, STATUS_OK if ok else STATUS_REJECTED, server_recv, bus_write if ok else 0.0)
+
+	def close(self):
+		if self._writer_task is not None:
+			self._writer_task.cancel()
+			self._writer_task = None
+		self._pending = None
+		# 연결이 끊기면 이 클라이언트가 건 속도 명령만 해제 (다른 클라이언트의 속도 명령은 유지)
+		self.keyboard.release_velocity(self)
+
+
+@ws_router.websocket("/ws/control")
+async def ws_control(websocket: WebSocket):
+	await websocket.accept()
+	state = websocket.app.state
+	session = _ControlSession(websocket, state.robot_adapter, state.keyboard_controller)
+	try:
+		while True:
+			message = await websocket.receive()
+			if message["type"] == "websocket.disconnect":
+				break
+			# 텍스트 프레임은 지원하지 않음 (빈 프레임으로 처리되어 MALFORMED 응답)
+			await session.handle(message.get("bytes") or b"", time.time())
+	except WebSocketDisconnect:
+		pass
+	except Exception as e:
+		print(f"[WS Control] Connection error: {e}")
+	finally:
+		session.close()
@@ -7,12 +7,17 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 CALIBRATION_DIR = DATA_DIR / "calibration"
 RECORD_DIR = DATA_DIR / "records"
+DATASET_DIR = DATA_DIR / "datasets"
+PROGRAM_DIR = RECORD_DIR / "programs"  # 키프레임 프로그램 (recording/simplify.py)
+PREVIEW_DIR = RECORD_DIR / "previews"  # 기록 미리보기 사이드카 (recording/preview.py)
 
 # 기본 설정
 DEFAULT_CONFIG: Dict[str, Any] = {
 	"server": {
 		"host": os.getenv("HOST", "0.0.0.0"),
 		"port": int(os.getenv("PORT", "8000")),
+		# 개발 모드: 템플릿/정적 파일 변경을 요청마다 확인해 다시 읽음 (기본은 시작 시 한 번 캐시)
+		"assets_dev_mode": os.getenv("ROSOTA_DEV", "0") == "1",
 	},
 	"robot": {
 		"default_port": os.getenv("ROBOT_PORT", "/dev/ttyUSB0"),
@@ -20,16 +25,40 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 		"default_host": os.getenv("ROBOT_HOST", "192.168.1.100"),
 		"default_tcp_port": int(os.getenv("ROBOT_TCP_PORT", "502")),
 		"connection_timeout": 5.0,
-		"state_update_rate": 20.0,  # Hz
+		"state_update_rate": 20.0,  # Hz (구독 기본 주기)
+		"max_state_update_rate": 50.0,  # Hz (클라이언트가 요청할 수 있는 최대 주기)
+		# 시리얼 버스를 자식 프로세스에서 실행 (웹 부하와 무관한 버스 타이밍)
+		"bus_in_subprocess": os.getenv("ROSOTA_BUS_SUBPROCESS", "0") == "1",
 	},
 	"control": {
 		"default_step_size": 5.0,  # degrees or mm
 		"min_speed_multiplier": 0.1,
 		"max_speed_multiplier": 2.0,
 		"key_debounce_ms": 50,
+		"jog_rate_hz": 50.0,  # 조그 적분/전송 주기
+		"jog_velocity": 45.0,  # deg/s (speed_multiplier 1.0 기준)
+	},
+	"ipc": {
+		# 로컬 프로세스용 공유 메모리 텔레메트리/명령 링 (rosota_copilot.ipc.SharedMemoryClient)
+		"shared_memory": os.getenv("ROSOTA_SHM_ENABLED", "0") == "1",
+		"shared_memory_name": os.getenv("ROSOTA_SHM_NAME", "rosota"),
+		"shared_memory_rate": 50.0,  # Hz (텔레메트리 폴링 주기)
+	},
+	"recording": {
+		"capture_rate_hz": float(os.getenv("ROSOTA_RECORD_RATE", "100")),  # Hz (30~200, 캡처 스레드 샘플링 주기)
+		"chunk_rows": 256,  # 기록 파일 청크당 행 수
+		"compression": os.getenv("ROSOTA_RECORD_COMPRESSION") or None,  # None(원시 컬럼), "zlib", "lzma"
+		"replay_rate_hz": 50.0,  # 재생 시 목표 위치 전송 주기
 	},
 	"calibration": {
 		"default_file": str(CALIBRATION_DIR / "default.json"),
+		"tracking_rate_hz": 50.0,  # 조인트 범위 측정 중 버스 폴링 주기 (스냅샷마다 min/max 갱신)
+		"realtime_ui_rate_hz": 15.0,  # calibration:realtime 이벤트 전송 주기
+		# 홈 이동 (robot/homing.py): 가장 먼 조인트의 최대 속도, 전송 주기, 도착 판정 오차/대기 시간
+		"home_max_velocity": 30.0,  # deg/s
+		"home_rate_hz": 50.0,
+		"home_tolerance": 1.0,  # 도
+		"home_settle_timeout": 3.0,  # 초
 	},
 	"limits": {
 		"joint_limits": [
@@ -45,8 +74,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 	},
 }
 
-# 디렉토리 생성
-DATA_DIR.mkdir(exist_ok=True)
-CALIBRATION_DIR.mkdir(exist_ok=True)
-RECORD_DIR.mkdir(exist_ok=True)
+
+def ensure_data_dirs() -> None:
+	"""데이터 디렉토리 생성 (import 시점이 아니라 서버 시작/파일 저장 시 호출)"""
+	for directory in (DATA_DIR, CALIBRATION_DIR, RECORD_DIR):
+		directory.mkdir(parents=True, exist_ok=True)
 
@@ -0,0 +1,14 @@
+"""
+공유 메모리 기반 로컬 프로세스 간 텔레메트리/명령 전달
+"""
+from .bridge import SharedMemoryBridge
+from .client import SharedMemoryClient, TelemetrySample
+from .ring import RING_FORMAT_VERSION, SeqlockRing
+
+__all__ = [
+	"RING_FORMAT_VERSION",
+	"SeqlockRing",
+	"SharedMemoryBridge",
+	"SharedMemoryClient",
+	"TelemetrySample",
+]
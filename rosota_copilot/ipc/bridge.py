@@ -0,0 +1,157 @@
+"""
+서버 쪽 공유 메모리 브리지
+
+- 텔레메트리: StatePublisher 스냅샷마다 조인트 위치를 텔레메트리 링에 기록 (JSON/소켓 없음)
+- 명령: 외부 프로세스가 명령 링에 쓴 최신 setpoint를 읽어 한 번의 sync write로 전송 (latest-wins)
+  E-Stop/홈 이동/재생 중에는 명령을 버리고 텔레메트리 flags(FLAG_COMMANDS_BLOCKED)와 stats()로 알림
+
+세그먼트 이름: "<name>_telemetry", "<name>_command" (클라이언트는 rosota_copilot.ipc.SharedMemoryClient 사용)
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+from .ring import (
+	COMMAND_MODE_ABSOLUTE,
+	FLAG_COMMANDS_BLOCKED,
+	FLAG_CONNECTED,
+	KIND_COMMAND,
+	KIND_TELEMETRY,
+	SeqlockRing,
+)
+
+
+def segment_names(name: str):
+	return f"{name}_telemetry", f"{name}_command"
+
+
+class SharedMemoryBridge:
+	"""
+	StatePublisher ↔ 공유 메모리 링 연결
+
+	Args:
+		publisher: StatePublisher (텔레메트리 원본)
+		robot_adapter: 명령을 적용할 어댑터 (move_joints_absolute)
+		name: 세그먼트 이름 접두어
+		rate_hz: 텔레메트리를 위해 StatePublisher에 요청할 폴링 주기
+		command_poll_interval: 명령 링 확인 주기 (초)
+		motion_guard: 명령을 막는 사유("E-Stop", "Homing", "Replay")를 반환하는 함수, 없으면 None
+	"""
+
+	DEMAND_NAME = "shared_memory"
+
+	def __init__(
+		self,
+		publisher,
+		robot_adapter,
+		name: str = "rosota",
+		n_joints: int = 6,
+		slot_count: int = 64,
+		rate_hz: Optional[float] = None,
+		command_poll_interval: float = 0.001,
+		motion_guard: Optional[Callable[[], Optional[str]]] = None,
+	):
+		self.publisher = publisher
+		self.robot = robot_adapter
+		self.name = name
+		self.n_joints = n_joints
+		self.slot_count = slot_count
+		self.rate_hz = rate_hz
+		self.command_poll_interval = command_poll_interval
+		self.motion_guard = motion_guard
+		self.telemetry: Optional[SeqlockRing] = None
+		self.command: Optional[SeqlockRing] = None
+		self._stop_event = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+		self.commands_applied = 0
+		self.commands_skipped = 0
+		self.commands_rejected = 0
+		self.last_rejection: Optional[str] = None
+
+	@property
+	def running(self) -> bool:
+		return self._thread is not None and self._thread.is_alive()
+
+	def start(self) -> None:
+		if self.running:
+			return
+		telemetry_name, command_name = segment_names(self.name)
+		self.telemetry = SeqlockRing.create(telemetry_name, KIND_TELEMETRY, self.n_joints, self.slot_count)
+		self.command = SeqlockRing.create(command_name, KIND_COMMAND, self.n_joints, self.slot_count)
+		self.publisher.add_listener(self._on_snapshot)
+		self.publisher.acquire(self.DEMAND_NAME, self.rate_hz)
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self._command_loop, name="shm-command", daemon=True)
+		self._thread.start()
+		print(f"[SharedMemory] Telemetry: {telemetry_name}, commands: {command_name}")
+
+	def stop(self, timeout: float = 2.0) -> None:
+		self._stop_event.set()
+		self.publisher.remove_listener(self._on_snapshot)
+		self.publisher.release(self.DEMAND_NAME)
+		if self._thread:
+			self._thread.join(timeout)
+		self._thread = None
+		for ring in (self.telemetry, self.command):
+			if ring is not None:
+				ring.close()
+		self.telemetry = None
+		self.command = None
+
+	def _on_snapshot(self, snapshot) -> None:
+		"""StatePublisher 스레드에서 호출 - 구조체 패킹만 수행"""
+		ring = self.telemetry
+		if ring is None:
+			return
+		positions = snapshot.state.get("joint_positions") or ()
+		flags = FLAG_CONNECTED if snapshot.connected else 0
+		if self._blocked_reason() is not None:
+			flags |= FLAG_COMMANDS_BLOCKED
+		ring.write((snapshot.timestamp, snapshot.monotonic, snapshot.seq & 0xFFFFFFFF, flags), positions)
+
+	def _blocked_reason(self) -> Optional[str]:
+		return self.motion_guard() if self.motion_guard is not None else None
+
+	def _command_loop(self) -> None:
+		last_count = self.command.write_count
+		while not self._stop_event.is_set():
+			count = self.command.write_count
+			if count == last_count:
+				time.sleep(self.command_poll_interval)
+				continue
+			# 밀린 명령은 건너뛰고 최신 것만 적용
+			self.commands_skipped += max(0, count - last_count - 1)
+			last_count = count
+			slot = self.command.read(count)
+			if slot is None:
+				continue
+			(_client_ts, mask, mode), values = slot
+			if mode != COMMAND_MODE_ABSOLUTE or not self.robot.connected:
+				continue
+			# E-Stop/홈 이동/재생 중 명령은 버림 (해제 후 재전송은 클라이언트 몫)
+			reason = self._blocked_reason()
+			if reason is not None:
+				self.commands_rejected += 1
+				if reason != self.last_rejection:
+					print(f"[SharedMemory] Commands rejected: {reason}")
+				self.last_rejection = reason
+				continue
+			targets = {i: values[i] for i in range(self.n_joints) if mask & (1 << i)}
+			try:
+				if self.robot.move_joints_absolute(targets):
+					self.commands_applied += 1
+			except Exception as e:
+				print(f"[SharedMemory] Command error: {e}")
+
+	def stats(self):
+		return {
+			"name": self.name,
+			"running": self.running,
+			"telemetry_writes": self.telemetry.write_count if self.telemetry else 0,
+			"commands_received": self.command.write_count if self.command else 0,
+			"commands_applied": self.commands_applied,
+			"commands_skipped": self.commands_skipped,
+			"commands_rejected": self.commands_rejected,
+			"blocked": self._blocked_reason(),
+			"last_rejection": self.last_rejection,
+		}
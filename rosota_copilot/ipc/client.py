@@ -0,0 +1,87 @@
+"""
+공유 메모리 클라이언트 (로컬 정책 추론 프로세스 등에서 사용)
+
+서버가 실행 중이고 공유 메모리 브리지가 켜져 있어야 합니다 (ROSOTA_SHM_ENABLED=1).
+표준 라이브러리만 사용하므로 서버 의존성(fastapi, socketio 등) 없이 import할 수 있습니다.
+
+예시:
+	from rosota_copilot.ipc import SharedMemoryClient
+
+	with SharedMemoryClient() as client:
+		state = client.wait_for_state(timeout=1.0)
+		target = list(state.joint_positions)
+		target[0] += 1.0
+		client.send_command(target)
+"""
+import time
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+from .bridge import segment_names
+from .ring import COMMAND_MODE_ABSOLUTE, FLAG_COMMANDS_BLOCKED, FLAG_CONNECTED, KIND_COMMAND, KIND_TELEMETRY, SeqlockRing
+
+
+class TelemetrySample(NamedTuple):
+	count: int  # 텔레메트리 링 write_count (새 샘플 판별용)
+	state_seq: int  # 서버 StateSnapshot.seq
+	timestamp: float  # 버스 읽기 시각 (unix)
+	monotonic: float  # 버스 읽기 시각 (CLOCK_MONOTONIC, 같은 머신의 time.monotonic()과 비교 가능)
+	connected: bool
+	joint_positions: Tuple[float, ...]
+	commands_blocked: bool = False  # E-Stop/홈 이동/재생 중 (send_command는 서버에서 버려짐)
+
+	def age(self) -> float:
+		return time.monotonic() - self.monotonic
+
+
+class SharedMemoryClient:
+	"""서버 공유 메모리 링에 연결해 상태 읽기/명령 쓰기 (명령은 한 프로세스만 보낼 것)"""
+
+	def __init__(self, name: str = "rosota"):
+		telemetry_name, command_name = segment_names(name)
+		self.telemetry = SeqlockRing.attach(telemetry_name)
+		self.command = SeqlockRing.attach(command_name)
+		if self.telemetry.kind != KIND_TELEMETRY or self.command.kind != KIND_COMMAND:
+			raise ValueError(f"Unexpected ring layout for '{name}'")
+		self.n_joints = self.telemetry.n_joints
+		self._last_count = 0
+
+	def read_state(self) -> Optional[TelemetrySample]:
+		"""최신 텔레메트리 (아직 없으면 None)"""
+		latest = self.telemetry.read_latest()
+		if latest is None:
+			return None
+		count, (timestamp, monotonic, state_seq, flags), values = latest
+		self._last_count = count
+		return TelemetrySample(
+			count, state_seq, timestamp, monotonic, bool(flags & FLAG_CONNECTED), values,
+			commands_blocked=bool(flags & FLAG_COMMANDS_BLOCKED),
+		)
+
+	def wait_for_state(self, timeout: Optional[float] = None) -> Optional[TelemetrySample]:
+		"""마지막으로 읽은 것보다 새로운 텔레메트리가 올 때까지 대기"""
+		if self.telemetry.wait_for(self._last_count, timeout) is None:
+			return None
+		return self.read_state()
+
+	def send_command(self, joint_positions: Sequence[Optional[float]]) -> int:
+		"""
+		절대 위치 setpoint 전송 (deg), None인 조인트는 현재 목표 유지
+		서버는 최신 명령만 적용합니다 (latest-wins)
+		"""
+		mask = 0
+		values = []
+		for i, value in enumerate(joint_positions[:self.n_joints]):
+			if value is not None:
+				mask |= 1 << i
+			values.append(0.0 if value is None else float(value))
+		return self.command.write((time.time(), mask, COMMAND_MODE_ABSOLUTE), values)
+
+	def close(self) -> None:
+		self.telemetry.close()
+		self.command.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
@@ -0,0 +1,189 @@
+"""
+공유 메모리 seqlock 링 버퍼
+
+고정 레이아웃 (little-endian):
+	헤더 (64 bytes)
+		4s   magic        b"RSHM"
+		u16  version      RING_FORMAT_VERSION
+		u16  n_joints
+		u32  slot_count
+		u32  slot_size
+		u64  write_count  지금까지 완료된 쓰기 수 (최신 슬롯 = (write_count - 1) % slot_count)
+		4s   kind         b"TELE" | b"CMND"
+	슬롯 × slot_count
+		u64  seq          쓰는 중이면 홀수, 완료되면 짝수 (seqlock)
+		...  슬롯 종류별 필드 + float32[n_joints]
+
+쓰는 쪽은 프로세스 하나(단일 생산자)여야 합니다. 읽는 쪽은 몇 개든 락 없이 읽을 수 있고,
+읽는 도중 덮어써진 슬롯은 seq 비교로 감지해 다시 읽습니다.
+"""
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Optional, Sequence, Tuple
+
+RING_FORMAT_VERSION = 1
+MAGIC = b"RSHM"
+KIND_TELEMETRY = b"TELE"
+KIND_COMMAND = b"CMND"
+
+HEADER = struct.Struct("<4sHHIIQ4s")
+HEADER_SIZE = 64
+_WRITE_COUNT_OFFSET = 16
+_WRITE_COUNT = struct.Struct("<Q")
+_SEQ = struct.Struct("<Q")
+
+# 슬롯 고정 필드 (seq 다음)
+# 텔레메트리: timestamp(unix), monotonic(CLOCK_MONOTONIC), state_seq(StateSnapshot.seq), flags(bit0=connected, bit1=commands_blocked)
+TELEMETRY_FIELDS = struct.Struct("<ddII")
+# 명령: client timestamp(unix), mask(bit i = 조인트 i 적용), mode(0=absolute deg)
+COMMAND_FIELDS = struct.Struct("<dII")
+
+FLAG_CONNECTED = 0x01
+FLAG_COMMANDS_BLOCKED = 0x02  # E-Stop/홈 이동/재생 중 - 명령 링 입력은 버려짐
+COMMAND_MODE_ABSOLUTE = 0
+
+
+def _slot_layout(kind: bytes, n_joints: int) -> Tuple[struct.Struct, struct.Struct]:
+	fields = TELEMETRY_FIELDS if kind == KIND_TELEMETRY else COMMAND_FIELDS
+	body = struct.Struct(f"<{fields.format[1:]}{n_joints}f")
+	return fields, body
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+	"""
+	기존 공유 메모리에 연결 (소유하지 않음)
+	Python 3.13 미만은 연결만 해도 resource_tracker가 종료 시 unlink하므로 추적에서 제외
+	"""
+	try:
+		return shared_memory.SharedMemory(name=name, track=False)
+	except TypeError:
+		shm = shared_memory.SharedMemory(name=name)
+		try:
+			from multiprocessing import resource_tracker
+			resource_tracker.unregister(shm._name, "shared_memory")
+		except Exception:
+			pass
+		return shm
+
+
+class SeqlockRing:
+	"""공유 메모리 위의 고정 크기 슬롯 링 (단일 생산자, 다중 소비자)"""
+
+	def __init__(self, shm: shared_memory.SharedMemory, owner: bool = False):
+		self.shm = shm
+		self.owner = owner
+		self.buf = shm.buf
+		magic, version, n_joints, slot_count, slot_size, _count, kind = HEADER.unpack_from(self.buf, 0)
+		if magic != MAGIC:
+			raise ValueError(f"Shared memory '{shm.name}' is not a rosota ring")
+		if version != RING_FORMAT_VERSION:
+			raise ValueError(f"Unsupported ring version {version} (expected {RING_FORMAT_VERSION})")
+		self.kind = kind
+		self.n_joints = n_joints
+		self.slot_count = slot_count
+		self.slot_size = slot_size
+		self._fields, self._body = _slot_layout(kind, n_joints)
+		self._n_fields = len(self._fields.format.lstrip("<"))
+		# 생산자 쪽 로컬 카운터 (공유 write_count의 원본)
+		self._write_count = _WRITE_COUNT.unpack_from(self.buf, _WRITE_COUNT_OFFSET)[0]
+
+	@classmethod
+	def create(cls, name: str, kind: bytes, n_joints: int, slot_count: int = 64) -> "SeqlockRing":
+		"""새 링 생성 (같은 이름의 남은 세그먼트가 있으면 지우고 다시 생성)"""
+		_fields, body = _slot_layout(kind, n_joints)
+		slot_size = _SEQ.size + body.size
+		size = HEADER_SIZE + slot_size * slot_count
+		try:
+			shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+		except FileExistsError:
+			# 이전 프로세스가 비정상 종료하며 남긴 세그먼트
+			stale = attach_shared_memory(name)
+			stale.close()
+			stale.unlink()
+			shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+		shm.buf[:size] = bytes(size)
+		HEADER.pack_into(shm.buf, 0, MAGIC, RING_FORMAT_VERSION, n_joints, slot_count, slot_size, 0, kind)
+		return cls(shm, owner=True)
+
+	@classmethod
+	def attach(cls, name: str) -> "SeqlockRing":
+		return cls(attach_shared_memory(name))
+
+	@property
+	def write_count(self) -> int:
+		return _WRITE_COUNT.unpack_from(self.buf, _WRITE_COUNT_OFFSET)[0]
+
+	def _slot_offset(self, index: int) -> int:
+		return HEADER_SIZE + (index % self.slot_count) * self.slot_size
+
+	def write(self, fields: Sequence, values: Sequence[float]) -> int:
+		"""
+		슬롯 하나 기록 후 write_count 반환
+		values가 n_joints보다 짧으면 0으로 채움
+		"""
+		count = self._write_count
+		offset = self._slot_offset(count)
+		seq = 2 * (count // self.slot_count + 1)
+		values = list(values[:self.n_joints]) + [0.0] * max(0, self.n_joints - len(values))
+
+		_SEQ.pack_into(self.buf, offset, seq - 1)  # 쓰는 중 (홀수)
+		self._body.pack_into(self.buf, offset + _SEQ.size, *fields, *values)
+		_SEQ.pack_into(self.buf, offset, seq)  # 완료 (짝수)
+
+		self._write_count = count + 1
+		_WRITE_COUNT.pack_into(self.buf, _WRITE_COUNT_OFFSET, self._write_count)
+		return self._write_count
+
+	def read(self, count: int, retries: int = 100) -> Optional[Tuple[tuple, Tuple[float, ...]]]:
+		"""
+		count번째 쓰기(1부터)의 슬롯 읽기 → (고정 필드, 조인트 값)
+		이미 덮어써졌거나 재시도 내에 일관된 값을 못 읽으면 None
+		"""
+		if count <= 0:
+			return None
+		offset = self._slot_offset(count - 1)
+		expected = 2 * ((count - 1) // self.slot_count + 1)
+		for _ in range(retries):
+			seq_before = _SEQ.unpack_from(self.buf, offset)[0]
+			if seq_before & 1:
+				continue
+			data = self._body.unpack_from(self.buf, offset + _SEQ.size)
+			seq_after = _SEQ.unpack_from(self.buf, offset)[0]
+			if seq_before != seq_after:
+				continue
+			if seq_before != expected:
+				return None
+			return data[:self._n_fields], data[self._n_fields:]
+		return None
+
+	def read_latest(self) -> Optional[Tuple[int, tuple, Tuple[float, ...]]]:
+		"""가장 최근 슬롯 → (write_count, 고정 필드, 조인트 값), 쓰인 적 없으면 None"""
+		for _ in range(10):
+			count = self.write_count
+			if count == 0:
+				return None
+			result = self.read(count)
+			if result is not None:
+				return (count, *result)
+		return None
+
+	def wait_for(self, after_count: int, timeout: Optional[float] = None, spin: float = 0.0005) -> Optional[int]:
+		"""write_count가 after_count보다 커질 때까지 대기 (짧은 sleep 폴링), 타임아웃이면 None"""
+		deadline = None if timeout is None else time.monotonic() + timeout
+		while True:
+			count = self.write_count
+			if count > after_count:
+				return count
+			if deadline is not None and time.monotonic() >= deadline:
+				return None
+			time.sleep(spin)
+
+	def close(self) -> None:
+		self.buf = None
+		self.shm.close()
+		if self.owner:
+			try:
+				self.shm.unlink()
+			except FileNotFoundError:
+				pass
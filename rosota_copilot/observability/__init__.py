@@ -0,0 +1,16 @@
+"""
+지연 추적/계측
+"""
+from .histogram import DEFAULT_LATENCY_BUCKETS, Histogram
+from .metrics import REGISTRY, MetricsRegistry
+from .tracing import STAGES, CommandTrace, CommandTracer
+
+__all__ = [
+	"DEFAULT_LATENCY_BUCKETS",
+	"REGISTRY",
+	"STAGES",
+	"CommandTrace",
+	"CommandTracer",
+	"Histogram",
+	"MetricsRegistry",
+]
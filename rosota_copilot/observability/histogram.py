@@ -0,0 +1,76 @@
+"""
+고정 버킷 히스토그램 (지연 시간 등 초 단위 관측값)
+"""
+from bisect import bisect_left
+from typing import Dict, Optional, Sequence
+
+# 0.5ms ~ 5s (로그 간격) - 네트워크/이벤트 루프/시리얼 지연 범위를 모두 포함
+DEFAULT_LATENCY_BUCKETS = (
+	0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+
+class Histogram:
+	"""
+	버킷 경계가 고정된 히스토그램
+	observe()는 이진 탐색 한 번과 정수 덧셈 몇 번뿐이라 핫 패스에서 호출해도 됨 (락 없음)
+	"""
+
+	def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+		self.buckets = tuple(sorted(buckets))
+		self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+		self.count = 0
+		self.sum = 0.0
+
+	def observe(self, value: float) -> None:
+		self.counts[bisect_left(self.buckets, value)] += 1
+		self.count += 1
+		self.sum += value
+
+	def reset(self) -> None:
+		self.counts = [0] * (len(self.buckets) + 1)
+		self.count = 0
+		self.sum = 0.0
+
+	def cumulative(self):
+		"""[(상한, 누적 개수), ...] (마지막 상한은 inf)"""
+		total = 0
+		result = []
+		for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+			total += count
+			result.append((bound, total))
+		return result
+
+	def quantile(self, q: float) -> Optional[float]:
+		"""버킷 내 선형 보간으로 분위수 추정 (관측값이 없으면 None)"""
+		counts = list(self.counts)
+		total = sum(counts)
+		if total == 0:
+			return None
+		rank = q * total
+		seen = 0
+		lower = 0.0
+		for i, count in enumerate(counts):
+			if count and seen + count >= rank:
+				if i == len(self.buckets):
+					# +Inf 버킷 - 마지막 유한 경계로 보고
+					return self.buckets[-1]
+				upper = self.buckets[i]
+				return lower + (upper - lower) * (rank - seen) / count
+			seen += count
+			if i < len(self.buckets):
+				lower = self.buckets[i]
+		return self.buckets[-1]
+
+	def summary(self) -> Dict[str, Optional[float]]:
+		"""JSON 응답용 요약 (ms 단위)"""
+		def ms(value):
+			return None if value is None else round(value * 1000.0, 3)
+
+		return {
+			"count": self.count,
+			"mean_ms": ms(self.sum / self.count) if self.count else None,
+			"p50_ms": ms(self.quantile(0.5)),
+			"p90_ms": ms(self.quantile(0.9)),
+			"p99_ms": ms(self.quantile(0.99)),
+		}
@@ -0,0 +1,300 @@
+"""
+프로세스 내 메트릭 레지스트리 (Prometheus 텍스트 포맷 내보내기)
+
+핫 패스 비용을 최소화하기 위해 카운터/히스토그램은 스레드별 셀에 기록하고 (락 없음),
+스크레이프 시점에만 셀을 합산합니다. 락은 스레드가 처음 기록할 때와 라벨 조합이 처음 생길 때만 잡습니다.
+
+사용 예:
+	from rosota_copilot.observability.metrics import REGISTRY
+
+	BUS_TRANSACTIONS = REGISTRY.counter("rosota_bus_transactions_total", "Bus tasks", ("action",))
+	BUS_TRANSACTIONS.labels("read").inc()
+"""
+import math
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .histogram import DEFAULT_LATENCY_BUCKETS, Histogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+	if value == math.inf:
+		return "+Inf"
+	if value == -math.inf:
+		return "-Inf"
+	if math.isnan(value):
+		return "NaN"
+	if float(value).is_integer():
+		return str(int(value))
+	return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+	return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+	if not labels:
+		return ""
+	return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+class _ThreadCells:
+	"""스레드별 셀 목록 (각 셀은 한 스레드만 쓰므로 락 없이 갱신)"""
+
+	def __init__(self, factory: Callable):
+		self._factory = factory
+		self.local = threading.local()  # 핫 패스는 local.cell을 바로 읽음
+		self._cells: List = []
+		self._lock = threading.Lock()
+
+	def new_cell(self):
+		"""이 스레드의 첫 기록 - 셀 생성/등록"""
+		cell = self._factory()
+		with self._lock:
+			self._cells.append(cell)
+		self.local.cell = cell
+		return cell
+
+	def all(self) -> List:
+		with self._lock:
+			return list(self._cells)
+
+
+class _CounterChild:
+	__slots__ = ("_cells", "_local")
+
+	def __init__(self):
+		self._cells = _ThreadCells(lambda: [0.0])
+		self._local = self._cells.local
+
+	def inc(self, amount: float = 1.0) -> None:
+		try:
+			self._local.cell[0] += amount
+		except AttributeError:
+			self._cells.new_cell()[0] += amount
+
+	def get(self) -> float:
+		return sum(cell[0] for cell in self._cells.all())
+
+
+class _GaugeChild:
+	__slots__ = ("_value", "_function")
+
+	def __init__(self):
+		self._value = 0.0
+		self._function: Optional[Callable[[], float]] = None
+
+	def set(self, value: float) -> None:
+		self._value = value
+
+	def inc(self, amount: float = 1.0) -> None:
+		self._value += amount
+
+	def dec(self, amount: float = 1.0) -> None:
+		self._value -= amount
+
+	def set_function(self, function: Callable[[], float]) -> None:
+		"""스크레이프 시점에 값을 계산 (None을 반환하면 출력하지 않음)"""
+		self._function = function
+
+	def get(self) -> Optional[float]:
+		if self._function is not None:
+			try:
+				return self._function()
+			except Exception:
+				return None
+		return self._value
+
+
+class _HistogramChild:
+	__slots__ = ("_buckets", "_cells", "_local")
+
+	def __init__(self, buckets: Sequence[float]):
+		self._buckets = tuple(buckets)
+		self._cells = _ThreadCells(lambda: Histogram(self._buckets))
+		self._local = self._cells.local
+
+	def observe(self, value: float) -> None:
+		try:
+			hist = self._local.cell
+		except AttributeError:
+			hist = self._cells.new_cell()
+		hist.observe(value)
+
+	def merged(self) -> Histogram:
+		merged = Histogram(self._buckets)
+		for hist in self._cells.all():
+			merged.counts = [a + b for a, b in zip(merged.counts, hist.counts)]
+			merged.count += hist.count
+			merged.sum += hist.sum
+		return merged
+
+
+class _Metric:
+	kind = ""
+
+	def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+		self.name = name
+		self.documentation = documentation
+		self.labelnames = tuple(labelnames)
+		self._children: Dict[Tuple[str, ...], object] = {}
+		self._lookup: Dict[tuple, object] = {}  # 호출자가 넘긴 원래 값 그대로의 키 (str 변환 생략용)
+		self._lock = threading.Lock()
+		# 라벨 없는 메트릭은 자식을 미리 만들어 inc()/observe()가 바로 쓰도록 함
+		self._unlabeled = self.labels() if not self.labelnames else None
+
+	def _new_child(self):
+		raise NotImplementedError
+
+	def labels(self, *values):
+		child = self._lookup.get(values)
+		if child is not None:
+			return child
+		if len(values) != len(self.labelnames):
+			raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+		key = tuple(str(v) for v in values)
+		with self._lock:
+			child = self._children.get(key)
+			if child is None:
+				child = self._children[key] = self._new_child()
+			self._lookup[values] = child
+		return child
+
+	def _items(self):
+		with self._lock:
+			items = list(self._children.items())
+		for key, child in items:
+			yield list(zip(self.labelnames, key)), child
+
+	def render(self) -> List[str]:
+		lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+		for labels, child in self._items():
+			value = child.get()
+			if value is not None:
+				lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+		return lines
+
+
+class Counter(_Metric):
+	"""단조 증가 카운터 (rate()로 초당 값 계산)"""
+
+	kind = "counter"
+
+	def _new_child(self):
+		return _CounterChild()
+
+	def inc(self, amount: float = 1.0) -> None:
+		self._unlabeled.inc(amount)
+
+	def get(self) -> float:
+		return self._unlabeled.get()
+
+
+class Gauge(_Metric):
+	"""현재 값 (직접 set하거나 set_function으로 스크레이프 시 계산)"""
+
+	kind = "gauge"
+
+	def _new_child(self):
+		return _GaugeChild()
+
+	def set(self, value: float) -> None:
+		self._unlabeled.set(value)
+
+	def inc(self, amount: float = 1.0) -> None:
+		self._unlabeled.inc(amount)
+
+	def dec(self, amount: float = 1.0) -> None:
+		self._unlabeled.dec(amount)
+
+	def set_function(self, function: Callable[[], float]) -> None:
+		self._unlabeled.set_function(function)
+
+	def get(self) -> Optional[float]:
+		return self._unlabeled.get()
+
+
+class HistogramMetric(_Metric):
+	"""고정 버킷 히스토그램 (초 단위)"""
+
+	kind = "histogram"
+
+	def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+		self.buckets = tuple(sorted(buckets))
+		super().__init__(name, documentation, labelnames)
+
+	def _new_child(self):
+		return _HistogramChild(self.buckets)
+
+	def observe(self, value: float) -> None:
+		self._unlabeled.observe(value)
+
+	def render(self) -> List[str]:
+		lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+		for labels, child in self._items():
+			hist = child.merged()
+			for bound, count in hist.cumulative():
+				le = labels + [("le", _format_value(bound))]
+				lines.append(f"{self.name}_bucket{_format_labels(le)} {count}")
+			lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(hist.sum)}")
+			lines.append(f"{self.name}_count{_format_labels(labels)} {hist.count}")
+		return lines
+
+
+class MetricsRegistry:
+	"""메트릭 모음 - 같은 이름으로 다시 등록하면 기존 메트릭을 반환"""
+
+	def __init__(self):
+		self._metrics: Dict[str, _Metric] = {}
+		self._collectors: List[Callable[[], None]] = []
+		self._lock = threading.Lock()
+
+	def _register(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+		with self._lock:
+			metric = self._metrics.get(name)
+			if metric is None:
+				metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+			elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+				raise ValueError(f"Metric {name} already registered with a different type or labels")
+			return metric
+
+	def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+		return self._register(Counter, name, documentation, labelnames)
+
+	def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+		return self._register(Gauge, name, documentation, labelnames)
+
+	def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> HistogramMetric:
+		return self._register(HistogramMetric, name, documentation, labelnames, buckets=buckets)
+
+	def get(self, name: str) -> Optional[_Metric]:
+		return self._metrics.get(name)
+
+	def add_collector(self, collector: Callable[[], None]) -> None:
+		"""스크레이프 직전에 호출될 콜백 등록 (기존 상태를 게이지로 옮길 때 사용)"""
+		self._collectors.append(collector)
+
+	def remove_collector(self, collector: Callable[[], None]) -> None:
+		if collector in self._collectors:
+			self._collectors.remove(collector)
+
+	def render(self) -> str:
+		"""Prometheus 텍스트 포맷 (0.0.4)"""
+		for collector in list(self._collectors):
+			try:
+				collector()
+			except Exception as e:
+				print(f"[Metrics] Collector error: {e}")
+		with self._lock:
+			metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+		lines: List[str] = []
+		for metric in metrics:
+			lines.extend(metric.render())
+		return "\n".join(lines) + "\n"
+
+
+# 프로세스 기본 레지스트리 (/metrics가 내보냄)
+REGISTRY = MetricsRegistry()
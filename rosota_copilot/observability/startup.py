@@ -0,0 +1,170 @@
+"""
+시작 시간 프로파일링 (python -m rosota_copilot --profile-startup 또는 ROSOTA_PROFILE_STARTUP=1)
+
+- 모듈 import 시간: sys.meta_path 맨 앞에 타이밍 finder를 넣어 모듈별 누적/자체 실행 시간 측정
+- 초기화 단계: phase() 구간 (uvicorn import, 서버 모듈 import, 앱 생성, lifespan + 소켓 바인드)
+- 지연 import 확인: 서버 모듈 import 직후 LAZY_MODULES 중 이미 불러와진 것이 있으면 보고
+  (단독 확인: python -m rosota_copilot.observability.startup - 새 인터프리터에서 서버만 import, 있으면 종료 코드 1)
+
+PyInstaller 빌드에서도 동작하도록 표준 라이브러리만 사용합니다.
+"""
+import importlib.abc
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 서버 import 시 불러오면 안 되는 무거운 모듈 (버스 연결/기록 처리 등 처음 쓸 때 import)
+LAZY_MODULES = ("numpy", "scservo_sdk", "serial", "pyarrow")
+
+
+def eager_imports(modules: Sequence[str] = LAZY_MODULES) -> List[str]:
+	"""이미 import된 지연 대상 모듈"""
+	return [name for name in modules if name in sys.modules]
+
+
+def check_lazy_imports(target: str = "rosota_copilot.server") -> List[str]:
+	"""새 인터프리터에서 target만 import했을 때 함께 불러와진 지연 대상 모듈 (빈 리스트면 통과)"""
+	import subprocess
+
+	code = (
+		f"import sys, {target}; "
+		f"print('LAZY_CHECK:' + ','.join(m for m in {tuple(LAZY_MODULES)!r} if m in sys.modules))"
+	)
+	result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+	for line in result.stdout.splitlines():
+		if line.startswith("LAZY_CHECK:"):
+			return [name for name in line[len("LAZY_CHECK:"):].split(",") if name]
+	raise RuntimeError(f"Lazy import check produced no result: {result.stdout[-200:]}")
+
+
+class _TimedLoader(importlib.abc.Loader):
+	"""원래 로더를 감싸 exec_module 시간만 측정 (실행 후 원래 로더로 되돌림)"""
+
+	def __init__(self, loader, profiler: "StartupProfiler"):
+		self._loader = loader
+		self._profiler = profiler
+
+	def create_module(self, spec):
+		return self._loader.create_module(spec)
+
+	def exec_module(self, module):
+		name = module.__name__
+		self._profiler._enter()
+		try:
+			self._loader.exec_module(module)
+		finally:
+			self._profiler._exit(name)
+			module.__loader__ = self._loader
+			if module.__spec__ is not None:
+				module.__spec__.loader = self._loader
+
+	def __getattr__(self, name):
+		return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+	def __init__(self, profiler: "StartupProfiler"):
+		self._profiler = profiler
+
+	def find_spec(self, fullname, path, target=None):
+		for finder in sys.meta_path:
+			if finder is self:
+				continue
+			find_spec = getattr(finder, "find_spec", None)
+			if find_spec is None:
+				continue
+			spec = find_spec(fullname, path, target)
+			if spec is not None:
+				break
+		else:
+			return None
+		if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+			spec.loader = _TimedLoader(spec.loader, self._profiler)
+		return spec
+
+
+class StartupProfiler:
+	"""import/초기화 시간 수집 및 보고"""
+
+	def __init__(self):
+		self.started = time.perf_counter()
+		self.phases: List[Tuple[str, float, float]] = []  # (이름, 시작 오프셋, 소요 시간)
+		self.imports: Dict[str, Tuple[float, float]] = {}  # 모듈 -> (누적, 자체)
+		self._stack: List[List[float]] = []  # [시작 시각, 하위 import 누적 시간]
+		self._finder: Optional[_TimingFinder] = None
+		self.eager: List[str] = []  # 서버 import 직후 이미 불러와진 지연 대상 모듈
+
+	def install(self) -> None:
+		"""이후 import되는 모듈의 실행 시간 측정 시작"""
+		if self._finder is None:
+			self._finder = _TimingFinder(self)
+			sys.meta_path.insert(0, self._finder)
+
+	def uninstall(self) -> None:
+		if self._finder is not None and self._finder in sys.meta_path:
+			sys.meta_path.remove(self._finder)
+		self._finder = None
+
+	def _enter(self) -> None:
+		self._stack.append([time.perf_counter(), 0.0])
+
+	def _exit(self, name: str) -> None:
+		start, children = self._stack.pop()
+		total = time.perf_counter() - start
+		self.imports[name] = (total, total - children)
+		if self._stack:
+			self._stack[-1][1] += total
+
+	@contextmanager
+	def phase(self, name: str):
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.phases.append((name, start - self.started, time.perf_counter() - start))
+
+	def check_lazy(self) -> None:
+		"""서버 모듈 import 직후 호출 - 지연 대상 모듈이 이미 불러와졌으면 보고서에 표시"""
+		self.eager = eager_imports()
+
+	def mark(self, name: str) -> None:
+		"""시작 이후 경과 시간만 기록 (예: 리스닝 시작)"""
+		self.phases.append((name, time.perf_counter() - self.started, 0.0))
+
+	def report(self, top: int = 15) -> str:
+		lines = ["", "=" * 60, "Startup profile", "=" * 60]
+		for name, offset, duration in self.phases:
+			if duration:
+				lines.append(f"  {name:<40} {duration * 1000:8.1f} ms  (at {offset * 1000:7.1f} ms)")
+			else:
+				lines.append(f"  {name:<40} {'':8}     at {offset * 1000:7.1f} ms")
+
+		if self.eager:
+			lines.append("")
+			lines.append(f"  WARNING: imported eagerly by the server module (should load on first use): {', '.join(self.eager)}")
+
+		if self.imports:
+			packages: Dict[str, float] = {}
+			for name, (_total, self_time) in self.imports.items():
+				root = name.split(".")[0]
+				packages[root] = packages.get(root, 0.0) + self_time
+			lines.append("")
+			lines.append(f"Imports by top-level package (self time, {len(self.imports)} modules)")
+			for root, self_time in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+				lines.append(f"  {root:<40} {self_time * 1000:8.1f} ms")
+			lines.append("")
+			lines.append("Slowest modules (self time / cumulative)")
+			slowest = sorted(self.imports.items(), key=lambda item: -item[1][1])[:top]
+			for name, (total, self_time) in slowest:
+				lines.append(f"  {name:<40} {self_time * 1000:8.1f} ms / {total * 1000:8.1f} ms")
+		lines.append("=" * 60)
+		return "\n".join(lines)
+
+
+if __name__ == "__main__":
+	eager = check_lazy_imports()
+	if eager:
+		print(f"[Startup] rosota_copilot.server imports {', '.join(eager)} eagerly")
+		raise SystemExit(1)
+	print(f"[Startup] rosota_copilot.server does not import {', '.join(LAZY_MODULES)}")
@@ -0,0 +1,224 @@
+"""
+키보드 명령 지연 추적 (브라우저 keydown → 서버 수신 → 컨트롤러 처리 → 버스 큐 대기 → 시리얼 전송 → 움직임이 보이는 텔레메트리)
+
+명령 ID(클라이언트 trace_id + sid)로 구간을 이어 붙이고, 구간별 히스토그램과 최근 트레이스를 보관합니다.
+
+구간 (초):
+	network     서버 수신(time.time) - 클라이언트 전송 시각 (브라우저/서버 시계 차이가 포함됨)
+	dispatch    컨트롤러 처리 완료 - 서버 수신 (이벤트 루프 + handle_key_event)
+	jog_wait    버스 쓰기 요청 - 컨트롤러 처리 완료 (다음 조그 틱까지 대기)
+	bus_queue   버스 워커가 작업을 꺼낸 시각 - 요청 시각 (다른 읽기/쓰기 뒤에서 대기)
+	serial      시리얼 전송 완료 - 워커 시작
+	telemetry   움직임이 보이는 첫 스냅샷 - 시리얼 전송 완료
+	server_total  움직임이 보이는 첫 스냅샷 - 서버 수신
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from .histogram import Histogram
+
+STAGES = ("network", "dispatch", "jog_wait", "bus_queue", "serial", "telemetry", "server_total")
+
+
+class CommandTrace:
+	"""명령 하나의 구간 시각 (server_* / bus_* / motion_seen은 time.monotonic 기준)"""
+
+	__slots__ = (
+		"trace_id", "key", "joint", "client_send", "server_recv_wall", "server_recv", "handled",
+		"bus_submitted", "bus_started", "bus_finished", "motion_seen", "status", "baseline",
+	)
+
+	def __init__(self, trace_id: str, key: str, joint: Optional[int], client_send: Optional[float]):
+		self.trace_id = trace_id
+		self.key = key
+		self.joint = joint
+		self.client_send = client_send  # 클라이언트 시각 (unix 초)
+		self.server_recv_wall = time.time()
+		self.server_recv = time.monotonic()
+		self.handled: Optional[float] = None
+		self.bus_submitted: Optional[float] = None
+		self.bus_started: Optional[float] = None
+		self.bus_finished: Optional[float] = None
+		self.motion_seen: Optional[float] = None
+		self.status = "pending"
+		self.baseline: Optional[float] = None  # 시작 시점 조인트 위치 (움직임 판별용)
+
+	def stages(self) -> Dict[str, float]:
+		"""측정된 구간만 반환 (초)"""
+		def span(end, start):
+			if end is None or start is None:
+				return None
+			return max(0.0, end - start)
+
+		stages = {
+			"network": span(self.server_recv_wall, self.client_send),
+			"dispatch": span(self.handled, self.server_recv),
+			"jog_wait": span(self.bus_submitted, self.handled),
+			"bus_queue": span(self.bus_started, self.bus_submitted),
+			"serial": span(self.bus_finished, self.bus_started),
+			"telemetry": span(self.motion_seen, self.bus_finished),
+			"server_total": span(self.motion_seen, self.server_recv),
+		}
+		return {name: value for name, value in stages.items() if value is not None}
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			"trace_id": self.trace_id,
+			"key": self.key,
+			"joint": self.joint,
+			"status": self.status,
+			"server_recv": self.server_recv_wall,
+			"stages_ms": {name: round(value * 1000.0, 3) for name, value in self.stages().items()},
+		}
+
+
+class CommandTracer:
+	"""
+	명령 지연 추적기
+
+	- begin/handled: Socket.IO 핸들러 (이벤트 루프)
+	- on_bus_write: 조그 스레드 (버스 쓰기 직후, 이 쓰기에 포함된 조인트의 대기 트레이스만 연결)
+	- on_snapshot: StatePublisher 리스너 (움직임이 보이면 완료)
+	timeout 안에 움직임이 보이지 않으면 status="timeout"으로 기록 (측정된 구간만 히스토그램에 반영)
+	세 스레드가 함께 쓰므로 대기 목록/히스토그램/최근 트레이스는 모두 _lock 안에서만 갱신
+	"""
+
+	def __init__(self, publisher=None, max_traces: int = 200, timeout: float = 1.0, motion_threshold: float = 0.1):
+		self.publisher = publisher
+		self.timeout = timeout
+		self.motion_threshold = motion_threshold  # deg
+		self.histograms: Dict[str, Histogram] = {stage: Histogram() for stage in STAGES}
+		self._lock = threading.Lock()
+		self._awaiting_bus: List[CommandTrace] = []
+		self._awaiting_motion: List[CommandTrace] = []
+		self._recent: deque = deque(maxlen=max_traces)
+		self.completed = 0
+		self.timed_out = 0
+
+	def start(self) -> None:
+		if self.publisher is not None:
+			self.publisher.add_listener(self.on_snapshot)
+
+	def stop(self) -> None:
+		if self.publisher is not None:
+			self.publisher.remove_listener(self.on_snapshot)
+
+	def _joint_position(self, snapshot, joint: int) -> Optional[float]:
+		if snapshot is None:
+			return None
+		positions = snapshot.state.get("joint_positions") or ()
+		return positions[joint] if joint < len(positions) else None
+
+	def begin(self, trace_id: str, key: str, client_ts_ms: Optional[float] = None, joint: Optional[int] = None) -> CommandTrace:
+		"""
+		서버 수신 시 호출 (joint가 있으면 조그 명령으로 보고 버스 쓰기를 기다림)
+		handle_key_event 전에 등록해야 처리 직후의 첫 조그 틱을 놓치지 않음
+		"""
+		client_send = client_ts_ms / 1000.0 if client_ts_ms else None
+		trace = CommandTrace(trace_id, key, joint, client_send)
+		if joint is not None:
+			trace.baseline = self._joint_position(self.publisher.latest if self.publisher else None, joint)
+			with self._lock:
+				self._awaiting_bus.append(trace)
+		return trace
+
+	def handled(self, trace: CommandTrace, result: Optional[Dict]) -> None:
+		"""컨트롤러 처리 완료 - 조그 시작이 아니면 여기서 트레이스 종료"""
+		trace.handled = time.monotonic()
+		if result and result.get("action") == "jog_start":
+			return
+		with self._lock:
+			if trace in self._awaiting_bus:
+				self._awaiting_bus.remove(trace)
+			if trace in self._awaiting_motion:
+				self._awaiting_motion.remove(trace)
+			self._finish(trace, "ok")
+
+	def on_bus_write(self, timing=None, joints: Optional[Iterable[int]] = None) -> None:
+		"""
+		조그 쓰기 완료 (조그 스레드에서 호출)
+		timing: 버스의 last_task_timing (submitted, started, finished) - 없으면 지금 시각만 기록
+		joints: 이 쓰기에 포함된 조인트 (None이면 모든 대기 트레이스, 조인트가 없는 트레이스는 항상 연결)
+		"""
+		if not self._awaiting_bus:
+			return
+		written = None if joints is None else set(joints)
+		with self._lock:
+			waiting = []
+			for trace in self._awaiting_bus:
+				if written is not None and trace.joint is not None and trace.joint not in written:
+					# 다른 조인트의 명령 - 그 조인트가 실제로 쓰일 때까지 대기
+					waiting.append(trace)
+					continue
+				if timing is not None:
+					trace.bus_submitted, trace.bus_started, trace.bus_finished = timing
+				else:
+					trace.bus_finished = time.monotonic()
+				self._awaiting_motion.append(trace)
+			self._awaiting_bus = waiting
+
+	def on_snapshot(self, snapshot) -> None:
+		"""StatePublisher 리스너 - 쓰기 이후에 시작된 읽기에서 조인트가 움직였으면 완료"""
+		if not self._awaiting_motion and not self._awaiting_bus:
+			return
+		read_started = snapshot.monotonic - snapshot.read_duration
+		done: List[CommandTrace] = []
+		with self._lock:
+			for trace in list(self._awaiting_motion):
+				if read_started < trace.bus_finished:
+					continue
+				position = self._joint_position(snapshot, trace.joint)
+				if position is None:
+					continue
+				if trace.baseline is None or abs(position - trace.baseline) >= self.motion_threshold:
+					trace.motion_seen = snapshot.monotonic
+					self._awaiting_motion.remove(trace)
+					done.append(trace)
+			for trace in done:
+				self._finish(trace, "ok")
+			for trace in self._expire(snapshot.monotonic):
+				self._finish(trace, "timeout")
+
+	def _expire(self, now: float) -> List[CommandTrace]:
+		"""timeout이 지난 대기 트레이스 제거 (락을 잡은 상태에서 호출)"""
+		expired = [t for t in self._awaiting_bus + self._awaiting_motion if now - t.server_recv > self.timeout]
+		if expired:
+			self._awaiting_bus = [t for t in self._awaiting_bus if t not in expired]
+			self._awaiting_motion = [t for t in self._awaiting_motion if t not in expired]
+		return expired
+
+	def _finish(self, trace: CommandTrace, status: str) -> None:
+		"""히스토그램/최근 목록에 반영 (락을 잡은 상태에서 호출)"""
+		trace.status = status
+		for name, value in trace.stages().items():
+			self.histograms[name].observe(value)
+		if status == "timeout":
+			self.timed_out += 1
+		else:
+			self.completed += 1
+		self._recent.append(trace)
+
+	def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+		"""최근 완료된 트레이스 (최신순)"""
+		with self._lock:
+			traces = list(self._recent)[-limit:]
+		return [trace.to_dict() for trace in reversed(traces)]
+
+	def summary(self) -> Dict[str, Any]:
+		with self._lock:
+			return {
+				"completed": self.completed,
+				"timed_out": self.timed_out,
+				"pending": len(self._awaiting_bus) + len(self._awaiting_motion),
+				"stages": {name: hist.summary() for name, hist in self.histograms.items()},
+			}
+
+	def reset(self) -> None:
+		with self._lock:
+			self._recent.clear()
+			for hist in self.histograms.values():
+				hist.reset()
+			self.completed = 0
+			self.timed_out = 0
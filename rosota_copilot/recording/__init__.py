@@ -0,0 +1,26 @@
+"""
+동작 기록 저장 포맷/도구
+"""
+from .format import (
+	RECORD_FORMAT_VERSION,
+	RECORD_SUFFIX,
+	RecordingReader,
+	RecordingWriter,
+	convert,
+	export_json,
+	recover,
+	to_record_dict,
+)
+from .memmap import MappedRecording
+
+__all__ = [
+	"RECORD_FORMAT_VERSION",
+	"RECORD_SUFFIX",
+	"MappedRecording",
+	"RecordingReader",
+	"RecordingWriter",
+	"convert",
+	"export_json",
+	"recover",
+	"to_record_dict",
+]
@@ -0,0 +1,205 @@
+"""
+고정 주기 상태 캡처 (기록용)
+
+캡처 스레드는 perf_counter_ns 절대 시각 격자에 맞춰 조인트 위치를 읽고 미리 할당한 링 버퍼에 넣기만 합니다.
+링에서 RecordingWriter로 옮기는 일(청크 복사/파일 쓰기)은 드레인 스레드가 맡으므로
+UI/API 트래픽이나 디스크 지연이 샘플 간격에 영향을 주지 않습니다.
+
+통계:
+	dropped       읽기가 주기를 넘겨 건너뛴 틱 수
+	read_failures 버스 읽기 실패 수
+	overflows     드레인이 밀려 링이 가득 차 버린 샘플 수
+	jitter        예정 시각 대비 읽기 시작 지연 분포
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from ..observability.histogram import Histogram
+from ..observability.metrics import REGISTRY
+
+MIN_CAPTURE_RATE_HZ = 30.0
+MAX_CAPTURE_RATE_HZ = 200.0
+
+# 10us ~ 50ms
+JITTER_BUCKETS = (
+	0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+)
+
+CAPTURE_DROPPED = REGISTRY.counter("rosota_recorder_dropped_samples_total", "Capture ticks skipped or lost", ("reason",))
+CAPTURE_JITTER = REGISTRY.histogram("rosota_recorder_capture_jitter_seconds", "Capture start delay vs schedule", buckets=JITTER_BUCKETS)
+
+
+def clamp_rate(rate_hz: float) -> float:
+	return max(MIN_CAPTURE_RATE_HZ, min(MAX_CAPTURE_RATE_HZ, float(rate_hz)))
+
+
+class CaptureThread:
+	"""
+	Args:
+		read_positions: 조인트 위치 읽기 함수 (실패 시 None)
+		writer: recording.RecordingWriter
+		rate_hz: 캡처 주기 (30~200Hz로 제한)
+		action_source: 틱마다 호출해 명령 목표 위치를 얻는 함수 (writer에 actions 컬럼이 있을 때만)
+		ring_seconds: 링 버퍼 길이 (드레인이 이만큼 밀려야 샘플 손실)
+		on_samples: 드레인할 때마다 추가된 행 수로 호출 (메트릭 등)
+	"""
+
+	DRAIN_INTERVAL = 0.05
+
+	def __init__(
+		self,
+		read_positions: Callable[[], Optional[Sequence[float]]],
+		writer,
+		rate_hz: float = 100.0,
+		action_source: Optional[Callable[[], Optional[Sequence[float]]]] = None,
+		ring_seconds: float = 2.0,
+		on_samples: Optional[Callable[[int], None]] = None,
+	):
+		self.read_positions = read_positions
+		self.writer = writer
+		self.rate_hz = clamp_rate(rate_hz)
+		self.period_ns = int(round(1e9 / self.rate_hz))
+		self.action_source = action_source if "actions" in writer.columns else None
+		self.on_samples = on_samples
+
+		# 링 버퍼 (단일 생산자/단일 소비자 - head는 캡처 스레드만, tail은 드레인 스레드만 갱신)
+		capacity = max(64, int(self.rate_hz * ring_seconds))
+		num_joints = writer.num_joints
+		self.capacity = capacity
+		self._ts = np.zeros(capacity, np.int64)
+		self._positions = np.full((capacity, num_joints), np.nan, np.float32)
+		self._actions = np.full((capacity, num_joints), np.nan, np.float32) if self.action_source else None
+		self._head = 0
+		self._tail = 0
+
+		self.samples = 0
+		self.dropped = 0
+		self.read_failures = 0
+		self.overflows = 0
+		self.jitter = Histogram(JITTER_BUCKETS)
+		self.max_jitter = 0.0
+		self.start_ns: Optional[int] = None
+		self.stop_ns: Optional[int] = None
+
+		self._stop_event = threading.Event()
+		self._capture_thread: Optional[threading.Thread] = None
+		self._drain_thread: Optional[threading.Thread] = None
+
+	@property
+	def running(self) -> bool:
+		return self._capture_thread is not None and self._capture_thread.is_alive()
+
+	def start(self) -> None:
+		self.start_ns = time.perf_counter_ns()
+		self.stop_ns = None
+		self._stop_event.clear()
+		self._capture_thread = threading.Thread(target=self._capture_loop, name="recorder-capture", daemon=True)
+		self._drain_thread = threading.Thread(target=self._drain_loop, name="recorder-drain", daemon=True)
+		self._capture_thread.start()
+		self._drain_thread.start()
+
+	def stop(self) -> None:
+		"""캡처 중지 후 링에 남은 샘플을 writer로 옮김"""
+		self._stop_event.set()
+		self.stop_ns = time.perf_counter_ns()
+		for thread in (self._capture_thread, self._drain_thread):
+			if thread is not None:
+				thread.join()
+		self._capture_thread = None
+		self._drain_thread = None
+		self._drain()
+
+	def _capture_loop(self) -> None:
+		period = self.period_ns
+		next_tick = self.start_ns
+		perf_counter_ns = time.perf_counter_ns
+		while not self._stop_event.is_set():
+			now = perf_counter_ns()
+			if now < next_tick:
+				time.sleep((next_tick - now) / 1e9)
+				continue
+
+			lateness = (now - next_tick) / 1e9
+			self.jitter.observe(lateness)
+			CAPTURE_JITTER.observe(lateness)
+			if lateness > self.max_jitter:
+				self.max_jitter = lateness
+
+			try:
+				positions = self.read_positions()
+			except Exception as e:
+				print(f"[Recorder] Capture read error: {e}")
+				positions = None
+			# 읽기 구간의 중간 시각을 샘플 시각으로 사용
+			sampled = (now + perf_counter_ns()) // 2
+
+			if positions is None:
+				self.read_failures += 1
+				CAPTURE_DROPPED.labels("read_failure").inc()
+			elif self._head - self._tail >= self.capacity:
+				self.overflows += 1
+				CAPTURE_DROPPED.labels("overflow").inc()
+			else:
+				slot = self._head % self.capacity
+				self._ts[slot] = sampled - self.start_ns
+				count = min(len(positions), self._positions.shape[1])
+				self._positions[slot, :count] = positions[:count]
+				if self._actions is not None:
+					action = self.action_source()
+					if action is None:
+						self._actions[slot] = np.nan
+					else:
+						count = min(len(action), self._actions.shape[1])
+						self._actions[slot, :count] = action[:count]
+				self._head += 1
+				self.samples += 1
+
+			# 다음 틱 (격자 유지 - 읽기가 주기를 넘기면 놓친 틱은 건너뛰고 dropped로 집계)
+			next_tick += period
+			now = perf_counter_ns()
+			if next_tick <= now:
+				missed = (now - next_tick) // period + 1
+				self.dropped += missed
+				CAPTURE_DROPPED.labels("overrun").inc(missed)
+				next_tick += missed * period
+
+	def _drain(self) -> None:
+		head = self._head
+		tail = self._tail
+		if head == tail:
+			return
+		slots = np.arange(tail, head) % self.capacity
+		actions = self._actions[slots] if self._actions is not None else None
+		self.writer.append_block(self._ts[slots] / 1e9, self._positions[slots], actions=actions)
+		self._tail = head
+		if self.on_samples is not None:
+			self.on_samples(head - tail)
+
+	def _drain_loop(self) -> None:
+		while not self._stop_event.wait(self.DRAIN_INTERVAL):
+			try:
+				self._drain()
+			except Exception as e:
+				print(f"[Recorder] Capture drain error: {e}")
+
+	def stats(self) -> Dict:
+		"""캡처 통계 (JSON 응답용)"""
+		end_ns = self.stop_ns or time.perf_counter_ns()
+		elapsed = (end_ns - self.start_ns) / 1e9 if self.start_ns is not None else 0.0
+		expected = self.samples + self.dropped + self.read_failures + self.overflows
+		return {
+			"rate_hz": self.rate_hz,
+			"elapsed": round(elapsed, 3),
+			"samples": self.samples,
+			"effective_rate_hz": round(self.samples / elapsed, 2) if elapsed > 0 else 0.0,
+			"dropped": self.dropped,
+			"read_failures": self.read_failures,
+			"overflows": self.overflows,
+			"drop_ratio": round(1.0 - self.samples / expected, 5) if expected else 0.0,
+			"jitter": {**self.jitter.summary(), "max_ms": round(self.max_jitter * 1000.0, 3)},
+			"ring_fill": self._head - self._tail,
+			"ring_capacity": self.capacity,
+		}
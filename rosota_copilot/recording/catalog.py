@@ -0,0 +1,241 @@
+"""
+기록 카탈로그 (RECORD_DIR/catalog.json)
+
+기록 목록을 볼 때마다 파일을 열어 메타데이터를 읽는 대신, 파일별 메타데이터를 매니페스트에 보관합니다.
+- 저장/삭제 시 Recorder가 update()/remove() 호출
+- 디렉토리 mtime이 바뀐 경우에만 디렉토리를 다시 훑어 추가/삭제된 파일 반영 (stat만, 내용은 읽지 않음)
+- 반환하는 페이지의 항목만 mtime/size로 검증하고, 다르면 그 파일만 다시 읽음
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .format import RECORD_SUFFIX, RecordingReader
+
+CATALOG_FILENAME = "catalog.json"
+CATALOG_VERSION = 1
+
+SORT_KEYS = ("created_at", "duration", "num_steps", "size", "filename")
+
+
+def _is_record(name: str) -> bool:
+	return name.startswith("record_") and (name.endswith(RECORD_SUFFIX) or name.endswith(".json"))
+
+
+def read_metadata(path: Path) -> Dict[str, Any]:
+	"""기록 파일 메타데이터 (.rec는 헤더/푸터만, 기존 JSON은 파일 전체를 읽음)"""
+	if path.suffix == RECORD_SUFFIX:
+		return RecordingReader(path).metadata
+	with open(path, "r", encoding="utf-8") as f:
+		return json.load(f).get("metadata", {})
+
+
+class RecordCatalog:
+	"""
+	Args:
+		record_dir: 기록 디렉토리 (catalog.json도 여기에 저장)
+	"""
+
+	def __init__(self, record_dir: Path):
+		self.record_dir = Path(record_dir)
+		self.path = self.record_dir / CATALOG_FILENAME
+		self._entries: Dict[str, Dict[str, Any]] = {}
+		self._dir_mtime: Optional[float] = None
+		self._loaded = False
+		self._lock = threading.RLock()
+		self.active: Optional[str] = None  # 기록 중인 파일 이름 (목록/스캔에서 제외)
+
+	# ---- 저장/로드 ----
+
+	def _load(self) -> None:
+		self._loaded = True
+		try:
+			with open(self.path, "r", encoding="utf-8") as f:
+				data = json.load(f)
+		except (OSError, ValueError):
+			return
+		if data.get("version") != CATALOG_VERSION:
+			return
+		self._entries = {entry["filename"]: entry for entry in data.get("records", [])}
+		self._dir_mtime = data.get("dir_mtime")
+
+	def _save(self) -> None:
+		# 임시 파일에 쓴 뒤 교체 (쓰는 중 종료되어도 이전 카탈로그 유지)
+		data = {
+			"version": CATALOG_VERSION,
+			"dir_mtime": self._dir_mtime,
+			"records": list(self._entries.values()),
+		}
+		tmp_path = self.path.with_suffix(".json.tmp")
+		before = self._dir_stat_mtime()
+		try:
+			with open(tmp_path, "w", encoding="utf-8") as f:
+				json.dump(data, f)
+			os.replace(tmp_path, self.path)
+		except OSError as e:
+			print(f"[Recorder] Failed to save record catalog: {e}")
+			return
+		# catalog.json 교체로 바뀐 디렉토리 mtime은 다시 훑을 필요 없음 (그 사이 다른 변경이 없었을 때만)
+		if before is not None and before == self._dir_mtime:
+			self._dir_mtime = self._dir_stat_mtime()
+
+	def _entry(self, path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+		try:
+			metadata = read_metadata(path)
+		except Exception as e:
+			print(f"[Recorder] Failed to read record metadata: {e}")
+			return None
+		return {
+			"filename": path.name,
+			"filepath": str(path),
+			"mode": metadata.get("mode", "unknown"),
+			"created_at": metadata.get("created_at", ""),
+			"duration": metadata.get("duration", 0.0),
+			"num_steps": metadata.get("num_steps", 0),
+			"sample_rate_hz": metadata.get("sample_rate_hz"),
+			"incomplete": bool(metadata.get("incomplete", False)),
+			"size": stat.st_size,
+			"mtime": stat.st_mtime,
+		}
+
+	def _dir_stat_mtime(self) -> Optional[float]:
+		try:
+			return self.record_dir.stat().st_mtime
+		except OSError:
+			return None
+
+	def _refresh(self) -> bool:
+		"""디렉토리가 바뀌었으면 추가/삭제/변경된 파일 반영 (카탈로그를 다시 저장해야 하면 True)"""
+		if not self._loaded:
+			self._load()
+		dir_mtime = self._dir_stat_mtime()
+		if dir_mtime is None:
+			changed = bool(self._entries)
+			self._entries = {}
+			return changed
+		if dir_mtime == self._dir_mtime:
+			return False
+
+		seen = set()
+		with os.scandir(self.record_dir) as it:
+			for dir_entry in it:
+				if not _is_record(dir_entry.name) or dir_entry.name == self.active or not dir_entry.is_file():
+					continue
+				seen.add(dir_entry.name)
+				stat = dir_entry.stat()
+				cached = self._entries.get(dir_entry.name)
+				if cached is not None and cached["size"] == stat.st_size and cached["mtime"] == stat.st_mtime:
+					continue
+				entry = self._entry(Path(dir_entry.path), stat)
+				if entry is not None:
+					self._entries[dir_entry.name] = entry
+		for name in list(self._entries):
+			if name not in seen:
+				del self._entries[name]
+		self._dir_mtime = dir_mtime
+		return True
+
+	def _validate(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+		"""페이지 항목 검증 - mtime/size가 다르면 다시 읽기, 파일이 없으면 None"""
+		path = self.record_dir / entry["filename"]
+		try:
+			stat = path.stat()
+		except OSError:
+			self._entries.pop(entry["filename"], None)
+			return None
+		if stat.st_size == entry["size"] and stat.st_mtime == entry["mtime"]:
+			return entry
+		fresh = self._entry(path, stat)
+		if fresh is None:
+			self._entries.pop(entry["filename"], None)
+		else:
+			self._entries[entry["filename"]] = fresh
+		return fresh
+
+	# ---- 갱신 ----
+
+	def update(self, path: Path) -> None:
+		"""저장된 기록 반영"""
+		path = Path(path)
+		with self._lock:
+			if not self._loaded:
+				self._load()
+			try:
+				stat = path.stat()
+			except OSError:
+				return
+			entry = self._entry(path, stat)
+			if entry is not None:
+				self._entries[path.name] = entry
+			self._refresh()
+			self._save()
+
+	def remove(self, path: Path) -> None:
+		"""삭제된 기록 반영"""
+		with self._lock:
+			if not self._loaded:
+				self._load()
+			self._entries.pop(Path(path).name, None)
+			self._refresh()
+			self._save()
+
+	# ---- 조회 ----
+
+	def query(
+		self,
+		offset: int = 0,
+		limit: Optional[int] = None,
+		sort: str = "created_at",
+		descending: bool = True,
+		mode: Optional[str] = None,
+		min_duration: Optional[float] = None,
+		max_duration: Optional[float] = None,
+		since: Optional[str] = None,
+		until: Optional[str] = None,
+	) -> Dict[str, Any]:
+		"""
+		기록 목록 조회
+
+		Args:
+			offset/limit: 페이지 (limit=None이면 전체)
+			sort: SORT_KEYS 중 하나
+			descending: 내림차순 여부
+			mode: 기록 모드 필터
+			min_duration/max_duration: 길이 필터 (초)
+			since/until: created_at 범위 (ISO 8601 문자열 또는 날짜 "YYYY-MM-DD", until은 포함)
+
+		Returns:
+			{"total": 필터 후 전체 개수, "records": 페이지 항목}
+		"""
+		if sort not in SORT_KEYS:
+			raise ValueError(f"Invalid sort key: {sort}")
+		with self._lock:
+			changed = self._refresh()
+			entries = [e for e in self._entries.values() if e["filename"] != self.active]
+			if mode:
+				entries = [e for e in entries if e["mode"] == mode]
+			if min_duration is not None:
+				entries = [e for e in entries if e["duration"] >= min_duration]
+			if max_duration is not None:
+				entries = [e for e in entries if e["duration"] <= max_duration]
+			if since:
+				entries = [e for e in entries if e["created_at"] >= since]
+			if until:
+				# 날짜만 주면 그 날 전체 포함
+				bound = until + "T99" if len(until) == 10 else until
+				entries = [e for e in entries if e["created_at"] <= bound]
+			entries.sort(key=lambda e: (e[sort], e["filename"]), reverse=descending)
+
+			total = len(entries)
+			end = None if limit is None else offset + limit
+			page = []
+			for entry in entries[offset:end]:
+				valid = self._validate(entry)
+				if valid is not None:
+					page.append(valid)
+				changed = changed or valid is not entry
+			if changed:
+				self._save()
+		return {"total": total, "records": page}
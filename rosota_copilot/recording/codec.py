@@ -0,0 +1,85 @@
+"""
+압축 청크 코덱 (.rec format version 2)
+
+청크 payload를 다음 순서로 만든 뒤 zlib 또는 lzma로 한 번에 압축합니다.
+	timestamp    청크 t_first 기준 마이크로초 정수의 행간 차분 (int32)
+	컬럼마다     u8 NaN 플래그 (+ 플래그가 1이면 packbits NaN 마스크),
+	             서보 분해능(4096 스텝/회전)으로 양자화한 값의 조인트별 행간 차분 (int32, 조인트 우선 배치)
+int32 배열은 바이트 단위로 전치(하위 바이트끼리 모음)해 저장하므로 작은 차분의 0x00/0xFF 바이트가 길게 이어집니다.
+
+양자화 오차는 최대 360/4096/2 ≈ 0.044°, timestamp는 0.5us입니다.
+디코딩은 청크마다 압축 해제 + cumsum 몇 번뿐이라 조인트/행 수와 무관하게 NumPy 벡터 연산으로 끝납니다.
+"""
+import lzma
+import zlib
+from typing import Callable, Dict, Sequence, Tuple
+
+import numpy as np
+
+CODEC_NAME = "delta-q12"
+STEPS_PER_TURN = 4096
+STEPS_PER_DEGREE = STEPS_PER_TURN / 360.0
+TIME_RESOLUTION = 1e-6
+
+COMPRESSORS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+	"zlib": (lambda data: zlib.compress(data, 6), zlib.decompress),
+	"lzma": (lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+
+
+def check_compression(compression: str) -> str:
+	if compression not in COMPRESSORS:
+		raise ValueError(f"Unknown recording compression: {compression} (use {', '.join(COMPRESSORS)})")
+	return compression
+
+
+def _shuffle(values: np.ndarray) -> bytes:
+	"""int32 배열 → 바이트 평면별로 모은 bytes"""
+	return np.ascontiguousarray(values, dtype="<i4").view(np.uint8).reshape(-1, 4).T.tobytes()
+
+
+def _unshuffle(raw: bytes, pos: int, count: int) -> np.ndarray:
+	planes = np.frombuffer(raw, np.uint8, count * 4, pos).reshape(4, count)
+	return np.ascontiguousarray(planes.T).view("<i4").reshape(count)
+
+
+def encode_chunk(buffer: Dict[str, np.ndarray], rows: int, columns: Sequence[str], compression: str) -> bytes:
+	"""청크 버퍼 ({"timestamp": (>=rows,), 컬럼: (>=rows, J)}) → 압축 payload"""
+	timestamps = np.asarray(buffer["timestamp"][:rows], dtype=np.float64)
+	ticks = np.round((timestamps - timestamps[0]) / TIME_RESOLUTION).astype(np.int64)
+	parts = [_shuffle(np.diff(ticks, prepend=0))]
+	for name in columns:
+		values = buffer[name][:rows]
+		mask = np.isnan(values)
+		if mask.any():
+			parts.append(b"\x01")
+			parts.append(np.packbits(mask.T.reshape(-1)).tobytes())
+			values = np.where(mask, 0.0, values)
+		else:
+			parts.append(b"\x00")
+		steps = np.round(values.T.astype(np.float64) * STEPS_PER_DEGREE).astype(np.int64)
+		parts.append(_shuffle(np.diff(steps, axis=1, prepend=0)))
+	return COMPRESSORS[compression][0](b"".join(parts))
+
+
+def decode_chunk(payload: bytes, rows: int, num_joints: int, columns: Sequence[str], compression: str, t_first: float) -> Dict[str, np.ndarray]:
+	"""압축 payload → {"timestamp": f64 (rows,), 컬럼: f32 (rows, J)}"""
+	raw = COMPRESSORS[compression][1](payload)
+	out = {"timestamp": t_first + np.cumsum(_unshuffle(raw, 0, rows), dtype=np.int64) * TIME_RESOLUTION}
+	pos = rows * 4
+	width = rows * num_joints
+	for name in columns:
+		mask = None
+		if raw[pos]:
+			mask_len = (width + 7) // 8
+			mask = np.unpackbits(np.frombuffer(raw, np.uint8, mask_len, pos + 1), count=width).astype(bool)
+			mask = mask.reshape(num_joints, rows).T
+			pos += mask_len
+		pos += 1
+		steps = np.cumsum(_unshuffle(raw, pos, width).reshape(num_joints, rows), axis=1, dtype=np.int32)
+		values = steps.T.astype(np.float32, order="C") * np.float32(1.0 / STEPS_PER_DEGREE)
+		if mask is not None:
+			values[mask] = np.nan
+		out[name] = values
+		pos += width * 4
+	return out
@@ -0,0 +1,579 @@
+"""
+LeRobot 형식 데이터셋 내보내기
+
+기록 파일(.rec, 기존 record_*.json) 하나를 에피소드 하나로 변환합니다.
+
+	<output>/
+		meta/info.json            fps, features, 경로 템플릿, 에피소드/프레임 수
+		meta/episodes.jsonl       에피소드별 길이/태스크
+		meta/tasks.jsonl          태스크 문자열 ↔ task_index
+		meta/stats.json           피처별 mean/std/min/max
+		meta/export_state.json    증분 내보내기 상태 (원본 mtime/size, 에피소드별 통계 누적값)
+		data/chunk-000/episode_000000.parquet
+
+- 프레임 컬럼: observation.state (positions), action, timestamp, frame_index, episode_index, index, task_index
+- 에피소드는 fps 균일 격자로 선형 보간해 다시 샘플링 (timestamp = frame_index / fps, 마지막 샘플 이후 격자 없음)
+- action: 기록에 actions 컬럼이 있으면 그 값 (NaN은 state), 없으면 다음 프레임의 state
+- pyarrow.parquet이 없으면 Arrow IPC(.arrow)로 저장, pyarrow가 없으면 RuntimeError
+- 에피소드 변환은 프로세스 풀에서 병렬 실행 (동시에 대기하는 작업 수 제한),
+  각 작업은 메모리 맵 청크를 BLOCK_ROWS 행씩 row group으로 써서 메모리 사용량이 기록 길이와 무관
+- 원본이 그대로이고 에피소드 번호/전역 프레임 오프셋/태스크/fps가 같으면 다시 쓰지 않음
+
+CLI:
+	python -m rosota_copilot.recording.dataset data/datasets/demo data/records/record_*.rec --task "pick cube"
+"""
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .format import RECORD_SUFFIX, PathLike, RecordingReader
+
+CODEBASE_VERSION = "v2.0"
+EXPORT_STATE_VERSION = 2
+CHUNKS_SIZE = 1000
+BLOCK_ROWS = 16384
+FEATURES = ("observation.state", "action")
+
+DATA_PATH = "data/chunk-{episode_chunk:03d}/episode_{episode_index:06d}.{ext}"
+
+
+def storage_backend() -> Optional[str]:
+	"""사용 가능한 저장 형식 ("parquet", "arrow", 없으면 None)"""
+	try:
+		import pyarrow  # noqa: F401
+	except ImportError:
+		return None
+	try:
+		import pyarrow.parquet  # noqa: F401
+		return "parquet"
+	except ImportError:
+		return "arrow"
+
+
+def _episode_path(root: Path, episode_index: int, backend: str) -> Path:
+	ext = "parquet" if backend == "parquet" else "arrow"
+	return root / DATA_PATH.format(episode_chunk=episode_index // CHUNKS_SIZE, episode_index=episode_index, ext=ext)
+
+
+# ---- 원본 읽기 ----
+
+def _source_info(path: Path) -> Dict[str, Any]:
+	"""길이/시작·끝 시각/조인트 수/메타데이터 (.rec는 헤더/푸터만 읽음)"""
+	if path.suffix == RECORD_SUFFIX:
+		reader = RecordingReader(path)
+		chunks = reader.chunks
+		return {
+			"length": reader.num_rows,
+			"start": chunks[0].t_first if chunks else 0.0,
+			"end": chunks[-1].t_last if chunks else 0.0,
+			"num_joints": reader.num_joints,
+			"metadata": reader.metadata,
+		}
+	with open(path, "r", encoding="utf-8") as f:
+		record = json.load(f)
+	data = record.get("data", [])
+	num_joints = len(data[0]["joint_positions"]) if data else 0
+	return {
+		"length": len(data),
+		"start": float(data[0]["timestamp"]) if data else 0.0,
+		"end": float(data[-1]["timestamp"]) if data else 0.0,
+		"num_joints": num_joints,
+		"metadata": record.get("metadata", {}),
+	}
+
+
+def _frame_count(duration: float, fps: float) -> int:
+	"""기록 길이(초) 안에 들어가는 격자 프레임 수 (0초 프레임 포함)"""
+	return int(np.floor(max(duration, 0.0) * fps + 1e-9)) + 1
+
+
+def _iter_source(path: Path) -> Iterator[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]]:
+	"""(timestamp, positions, actions 또는 None) 블록 (.rec는 메모리 맵 청크를 BLOCK_ROWS 단위로 묶음)"""
+	if path.suffix != RECORD_SUFFIX:
+		with open(path, "r", encoding="utf-8") as f:
+			data = json.load(f).get("data", [])
+		if not data:
+			return
+		timestamps = np.array([entry["timestamp"] for entry in data], dtype=np.float64)
+		positions = np.array([entry["joint_positions"] for entry in data], dtype=np.float32)
+		actions = None
+		if any("action" in entry for entry in data):
+			actions = np.array([entry.get("action") or [np.nan] * positions.shape[1] for entry in data], dtype=np.float32)
+		yield timestamps, positions, actions
+		return
+
+	from .memmap import MappedRecording
+
+	with MappedRecording(path) as mapped:
+		has_actions = "actions" in mapped.columns
+		pending: List[Dict[str, np.ndarray]] = []
+		rows = 0
+		for views in mapped.chunk_views():
+			pending.append(views)
+			rows += len(views["timestamp"])
+			if rows >= BLOCK_ROWS:
+				yield _merge_views(pending, has_actions)
+				pending, rows = [], 0
+		if pending:
+			yield _merge_views(pending, has_actions)
+
+
+def _merge_views(views: List[Dict[str, np.ndarray]], has_actions: bool):
+	timestamps = np.concatenate([v["timestamp"] for v in views])
+	positions = np.concatenate([v["positions"] for v in views])
+	actions = np.concatenate([v["actions"] for v in views]) if has_actions else None
+	return timestamps, positions, actions
+
+
+def _fill_forward(values: np.ndarray, last: Optional[np.ndarray]) -> np.ndarray:
+	"""NaN을 조인트별 직전 유효값으로 채움 (앞에 유효값이 없으면 0)"""
+	if not np.isnan(values).any():
+		return values
+	if last is not None:
+		values = np.vstack([last[None, :], values])
+	valid = ~np.isnan(values)
+	index = np.where(valid, np.arange(len(values))[:, None], 0)
+	np.maximum.accumulate(index, axis=0, out=index)
+	filled = values[index, np.arange(values.shape[1])]
+	filled = np.nan_to_num(filled, nan=0.0)
+	return filled[1:] if last is not None else filled
+
+
+def _interp(grid: np.ndarray, times: np.ndarray, values: np.ndarray) -> np.ndarray:
+	"""조인트별 선형 보간 (times 범위 밖은 끝 값 유지)"""
+	if len(times) == 1:
+		return np.repeat(values, len(grid), axis=0)
+	index = np.clip(np.searchsorted(times, grid, side="right") - 1, 0, len(times) - 2)
+	span = times[index + 1] - times[index]
+	weight = np.divide(grid - times[index], span, out=np.zeros_like(grid), where=span > 0)
+	np.clip(weight, 0.0, 1.0, out=weight)
+	low = values[index]
+	return (low + (values[index + 1] - low) * weight[:, None]).astype(np.float32)
+
+
+def _resample(blocks: Iterator[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]], fps: float, frames: int) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+	"""
+	원본 블록 → fps 균일 격자 위의 (state, action 또는 None) 블록 (frame_index 순서대로, 모두 합쳐 frames행)
+	블록 경계는 직전 블록의 마지막 샘플을 앞에 붙여 보간하므로 블록 단위로 스트리밍해도 결과가 같음
+	"""
+	t0: Optional[float] = None
+	next_frame = 0
+	last_state: Optional[np.ndarray] = None
+	carry: Optional[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]] = None  # 직전 블록 마지막 샘플
+	for timestamps, positions, actions in blocks:
+		if t0 is None:
+			t0 = float(timestamps[0])
+		state = _fill_forward(positions.astype(np.float32), last_state)
+		last_state = state[-1]
+		if actions is not None:
+			actions = np.where(np.isnan(actions), state, actions).astype(np.float32)
+		times = timestamps.astype(np.float64) - t0
+		if carry is not None:
+			times = np.concatenate([carry[0], times])
+			state = np.vstack([carry[1], state])
+			if actions is not None:
+				actions = np.vstack([carry[2], actions])
+		carry = (times[-1:], state[-1:], actions[-1:] if actions is not None else None)
+		stop = min(frames, _frame_count(float(times[-1]), fps))
+		if stop <= next_frame:
+			continue
+		grid = np.arange(next_frame, stop) / fps
+		yield _interp(grid, times, state), _interp(grid, times, actions) if actions is not None else None
+		next_frame = stop
+	if carry is not None and next_frame < frames:
+		# 원본 헤더/푸터 시각과 마지막 블록이 어긋난 경우 - 마지막 샘플 유지
+		rows = frames - next_frame
+		yield np.repeat(carry[1], rows, axis=0), np.repeat(carry[2], rows, axis=0) if carry[2] is not None else None
+
+
+# ---- 통계 ----
+
+class _FeatureStats:
+	"""count/sum/sumsq/min/max 누적 (에피소드 간 합칠 수 있는 형태)"""
+
+	def __init__(self, dim: int):
+		self.count = 0
+		self.sum = np.zeros(dim)
+		self.sumsq = np.zeros(dim)
+		self.min = np.full(dim, np.inf)
+		self.max = np.full(dim, -np.inf)
+
+	def update(self, values: np.ndarray) -> None:
+		values = values.astype(np.float64)
+		self.count += len(values)
+		self.sum += values.sum(axis=0)
+		self.sumsq += np.square(values).sum(axis=0)
+		self.min = np.minimum(self.min, values.min(axis=0))
+		self.max = np.maximum(self.max, values.max(axis=0))
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {"count": self.count, "sum": self.sum.tolist(), "sumsq": self.sumsq.tolist(), "min": self.min.tolist(), "max": self.max.tolist()}
+
+	@classmethod
+	def merge(cls, parts: Sequence[Dict[str, Any]]) -> Dict[str, List[float]]:
+		"""에피소드별 누적값 → mean/std/min/max"""
+		count = sum(part["count"] for part in parts)
+		total = np.sum([part["sum"] for part in parts], axis=0)
+		total_sq = np.sum([part["sumsq"] for part in parts], axis=0)
+		mean = total / count
+		std = np.sqrt(np.maximum(total_sq / count - np.square(mean), 0.0))
+		return {
+			"mean": mean.tolist(),
+			"std": std.tolist(),
+			"min": np.min([part["min"] for part in parts], axis=0).tolist(),
+			"max": np.max([part["max"] for part in parts], axis=0).tolist(),
+		}
+
+
+# ---- 에피소드 변환 (작업 프로세스) ----
+
+def _open_table_writer(path: Path, schema, backend: str):
+	if backend == "parquet":
+		import pyarrow.parquet as pq
+		return pq.ParquetWriter(str(path), schema, compression="zstd")
+	import pyarrow as pa
+	return pa.ipc.new_file(str(path), schema)
+
+
+def _export_episode(
+	source: str,
+	target: str,
+	backend: str,
+	episode_index: int,
+	index_offset: int,
+	task_index: int,
+	num_joints: int,
+	fps: float,
+	length: int,
+) -> Dict[str, Any]:
+	"""기록 하나 → fps 격자로 다시 샘플링한 에피소드 파일 하나 (length 프레임, 임시 파일에 쓴 뒤 교체)"""
+	import pyarrow as pa
+
+	vector = pa.list_(pa.float32(), num_joints)
+	schema = pa.schema([
+		("observation.state", vector),
+		("action", vector),
+		("timestamp", pa.float32()),
+		("frame_index", pa.int64()),
+		("episode_index", pa.int64()),
+		("index", pa.int64()),
+		("task_index", pa.int64()),
+	])
+	target_path = Path(target)
+	target_path.parent.mkdir(parents=True, exist_ok=True)
+	tmp_path = target_path.with_name(target_path.name + ".tmp")
+	stats = {name: _FeatureStats(num_joints) for name in FEATURES}
+
+	frames = 0
+	held: Optional[np.ndarray] = None  # action을 다음 state로 채워야 하는 마지막 행
+
+	def write(writer, state: np.ndarray, action: np.ndarray) -> None:
+		nonlocal frames
+		rows = len(state)
+		frame_index = np.arange(frames, frames + rows, dtype=np.int64)
+		columns = [
+			pa.FixedSizeListArray.from_arrays(pa.array(state.reshape(-1), pa.float32()), num_joints),
+			pa.FixedSizeListArray.from_arrays(pa.array(action.reshape(-1), pa.float32()), num_joints),
+			pa.array((frame_index / fps).astype(np.float32)),
+			pa.array(frame_index),
+			pa.array(np.full(rows, episode_index, dtype=np.int64)),
+			pa.array(frame_index + index_offset),
+			pa.array(np.full(rows, task_index, dtype=np.int64)),
+		]
+		writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+		stats["observation.state"].update(state)
+		stats["action"].update(action)
+		frames += rows
+
+	writer = _open_table_writer(tmp_path, schema, backend)
+	try:
+		for state, action in _resample(_iter_source(Path(source)), fps, length):
+			if action is not None:
+				write(writer, state, action)
+				continue
+			# action = 다음 프레임 state (블록 마지막 행은 다음 블록까지 보류)
+			if held is not None:
+				state = np.vstack([held, state])
+			action = np.vstack([state[1:], state[-1:]])
+			held = state[-1:]
+			if len(state) > 1:
+				write(writer, state[:-1], action[:-1])
+		if held is not None:
+			write(writer, held, held)
+	finally:
+		writer.close()
+	os.replace(tmp_path, target_path)
+	return {"length": frames, "stats": {name: feature.to_dict() for name, feature in stats.items()}}
+
+
+# ---- 데이터셋 ----
+
+def _load_state(meta_dir: Path) -> Dict[str, Any]:
+	try:
+		with open(meta_dir / "export_state.json", "r", encoding="utf-8") as f:
+			state = json.load(f)
+	except (OSError, ValueError):
+		return {}
+	return state if state.get("version") == EXPORT_STATE_VERSION else {}
+
+
+def _write_json(path: Path, data: Any) -> None:
+	tmp_path = path.with_name(path.name + ".tmp")
+	with open(tmp_path, "w", encoding="utf-8") as f:
+		json.dump(data, f, indent=2)
+	os.replace(tmp_path, path)
+
+
+def _write_jsonl(path: Path, rows: Sequence[Dict[str, Any]]) -> None:
+	tmp_path = path.with_name(path.name + ".tmp")
+	with open(tmp_path, "w", encoding="utf-8") as f:
+		for row in rows:
+			f.write(json.dumps(row, ensure_ascii=False) + "\n")
+	os.replace(tmp_path, path)
+
+
+def _default_task(metadata: Dict[str, Any]) -> str:
+	return metadata.get("task") or f"{metadata.get('mode', 'manual')} demonstration"
+
+
+def export_dataset(
+	sources: Sequence[PathLike],
+	output_dir: PathLike,
+	fps: Optional[int] = None,
+	task: Optional[str] = None,
+	workers: Optional[int] = None,
+	force: bool = False,
+) -> Dict[str, Any]:
+	"""
+	기록들을 LeRobot 형식 데이터셋으로 내보내기 (증분)
+
+	이미 내보낸 에피소드는 원본 순서를 유지하고 새 기록은 뒤에 추가됩니다.
+	원본 파일이 사라진 에피소드는 빠지고, 뒤 에피소드 번호가 당겨져 다시 써집니다.
+
+	Args:
+		sources: 기록 파일 경로들
+		output_dir: 데이터셋 디렉토리
+		fps: 데이터셋 fps (None이면 기록의 sample_rate_hz 중앙값) - 모든 에피소드를 이 격자로 다시 샘플링
+		task: 태스크 문자열 (None이면 기록 메타데이터의 task 또는 "<mode> demonstration")
+		workers: 프로세스 수 (None이면 CPU 수)
+		force: 모든 에피소드 다시 쓰기
+
+	Returns:
+		요약 (episodes/exported/skipped/failed/total_frames/elapsed 등)
+
+	Raises:
+		RuntimeError: pyarrow가 설치되지 않은 경우
+	"""
+	backend = storage_backend()
+	if backend is None:
+		raise RuntimeError("Dataset export requires pyarrow (pip install pyarrow)")
+	started = time.perf_counter()
+	root = Path(output_dir)
+	meta_dir = root / "meta"
+	meta_dir.mkdir(parents=True, exist_ok=True)
+	previous = {} if force else _load_state(meta_dir)
+	if previous.get("backend") != backend:
+		previous = {}
+
+	# 이전 에피소드 순서 유지 + 새 기록은 이름순으로 뒤에
+	known = {episode["source"]: episode for episode in previous.get("episodes", [])}
+	requested = [str(Path(source).resolve()) for source in sources]
+	order = [source for source in known if Path(source).exists()]
+	order += sorted(source for source in dict.fromkeys(requested) if source not in known)
+
+	failed: List[Dict[str, str]] = []
+	plans: List[Dict[str, Any]] = []
+	num_joints: Optional[int] = None
+	for source in order:
+		path = Path(source)
+		try:
+			stat = path.stat()
+			info = _source_info(path)
+		except Exception as e:
+			failed.append({"source": path.name, "error": str(e)})
+			continue
+		if info["length"] == 0:
+			failed.append({"source": path.name, "error": "Empty recording"})
+			continue
+		if num_joints is None:
+			num_joints = info["num_joints"]
+		elif info["num_joints"] != num_joints:
+			failed.append({"source": path.name, "error": f"Joint count {info['num_joints']} != {num_joints}"})
+			continue
+		old = known.get(source, {})
+		plans.append({
+			"source": source,
+			"filename": path.name,
+			"mtime": stat.st_mtime,
+			"size": stat.st_size,
+			"duration": info["end"] - info["start"],
+			"task": old.get("task") if source in known and task is None else (task or _default_task(info["metadata"])),
+			"sample_rate_hz": info["metadata"].get("sample_rate_hz"),
+			"joint_names": info["metadata"].get("joint_names") or [],
+			"previous": old,
+		})
+	if not plans:
+		raise ValueError("No recordings to export")
+
+	if fps is None:
+		rates = [plan["sample_rate_hz"] for plan in plans if plan["sample_rate_hz"]]
+		fps = int(round(float(np.median(rates)))) if rates else 30
+
+	tasks: Dict[str, int] = {}
+	offset = 0
+	jobs = []
+	for episode_index, plan in enumerate(plans):
+		plan["episode_index"] = episode_index
+		plan["task_index"] = tasks.setdefault(plan["task"], len(tasks))
+		plan["index_offset"] = offset
+		plan["fps"] = fps
+		plan["length"] = _frame_count(plan.pop("duration"), fps)
+		old = plan.pop("previous")
+		target = _episode_path(root, episode_index, backend)
+		unchanged = (
+			old.get("mtime") == plan["mtime"]
+			and old.get("size") == plan["size"]
+			and old.get("episode_index") == episode_index
+			and old.get("index_offset") == offset
+			and old.get("task_index") == plan["task_index"]
+			and old.get("fps") == fps
+			and old.get("length") == plan["length"]
+			and target.exists()
+		)
+		if unchanged:
+			plan["stats"] = old["stats"]
+		else:
+			jobs.append(plan)
+		offset += plan["length"]
+
+	# 변환 (프로세스 풀, 대기 작업 수 제한 - 결과/인자 직렬화 메모리를 묶어 둠)
+	workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+	if jobs:
+		with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+			pending = {}
+			queue = list(jobs)
+			while queue or pending:
+				while queue and len(pending) < workers * 2:
+					plan = queue.pop(0)
+					future = pool.submit(
+						_export_episode,
+						plan["source"],
+						str(_episode_path(root, plan["episode_index"], backend)),
+						backend,
+						plan["episode_index"],
+						plan["index_offset"],
+						plan["task_index"],
+						num_joints,
+						fps,
+						plan["length"],
+					)
+					pending[future] = plan
+				done, _ = wait(pending, return_when=FIRST_COMPLETED)
+				for future in done:
+					plan = pending.pop(future)
+					try:
+						plan.update(future.result())
+					except Exception as e:
+						failed.append({"source": plan["filename"], "error": str(e)})
+						plan["failed"] = True
+
+	# 실패한 에피소드는 빠지므로 번호/오프셋이 달라지면 다음 실행에서 다시 씀
+	episodes = [plan for plan in plans if not plan.get("failed")]
+	if not episodes:
+		raise RuntimeError("All recordings failed to export")
+	referenced = {_episode_path(root, plan["episode_index"], backend) for plan in episodes}
+	for stale in (root / "data").glob("chunk-*/episode_*"):
+		if stale not in referenced:
+			stale.unlink()
+
+	total_frames = sum(plan["length"] for plan in episodes)
+	joint_names = episodes[0]["joint_names"] or [f"joint_{i}" for i in range(num_joints)]
+	ext = "parquet" if backend == "parquet" else "arrow"
+	vector_feature = {"dtype": "float32", "shape": [num_joints], "names": list(joint_names)}
+	_write_json(meta_dir / "info.json", {
+		"codebase_version": CODEBASE_VERSION,
+		"robot_type": "so100",
+		"total_episodes": len(episodes),
+		"total_frames": total_frames,
+		"total_tasks": len(tasks),
+		"total_videos": 0,
+		"total_chunks": (max(plan["episode_index"] for plan in episodes) // CHUNKS_SIZE) + 1,
+		"chunks_size": CHUNKS_SIZE,
+		"fps": fps,
+		"splits": {"train": f"0:{len(episodes)}"},
+		"data_path": DATA_PATH.replace("{ext}", ext),
+		"video_path": None,
+		"features": {
+			"observation.state": vector_feature,
+			"action": vector_feature,
+			"timestamp": {"dtype": "float32", "shape": [1], "names": None},
+			"frame_index": {"dtype": "int64", "shape": [1], "names": None},
+			"episode_index": {"dtype": "int64", "shape": [1], "names": None},
+			"index": {"dtype": "int64", "shape": [1], "names": None},
+			"task_index": {"dtype": "int64", "shape": [1], "names": None},
+		},
+	})
+	_write_jsonl(meta_dir / "tasks.jsonl", [{"task_index": index, "task": name} for name, index in tasks.items()])
+	_write_jsonl(meta_dir / "episodes.jsonl", [
+		{"episode_index": plan["episode_index"], "tasks": [plan["task"]], "length": plan["length"]} for plan in episodes
+	])
+	_write_json(meta_dir / "stats.json", {
+		name: _FeatureStats.merge([plan["stats"][name] for plan in episodes]) for name in FEATURES
+	})
+	_write_json(meta_dir / "export_state.json", {
+		"version": EXPORT_STATE_VERSION,
+		"backend": backend,
+		"fps": fps,
+		"episodes": [
+			{key: plan[key] for key in ("source", "filename", "mtime", "size", "length", "fps", "task", "episode_index", "task_index", "index_offset", "stats")}
+			for plan in episodes
+		],
+	})
+
+	return {
+		"output": str(root),
+		"backend": backend,
+		"fps": fps,
+		"episodes": len(episodes),
+		"exported": len([plan for plan in jobs if not plan.get("failed")]),
+		"skipped": len(plans) - len(jobs),
+		"failed": failed,
+		"total_frames": total_frames,
+		"workers": workers if jobs else 0,
+		"elapsed": round(time.perf_counter() - started, 3),
+	}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+	import argparse
+
+	parser = argparse.ArgumentParser(prog="python -m rosota_copilot.recording.dataset", description="Export recordings to a LeRobot-style dataset")
+	parser.add_argument("output", help="dataset directory")
+	parser.add_argument("sources", nargs="*", help="recording files (default: every record in data/records)")
+	parser.add_argument("--fps", type=int, default=None)
+	parser.add_argument("--task", default=None)
+	parser.add_argument("--workers", type=int, default=None)
+	parser.add_argument("--force", action="store_true", help="re-export every episode")
+	args = parser.parse_args(argv)
+
+	sources = args.sources
+	if not sources:
+		from ..config import RECORD_DIR
+		sources = sorted(str(path) for path in RECORD_DIR.glob("record_*") if path.suffix in (RECORD_SUFFIX, ".json"))
+	try:
+		summary = export_dataset(sources, args.output, fps=args.fps, task=args.task, workers=args.workers, force=args.force)
+	except (RuntimeError, ValueError) as e:
+		print(f"[Dataset] {e}")
+		return 1
+	print(json.dumps(summary, indent=2))
+	return 0 if not summary["failed"] else 2
+
+
+if __name__ == "__main__":
+	raise SystemExit(main())
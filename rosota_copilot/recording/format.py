@@ -0,0 +1,521 @@
+"""
+청크 단위 컬럼형 바이너리 기록 포맷 (.rec, format version 1: 원시 컬럼, 2: 압축 청크)
+
+기록 중에는 고정 폭 NumPy 컬럼을 청크로 모아 백그라운드 스레드가 파일 끝에 덧붙입니다.
+메모리 사용량은 청크 몇 개로 고정되고, 프로세스가 죽어도 마지막으로 쓴 청크까지는 남습니다.
+
+파일 레이아웃 (little-endian):
+	파일 헤더
+		8s   magic        b"ROSOREC1"
+		u16  version      RECORD_FORMAT_VERSION
+		u16  num_joints
+		u32  meta_len
+		     meta         JSON (mode, created_at, robot_type, columns, ...)
+	청크 * N
+		4s   magic        b"CHNK"
+		u32  rows
+		u32  payload_len
+		u32  crc32        payload CRC
+		f64  t_first      첫 행 timestamp
+		f64  t_last       마지막 행 timestamp
+		     payload      컬럼 순서대로 연속 배치: timestamp f64[rows], 이후 컬럼마다 f32[rows, num_joints]
+		                  (version 2는 meta["codec"]의 압축 방식으로 인코딩 - codec.py 참고)
+	푸터 (정상 종료 시에만)
+		     index        청크마다 (u64 offset, u32 rows, f64 t_first, f64 t_last)
+		     meta         JSON (duration, num_steps, finished_at, ...)
+		4s   magic        b"RIDX"
+		u64  index_offset
+		u32  num_chunks
+		u32  meta_len
+		8s   end_magic    b"ROSOEND1"
+
+푸터가 없거나 깨진 파일(비정상 종료)은 청크를 처음부터 스캔해 CRC가 맞는 청크까지 읽습니다.
+RecordingWriter.resume()은 유효한 마지막 청크 뒤를 잘라내고 이어서 기록합니다.
+
+압축하지 않은 기록은 지금도 version 1로 쓰므로 이전 버전 앱에서도 읽을 수 있습니다.
+"""
+import json
+import os
+import queue
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+RECORD_FORMAT_VERSION = 2
+RAW_FORMAT_VERSION = 1
+RECORD_SUFFIX = ".rec"
+
+FILE_MAGIC = b"ROSOREC1"
+CHUNK_MAGIC = b"CHNK"
+INDEX_MAGIC = b"RIDX"
+END_MAGIC = b"ROSOEND1"
+
+FILE_HEADER = struct.Struct("<8sHHI")
+CHUNK_HEADER = struct.Struct("<4sIIIdd")
+INDEX_ENTRY = struct.Struct("<QIdd")
+TRAILER = struct.Struct("<4sQII8s")
+
+TIMESTAMP_DTYPE = np.dtype("<f8")
+VALUE_DTYPE = np.dtype("<f4")
+
+# timestamp 외의 조인트 폭 컬럼 (positions는 항상 포함)
+JOINT_COLUMNS = ("positions", "velocities", "actions")
+
+PathLike = Union[str, Path]
+
+
+class ChunkInfo(NamedTuple):
+	offset: int  # 청크 헤더 시작 위치
+	rows: int
+	t_first: float
+	t_last: float
+
+
+def _payload_size(rows: int, num_joints: int, columns: Sequence[str]) -> int:
+	return rows * (TIMESTAMP_DTYPE.itemsize + len(columns) * num_joints * VALUE_DTYPE.itemsize)
+
+
+class RecordingReader:
+	"""
+	.rec 파일 읽기
+
+	푸터가 있으면 인덱스를 바로 읽고, 없으면 청크를 스캔합니다 (complete=False).
+	"""
+
+	def __init__(self, path: PathLike):
+		self.path = Path(path)
+		self.file_size = self.path.stat().st_size
+		with open(self.path, "rb") as f:
+			head = f.read(FILE_HEADER.size)
+			if len(head) < FILE_HEADER.size:
+				raise ValueError(f"Not a recording file: {self.path}")
+			magic, version, num_joints, meta_len = FILE_HEADER.unpack(head)
+			if magic != FILE_MAGIC:
+				raise ValueError(f"Not a recording file: {self.path}")
+			if version not in (RAW_FORMAT_VERSION, RECORD_FORMAT_VERSION):
+				raise ValueError(f"Unsupported recording format version: {version}")
+			self.num_joints = num_joints
+			self.header_meta: Dict[str, Any] = json.loads(f.read(meta_len).decode("utf-8"))
+			self.columns: Tuple[str, ...] = tuple(self.header_meta.get("columns", ("positions",)))
+			# 압축 방식 (version 1은 None)
+			self.compression: Optional[str] = (self.header_meta.get("codec") or {}).get("compression") if version != RAW_FORMAT_VERSION else None
+			self.data_offset = FILE_HEADER.size + meta_len
+			self.footer_meta: Dict[str, Any] = {}
+			self.chunks: List[ChunkInfo] = self._read_footer(f)
+			self.complete = self.chunks is not None
+			if self.chunks is None:
+				self.chunks = self._scan(f)
+
+	@property
+	def metadata(self) -> Dict[str, Any]:
+		"""헤더 + 푸터 메타데이터 (비정상 종료 파일은 스캔 결과로 채움)"""
+		meta = dict(self.header_meta)
+		meta.update(self.footer_meta)
+		if not self.complete:
+			meta["duration"] = self.chunks[-1].t_last if self.chunks else 0.0
+			meta["num_steps"] = self.num_rows
+			meta["incomplete"] = True
+		return meta
+
+	@property
+	def num_rows(self) -> int:
+		return sum(chunk.rows for chunk in self.chunks)
+
+	@property
+	def data_end(self) -> int:
+		"""마지막 유효 청크의 끝 위치"""
+		if not self.chunks:
+			return self.data_offset
+		last = self.chunks[-1]
+		if self.compression is None:
+			return last.offset + CHUNK_HEADER.size + _payload_size(last.rows, self.num_joints, self.columns)
+		with open(self.path, "rb") as f:
+			f.seek(last.offset)
+			payload_len = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))[2]
+		return last.offset + CHUNK_HEADER.size + payload_len
+
+	def _read_footer(self, f) -> Optional[List[ChunkInfo]]:
+		if self.file_size < self.data_offset + TRAILER.size:
+			return None
+		f.seek(self.file_size - TRAILER.size)
+		magic, index_offset, num_chunks, meta_len, end = TRAILER.unpack(f.read(TRAILER.size))
+		if magic != INDEX_MAGIC or end != END_MAGIC:
+			return None
+		index_size = num_chunks * INDEX_ENTRY.size
+		if index_offset + index_size + meta_len + TRAILER.size != self.file_size:
+			return None
+		f.seek(index_offset)
+		raw = f.read(index_size)
+		chunks = [ChunkInfo(*INDEX_ENTRY.unpack_from(raw, i * INDEX_ENTRY.size)) for i in range(num_chunks)]
+		try:
+			self.footer_meta = json.loads(f.read(meta_len).decode("utf-8"))
+		except ValueError:
+			return None
+		return chunks
+
+	def _scan(self, f) -> List[ChunkInfo]:
+		"""청크를 처음부터 확인 (잘리거나 CRC가 맞지 않는 청크에서 중단)"""
+		chunks = []
+		offset = self.data_offset
+		while offset + CHUNK_HEADER.size <= self.file_size:
+			f.seek(offset)
+			magic, rows, payload_len, crc, t_first, t_last = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))
+			if magic != CHUNK_MAGIC:
+				break
+			if self.compression is None and payload_len != _payload_size(rows, self.num_joints, self.columns):
+				break
+			payload = f.read(payload_len)
+			if len(payload) != payload_len or zlib.crc32(payload) != crc:
+				break
+			chunks.append(ChunkInfo(offset, rows, t_first, t_last))
+			offset += CHUNK_HEADER.size + payload_len
+		return chunks
+
+	def _read_payload(self, f, chunk: ChunkInfo) -> bytes:
+		if self.compression is None:
+			f.seek(chunk.offset + CHUNK_HEADER.size)
+			return f.read(_payload_size(chunk.rows, self.num_joints, self.columns))
+		f.seek(chunk.offset)
+		payload_len = CHUNK_HEADER.unpack(f.read(CHUNK_HEADER.size))[2]
+		return f.read(payload_len)
+
+	def decode(self, payload: bytes, chunk: ChunkInfo) -> Dict[str, np.ndarray]:
+		"""청크 payload → 컬럼 배열"""
+		if self.compression is not None:
+			from .codec import decode_chunk
+			return decode_chunk(payload, chunk.rows, self.num_joints, self.columns, self.compression, chunk.t_first)
+		return self._decode(payload, chunk.rows)
+
+	def _decode(self, payload: bytes, rows: int) -> Dict[str, np.ndarray]:
+		out = {"timestamp": np.frombuffer(payload, TIMESTAMP_DTYPE, rows, 0)}
+		pos = rows * TIMESTAMP_DTYPE.itemsize
+		width = rows * self.num_joints
+		for name in self.columns:
+			out[name] = np.frombuffer(payload, VALUE_DTYPE, width, pos).reshape(rows, self.num_joints)
+			pos += width * VALUE_DTYPE.itemsize
+		return out
+
+	def read_chunk(self, index: int) -> Dict[str, np.ndarray]:
+		chunk = self.chunks[index]
+		with open(self.path, "rb") as f:
+			payload = self._read_payload(f, chunk)
+		return self.decode(payload, chunk)
+
+	def read_all(self) -> Dict[str, np.ndarray]:
+		"""전체 컬럼을 이어 붙여 반환 ({"timestamp": (N,), "positions": (N, J), ...})"""
+		parts: Dict[str, List[np.ndarray]] = {"timestamp": []}
+		for name in self.columns:
+			parts[name] = []
+		with open(self.path, "rb") as f:
+			for chunk in self.chunks:
+				for name, array in self.decode(self._read_payload(f, chunk), chunk).items():
+					parts[name].append(array)
+		out = {}
+		for name, arrays in parts.items():
+			if arrays:
+				out[name] = np.concatenate(arrays)
+			elif name == "timestamp":
+				out[name] = np.empty(0, TIMESTAMP_DTYPE)
+			else:
+				out[name] = np.empty((0, self.num_joints), VALUE_DTYPE)
+		return out
+
+
+class RecordingWriter:
+	"""
+	.rec 파일 쓰기
+
+	append()는 호출 스레드에서 청크 버퍼에 행을 채우기만 하고,
+	청크가 차면 쓰기 스레드가 파일에 덧붙이고 flush(+fsync)합니다.
+
+	Args:
+		path: 파일 경로 (이미 있으면 덮어씀)
+		num_joints: 조인트 수
+		metadata: 헤더에 저장할 메타데이터 (mode, created_at 등)
+		columns: 조인트 폭 컬럼 (JOINT_COLUMNS 중 선택, positions 필수)
+		chunk_rows: 청크당 행 수
+		fsync: 청크마다 os.fsync (전원 차단에도 안전, 대신 느린 디스크에서는 쓰기 지연 증가)
+		compression: None이면 원시 컬럼 (version 1), "zlib"/"lzma"면 양자화 + 차분 압축 청크 (version 2, codec.py)
+	"""
+
+	def __init__(
+		self,
+		path: PathLike,
+		num_joints: int,
+		metadata: Optional[Dict[str, Any]] = None,
+		columns: Sequence[str] = ("positions",),
+		chunk_rows: int = 256,
+		fsync: bool = True,
+		compression: Optional[str] = None,
+		_resume: Optional[RecordingReader] = None,
+	):
+		columns = tuple(columns)
+		if "positions" not in columns or any(c not in JOINT_COLUMNS for c in columns):
+			raise ValueError(f"Invalid recording columns: {columns}")
+		self.path = Path(path)
+		self.num_joints = num_joints
+		self.columns = columns
+		self.chunk_rows = max(1, int(chunk_rows))
+		self.fsync = fsync
+		self.error: Optional[Exception] = None
+
+		if _resume is not None:
+			compression = _resume.compression
+		elif compression is not None:
+			from .codec import check_compression
+			check_compression(compression)
+		self.compression = compression
+
+		if _resume is not None:
+			# 유효한 마지막 청크 뒤(깨진 청크/이전 푸터)를 잘라내고 이어서 쓰기
+			self.metadata = dict(_resume.header_meta)
+			self._chunks: List[ChunkInfo] = list(_resume.chunks)
+			self._file = open(self.path, "r+b")
+			self._file.truncate(_resume.data_end)
+			self._file.seek(_resume.data_end)
+		else:
+			self.metadata = dict(metadata or {})
+			self.metadata["columns"] = list(columns)
+			version = RAW_FORMAT_VERSION
+			if compression is not None:
+				from .codec import CODEC_NAME, STEPS_PER_TURN, TIME_RESOLUTION
+				version = RECORD_FORMAT_VERSION
+				self.metadata["codec"] = {
+					"name": CODEC_NAME,
+					"compression": compression,
+					"steps_per_turn": STEPS_PER_TURN,
+					"time_resolution": TIME_RESOLUTION,
+				}
+			self.metadata["format_version"] = version
+			self._chunks = []
+			meta = json.dumps(self.metadata).encode("utf-8")
+			self._file = open(self.path, "wb")
+			self._file.write(FILE_HEADER.pack(FILE_MAGIC, version, num_joints, len(meta)))
+			self._file.write(meta)
+			self._sync()
+
+		self.num_rows = sum(chunk.rows for chunk in self._chunks)
+		self.last_timestamp = self._chunks[-1].t_last if self._chunks else None
+		self._offset = self._file.tell()
+		self._buffer = self._new_buffer()
+		self._fill = 0
+		self._queue: "queue.Queue" = queue.Queue()
+		self._closed = False
+		self._thread = threading.Thread(target=self._write_loop, name="RecordingWriter", daemon=True)
+		self._thread.start()
+
+	@classmethod
+	def resume(cls, path: PathLike, chunk_rows: int = 256, fsync: bool = True) -> "RecordingWriter":
+		"""비정상 종료되었거나 닫힌 기록에 이어 쓰기"""
+		reader = RecordingReader(path)
+		return cls(path, reader.num_joints, columns=reader.columns, chunk_rows=chunk_rows, fsync=fsync, _resume=reader)
+
+	def _new_buffer(self) -> Dict[str, np.ndarray]:
+		buffer = {"timestamp": np.empty(self.chunk_rows, TIMESTAMP_DTYPE)}
+		for name in self.columns:
+			buffer[name] = np.full((self.chunk_rows, self.num_joints), np.nan, VALUE_DTYPE)
+		return buffer
+
+	def append(self, timestamp: float, positions: Sequence[float], velocities: Optional[Sequence[float]] = None, actions: Optional[Sequence[float]] = None) -> None:
+		"""한 행 추가 (없는 컬럼 값은 NaN)"""
+		if self._closed:
+			raise RuntimeError("Recording writer is closed")
+		row = self._fill
+		buffer = self._buffer
+		buffer["timestamp"][row] = timestamp
+		values = {"positions": positions, "velocities": velocities, "actions": actions}
+		for name in self.columns:
+			value = values[name]
+			if value is not None:
+				value = value[:self.num_joints]
+				buffer[name][row, :len(value)] = value
+		self._fill += 1
+		self.num_rows += 1
+		self.last_timestamp = timestamp
+		if self._fill == self.chunk_rows:
+			self._submit()
+
+	def append_block(self, timestamps: np.ndarray, positions: np.ndarray, velocities: Optional[np.ndarray] = None, actions: Optional[np.ndarray] = None) -> None:
+		"""여러 행을 한 번에 추가 (timestamps: (N,), 나머지: (N, num_joints))"""
+		values = {"positions": positions, "velocities": velocities, "actions": actions}
+		total = len(timestamps)
+		start = 0
+		while start < total:
+			if self._closed:
+				raise RuntimeError("Recording writer is closed")
+			count = min(total - start, self.chunk_rows - self._fill)
+			end = start + count
+			rows = slice(self._fill, self._fill + count)
+			self._buffer["timestamp"][rows] = timestamps[start:end]
+			for name in self.columns:
+				if values[name] is not None:
+					self._buffer[name][rows] = values[name][start:end]
+			self._fill += count
+			start = end
+			if self._fill == self.chunk_rows:
+				self._submit()
+		if total:
+			self.num_rows += total
+			self.last_timestamp = float(timestamps[-1])
+
+	def _submit(self) -> None:
+		if self._fill:
+			self._queue.put(("chunk", self._buffer, self._fill))
+			self._buffer = self._new_buffer()
+			self._fill = 0
+
+	def flush(self) -> None:
+		"""채우던 청크를 바로 쓰기 요청 (반쯤 찬 청크도 파일에 남김)"""
+		self._submit()
+
+	def close(self, metadata: Optional[Dict[str, Any]] = None) -> Path:
+		"""남은 행을 쓰고 인덱스/메타데이터 푸터를 붙여 마무리"""
+		if self._closed:
+			return self.path
+		self._submit()
+		self._closed = True
+		self._queue.put(("close", metadata or {}, 0))
+		self._thread.join()
+		if self.error is not None:
+			raise self.error
+		return self.path
+
+	def abort(self) -> None:
+		"""기록을 버리고 파일 삭제"""
+		if not self._closed:
+			self._closed = True
+			self._queue.put(("abort", None, 0))
+			self._thread.join()
+		try:
+			self.path.unlink()
+		except OSError:
+			pass
+
+	def _sync(self) -> None:
+		self._file.flush()
+		if self.fsync:
+			os.fsync(self._file.fileno())
+
+	def _write_chunk(self, buffer: Dict[str, np.ndarray], rows: int) -> None:
+		if self.compression is not None:
+			from .codec import encode_chunk
+			payload = encode_chunk(buffer, rows, self.columns, self.compression)
+		else:
+			payload = b"".join([buffer["timestamp"][:rows].tobytes()] + [buffer[name][:rows].tobytes() for name in self.columns])
+		t_first = float(buffer["timestamp"][0])
+		t_last = float(buffer["timestamp"][rows - 1])
+		self._file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, rows, len(payload), zlib.crc32(payload), t_first, t_last))
+		self._file.write(payload)
+		self._sync()
+		self._chunks.append(ChunkInfo(self._offset, rows, t_first, t_last))
+		self._offset += CHUNK_HEADER.size + len(payload)
+
+	def _write_footer(self, metadata: Dict[str, Any]) -> None:
+		index_offset = self._offset
+		for chunk in self._chunks:
+			self._file.write(INDEX_ENTRY.pack(*chunk))
+		footer = {
+			"duration": self._chunks[-1].t_last if self._chunks else 0.0,
+			"num_steps": sum(chunk.rows for chunk in self._chunks),
+		}
+		footer.update(metadata)
+		meta = json.dumps(footer).encode("utf-8")
+		self._file.write(meta)
+		self._file.write(TRAILER.pack(INDEX_MAGIC, index_offset, len(self._chunks), len(meta), END_MAGIC))
+		self._sync()
+
+	def _fail(self, error: Exception) -> None:
+		# 첫 오류만 기록 - 이후 청크는 버리고 close()에서 예외 전달
+		if self.error is None:
+			self.error = error
+			print(f"[Recorder] Failed to write recording {self.path.name}: {error}")
+
+	def _write_loop(self) -> None:
+		# close/abort 항목을 처리하면 (성공이든 실패든) 바로 끝냄 - 그 뒤로는 큐에 아무것도 오지 않음
+		try:
+			while True:
+				kind, payload, rows = self._queue.get()
+				if kind == "chunk":
+					if self.error is None:
+						try:
+							self._write_chunk(payload, rows)
+						except Exception as e:
+							self._fail(e)
+				elif kind == "close":
+					if self.error is None:
+						try:
+							self._write_footer(payload)
+						except Exception as e:
+							self._fail(e)
+					break
+				else:
+					break
+		finally:
+			try:
+				self._file.close()
+			except OSError as e:
+				self._fail(e)
+
+
+def recover(path: PathLike) -> Optional[Path]:
+	"""
+	비정상 종료로 푸터가 없는 기록을 마무리 (이미 완료된 파일은 그대로)
+
+	Returns:
+		복구된 파일 경로 (유효한 청크가 없으면 삭제하고 None)
+	"""
+	reader = RecordingReader(path)
+	if reader.complete:
+		return reader.path
+	if not reader.chunks:
+		reader.path.unlink()
+		return None
+	writer = RecordingWriter.resume(path)
+	return writer.close({"recovered": True})
+
+
+def convert(path: PathLike, target: PathLike, compression: Optional[str] = "zlib", chunk_rows: int = 1024) -> Path:
+	"""
+	기록을 다른 압축 방식으로 다시 쓰기 (compression=None이면 원시 컬럼)
+
+	메타데이터는 그대로 옮기고, 청크는 chunk_rows 행 단위로 다시 나눕니다.
+	"""
+	reader = RecordingReader(path)
+	metadata = {key: value for key, value in reader.header_meta.items() if key not in ("columns", "format_version", "codec")}
+	writer = RecordingWriter(target, reader.num_joints, metadata, columns=reader.columns, chunk_rows=chunk_rows, fsync=False, compression=compression)
+	try:
+		for index in range(len(reader.chunks)):
+			columns = reader.read_chunk(index)
+			writer.append_block(columns.pop("timestamp"), **columns)
+	except Exception:
+		writer.abort()
+		raise
+	return writer.close(reader.footer_meta)
+
+
+def to_record_dict(path: PathLike) -> Dict[str, Any]:
+	"""기존 JSON 기록과 같은 형태의 딕셔너리 ({"metadata": ..., "data": [...]})로 변환"""
+	reader = RecordingReader(path)
+	columns = reader.read_all()
+	positions = columns["positions"].astype(float).tolist()
+	data = []
+	for i, timestamp in enumerate(columns["timestamp"].tolist()):
+		entry: Dict[str, Any] = {"timestamp": timestamp, "joint_positions": positions[i]}
+		for name in ("velocities", "actions"):
+			if name in columns and not np.isnan(columns[name][i]).all():
+				entry[name if name != "actions" else "action"] = columns[name][i].astype(float).tolist()
+		data.append(entry)
+	return {"metadata": reader.metadata, "data": data}
+
+
+def export_json(path: PathLike, json_path: Optional[PathLike] = None) -> Path:
+	"""기록을 JSON 파일로 변환 (기본: 같은 이름의 .json)"""
+	source = Path(path)
+	target = Path(json_path) if json_path is not None else source.with_suffix(".json")
+	with open(target, "w", encoding="utf-8") as f:
+		json.dump(to_record_dict(source), f, indent=2)
+	return target
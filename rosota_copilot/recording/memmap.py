@@ -0,0 +1,162 @@
+"""
+메모리 맵 기반 기록 읽기 (.rec)
+
+파일 전체를 numpy.memmap으로 열고 청크별 컬럼을 복사 없이 배열 뷰로 만듭니다.
+청크 인덱스의 t_first로 시각 → 청크를 찾고, 청크 안에서는 timestamp 컬럼을 이진 탐색하므로
+긴 기록에서도 frame_at()/slice()는 필요한 청크만 건드립니다 (메모리 사용량은 요청 범위에 비례).
+
+압축 기록(version 2)은 뷰 대신 필요한 청크만 디코딩해 최근 DECODED_CACHE_CHUNKS개를 보관합니다.
+"""
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .format import CHUNK_HEADER, TIMESTAMP_DTYPE, VALUE_DTYPE, PathLike, RecordingReader
+
+DECODED_CACHE_CHUNKS = 64
+
+
+class MappedRecording:
+	"""
+	사용 예:
+		with MappedRecording(path) as rec:
+			frame = rec.frame_at(12.5)                  # {"timestamp": ..., "positions": (J,)}
+			window = rec.slice(10.0, 20.0)              # {"timestamp": (N,), "positions": (N, J), ...}
+			shoulder = rec.joint(1, "positions", 0, 60)  # (N,)
+	"""
+
+	def __init__(self, path: PathLike):
+		reader = RecordingReader(path)
+		self.path = Path(path)
+		self.metadata = reader.metadata
+		self.num_joints = reader.num_joints
+		self.columns = reader.columns
+		self.complete = reader.complete
+		self.chunks = reader.chunks
+		self.num_rows = reader.num_rows
+		self.compression = reader.compression
+		self._reader = reader
+		self._map = np.memmap(self.path, dtype=np.uint8, mode="r") if self.chunks else None
+
+		# 청크별 컬럼 뷰 (복사 없음, 압축 기록은 _chunk()에서 디코딩)
+		self._views: List[Dict[str, np.ndarray]] = []
+		self._decoded: Dict[int, Dict[str, np.ndarray]] = {}
+		for chunk in self.chunks if self.compression is None else ():
+			offset = chunk.offset + CHUNK_HEADER.size
+			views = {"timestamp": self._view(offset, TIMESTAMP_DTYPE, (chunk.rows,))}
+			offset += chunk.rows * TIMESTAMP_DTYPE.itemsize
+			for name in self.columns:
+				views[name] = self._view(offset, VALUE_DTYPE, (chunk.rows, self.num_joints))
+				offset += chunk.rows * self.num_joints * VALUE_DTYPE.itemsize
+			self._views.append(views)
+		# 시각 → 청크 인덱스, 행 번호 → 청크 인덱스
+		self._chunk_t_first = np.array([chunk.t_first for chunk in self.chunks], dtype=np.float64)
+		self._chunk_row_start = np.cumsum([0] + [chunk.rows for chunk in self.chunks])
+
+	def _view(self, offset: int, dtype: np.dtype, shape: Tuple[int, ...]) -> np.ndarray:
+		return np.ndarray(shape, dtype=dtype, buffer=self._map, offset=offset)
+
+	def _decode_chunk(self, index: int) -> Dict[str, np.ndarray]:
+		chunk = self.chunks[index]
+		payload_len = CHUNK_HEADER.unpack(bytes(self._map[chunk.offset:chunk.offset + CHUNK_HEADER.size]))[2]
+		start = chunk.offset + CHUNK_HEADER.size
+		return self._reader.decode(bytes(self._map[start:start + payload_len]), chunk)
+
+	def _chunk(self, index: int) -> Dict[str, np.ndarray]:
+		if self.compression is None:
+			return self._views[index]
+		decoded = self._decoded.pop(index, None)
+		if decoded is None:
+			decoded = self._decode_chunk(index)
+			while len(self._decoded) >= DECODED_CACHE_CHUNKS:
+				self._decoded.pop(next(iter(self._decoded)))
+		self._decoded[index] = decoded
+		return decoded
+
+	def __enter__(self) -> "MappedRecording":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.close()
+
+	def close(self) -> None:
+		"""매핑 해제 (반환된 뷰를 아직 들고 있으면 그 뷰가 사라질 때 해제됨)"""
+		self._views = []
+		self._decoded = {}
+		self._map = None
+
+	@property
+	def start_time(self) -> float:
+		return self.chunks[0].t_first if self.chunks else 0.0
+
+	@property
+	def end_time(self) -> float:
+		return self.chunks[-1].t_last if self.chunks else 0.0
+
+	def chunk_views(self) -> Iterator[Dict[str, np.ndarray]]:
+		"""청크별 컬럼 뷰 (읽기 전용, 파일에 매핑된 메모리 - 압축 기록은 청크마다 디코딩한 배열)"""
+		if self.compression is None:
+			return iter(self._views)
+		return (self._decode_chunk(index) for index in range(len(self.chunks)))
+
+	def _locate(self, t: float, side: str = "left") -> int:
+		"""시각 t 이상(side="right"면 초과)인 첫 행 번호"""
+		if not self.chunks:
+			return 0
+		chunk = max(0, int(np.searchsorted(self._chunk_t_first, t, side="right")) - 1)
+		timestamps = self._chunk(chunk)["timestamp"]
+		row = int(np.searchsorted(timestamps, t, side=side))
+		return int(self._chunk_row_start[chunk]) + row
+
+	def rows(self, start: int, stop: int, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+		"""행 범위 [start, stop) - 한 청크 안이면 뷰, 여러 청크에 걸치면 해당 부분만 복사"""
+		start = max(0, start)
+		stop = min(self.num_rows, stop)
+		names = ["timestamp"] + list(columns if columns is not None else self.columns)
+		if start >= stop:
+			return {
+				name: np.empty((0,) if name == "timestamp" else (0, self.num_joints), TIMESTAMP_DTYPE if name == "timestamp" else VALUE_DTYPE)
+				for name in names
+			}
+		first = int(np.searchsorted(self._chunk_row_start, start, side="right")) - 1
+		last = int(np.searchsorted(self._chunk_row_start, stop - 1, side="right")) - 1
+		parts: Dict[str, List[np.ndarray]] = {name: [] for name in names}
+		for chunk in range(first, last + 1):
+			base = int(self._chunk_row_start[chunk])
+			lo = max(start, base) - base
+			hi = min(stop, int(self._chunk_row_start[chunk + 1])) - base
+			for name in names:
+				parts[name].append(self._chunk(chunk)[name][lo:hi])
+		return {name: arrays[0] if len(arrays) == 1 else np.concatenate(arrays) for name, arrays in parts.items()}
+
+	def slice(self, t0: float, t1: float, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+		"""시각 범위 [t0, t1]의 행"""
+		return self.rows(self._locate(t0, "left"), self._locate(t1, "right"), columns)
+
+	def joint(self, index: int, column: str = "positions", t0: Optional[float] = None, t1: Optional[float] = None) -> np.ndarray:
+		"""조인트 하나의 값 (시각 범위를 주면 그 범위만)"""
+		start = 0 if t0 is None else self._locate(t0, "left")
+		stop = self.num_rows if t1 is None else self._locate(t1, "right")
+		return self.rows(start, stop, [column])[column][:, index]
+
+	def frame_at(self, t: float, interpolate: bool = True) -> Optional[Dict[str, np.ndarray]]:
+		"""
+		시각 t의 프레임 (앞뒤 샘플 사이 선형 보간, interpolate=False면 t 이전의 마지막 샘플)
+		기록 범위 밖이면 처음/마지막 샘플
+		"""
+		if not self.num_rows:
+			return None
+		after = min(self._locate(t, "left"), self.num_rows - 1)
+		before = max(after - 1, 0)
+		pair = self.rows(before, after + 1)
+		timestamps = pair["timestamp"]
+		if len(timestamps) == 1 or t >= timestamps[-1]:
+			return {name: np.array(values[-1]) for name, values in pair.items()}
+		if t <= timestamps[0] or not interpolate:
+			return {name: np.array(values[0]) for name, values in pair.items()}
+		frac = (t - timestamps[0]) / (timestamps[1] - timestamps[0])
+		frame = {"timestamp": np.array(t)}
+		for name in self.columns:
+			frame[name] = pair[name][0] + (pair[name][1] - pair[name][0]) * np.float32(frac)
+		return frame
@@ -0,0 +1,196 @@
+"""
+기록 미리보기 (요약 통계 + 다중 해상도 min/max/mean 피라미드)
+
+대시보드가 조인트 곡선을 그릴 때 기록 전체를 보내지 않도록, 저장 시 오디오 파형 개요처럼
+BASE_BIN 행씩 묶은 레벨 0부터 두 칸씩 합친 레벨을 MIN_BINS개 이하가 될 때까지 만들어
+사이드카 파일(<기록 이름>.preview.npz)에 저장합니다.
+조회 시에는 차트 폭(px) 이상의 구간 수를 가진 가장 거친 레벨 하나만 읽습니다.
+
+통계 (조인트별): min/max/range/mean/std, 최대 속도(deg/s), 제한값 근처(margin 이내)에 머문 시간(초)
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .format import RECORD_SUFFIX, PathLike
+
+PREVIEW_SUFFIX = ".preview.npz"
+PREVIEW_VERSION = 1
+BASE_BIN = 4
+MIN_BINS = 32
+LIMIT_MARGIN = 5.0  # 도
+
+
+def _read_positions(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+	if path.suffix == RECORD_SUFFIX:
+		from .memmap import MappedRecording
+
+		with MappedRecording(path) as mapped:
+			columns = mapped.rows(0, mapped.num_rows, ["positions"])
+			return np.array(columns["timestamp"]), np.array(columns["positions"])
+	with open(path, "r", encoding="utf-8") as f:
+		data = json.load(f).get("data", [])
+	timestamps = np.array([entry["timestamp"] for entry in data], dtype=np.float64)
+	positions = np.array([entry["joint_positions"] for entry in data], dtype=np.float32)
+	return timestamps, positions
+
+
+def _bin(values: np.ndarray, size: int, reducer) -> np.ndarray:
+	"""(N, J) → (ceil(N/size), J), 모자란 마지막 구간은 NaN으로 채워 reducer(NaN 무시)로 합침"""
+	rows = len(values)
+	bins = -(-rows // size)
+	padded = np.full((bins * size,) + values.shape[1:], np.nan, values.dtype)
+	padded[:rows] = values
+	return reducer(padded.reshape((bins, size) + values.shape[1:]))
+
+
+def _pyramid(timestamps: np.ndarray, positions: np.ndarray) -> List[Dict[str, np.ndarray]]:
+	"""레벨 0 (BASE_BIN 행) → 2배씩 합친 레벨들"""
+	valid = ~np.isnan(positions)
+	level = {
+		"t": timestamps[::BASE_BIN].astype(np.float64),
+		"min": _bin(positions, BASE_BIN, lambda a: np.fmin.reduce(a, axis=1)),
+		"max": _bin(positions, BASE_BIN, lambda a: np.fmax.reduce(a, axis=1)),
+		"sum": _bin(np.where(valid, positions, 0.0).astype(np.float64), BASE_BIN, lambda a: np.nansum(a, axis=1)),
+		"count": _bin(valid.astype(np.float64), BASE_BIN, lambda a: np.nansum(a, axis=1)),
+	}
+	levels = [level]
+	while len(level["t"]) > MIN_BINS:
+		level = {
+			"t": level["t"][::2],
+			"min": _bin(level["min"], 2, lambda a: np.fmin.reduce(a, axis=1)),
+			"max": _bin(level["max"], 2, lambda a: np.fmax.reduce(a, axis=1)),
+			"sum": _bin(level["sum"], 2, lambda a: np.nansum(a, axis=1)),
+			"count": _bin(level["count"], 2, lambda a: np.nansum(a, axis=1)),
+		}
+		levels.append(level)
+	return levels
+
+
+def compute_stats(
+	timestamps: np.ndarray,
+	positions: np.ndarray,
+	joint_limits: Optional[Sequence[Sequence[float]]] = None,
+	limit_margin: float = LIMIT_MARGIN,
+) -> Dict[str, Any]:
+	"""요약 통계 (조인트별 리스트)"""
+	positions = positions.astype(np.float64)
+	num_joints = positions.shape[1]
+	stats: Dict[str, Any] = {
+		"num_rows": len(timestamps),
+		"duration": float(timestamps[-1] - timestamps[0]) if len(timestamps) else 0.0,
+	}
+	if not len(timestamps) or np.isnan(positions).all():
+		return stats
+	with np.errstate(invalid="ignore"):
+		low = np.nanmin(positions, axis=0)
+		high = np.nanmax(positions, axis=0)
+		stats["min"] = np.round(low, 3).tolist()
+		stats["max"] = np.round(high, 3).tolist()
+		stats["range"] = np.round(high - low, 3).tolist()
+		stats["mean"] = np.round(np.nanmean(positions, axis=0), 3).tolist()
+		stats["std"] = np.round(np.nanstd(positions, axis=0), 3).tolist()
+	dt = np.diff(timestamps)
+	if len(dt):
+		with np.errstate(divide="ignore", invalid="ignore"):
+			velocity = np.abs(np.diff(positions, axis=0)) / dt[:, None]
+		velocity[~np.isfinite(velocity)] = np.nan
+		peak = np.nanmax(np.where(np.isnan(velocity), -np.inf, velocity), axis=0)
+		stats["peak_velocity"] = np.round(np.where(np.isfinite(peak), peak, 0.0), 2).tolist()
+	if joint_limits is not None and len(dt):
+		limits = np.asarray(joint_limits[:num_joints], dtype=np.float64)
+		lo, hi = limits.min(axis=1), limits.max(axis=1)
+		# 각 행이 다음 행까지의 시간 동안 유지된다고 보고 제한값 근처 시간 합산
+		near = (positions[:-1] <= lo + limit_margin) | (positions[:-1] >= hi - limit_margin)
+		stats["time_near_limits"] = np.round((near * dt[:, None]).sum(axis=0), 3).tolist()
+		stats["joint_limits"] = limits.tolist()
+		stats["limit_margin"] = limit_margin
+	return stats
+
+
+def preview_path(record_path: PathLike, preview_dir: PathLike) -> Path:
+	return Path(preview_dir) / (Path(record_path).name + PREVIEW_SUFFIX)
+
+
+def build_preview(
+	record_path: PathLike,
+	output: PathLike,
+	joint_limits: Optional[Sequence[Sequence[float]]] = None,
+) -> Dict[str, Any]:
+	"""기록 → 사이드카 (통계 + 피라미드), 통계 반환"""
+	record_path = Path(record_path)
+	timestamps, positions = _read_positions(record_path)
+	stats = compute_stats(timestamps, positions, joint_limits)
+	stats["source_mtime"] = record_path.stat().st_mtime
+	arrays: Dict[str, np.ndarray] = {}
+	bins = []
+	if len(timestamps):
+		for index, level in enumerate(_pyramid(timestamps, positions)):
+			with np.errstate(invalid="ignore", divide="ignore"):
+				mean = level["sum"] / level["count"]
+			arrays[f"l{index}_t"] = level["t"]
+			arrays[f"l{index}_min"] = level["min"].astype(np.float32)
+			arrays[f"l{index}_max"] = level["max"].astype(np.float32)
+			arrays[f"l{index}_mean"] = mean.astype(np.float32)
+			bins.append(len(level["t"]))
+	meta = {"version": PREVIEW_VERSION, "base_bin": BASE_BIN, "bins": bins, "stats": stats}
+	arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), np.uint8)
+	output = Path(output)
+	output.parent.mkdir(parents=True, exist_ok=True)
+	# 임시 파일 이름은 생성마다 고유 (같은 기록을 동시에 만들어도 서로의 임시 파일을 덮어쓰지 않음)
+	tmp = tempfile.NamedTemporaryFile(dir=output.parent, prefix=output.name + ".", suffix=".tmp.npz", delete=False)
+	try:
+		with tmp:
+			np.savez(tmp, **arrays)
+		os.replace(tmp.name, output)
+	except Exception:
+		Path(tmp.name).unlink(missing_ok=True)
+		raise
+	return stats
+
+
+def _round(values: np.ndarray) -> list:
+	values = np.round(values.astype(np.float64), 3)
+	if np.isnan(values).any():
+		return np.where(np.isnan(values), None, values).tolist()
+	return values.tolist()
+
+
+def read_preview(path: PathLike, width: Optional[int] = None) -> Dict[str, Any]:
+	"""
+	사이드카에서 통계와 차트 폭에 맞는 레벨 하나 읽기
+
+	Args:
+		width: 차트 폭 (구간 수, None이면 통계만)
+
+	Returns:
+		{"stats", "level", "bin_rows", "t", "min", "max", "mean"} - min/max/mean은 조인트별 리스트
+	"""
+	with np.load(path) as data:
+		meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+		if meta.get("version") != PREVIEW_VERSION:
+			raise ValueError("Unsupported preview version")
+		result: Dict[str, Any] = {"stats": meta["stats"]}
+		if width is None:
+			return result
+		bins = meta["bins"]
+		if not bins:
+			return result
+		# 구간 수가 width 이상인 가장 거친 레벨 (모두 width보다 적으면 가장 고운 레벨)
+		chosen = 0
+		for index, count in enumerate(bins):
+			if count >= width:
+				chosen = index
+		result.update({
+			"level": chosen,
+			"bin_rows": meta["base_bin"] << chosen,
+			"t": np.round(data[f"l{chosen}_t"], 4).tolist(),
+			"min": _round(data[f"l{chosen}_min"].T),
+			"max": _round(data[f"l{chosen}_max"].T),
+			"mean": _round(data[f"l{chosen}_mean"].T),
+		})
+	return result
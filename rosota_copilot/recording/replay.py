@@ -0,0 +1,261 @@
+"""
+기록 재생 엔진
+
+- 기록을 제어 주기(rate_hz) 격자로 미리 보간해 두고, 재생 스레드가 절대 시각(perf_counter_ns) 격자에 맞춰
+  틱마다 한 번의 일괄 쓰기(move_joints_absolute)로 목표 위치를 보냄 - 버스/스케줄링 지연이 누적되지 않음
+- 재생 시각 = 기준 기록 시각 + (현재 - 기준 벽시계) * speed 이므로 속도 변경/일시정지/탐색은 기준만 다시 잡음
+- 시작/탐색/반복으로 위치가 크게 바뀌면 max_velocity 이하의 직선 램프로 먼저 이동 (고정 대기 없음)
+- 틱마다 예정 시각 대비 쓰기 시작 지연을 기록 (timing)
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from ..observability.histogram import Histogram
+from .capture import JITTER_BUCKETS
+
+MIN_APPROACH_SECONDS = 0.2
+
+
+class ReplayEngine:
+	"""
+	Args:
+		robot_adapter: move_joints_absolute/enable_torque/joint_limits를 가진 어댑터
+		rate_hz: 재생(쓰기) 주기
+		max_velocity: 램프 이동 최대 속도 (deg/s)
+	"""
+
+	def __init__(self, robot_adapter, rate_hz: float = 50.0, max_velocity: float = 30.0):
+		self.robot = robot_adapter
+		self.rate_hz = float(rate_hz)
+		self.period_ns = int(round(1e9 / self.rate_hz))
+		self.max_velocity = float(max_velocity)
+
+		self._trajectory: Optional[np.ndarray] = None  # (N, J) 기록 시각 격자 (1/rate_hz 간격)
+		self.duration = 0.0
+		self.filename: Optional[str] = None
+
+		self.speed = 1.0
+		self.loop = False
+		self.paused = False
+		self.finished = False
+		self._record_anchor = 0.0  # 기준 기록 시각 (초)
+		self._wall_anchor = 0  # 기준 벽시계 (perf_counter_ns)
+		self._approach: Optional[tuple] = None  # (시작 위치, 끝 위치, 시작 ns, 길이 ns)
+		self._last_command: Optional[np.ndarray] = None
+
+		self.ticks = 0
+		self.overruns = 0
+		self.write_failures = 0
+		self.timing = Histogram(JITTER_BUCKETS)
+		self.max_lateness = 0.0
+
+		self._lock = threading.Lock()
+		self._stop_event = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+
+	@property
+	def running(self) -> bool:
+		return self._thread is not None and self._thread.is_alive()
+
+	# ---- 준비 ----
+
+	def load(self, timestamps: Sequence[float], positions: np.ndarray, filename: Optional[str] = None) -> None:
+		"""기록을 제어 주기 격자로 보간 (조인트 제한값으로 클리핑)"""
+		timestamps = np.asarray(timestamps, dtype=np.float64)
+		positions = np.asarray(positions, dtype=np.float64)
+		valid = ~np.isnan(positions).any(axis=1)
+		timestamps, positions = timestamps[valid], positions[valid]
+		if len(timestamps) < 2:
+			raise ValueError("Recording has fewer than 2 valid samples")
+		# 단조 증가하지 않는 시각(중복 등) 제거
+		keep = np.concatenate(([True], np.diff(timestamps) > 0))
+		timestamps, positions = timestamps[keep], positions[keep]
+		t0 = timestamps[0]
+		self.duration = float(timestamps[-1] - t0)
+		grid = np.arange(0.0, self.duration + 0.5 / self.rate_hz, 1.0 / self.rate_hz)
+		trajectory = np.empty((len(grid), positions.shape[1]))
+		for joint in range(positions.shape[1]):
+			trajectory[:, joint] = np.interp(grid, timestamps - t0, positions[:, joint])
+		limits = np.asarray(self.robot.joint_limits[: positions.shape[1]], dtype=np.float64)
+		trajectory = np.clip(trajectory, limits.min(axis=1), limits.max(axis=1))
+		self._trajectory = trajectory
+		self.filename = filename
+
+	def _sample(self, record_time: float) -> np.ndarray:
+		"""기록 시각의 목표 위치 (미리 보간한 격자 사이는 선형 보간)"""
+		trajectory = self._trajectory
+		position = min(max(record_time, 0.0), self.duration) * self.rate_hz
+		index = min(int(position), len(trajectory) - 1)
+		frac = position - index
+		if frac <= 0.0 or index + 1 >= len(trajectory):
+			return trajectory[index]
+		return trajectory[index] + (trajectory[index + 1] - trajectory[index]) * frac
+
+	# ---- 제어 ----
+
+	def start(self, speed: float = 1.0, loop: bool = False, start_time: float = 0.0) -> None:
+		if self._trajectory is None:
+			raise RuntimeError("No trajectory loaded")
+		if self.running:
+			raise RuntimeError("Replay already running")
+		self.speed = max(0.05, float(speed))
+		self.loop = loop
+		self.paused = False
+		self.finished = False
+		self.ticks = 0
+		self.overruns = 0
+		self.write_failures = 0
+		self.timing.reset()
+		self.max_lateness = 0.0
+		self._last_command = None
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self._run, args=(float(start_time),), name="replay", daemon=True)
+		self._thread.start()
+
+	def stop(self) -> None:
+		self._stop_event.set()
+		if self._thread is not None and self._thread is not threading.current_thread():
+			self._thread.join()
+		self._thread = None
+
+	def _record_time(self, now: int) -> float:
+		# 일시정지/램프 이동 중에는 재생 시각이 멈춰 있음
+		if self.paused or self._approach is not None:
+			return self._record_anchor
+		return self._record_anchor + (now - self._wall_anchor) / 1e9 * self.speed
+
+	def _reanchor(self, record_time: float, now: Optional[int] = None) -> None:
+		self._record_anchor = record_time
+		self._wall_anchor = now if now is not None else time.perf_counter_ns()
+
+	def pause(self) -> None:
+		with self._lock:
+			if not self.paused:
+				now = time.perf_counter_ns()
+				self._reanchor(self._record_time(now), now)
+				self.paused = True
+
+	def resume(self) -> None:
+		with self._lock:
+			if self.paused:
+				self.paused = False
+				self._reanchor(self._record_anchor)
+
+	def set_speed(self, speed: float) -> None:
+		with self._lock:
+			now = time.perf_counter_ns()
+			self._reanchor(self._record_time(now), now)
+			self.speed = max(0.05, float(speed))
+
+	def seek(self, record_time: float) -> None:
+		"""기록 시각으로 이동 (목표가 멀면 램프로 이동 후 이어서 재생)"""
+		with self._lock:
+			record_time = min(max(float(record_time), 0.0), self.duration)
+			self._begin_approach(self._sample(record_time))
+			self._reanchor(record_time)
+
+	@property
+	def position(self) -> float:
+		"""현재 재생 위치 (기록 시각, 초)"""
+		with self._lock:
+			return min(self._record_time(time.perf_counter_ns()), self.duration)
+
+	# ---- 재생 루프 ----
+
+	def _begin_approach(self, target: np.ndarray) -> None:
+		"""마지막 명령(없으면 현재 위치)에서 target까지 최대 속도 이하 램프 준비"""
+		start = self._last_command
+		if start is None:
+			current = self.robot.get_state().get("joint_positions") or target
+			start = np.asarray(current[: len(target)], dtype=np.float64)
+		distance = float(np.max(np.abs(target - start))) if len(target) else 0.0
+		duration = max(MIN_APPROACH_SECONDS, distance / self.max_velocity) if self.max_velocity > 0 else MIN_APPROACH_SECONDS
+		self._approach = (start, np.array(target), time.perf_counter_ns(), int(duration * 1e9))
+
+	def _next_command(self, now: int) -> Optional[np.ndarray]:
+		"""이번 틱의 목표 위치 (재생 종료 시 None)"""
+		with self._lock:
+			if self._approach is not None:
+				start, end, started, length = self._approach
+				frac = (now - started) / length
+				if frac < 1.0:
+					return start + (end - start) * frac
+				# 램프 완료 - 재생 시각 기준을 지금으로
+				self._approach = None
+				self._reanchor(self._record_anchor, now)
+				return end
+			record_time = self._record_time(now)
+			if record_time >= self.duration:
+				if not self.loop:
+					# 마지막 프레임을 정확히 한 번 보낸 뒤 종료
+					final = self._trajectory[-1]
+					if self._last_command is not None and np.array_equal(self._last_command, final):
+						return None
+					return final
+				self._begin_approach(self._trajectory[0])
+				self._reanchor(0.0, now)
+				return self._trajectory[-1]
+			return self._sample(record_time)
+
+	def _run(self, start_time: float) -> None:
+		try:
+			self.robot.enable_torque()
+			with self._lock:
+				self._reanchor(min(max(start_time, 0.0), self.duration))
+				self._begin_approach(self._sample(self._record_anchor))
+
+			period = self.period_ns
+			next_tick = time.perf_counter_ns()
+			while not self._stop_event.is_set():
+				now = time.perf_counter_ns()
+				if now < next_tick:
+					time.sleep((next_tick - now) / 1e9)
+					continue
+				lateness = (now - next_tick) / 1e9
+				self.timing.observe(lateness)
+				if lateness > self.max_lateness:
+					self.max_lateness = lateness
+
+				command = self._next_command(now)
+				if command is None:
+					self.finished = True
+					break
+				if self._last_command is None or not np.array_equal(command, self._last_command):
+					targets = {joint: float(value) for joint, value in enumerate(command)}
+					if not self.robot.move_joints_absolute(targets):
+						self.write_failures += 1
+					self._last_command = command
+				self.ticks += 1
+
+				# 절대 시각 격자 (밀린 틱은 몰아서 보내지 않고 건너뜀)
+				next_tick += period
+				now = time.perf_counter_ns()
+				if next_tick <= now:
+					missed = (now - next_tick) // period + 1
+					self.overruns += missed
+					next_tick += missed * period
+		except Exception as e:
+			print(f"[Recorder] Replay error: {e}")
+
+	def status(self) -> Dict[str, Any]:
+		return {
+			"filename": self.filename,
+			"running": self.running,
+			"finished": self.finished,
+			"paused": self.paused,
+			"approaching": self._approach is not None,
+			"position": round(self.position, 3) if self._trajectory is not None else 0.0,
+			"duration": round(self.duration, 3),
+			"speed": self.speed,
+			"loop": self.loop,
+			"rate_hz": self.rate_hz,
+			"timing": {
+				"ticks": self.ticks,
+				"overruns": self.overruns,
+				"write_failures": self.write_failures,
+				"lateness": {**self.timing.summary(), "max_ms": round(self.max_lateness * 1000.0, 3)},
+			},
+		}
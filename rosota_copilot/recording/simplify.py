@@ -0,0 +1,355 @@
+"""
+궤적 단순화 (키프레임 프로그램)
+
+고주기 기록에는 긴 정지 구간과 거의 직선인 구간이 많아 그대로 재생하면 버스 대역폭을 낭비합니다.
+아래 순서로 줄인 키프레임을 프로그램 파일로 저장하고, 재생은 ReplayEngine이 키프레임 사이를 보간합니다.
+
+1. trim_stationary: 앞/뒤 정지 구간 제거, max_pause초보다 긴 중간 정지 구간은 max_pause초로 단축
+   (정지 = 구간 시작 자세에서 모든 조인트가 stationary_tolerance 이내 - 행간 변화가 아니라 누적 변위라서 느린 이동은 남음)
+2. resample: 목표 주기 격자로 재샘플링 (선택)
+3. rdp_indices: 시간 축 기준 Ramer–Douglas–Peucker - 키프레임 사이 선형 보간과 원래 궤적의 차이가
+   모든 조인트에서 tolerance(도) 이하가 되도록 필요한 점만 남김 (RDP_WINDOW행 구간별로 실행해 이어 붙임)
+
+오차는 정리한 원래 샘플 전체(잘라낸 앞/뒤 정지 구간 포함, 줄인 시간축으로 옮김)를 키프레임 보간값과 비교합니다.
+
+CLI:
+	python -m rosota_copilot.recording.simplify data/records/record_manual_*.rec --tolerance 0.5 --rate 50
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .format import RECORD_SUFFIX, PathLike, RecordingReader
+
+PROGRAM_SUFFIX = ".program.json"
+PROGRAM_VERSION = 1
+
+
+def _clean(timestamps: np.ndarray, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+	"""NaN 행과 단조 증가하지 않는 시각 제거"""
+	timestamps = np.asarray(timestamps, dtype=np.float64)
+	positions = np.asarray(positions, dtype=np.float64)
+	valid = ~np.isnan(positions).any(axis=1)
+	timestamps, positions = timestamps[valid], positions[valid]
+	keep = np.concatenate(([True], np.diff(timestamps) > 0)) if len(timestamps) else np.zeros(0, bool)
+	return timestamps[keep], positions[keep]
+
+
+def _first_departure(positions: np.ndarray, anchor: np.ndarray, start: int, tolerance: float) -> int:
+	"""start행부터 anchor 자세에서 어느 조인트든 tolerance를 넘게 벗어나는 첫 행 (없으면 행 수)"""
+	count = len(positions)
+	block = 64
+	while start < count:
+		stop = min(count, start + block)
+		away = np.flatnonzero(np.abs(positions[start:stop] - anchor).max(axis=1) > tolerance)
+		if len(away):
+			return start + int(away[0])
+		start = stop
+		block *= 2
+	return count
+
+
+def _pauses(timestamps: np.ndarray, positions: np.ndarray, tolerance: float, min_duration: float) -> List[Tuple[int, int]]:
+	"""
+	정지 구간 (시작 행, 끝 행) - 시작 자세에서 모든 조인트가 tolerance 이내로 min_duration초보다 오래 머문 구간
+
+	min_duration보다 긴 구간은 최소 k행이므로, k행 창이 첫 행 자세에서 벗어나지 않는 행만 벡터 연산으로 후보로 고르고
+	후보에서만 시작 자세 기준으로 끝 행을 찾습니다.
+	"""
+	count = len(timestamps)
+	span_end = np.searchsorted(timestamps, timestamps + min_duration, side="right")
+	has_span = span_end < count
+	if not has_span.any():
+		return []
+	k = int((span_end[has_span] - np.flatnonzero(has_span)).min()) + 1
+	# 오프셋마다 벗어난 행을 버려 움직이는 구간은 처음 몇 번 만에 빠짐
+	candidates = np.arange(count - k + 1)
+	for offset in range(1, k):
+		if not len(candidates):
+			return []
+		still = np.abs(positions[candidates + offset] - positions[candidates]).max(axis=1) <= tolerance
+		candidates = candidates[still]
+
+	pauses: List[Tuple[int, int]] = []
+	index = 0
+	while index < len(candidates):
+		start = int(candidates[index])
+		end = _first_departure(positions, positions[start], start + k, tolerance) - 1
+		if timestamps[end] - timestamps[start] > min_duration:
+			pauses.append((start, end))
+			index = int(np.searchsorted(candidates, end, side="right"))
+		else:
+			index += 1
+	return pauses
+
+
+def _trim_timeline(timestamps: np.ndarray, positions: np.ndarray, tolerance: float, max_pause: float) -> Tuple[np.ndarray, int, int]:
+	"""
+	정지 구간을 줄인 시간축 (모든 행, first행이 0초) 과 남길 행 범위 [first, last]
+
+	앞 정지 구간은 첫 자세에서 tolerance를 넘게 벗어나기 직전 행까지, 뒤 정지 구간은 마지막 자세 기준으로 같은 방식.
+	잘린 행은 음수/끝 이후 시각이 되어 키프레임 보간 시 시작/끝 자세로 비교됩니다.
+	"""
+	count = len(timestamps)
+	departure = _first_departure(positions, positions[0], 1, tolerance)
+	if departure == count:
+		return timestamps - timestamps[0], 0, 0
+	first = departure - 1
+	last = count - _first_departure(positions[::-1], positions[-1], 1, tolerance)
+
+	dt = np.diff(timestamps)
+	for start, end in _pauses(timestamps[first:last + 1], positions[first:last + 1], tolerance, max_pause):
+		# 점은 그대로 두고 구간 안의 dt를 비례해서 줄임
+		duration = timestamps[first + end] - timestamps[first + start]
+		dt[first + start:first + end] *= max_pause / duration
+	mapped = np.concatenate(([0.0], np.cumsum(dt)))
+	return mapped - mapped[first], first, last
+
+
+def trim_stationary(
+	timestamps: np.ndarray,
+	positions: np.ndarray,
+	tolerance: float = 0.1,
+	max_pause: float = 0.5,
+) -> Tuple[np.ndarray, np.ndarray]:
+	"""
+	정지 구간 줄이기
+
+	구간 시작 자세에서 모든 조인트가 tolerance(도) 이내에 머무는 구간을 정지로 보고,
+	맨 앞/맨 뒤 정지 구간은 없애고 max_pause초보다 긴 중간 정지 구간은 max_pause초로 줄입니다 (점은 그대로, 시각만 당김).
+
+	Returns:
+		(0부터 시작하는 timestamps, positions)
+	"""
+	if len(timestamps) == 0:
+		return timestamps, positions
+	mapped, first, last = _trim_timeline(timestamps, positions, tolerance, max_pause)
+	return mapped[first:last + 1], positions[first:last + 1]
+
+
+def resample(timestamps: np.ndarray, positions: np.ndarray, rate_hz: float) -> Tuple[np.ndarray, np.ndarray]:
+	"""rate_hz 격자로 선형 재샘플링 (마지막 샘플 포함)"""
+	if len(timestamps) < 2:
+		return timestamps, positions
+	grid = np.arange(timestamps[0], timestamps[-1], 1.0 / rate_hz)
+	if grid[-1] < timestamps[-1]:
+		grid = np.append(grid, timestamps[-1])
+	resampled = np.empty((len(grid), positions.shape[1]))
+	for joint in range(positions.shape[1]):
+		resampled[:, joint] = np.interp(grid, timestamps, positions[:, joint])
+	return grid, resampled
+
+
+RDP_WINDOW = 2048  # 행 - rdp_indices를 이 길이 구간으로 나눠 실행 (긴 기록의 분할 깊이/반복 계산 제한)
+
+
+def _rdp_segment(timestamps: np.ndarray, positions: np.ndarray, start: int, end: int, tolerance: float, keep: np.ndarray) -> None:
+	"""[start, end] 구간 RDP - 양 끝은 호출자가 남김"""
+	stack = [(start, end)]
+	while stack:
+		start, end = stack.pop()
+		if end - start < 2:
+			continue
+		frac = (timestamps[start + 1:end] - timestamps[start]) / (timestamps[end] - timestamps[start])
+		line = positions[start] + frac[:, None] * (positions[end] - positions[start])
+		error = np.abs(positions[start + 1:end] - line).max(axis=1)
+		worst = int(np.argmax(error))
+		if error[worst] > tolerance:
+			split = start + 1 + worst
+			keep[split] = True
+			stack.append((start, split))
+			stack.append((split, end))
+
+
+def rdp_indices(timestamps: np.ndarray, positions: np.ndarray, tolerance: float, window: int = RDP_WINDOW) -> np.ndarray:
+	"""
+	시간 축 Ramer–Douglas–Peucker - 남길 행 번호
+
+	구간 양 끝을 잇는 시간 선형 보간과 중간 점들의 차이(조인트별 절댓값 최대)가 tolerance를 넘으면
+	가장 먼 점에서 나눕니다. 구간마다 오차 계산은 벡터 연산 한 번입니다.
+	전체를 window행 구간으로 나눠 따로 실행하고 이어 붙이므로 (구간 경계 행은 항상 남음)
+	비용이 기록 길이에 선형이고, 오차 보장은 구간마다 그대로 유지됩니다.
+	"""
+	count = len(timestamps)
+	if count <= 2:
+		return np.arange(count)
+	keep = np.zeros(count, bool)
+	bounds = list(range(0, count - 1, max(2, window))) + [count - 1]
+	keep[bounds] = True
+	for start, end in zip(bounds, bounds[1:]):
+		_rdp_segment(timestamps, positions, start, end, tolerance, keep)
+	return np.flatnonzero(keep)
+
+
+def interpolate(keyframe_times: np.ndarray, keyframes: np.ndarray, timestamps: np.ndarray) -> np.ndarray:
+	"""키프레임을 timestamps에서 선형 보간"""
+	out = np.empty((len(timestamps), keyframes.shape[1]))
+	for joint in range(keyframes.shape[1]):
+		out[:, joint] = np.interp(timestamps, keyframe_times, keyframes[:, joint])
+	return out
+
+
+def simplify(
+	timestamps: np.ndarray,
+	positions: np.ndarray,
+	tolerance: float = 0.5,
+	rate_hz: Optional[float] = None,
+	stationary_tolerance: float = 0.1,
+	max_pause: float = 0.5,
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+	"""
+	기록 → 키프레임
+
+	Args:
+		tolerance: 키프레임 보간 허용 오차 (도)
+		rate_hz: 단순화 전에 재샘플링할 주기 (None이면 원래 샘플)
+		stationary_tolerance: 정지로 보는 구간 시작 자세로부터의 변위 (도)
+		max_pause: 중간 정지 구간 최대 길이 (초)
+
+	Returns:
+		(keyframe_times, keyframes, report)
+
+	Raises:
+		ValueError: 유효한 샘플이 없거나 움직임이 없어 키프레임이 하나뿐인 경우
+	"""
+	timestamps, positions = _clean(timestamps, positions)
+	if len(timestamps) == 0:
+		raise ValueError("Recording has no valid samples")
+	original_points = len(timestamps)
+	original_duration = float(timestamps[-1] - timestamps[0])
+
+	mapped_t, first, last = _trim_timeline(timestamps, positions, stationary_tolerance, max_pause)
+	trimmed_t, trimmed_p = mapped_t[first:last + 1], positions[first:last + 1]
+	work_t, work_p = resample(trimmed_t, trimmed_p, rate_hz) if rate_hz else (trimmed_t, trimmed_p)
+	keep = rdp_indices(work_t, work_p, tolerance)
+	keyframe_times, keyframes = work_t[keep], work_p[keep]
+	if len(keyframe_times) < 2:
+		# 처음부터 끝까지 정지 - 키프레임 하나로는 재생할 수 없음
+		raise ValueError("Recording has no motion to simplify (single keyframe)")
+
+	# 잘라낸 정지 구간까지 포함한 원래 샘플 전체와 비교
+	error = np.abs(interpolate(keyframe_times, keyframes, mapped_t) - positions)
+	report = {
+		"original_points": original_points,
+		"trimmed_points": len(trimmed_t),
+		"resampled_points": len(work_t) if rate_hz else None,
+		"keyframes": len(keyframe_times),
+		"reduction": round(1.0 - len(keyframe_times) / original_points, 4),
+		"original_duration": round(original_duration, 3),
+		"duration": round(float(trimmed_t[-1]), 3),
+		"max_error": round(float(error.max()), 4),
+		"rms_error": round(float(np.sqrt(np.mean(np.square(error)))), 4),
+		"max_error_per_joint": np.round(error.max(axis=0), 4).tolist(),
+	}
+	return keyframe_times, keyframes, report
+
+
+# ---- 파일 ----
+
+def _read_source(path: Path) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+	if path.suffix == RECORD_SUFFIX:
+		reader = RecordingReader(path)
+		columns = reader.read_all()
+		return columns["timestamp"], columns["positions"], reader.metadata
+	with open(path, "r", encoding="utf-8") as f:
+		record = json.load(f)
+	data = record.get("data", [])
+	timestamps = np.array([entry["timestamp"] for entry in data], dtype=np.float64)
+	positions = np.array([entry["joint_positions"] for entry in data], dtype=np.float64)
+	return timestamps, positions, record.get("metadata", {})
+
+
+def program_path(source: PathLike, program_dir: PathLike) -> Path:
+	return Path(program_dir) / (Path(source).stem + PROGRAM_SUFFIX)
+
+
+def simplify_record(source: PathLike, output: Optional[PathLike] = None, **options) -> Dict[str, Any]:
+	"""
+	기록 파일 → 키프레임 프로그램 파일
+
+	Args:
+		source: 기록 파일 (.rec 또는 기존 JSON)
+		output: 프로그램 파일 경로 (None이면 저장하지 않고 보고서만)
+		**options: simplify() 옵션
+
+	Returns:
+		보고서 (저장했으면 "program" 경로 포함)
+	"""
+	source = Path(source)
+	timestamps, positions, metadata = _read_source(source)
+	keyframe_times, keyframes, report = simplify(timestamps, positions, **options)
+	report["source"] = source.name
+	if output is not None:
+		output = Path(output)
+		output.parent.mkdir(parents=True, exist_ok=True)
+		program = {
+			"metadata": {
+				"version": PROGRAM_VERSION,
+				"type": "keyframe_program",
+				"source": source.name,
+				"mode": metadata.get("mode"),
+				"joint_names": metadata.get("joint_names") or [],
+				"created_at": datetime.now().isoformat(),
+				"duration": report["duration"],
+				"num_steps": report["keyframes"],
+				"options": options,
+				"report": dict(report),
+			},
+			"timestamps": np.round(keyframe_times, 6).tolist(),
+			"positions": np.round(keyframes, 4).tolist(),
+		}
+		tmp_path = output.with_name(output.name + ".tmp")
+		with open(tmp_path, "w", encoding="utf-8") as f:
+			json.dump(program, f)
+		os.replace(tmp_path, output)
+		report["program"] = str(output)
+	return report
+
+
+def load_program(path: PathLike) -> Tuple[np.ndarray, np.ndarray, Dict[str, Any]]:
+	"""프로그램 파일 → (keyframe_times, keyframes, metadata)"""
+	with open(path, "r", encoding="utf-8") as f:
+		program = json.load(f)
+	metadata = program.get("metadata", {})
+	if metadata.get("type") != "keyframe_program":
+		raise ValueError(f"Not a keyframe program: {path}")
+	return np.asarray(program["timestamps"], dtype=np.float64), np.asarray(program["positions"], dtype=np.float64), metadata
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+	import argparse
+
+	parser = argparse.ArgumentParser(prog="python -m rosota_copilot.recording.simplify", description="Simplify recordings into keyframe programs")
+	parser.add_argument("sources", nargs="+", help="recording files")
+	parser.add_argument("--tolerance", type=float, default=0.5, help="max interpolation error (deg)")
+	parser.add_argument("--rate", type=float, default=None, help="resample rate before simplification (Hz)")
+	parser.add_argument("--stationary-tolerance", type=float, default=0.1, help="displacement from a pause's start pose treated as stationary (deg)")
+	parser.add_argument("--max-pause", type=float, default=0.5, help="longest kept pause (s)")
+	parser.add_argument("-o", "--output-dir", default=None, help="write <name>.program.json here (default: report only)")
+	args = parser.parse_args(argv)
+
+	options = {
+		"tolerance": args.tolerance,
+		"rate_hz": args.rate,
+		"stationary_tolerance": args.stationary_tolerance,
+		"max_pause": args.max_pause,
+	}
+	status = 0
+	for source in args.sources:
+		output = program_path(source, args.output_dir) if args.output_dir else None
+		try:
+			report = simplify_record(source, output, **options)
+		except (OSError, ValueError) as e:
+			print(f"[Simplify] {Path(source).name}: {e}")
+			status = 1
+			continue
+		print(json.dumps(report))
+	return status
+
+
+if __name__ == "__main__":
+	raise SystemExit(main())
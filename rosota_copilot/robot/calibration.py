@@ -1,6 +1,12 @@
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, List, Sequence
 import json
+import math
 import os
+import threading
+
+NUM_JOINTS = 6
+TRACKING_DEMAND = "calibration"  # 범위 측정 중 StatePublisher 수요 이름
+SNAPSHOT_MAX_AGE = 0.5  # 초, 이보다 오래된 스냅샷은 버튼 기록에 쓰지 않고 버스를 직접 읽음
 
 
 class CalibrationManager:
@@ -17,17 +23,131 @@ class CalibrationManager:
 			"tcp_offset": {"x": 0.0, "y": 0.0, "z": 0.0, "rx": 0.0, "ry": 0.0, "rz": 0.0},
 			"home_pose": {"joints": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]},
 		}
-		# 캘리브레이션 마법사 상태
-		self.calibration_current_step = 0
+		# 캘리브레이션 마법사 상태 (step 2 동안 StatePublisher 스냅샷으로 min/max 추적)
+		self.publisher = None
+		self.tracking_rate_hz = 50.0
+		self._step = 0
 		self.calibration_max_steps = 2  # 2단계: 범위 측정, 저장
 		# 각 조인트의 최소/최대값 측정용
 		self.joint_min_positions = [None] * 6  # 각 조인트의 최소 위치 (기록된 값)
 		self.joint_max_positions = [None] * 6  # 각 조인트의 최대 위치 (기록된 값)
 		self.current_joint_index = 0  # 현재 측정 중인 조인트 인덱스
-		# 실시간 추적용 (조인트를 움직이는 동안 자동으로 업데이트)
-		self.realtime_min_positions = [None] * 6  # 실시간 최소값 추적
-		self.realtime_max_positions = [None] * 6  # 실시간 최대값 추적
-		self.realtime_current_positions = [0.0] * 6  # 실시간 현재 위치
+		# 실시간 추적용 (발행 스레드가 스냅샷마다 갱신, NaN은 아직 값 없음)
+		# numpy 배열은 첫 추적 때 생성 (서버 시작 시 numpy를 import하지 않도록)
+		self._realtime_lock = threading.Lock()
+		self._realtime_min = None
+		self._realtime_max = None
+		self._realtime_current = None
+		self.realtime_seq = 0  # 마지막으로 반영한 스냅샷 번호
+		# 홈 이동 (robot/homing.py, 실행 중이거나 마지막으로 실행한 이동)
+		self.homing = None
+		self.home_options: Dict[str, Any] = {}  # HomingMove 인자 (max_velocity, tolerance, settle_timeout 등)
+		self.home_progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+	
+	@property
+	def calibration_current_step(self) -> int:
+		return self._step
+	
+	@calibration_current_step.setter
+	def calibration_current_step(self, step: int) -> None:
+		self._step = step
+		self._update_tracking_demand()
+	
+	@property
+	def tracking(self) -> bool:
+		"""조인트 범위 측정 중인지 (스냅샷마다 min/max 추적)"""
+		return self._step == 2
+	
+	@property
+	def realtime_min_positions(self) -> List[Optional[float]]:
+		return self._to_list(self._realtime_min, None)
+	
+	@property
+	def realtime_max_positions(self) -> List[Optional[float]]:
+		return self._to_list(self._realtime_max, None)
+	
+	@property
+	def realtime_current_positions(self) -> List[Optional[float]]:
+		return self._to_list(self._realtime_current, 0.0)
+	
+	@staticmethod
+	def _to_list(values, default: Optional[float]) -> List[Optional[float]]:
+		"""추적 배열 → 리스트 (아직 추적 전이면 default)"""
+		if values is None:
+			return [default] * NUM_JOINTS
+		return [None if math.isnan(v) else float(v) for v in values]
+	
+	def attach_publisher(self, publisher, rate_hz: Optional[float] = None) -> None:
+		"""
+		StatePublisher 스냅샷으로 실시간 min/max 추적 (별도 버스 읽기 없음)
+		범위 측정 단계 동안만 rate_hz(기본: 발행자 최대 주기)로 수요를 등록해 빠른 움직임의 극값도 잡음
+		"""
+		self.publisher = publisher
+		self.tracking_rate_hz = rate_hz or publisher.max_rate_hz
+		publisher.add_listener(self.on_snapshot)
+		self._update_tracking_demand()
+	
+	def _update_tracking_demand(self) -> None:
+		if self.publisher is None:
+			return
+		if self.tracking:
+			self.publisher.acquire(TRACKING_DEMAND, self.tracking_rate_hz)
+		else:
+			self.publisher.release(TRACKING_DEMAND)
+	
+	def on_snapshot(self, snapshot) -> None:
+		"""StatePublisher 리스너 (발행 스레드에서 호출, 벡터 연산 몇 번뿐)"""
+		if not self.tracking or not snapshot.connected:
+			return
+		positions = snapshot.state.get("joint_positions")
+		if positions:
+			self._track(positions, snapshot.seq)
+	
+	def _track(self, positions: Sequence[float], seq: int = 0) -> None:
+		import numpy as np
+		
+		values = np.asarray(positions[:NUM_JOINTS], dtype=np.float64)
+		count = len(values)
+		with self._realtime_lock:
+			if self._realtime_min is None:
+				self._realtime_min = np.full(NUM_JOINTS, np.nan)
+				self._realtime_max = np.full(NUM_JOINTS, np.nan)
+				self._realtime_current = np.zeros(NUM_JOINTS)
+			self._realtime_current[:count] = values
+			np.fmin(self._realtime_min[:count], values, out=self._realtime_min[:count])
+			np.fmax(self._realtime_max[:count], values, out=self._realtime_max[:count])
+			self.realtime_seq = seq
+	
+	def reset_realtime(self, joint_index: Optional[int] = None) -> None:
+		"""실시간 min/max 초기화 (joint_index가 None이면 전체 + 현재 위치)"""
+		with self._realtime_lock:
+			if self._realtime_min is None:
+				return
+			if joint_index is None:
+				self._realtime_min[:] = math.nan
+				self._realtime_max[:] = math.nan
+				self._realtime_current[:] = 0.0
+			elif joint_index < NUM_JOINTS:
+				self._realtime_min[joint_index] = math.nan
+				self._realtime_max[joint_index] = math.nan
+	
+	def reset_wizard(self) -> None:
+		"""마법사 상태 초기화 (범위 측정 수요도 해제)"""
+		self.calibration_current_step = 0
+		self.joint_min_positions = [None] * 6
+		self.joint_max_positions = [None] * 6
+		self.current_joint_index = 0
+		self.reset_realtime()
+	
+	def _current_positions(self) -> List[float]:
+		"""최근 스냅샷의 조인트 위치 (없거나 오래됐으면 버스 직접 읽기)"""
+		snapshot = self.publisher.latest if self.publisher is not None else None
+		if snapshot is not None and snapshot.connected and snapshot.age() < SNAPSHOT_MAX_AGE:
+			positions = snapshot.state.get("joint_positions")
+			if positions:
+				return list(positions)
+		state = self.robot.get_state()
+		return state.get("joint_positions", [0.0] * 6)
 	
 	def _log(self, message: str, level: str = "info"):
 		"""로그 출력 (콜백이 있으면 콜백 호출, 없으면 print)"""
@@ -36,54 +156,54 @@ class CalibrationManager:
 		else:
 			print(f"[{level.upper()}] {message}")
 
-	def home(self) -> bool:
+	def start_home(self, progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None):
 		"""
-		로봇을 홈 포지션으로 이동
-		SO-100의 경우 각 조인트를 홈 포지션으로 이동
+		홈 포지션으로 동기화 이동 시작 (백그라운드 스레드, HomingMove 반환)
+		모든 조인트를 한 궤적으로 함께 움직이고 Moving 레지스터/현재 위치로 도착을 판정합니다.
+		
+		Raises:
+			RuntimeError: 로봇 미연결 또는 이미 홈 이동 중
 		"""
 		if not self.robot or not self.robot.connected:
-			self._log("Cannot move to home: robot not connected", "error")
-			return False
+			raise RuntimeError("Robot not connected")
+		if self.homing is not None and self.homing.running:
+			raise RuntimeError("Homing already in progress")
 		
-		home_joints = self.data["home_pose"]["joints"]
-		success = True
-		import time
+		from .homing import HomingMove
 		
-		self._log("Starting home movement...", "info")
-		self._log(f"Target home position: {home_joints}", "info")
+		home_joints = self.data["home_pose"]["joints"][:6]
+		callback = progress_callback or self.home_progress_callback
 		
-		# 각 조인트를 홈 포지션으로 이동
-		for i, target_deg in enumerate(home_joints):
-			if i >= 6:  # 6개 조인트만
-				break
-			
-			# 현재 위치 가져오기
-			state = self.robot.get_state()
-			current_pos = state.get("joint_positions", [0.0] * 6)[i]
-			
-			# 목표 위치까지 이동
-			delta = target_deg - current_pos
-			if abs(delta) > 0.1:  # 0.1도 이상 차이만 이동
-				joint_name = self.robot.JOINT_NAMES[i] if hasattr(self.robot, 'JOINT_NAMES') else f"Joint {i+1}"
-				self._log(f"Moving {joint_name} from {current_pos:.1f}° to {target_deg:.1f}° (delta: {delta:.1f}°)", "info")
-				result = self.robot.move_joint_delta(i, delta)
-				if not result:
-					self._log(f"Failed to move {joint_name} to home position", "error")
-					success = False
-				else:
-					self._log(f"{joint_name} moved successfully, waiting for stabilization...", "info")
-					# 조인트 이동 대기 (서보가 목표 위치에 도달할 시간)
-					time.sleep(0.5)  # 각 조인트 이동 대기 시간 증가
-			else:
-				joint_name = self.robot.JOINT_NAMES[i] if hasattr(self.robot, 'JOINT_NAMES') else f"Joint {i+1}"
-				self._log(f"{joint_name} already at home position ({current_pos:.1f}°)", "info")
-		
-		if success:
-			self._log("Home movement completed successfully", "success")
-		else:
-			self._log("Home movement completed with errors", "warning")
+		def on_progress(status: Dict[str, Any]) -> None:
+			if status["phase"] in ("done", "timeout", "cancelled", "error"):
+				self._log(status["message"], "success" if status["phase"] == "done" else "warning")
+			if callback is not None:
+				callback(status)
 		
-		return success
+		self._log(f"Starting home movement to {home_joints}", "info")
+		self.homing = HomingMove(self.robot, home_joints, progress_callback=on_progress, **self.home_options)
+		self.homing.start()
+		return self.homing
+	
+	def cancel_home(self) -> bool:
+		"""진행 중인 홈 이동 취소 (진행 중이 아니면 False)"""
+		if self.homing is None or not self.homing.running:
+			return False
+		self.homing.cancel()
+		return True
+	
+	def home(self) -> bool:
+		"""
+		로봇을 홈 포지션으로 이동 (완료까지 대기하는 동기 버전)
+		이벤트 루프에서는 start_home()을 사용할 것
+		"""
+		try:
+			homing = self.start_home()
+		except RuntimeError as e:
+			self._log(f"Cannot move to home: {e}", "error")
+			return False
+		homing.join()
+		return homing.succeeded
 
 	def zero_joints(self) -> bool:
 		"""
@@ -250,9 +370,7 @@ class CalibrationManager:
 			# 조인트 범위 초기화
 			self.joint_min_positions = [None] * 6
 			self.joint_max_positions = [None] * 6
-			self.realtime_min_positions = [None] * 6
-			self.realtime_max_positions = [None] * 6
-			self.realtime_current_positions = [0.0] * 6
+			self.reset_realtime()
 			self.current_joint_index = 0
 			
 			# Step 1을 건너뛰고 바로 Step 2 (조인트 범위 측정)로
@@ -416,53 +534,50 @@ class CalibrationManager:
 
 	def update_realtime_positions(self) -> Dict[str, Any]:
 		"""
-		실시간으로 조인트 위치를 업데이트하고 min/max 추적
-		조인트를 움직이는 동안 자동으로 호출되어야 함
+		실시간 조인트 위치와 추적된 min/max 반환
+		StatePublisher가 연결되어 있으면 스냅샷마다 이미 갱신되므로 버스를 읽지 않음
+		(발행자 없이 단독으로 쓸 때만 get_state()로 한 번 읽어 추적)
 		"""
-		if self.calibration_current_step != 2:
-			return {
-				"current_joint_index": self.current_joint_index,
-				"positions": [0.0] * 6,
-				"min_positions": [None] * 6,
-				"max_positions": [None] * 6
-			}
-		
-		state = self.robot.get_state()
-		current_joints = state.get("joint_positions", [0.0] * 6)
-		
-		# 실시간 위치 업데이트
-		self.realtime_current_positions = current_joints.copy()
-		
-		# 실시간 min/max 추적 (모든 조인트에 대해)
-		for i in range(6):
-			pos = current_joints[i]
-			
-			# 최소값 업데이트
-			if self.realtime_min_positions[i] is None or pos < self.realtime_min_positions[i]:
-				self.realtime_min_positions[i] = pos
-			
-			# 최대값 업데이트
-			if self.realtime_max_positions[i] is None or pos > self.realtime_max_positions[i]:
-				self.realtime_max_positions[i] = pos
-		
+		if self.tracking and (self.publisher is None or not self.publisher.running):
+			state = self.robot.get_state()
+			self._track(state.get("joint_positions", [0.0] * 6))
+		return self.realtime_status()
+	
+	def realtime_status(self) -> Dict[str, Any]:
+		"""마법사 실시간 뷰 (calibration:realtime 이벤트 / GET /calibration/wizard/realtime 공통 형식)"""
+		with self._realtime_lock:
+			current = self._to_list(self._realtime_current, 0.0)
+			low = self._to_list(self._realtime_min, None)
+			high = self._to_list(self._realtime_max, None)
+			seq = self.realtime_seq
 		return {
+			"step": self._step,
+			"seq": seq,
 			"current_joint_index": self.current_joint_index,
-			"positions": self.realtime_current_positions,
-			"min_positions": self.realtime_min_positions,
-			"max_positions": self.realtime_max_positions,
-			"recorded_min": self.joint_min_positions,
-			"recorded_max": self.joint_max_positions
+			"joint_names": self._joint_names(),
+			"realtime_current_positions": current,
+			"realtime_min_positions": low,
+			"realtime_max_positions": high,
+			"recorded_min": list(self.joint_min_positions),
+			"recorded_max": list(self.joint_max_positions),
 		}
 	
+	def _joint_names(self) -> List[str]:
+		motors = getattr(self.robot, "MOTORS", None)
+		if isinstance(motors, dict):
+			return list(motors.keys())
+		if hasattr(self.robot, "JOINT_NAMES"):
+			return list(self.robot.JOINT_NAMES)
+		return ["shoulder_pan", "shoulder_lift", "elbow", "wrist_1", "wrist_2", "gripper"]
+	
 	def record_joint_min(self) -> bool:
 		"""현재 조인트의 최소 위치 기록 (버튼을 누른 순간의 현재 위치)"""
 		if self.calibration_current_step != 2:
 			return False
 		
 		if self.current_joint_index < 6:
-			# 항상 현재 위치를 읽어서 기록 (추적된 값 사용하지 않음)
-			state = self.robot.get_state()
-			current_joints = state.get("joint_positions", [0.0] * 6)
+			# 항상 현재 위치를 기록 (추적된 min/max 사용하지 않음)
+			current_joints = self._current_positions()
 			recorded_value = current_joints[self.current_joint_index]
 			
 			self.joint_min_positions[self.current_joint_index] = recorded_value
@@ -480,9 +595,8 @@ class CalibrationManager:
 		if self.current_joint_index >= 6:
 			return False
 		
-		# 항상 현재 위치를 읽어서 기록 (추적된 값 사용하지 않음)
-		state = self.robot.get_state()
-		current_joints = state.get("joint_positions", [0.0] * 6)
+		# 항상 현재 위치를 기록 (추적된 min/max 사용하지 않음)
+		current_joints = self._current_positions()
 		recorded_value = current_joints[self.current_joint_index]
 		
 		self.joint_max_positions[self.current_joint_index] = recorded_value
@@ -492,8 +606,7 @@ class CalibrationManager:
 		# 최소/최대 모두 기록되었으면 다음 조인트로
 		if self.joint_min_positions[self.current_joint_index] is not None:
 			# 다음 조인트로 넘어가기 전에 실시간 추적 초기화
-			self.realtime_min_positions[self.current_joint_index] = None
-			self.realtime_max_positions[self.current_joint_index] = None
+			self.reset_realtime(self.current_joint_index)
 			self.current_joint_index += 1
 		
 		return True
@@ -505,8 +618,7 @@ class CalibrationManager:
 		
 		if self.current_joint_index < 6:
 			# 실시간 추적 초기화
-			self.realtime_min_positions[self.current_joint_index] = None
-			self.realtime_max_positions[self.current_joint_index] = None
+			self.reset_realtime(self.current_joint_index)
 			self.current_joint_index += 1
 			return True
 		
@@ -542,8 +654,7 @@ class CalibrationManager:
 			self._log(f"{joint_name} auto-recorded: {self.joint_min_positions[self.current_joint_index]:.2f}° ~ {self.joint_max_positions[self.current_joint_index]:.2f}°", "info")
 			
 			# 다음 조인트로 넘어가기 전에 실시간 추적 초기화
-			self.realtime_min_positions[self.current_joint_index] = None
-			self.realtime_max_positions[self.current_joint_index] = None
+			self.reset_realtime(self.current_joint_index)
 			self.current_joint_index += 1
 			return True
 		
@@ -0,0 +1,260 @@
+"""
+동기화 홈 이동
+
+- 모든 조인트가 같은 시간에 도착하도록 한 번의 다관절 궤적(minimum-jerk)을 계획하고,
+  절대 시각 격자에 맞춰 틱마다 한 번의 일괄 쓰기(move_joints_absolute)로 스트리밍
+- 가장 먼 조인트의 최대 속도가 max_velocity를 넘지 않도록 이동 시간을 정함
+- 스트리밍 후 서보의 Moving 레지스터 + Present_Position으로 도착 판정 (tolerance 이내, settle_timeout 초과 시 timeout)
+- 전용 스레드에서 실행되며 cancel()로 중단 (현재 위치를 목표로 다시 써서 정지), 진행 상황은 progress_callback으로 전달
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+MIN_MOVE_SECONDS = 0.3
+PEAK_VELOCITY_RATIO = 1.875  # minimum-jerk 최대 속도 / 평균 속도
+PROGRESS_INTERVAL = 0.1  # 초, 이동 중 진행 이벤트 간격
+
+# 진행 단계: planning → moving → settling → 종료 상태 중 하나
+FINAL_PHASES = ("done", "timeout", "cancelled", "error")
+
+
+def _min_jerk(fraction: float) -> float:
+	"""0~1 진행률 → 위치 비율 (시작/끝에서 속도·가속도 0)"""
+	s = min(max(fraction, 0.0), 1.0)
+	return s * s * s * (10.0 + s * (-15.0 + 6.0 * s))
+
+
+class HomingMove:
+	"""
+	Args:
+		robot_adapter: move_joints_absolute/read_joint_positions/enable_torque/joint_limits를 가진 어댑터
+			(read_moving()이 있으면 Moving 레지스터로 도착 판정, 없으면 위치만 사용)
+		target: 목표 조인트 각도 (도)
+		max_velocity: 가장 먼 조인트의 최대 속도 (deg/s)
+		rate_hz: 목표 위치 전송 주기
+		tolerance: 도착 판정 허용 오차 (도)
+		settle_timeout: 스트리밍 종료 후 도착을 기다리는 최대 시간 (초)
+		settle_rate_hz: 도착 판정 폴링 주기
+		progress_callback: 진행 이벤트 콜백 (이동 스레드에서 호출되므로 가볍게 유지)
+	"""
+
+	def __init__(
+		self,
+		robot_adapter,
+		target: Sequence[float],
+		max_velocity: float = 30.0,
+		rate_hz: float = 50.0,
+		tolerance: float = 1.0,
+		settle_timeout: float = 3.0,
+		settle_rate_hz: float = 20.0,
+		progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+	):
+		self.robot = robot_adapter
+		self.target = np.asarray(target, dtype=np.float64)
+		self.max_velocity = float(max_velocity)
+		self.rate_hz = float(rate_hz)
+		self.tolerance = float(tolerance)
+		self.settle_timeout = float(settle_timeout)
+		self.settle_rate_hz = float(settle_rate_hz)
+		self.progress_callback = progress_callback
+
+		self.phase = "planning"
+		self.message = ""
+		self.start_positions: Optional[np.ndarray] = None
+		self.duration = 0.0
+		self.progress = 0.0
+		self.positions: Optional[np.ndarray] = None  # 마지막으로 읽은 위치
+		self.commanded: Optional[np.ndarray] = None  # 마지막으로 보낸 목표 위치
+		self.moving: Optional[List[bool]] = None  # 마지막으로 읽은 Moving 플래그
+		self.started_at: Optional[float] = None
+		self.finished_at: Optional[float] = None
+		self.write_failures = 0
+		self._last_emit = 0.0
+
+		self._stop_event = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+
+	@property
+	def running(self) -> bool:
+		return self._thread is not None and self._thread.is_alive()
+
+	@property
+	def succeeded(self) -> bool:
+		return self.phase == "done"
+
+	def start(self) -> None:
+		if self.running:
+			return
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self._run, name="homing", daemon=True)
+		self._thread.start()
+
+	def cancel(self) -> None:
+		"""이동 중단 요청 (스레드가 현재 위치를 목표로 다시 써서 정지)"""
+		self._stop_event.set()
+
+	def join(self, timeout: Optional[float] = None) -> None:
+		if self._thread is not None:
+			self._thread.join(timeout)
+
+	# ---- 계획 ----
+
+	def _clip_target(self) -> None:
+		"""조인트 제한값 밖의 목표는 제한값으로 (제한 밖이면 일괄 쓰기 전체가 거부됨)"""
+		limits = np.asarray(getattr(self.robot, "joint_limits", [])[: len(self.target)], dtype=np.float64)
+		if limits.shape != (len(self.target), 2):
+			return
+		clipped = np.clip(self.target, limits.min(axis=1), limits.max(axis=1))
+		if not np.array_equal(clipped, self.target):
+			print(f"[Homing] Home target clipped to joint limits: {clipped.round(2).tolist()}")
+			self.target = clipped
+
+	def _plan(self, start: np.ndarray) -> float:
+		"""이동 시간 (모든 조인트 공통)"""
+		distance = float(np.max(np.abs(self.target - start))) if len(start) else 0.0
+		if self.max_velocity <= 0:
+			return MIN_MOVE_SECONDS
+		return max(MIN_MOVE_SECONDS, distance * PEAK_VELOCITY_RATIO / self.max_velocity)
+
+	def _read_positions(self) -> Optional[np.ndarray]:
+		positions = self.robot.read_joint_positions()
+		if positions is None:
+			return None
+		return np.asarray(positions[: len(self.target)], dtype=np.float64)
+
+	# ---- 실행 ----
+
+	def _emit(self, phase: Optional[str] = None, message: Optional[str] = None) -> None:
+		"""진행 이벤트 (단계가 바뀌지 않는 갱신은 PROGRESS_INTERVAL마다 한 번)"""
+		now = time.monotonic()
+		if phase is None and now - self._last_emit < PROGRESS_INTERVAL:
+			return
+		self._last_emit = now
+		if phase is not None:
+			self.phase = phase
+		if message is not None:
+			self.message = message
+		if phase in FINAL_PHASES:
+			self.finished_at = now
+			print(f"[Homing] {self.phase}: {self.message}")
+		if self.progress_callback is not None:
+			try:
+				self.progress_callback(self.status())
+			except Exception as e:
+				print(f"[Homing] Progress callback error: {e}")
+
+	def _command(self, positions: np.ndarray) -> None:
+		targets = {joint: float(value) for joint, value in enumerate(positions)}
+		if not self.robot.move_joints_absolute(targets):
+			self.write_failures += 1
+		self.commanded = positions
+
+	def _hold(self) -> None:
+		"""취소 시 현재 위치를 목표로 써서 그 자리에 정지"""
+		positions = self._read_positions()
+		if positions is not None:
+			self.positions = positions
+			self._command(positions)
+
+	def _run(self) -> None:
+		self.started_at = time.monotonic()
+		try:
+			self._clip_target()
+			start = self._read_positions()
+			if start is None:
+				self._emit("error", "Failed to read joint positions")
+				return
+			self.start_positions = self.positions = start
+			self.duration = self._plan(start)
+			self.robot.enable_torque()
+			self._emit("moving", f"Moving all joints to home in {self.duration:.2f}s")
+
+			if not self._stream():
+				self._hold()
+				self._emit("cancelled", "Homing cancelled")
+				return
+			self._settle()
+		except Exception as e:
+			self._emit("error", f"Homing error: {e}")
+
+	def _stream(self) -> bool:
+		"""계획한 궤적을 절대 시각 격자로 전송 (취소되면 False)"""
+		period_ns = int(round(1e9 / self.rate_hz))
+		length_ns = int(self.duration * 1e9)
+		began = next_tick = time.perf_counter_ns()
+		while True:
+			if self._stop_event.is_set():
+				return False
+			now = time.perf_counter_ns()
+			if now < next_tick:
+				time.sleep((next_tick - now) / 1e9)
+				continue
+			fraction = min(1.0, (now - began) / length_ns)
+			self._command(self.start_positions + (self.target - self.start_positions) * _min_jerk(fraction))
+			self.progress = fraction
+			if fraction >= 1.0:
+				return True
+			self._emit()
+			# 밀린 틱은 몰아서 보내지 않고 건너뜀
+			next_tick += period_ns
+			now = time.perf_counter_ns()
+			if next_tick <= now:
+				next_tick += ((now - next_tick) // period_ns + 1) * period_ns
+
+	def _settle(self) -> None:
+		"""Moving 레지스터가 모두 0이고 위치 오차가 tolerance 이내가 될 때까지 대기"""
+		read_moving = getattr(self.robot, "read_moving", None)
+		interval = 1.0 / self.settle_rate_hz
+		deadline = time.monotonic() + self.settle_timeout
+		self._emit("settling", "Waiting for servos to settle")
+		while True:
+			if self._stop_event.is_set():
+				self._hold()
+				self._emit("cancelled", "Homing cancelled")
+				return
+			positions = self._read_positions()
+			if positions is not None:
+				self.positions = positions
+				self.moving = read_moving() if read_moving is not None else None
+				within = bool(np.all(np.abs(positions - self.target) <= self.tolerance))
+				stopped = self.moving is not None and not any(self.moving)
+				# Moving 레지스터를 못 읽으면 위치 오차만으로 판정
+				if within and (stopped or self.moving is None):
+					self._emit("done", f"Home reached (max error {self.max_error():.2f}°)")
+					return
+			if time.monotonic() >= deadline:
+				self._emit("timeout", f"Home not reached within {self.settle_timeout:.1f}s (max error {self.max_error():.2f}°)")
+				return
+			self._emit()
+			self._stop_event.wait(interval)
+
+	# ---- 상태 ----
+
+	def max_error(self) -> float:
+		if self.positions is None:
+			return float("nan")
+		return float(np.max(np.abs(self.positions - self.target)))
+
+	def status(self) -> Dict[str, Any]:
+		end = self.finished_at if self.finished_at is not None else time.monotonic()
+		errors = None
+		if self.positions is not None:
+			errors = np.round(np.abs(self.positions - self.target), 2).tolist()
+		return {
+			"phase": self.phase,
+			"message": self.message,
+			"running": self.running and self.phase not in FINAL_PHASES,
+			"progress": round(self.progress, 3),
+			"duration": round(self.duration, 3),
+			"elapsed": round(end - self.started_at, 3) if self.started_at is not None else 0.0,
+			"target": np.round(self.target, 2).tolist(),
+			"positions": np.round(self.positions, 2).tolist() if self.positions is not None else None,
+			"commanded": np.round(self.commanded, 2).tolist() if self.commanded is not None else None,
+			"errors": errors,
+			"moving": self.moving,
+			"tolerance": self.tolerance,
+			"write_failures": self.write_failures,
+		}
@@ -1,8 +1,15 @@
-from typing import Dict, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from enum import Enum
+import threading
 import time
 from collections import deque
 
+from ..observability.metrics import REGISTRY
+
+JOG_TICKS = REGISTRY.counter("rosota_control_loop_ticks_total", "Jog loop ticks")
+JOG_OVERRUNS = REGISTRY.counter("rosota_control_loop_overruns_total", "Jog loop ticks that missed their deadline")
+JOG_STEP_SECONDS = REGISTRY.histogram("rosota_control_loop_step_seconds", "Jog step duration (integration + bus write)")
+
 
 class ControlMode(Enum):
 	JOINT = "joint"
@@ -14,10 +21,25 @@ class KeyboardController:
 	"""
 	키보드 입력을 로봇 제어 명령으로 변환하는 컨트롤러.
 	브라우저에서 키 입력을 받아 처리합니다.
+
+	Joint 모드의 이동 키는 누르고 있는 동안 속도 명령으로 처리됩니다.
+	keydown/keyup은 눌린 축 상태만 바꾸고, 조그 스레드가 고정 주기로 목표 위치를 적분해
+	틱마다 한 번의 일괄 쓰기로 전송합니다 (브라우저 키 반복/네트워크 지터와 무관).
 	"""
 
-	def __init__(self, robot_adapter):
+	# Joint 모드 조그 키: 키 -> (조인트 인덱스, 방향)
+	JOG_KEYS: Dict[str, Tuple[int, int]] = {
+		"i": (0, +1), "k": (0, -1),  # Joint 1
+		"j": (1, +1), "l": (1, -1),  # Joint 2
+		"u": (2, +1), "o": (2, -1),  # Joint 3
+		"7": (3, +1), "9": (3, -1),  # Joint 4
+		"8": (4, +1), "0": (4, -1),  # Joint 5
+		"y": (5, +1), "h": (5, -1),  # Joint 6
+	}
+
+	def __init__(self, robot_adapter, jog_rate_hz: float = 50.0, jog_velocity: float = 45.0, tracer=None):
 		self.robot = robot_adapter
+		self.tracer = tracer  # CommandTracer (조그 쓰기 시각 기록, 선택)
 		self.mode = ControlMode.JOINT
 		self.running = False
 		self.estop_active = False
@@ -30,20 +52,6 @@ class KeyboardController:
 			"m": self._toggle_mode,
 			" ": self._emergency_stop,
 			
-			# Joint 모드 (6 DOF)
-			"i": lambda: self._move_joint(0, +1),  # Joint 1 증가
-			"k": lambda: self._move_joint(0, -1),  # Joint 1 감소
-			"j": lambda: self._move_joint(1, +1),  # Joint 2 증가
-			"l": lambda: self._move_joint(1, -1),  # Joint 2 감소
-			"u": lambda: self._move_joint(2, +1),  # Joint 3 증가
-			"o": lambda: self._move_joint(2, -1),  # Joint 3 감소
-			"7": lambda: self._move_joint(3, +1),  # Joint 4 증가
-			"9": lambda: self._move_joint(3, -1),  # Joint 4 감소
-			"8": lambda: self._move_joint(4, +1),  # Joint 5 증가
-			"0": lambda: self._move_joint(4, -1),  # Joint 5 감소
-			"y": lambda: self._move_joint(5, +1),  # Joint 6 증가
-			"h": lambda: self._move_joint(5, -1),  # Joint 6 감소
-			
 			# Cartesian 모드
 			"w": lambda: self._move_cartesian(0, +1),  # X+
 			"s": lambda: self._move_cartesian(0, -1),  # X-
@@ -68,24 +76,54 @@ class KeyboardController:
 			"_": lambda: self._adjust_speed(0.9),  # - 키 (shift 없을 때)
 		}
 		
-		# 활성 키 추적 (키를 누르고 있는 동안)
+		# 활성 키 추적 (키를 누르고 있는 동안) - active_keys는 클라이언트별 눌린 키의 합집합
 		self.active_keys: set = set()
+		self._held_keys: Dict[Any, set] = {}  # owner(Socket.IO sid 등) -> 눌린 조그 키
 		self.last_key_time: Dict[str, float] = {}
+		
+		# 조그 (누르고 있는 키 -> 속도 명령)
+		self.jog_rate_hz = jog_rate_hz
+		self.jog_velocity = jog_velocity  # deg/s (speed_multiplier 1.0 기준)
+		self._jog_targets: Optional[list] = None  # 현재 조그 세션의 목표 위치
+		self._jog_condition = threading.Condition()
+		self._jog_thread: Optional[threading.Thread] = None
+		self.jog_ticks = 0
+		self.jog_overruns = 0
+		
+		# 외부 속도 명령 (/ws/control 등) - hold 시간 안에 갱신되지 않으면 자동 정지
+		self._velocity_command: Dict[int, float] = {}
+		self._velocity_deadline = 0.0
+		self._velocity_owner: Any = None  # 마지막으로 속도 명령을 건 클라이언트 (연결 해제 시 자기 명령만 해제)
+		
+		# 다른 동작(홈 이동/재생)이 로봇을 움직이는 중이면 그 이름을 반환 - 그동안 조그/이동 명령 거부
+		self.motion_guard: Optional[Callable[[], Optional[str]]] = None
+		# E-Stop 시 함께 멈출 동작 (재생 중지, 홈 이동 취소 등 - add_estop_callback으로 등록)
+		self._estop_callbacks: List[Callable[[], Any]] = []
 
 	def _toggle_mode(self):
 		"""모드 전환: Joint -> Cartesian -> Gripper -> Joint"""
 		modes = [ControlMode.JOINT, ControlMode.CARTESIAN, ControlMode.GRIPPER]
 		current_idx = modes.index(self.mode)
 		self.mode = modes[(current_idx + 1) % len(modes)]
+		self.release_all()
 		return {"action": "mode_change", "mode": self.mode.value}
 
+	def add_estop_callback(self, callback: Callable[[], Any]) -> None:
+		"""E-Stop이 걸릴 때 호출할 정지 함수 등록 (호출한 스레드에서 바로 실행되므로 오래 막지 않아야 함)"""
+		self._estop_callbacks.append(callback)
+
 	def _emergency_stop(self):
 		"""긴급 정지"""
 		self.estop_active = not self.estop_active
 		if self.estop_active:
-			# 모든 모션 중지
+			# 모든 모션 중지 (조그 중인 축 해제 + 재생/홈 이동 등 등록된 동작 정지)
+			self.release_all()
+			for callback in self._estop_callbacks:
+				try:
+					callback()
+				except Exception as e:
+					print(f"[KeyboardController] E-Stop callback error: {e}")
 			# TODO: 실제 로봇에 E-Stop 명령 전송
-			pass
 		return {"action": "estop", "active": self.estop_active}
 
 	def start(self) -> Dict:
@@ -97,8 +135,9 @@ class KeyboardController:
 		self.running = True
 		self.estop_active = False
 		# 활성 키 초기화
-		self.active_keys.clear()
+		self.release_all()
 		self.last_key_time.clear()
+		self._start_jog_thread()
 		print(f"[KeyboardController] Control started. Running: {self.running}")
 		return {
 			"action": "control_started",
@@ -109,8 +148,8 @@ class KeyboardController:
 	def stop(self) -> Dict:
 		"""키보드 제어 중지"""
 		self.running = False
-		# 활성 키 초기화
-		self.active_keys.clear()
+		# 활성 키 초기화 (조그 스레드는 running이 False가 되면 종료)
+		self.release_all()
 		self.last_key_time.clear()
 		return {
 			"action": "control_stopped",
@@ -118,36 +157,21 @@ class KeyboardController:
 			"status": self.get_status()
 		}
 
-	def _move_joint(self, joint_index: int, direction: int):
-		"""조인트 이동"""
-		if not self.running:
-			print(f"[KeyboardController] Move joint {joint_index} ignored: control not running")
-			return None
-		if self.mode != ControlMode.JOINT:
-			print(f"[KeyboardController] Move joint {joint_index} ignored: wrong mode ({self.mode.value})")
-			return None
-		if self.estop_active:
-			print(f"[KeyboardController] Move joint {joint_index} ignored: E-Stop active")
+	def motion_owner(self) -> Optional[str]:
+		"""로봇을 단독으로 움직이는 중인 동작 이름 (없으면 None)"""
+		return self.motion_guard() if self.motion_guard is not None else None
+
+	@property
+	def motion_active(self) -> bool:
+		"""조그 키 또는 외부 속도 명령으로 움직이는 중인지"""
+		with self._jog_condition:
+			return self._motion_requested()
+
+	def _blocked(self) -> Optional[Dict]:
+		owner = self.motion_owner()
+		if owner is None:
 			return None
-		
-		delta = direction * self.step_size * self.speed_multiplier
-		print(f"[KeyboardController] Moving joint {joint_index} by {delta:.2f}°")
-		
-		# 현재 위치 확인 (디버깅용)
-		state = self.robot.get_state()
-		current_pos = state.get("joint_positions", [0.0] * 6)[joint_index] if state else None
-		if current_pos is not None:
-			limits = self.robot.joint_limits[joint_index]
-			print(f"[KeyboardController] Joint {joint_index} current: {current_pos:.2f}°, limits: [{limits[0]:.2f}, {limits[1]:.2f}]")
-		
-		success = self.robot.move_joint_delta(joint_index, delta)
-		print(f"[KeyboardController] Joint {joint_index} move result: {success}")
-		return {
-			"action": "joint_move",
-			"joint": joint_index,
-			"delta": delta,
-			"success": success,
-		}
+		return {"action": "ignored", "message": f"{owner} in progress"}
 
 	def _move_cartesian(self, axis: int, direction: int):
 		"""Cartesian 이동 (0:X, 1:Y, 2:Z, 3:Roll, 4:Pitch, 5:Yaw)"""
@@ -155,6 +179,9 @@ class KeyboardController:
 			return None
 		if self.mode != ControlMode.CARTESIAN or self.estop_active:
 			return None
+		blocked = self._blocked()
+		if blocked:
+			return blocked
 		
 		delta = [0.0] * 6
 		step = self.step_size * self.speed_multiplier
@@ -177,6 +204,9 @@ class KeyboardController:
 			return None
 		if self.estop_active:
 			return None
+		blocked = self._blocked()
+		if blocked:
+			return blocked
 		# TODO: 현재 그리퍼 상태 확인 후 토글
 		success = self.robot.set_gripper(0.5)  # 임시
 		return {"action": "gripper_toggle", "success": success}
@@ -186,22 +216,29 @@ class KeyboardController:
 		self.speed_multiplier = max(0.1, min(2.0, self.speed_multiplier * multiplier))
 		return {"action": "speed_change", "multiplier": self.speed_multiplier}
 
-	def handle_key_event(self, key: str, event_type: str = "keydown") -> Optional[Dict]:
+	def handle_key_event(self, key: str, event_type: str = "keydown", owner: Any = None) -> Optional[Dict]:
 		"""
 		키 이벤트 처리
 		key: 키 이름 (소문자 권장)
 		event_type: "keydown" or "keyup"
+		owner: 키를 누른 클라이언트 (release_keys로 그 클라이언트의 키만 해제)
 		"""
 		# 제어가 시작되지 않았으면 키 입력 무시 (단, 모드 전환/긴급정지는 허용)
 		key_lower = key.lower()
 		control_keys = ["m", " "]  # 모드 전환, 긴급 정지
 		
 		if event_type == "keydown":
-			if key_lower in self.key_mapping:
+			if key_lower in self.key_mapping or key_lower in self.JOG_KEYS:
 				# 제어가 시작되지 않았고, 제어 키가 아니면 무시
 				if not self.running and key_lower not in control_keys:
 					return {"action": "ignored", "message": "Control not started. Press Start Control first."}
 				
+				# Joint 모드 이동 키는 누른 상태만 기록 (반복 keydown은 무시, 이동은 조그 스레드가 수행)
+				if key_lower in self.JOG_KEYS:
+					if self.mode != ControlMode.JOINT:
+						return None
+					return self._press_jog_key(key_lower, owner)
+				
 				# 중복 방지: 같은 키가 너무 빠르게 반복되지 않도록
 				# 제어 루프가 50ms마다 실행되므로 디바운스를 30ms로 줄임
 				now = time.time()
@@ -214,18 +251,212 @@ class KeyboardController:
 				return handler()
 		
 		elif event_type == "keyup":
-			if key_lower in self.active_keys:
-				self.active_keys.discard(key_lower)
+			if key_lower in self._held_keys.get(owner, ()):
+				with self._jog_condition:
+					self._held_keys[owner].discard(key_lower)
+					self._update_active_keys()
+				joint_index, _ = self.JOG_KEYS[key_lower]
+				return {"action": "jog_stop", "joint": joint_index}
 		
 		return None
 
+	# ---- 조그 (held-key 속도 제어) ----
+
+	def _press_jog_key(self, key: str, owner: Any = None) -> Optional[Dict]:
+		if self.estop_active:
+			return None
+		if key in self._held_keys.get(owner, ()):
+			# 브라우저 키 반복 - 이미 조그 중
+			return None
+		blocked = self._blocked()
+		if blocked:
+			return blocked
+		joint_index, direction = self.JOG_KEYS[key]
+		with self._jog_condition:
+			self._held_keys.setdefault(owner, set()).add(key)
+			self._update_active_keys()
+			self._jog_condition.notify_all()
+		return {"action": "jog_start", "joint": joint_index, "direction": direction}
+
+	def _update_active_keys(self):
+		"""_jog_condition을 잡은 상태에서 호출"""
+		self._held_keys = {owner: keys for owner, keys in self._held_keys.items() if keys}
+		self.active_keys = set().union(*self._held_keys.values())
+
+	def release_keys(self, owner: Any) -> None:
+		"""owner가 누른 키만 해제 - 연결 해제/포커스 이탈 시 다른 클라이언트의 조그는 유지"""
+		with self._jog_condition:
+			if self._held_keys.pop(owner, None) is None:
+				return
+			self._update_active_keys()
+			self._jog_condition.notify_all()
+
+	def release_all(self):
+		"""눌린 키와 외부 속도 명령을 모두 해제 (조그 정지) - 모드 전환/제어 정지/E-Stop/케이블 분리 시 호출"""
+		with self._jog_condition:
+			self._held_keys = {}
+			self.active_keys = set()
+			self._velocity_command = {}
+			self._velocity_owner = None
+			self._jog_targets = None
+			self._jog_condition.notify_all()
+
+	def set_velocity(self, velocities: Dict[int, float], hold: float = 0.25, owner: Any = None) -> bool:
+		"""
+		외부 속도 명령 설정 (deg/s, 키보드 조그와 합산)
+		hold 초 안에 다시 호출되지 않으면 정지 (클라이언트가 끊겨도 계속 움직이지 않도록)
+		빈 딕셔너리를 넘기면 즉시 정지 (홈 이동/재생 중에는 정지만 허용)
+		owner: 명령을 건 클라이언트 (release_velocity(owner)로 자기 명령만 해제)
+		"""
+		if velocities and (self.estop_active or not self.robot.connected or self.motion_owner() is not None):
+			return False
+		num_joints = len(self.robot.joint_limits)
+		with self._jog_condition:
+			# 범위 밖 조인트는 무시 (조그 틱마다 IndexError가 나지 않도록)
+			self._velocity_command = {j: v for j, v in velocities.items() if v != 0.0 and 0 <= j < num_joints}
+			self._velocity_deadline = time.monotonic() + hold if self._velocity_command else 0.0
+			self._velocity_owner = owner if self._velocity_command else None
+			self._jog_condition.notify_all()
+			if self._velocity_command:
+				self._start_jog_thread()
+		return True
+
+	def release_velocity(self, owner: Any) -> None:
+		"""owner가 건 속도 명령만 해제 (다른 클라이언트의 명령은 유지)"""
+		with self._jog_condition:
+			if self._velocity_command and self._velocity_owner is owner:
+				self._velocity_command = {}
+				self._velocity_deadline = 0.0
+				self._velocity_owner = None
+				self._jog_condition.notify_all()
+
+	def _velocity_active(self) -> bool:
+		return bool(self._velocity_command) and time.monotonic() < self._velocity_deadline
+
+	def _motion_requested(self) -> bool:
+		return (self.running and bool(self.active_keys)) or self._velocity_active()
+
+	def _jog_velocities(self) -> Dict[int, float]:
+		"""현재 눌린 키와 외부 속도 명령으로부터 조인트별 속도 (deg/s), 반대 방향 키를 같이 누르면 상쇄"""
+		velocities: Dict[int, float] = {}
+		if self.running:
+			speed = self.jog_velocity * self.speed_multiplier
+			for key in self.active_keys:
+				joint_index, direction = self.JOG_KEYS[key]
+				velocities[joint_index] = velocities.get(joint_index, 0.0) + direction * speed
+		if self._velocity_active():
+			for joint_index, velocity in self._velocity_command.items():
+				velocities[joint_index] = velocities.get(joint_index, 0.0) + velocity
+		return {j: v for j, v in velocities.items() if v != 0.0}
+
+	def _start_jog_thread(self):
+		with self._jog_condition:
+			if self._jog_thread is not None:
+				return
+			self._jog_thread = threading.Thread(target=self._jog_loop, name="keyboard-jog", daemon=True)
+			self._jog_thread.start()
+
+	def _jog_loop(self):
+		"""고정 주기로 목표 위치를 적분하고 틱마다 한 번 일괄 전송"""
+		interval = 1.0 / self.jog_rate_hz
+		while True:
+			with self._jog_condition:
+				# 제어 중지 + 외부 속도 명령 없음 - 스레드 종료
+				if not self.running and not self._velocity_active():
+					self._jog_thread = None
+					return
+				# 움직일 게 없으면 keydown/속도 명령/stop까지 대기 (버스 사용 없음)
+				self._jog_condition.wait_for(
+					lambda: self._motion_requested() or not self.running,
+					timeout=0.5,
+				)
+			if not self._motion_requested():
+				continue
+			
+			next_tick = time.monotonic()
+			last = next_tick
+			while self._motion_requested() and not self.estop_active:
+				now = time.monotonic()
+				dt = min(now - last, 2 * interval)  # 지연된 틱이 큰 점프를 만들지 않도록 제한
+				last = now
+				try:
+					self._jog_step(dt)
+				except Exception as e:
+					print(f"[KeyboardController] Jog error: {e}")
+				JOG_TICKS.inc()
+				
+				next_tick += interval
+				step_end = time.monotonic()
+				JOG_STEP_SECONDS.observe(step_end - now)
+				now = step_end
+				if next_tick < now:
+					self.jog_overruns += 1
+					JOG_OVERRUNS.inc()
+					next_tick = now
+				time.sleep(next_tick - now)
+			
+			with self._jog_condition:
+				# 조그 세션 종료 - 다음 세션은 실제 위치에서 다시 시작
+				self._jog_targets = None
+
+	def _jog_step(self, dt: float):
+		# 목표 위치는 락 안에서 참조만 가져오고, 이번 틱 결과는 새 리스트로 만들어 락 안에서 교체
+		# (release_all()이 도중에 세션을 초기화해도 None을 건드리지 않음)
+		with self._jog_condition:
+			velocities = self._jog_velocities()
+			base = self._jog_targets
+		if not velocities:
+			return
+		
+		if base is None:
+			# 세션 시작: 현재 위치를 한 번 읽어 적분 기준으로 사용
+			state = self.robot.get_state()
+			current = list(state.get("joint_positions") or [0.0] * 6)
+			dt = 0.0
+		else:
+			current = list(base)
+		
+		targets: Dict[int, float] = {}
+		for joint_index, velocity in velocities.items():
+			limits = self.robot.joint_limits[joint_index]
+			low, high = min(limits), max(limits)
+			target = current[joint_index] + velocity * dt
+			target = max(low, min(high, target))
+			current[joint_index] = target
+			targets[joint_index] = target
+		
+		with self._jog_condition:
+			if self._jog_targets is not base:
+				# 이번 틱 도중 해제됨 (정지 요청) - 쓰지 않음
+				return
+			self._jog_targets = current
+		
+		self.jog_ticks += 1
+		if hasattr(self.robot, "move_joints_absolute"):
+			self.robot.move_joints_absolute(targets)
+		else:
+			for joint_index, target in targets.items():
+				self.robot.move_joint_absolute(joint_index, target)
+		if self.tracer is not None:
+			self.tracer.on_bus_write(getattr(self.robot, "last_bus_timing", None), targets.keys())
+
+	@property
+	def jog_targets(self) -> Optional[list]:
+		"""현재 조그 세션의 목표 위치 (조그 중이 아니면 None, 기록의 action 컬럼용)"""
+		targets = self._jog_targets
+		return list(targets) if targets is not None else None
+
 	def get_status(self) -> Dict:
 		"""현재 컨트롤러 상태 반환"""
+		with self._jog_condition:
+			jogging = sorted(self.JOG_KEYS[k][0] for k in self.active_keys)
 		return {
 			"mode": self.mode.value,
 			"estop_active": self.estop_active,
 			"speed_multiplier": self.speed_multiplier,
 			"step_size": self.step_size,
 			"running": self.running,
+			"jog_velocity": self.jog_velocity * self.speed_multiplier,
+			"jogging": jogging,
 		}
 
@@ -6,12 +6,17 @@ import time
 from typing import Optional, Dict, List, Tuple
 from enum import Enum
 
-try:
-	from .motors.feetech import FeetechMotorsBus, SCS_SERIES_BAUDRATE_TABLE, MODEL_BAUDRATE_TABLE
-	HAS_FEETECH = True
-except ImportError:
-	HAS_FEETECH = False
-	print("Warning: FeetechMotorsBus not available.")
+
+def _load_feetech():
+	"""
+	FeetechMotorsBus와 baudrate 테이블 (numpy/scservo_sdk는 모터 설정을 처음 할 때 import)
+	서버 시작 시간을 줄이기 위해 모듈 import 시점에는 불러오지 않음
+	"""
+	try:
+		from .motors.feetech import FeetechMotorsBus, SCS_SERIES_BAUDRATE_TABLE
+	except ImportError as e:
+		raise RuntimeError(f"FeetechMotorsBus not available: {e}")
+	return FeetechMotorsBus, SCS_SERIES_BAUDRATE_TABLE
 
 
 class SetupStatus(Enum):
@@ -60,7 +65,7 @@ class MotorSetupManager:
 		self.robot_type: Optional[str] = None  # "follower" or "leader"
 		self.current_motor_index = 0
 		self.error_message: Optional[str] = None
-		self.motors_bus: Optional[FeetechMotorsBus] = None
+		self.motors_bus = None  # FeetechMotorsBus
 		
 	def reset(self):
 		"""설정 상태 초기화"""
@@ -91,8 +96,7 @@ class MotorSetupManager:
 		Returns:
 			찾은 포트 또는 None
 		"""
-		if not HAS_FEETECH:
-			raise RuntimeError("FeetechMotorsBus not available")
+		_load_feetech()  # 의존성 확인
 		
 		import serial.tools.list_ports
 		time.sleep(0.5)  # 포트 해제 대기
@@ -157,8 +161,7 @@ class MotorSetupManager:
 		Returns:
 			설정 결과 딕셔너리
 		"""
-		if not HAS_FEETECH:
-			raise RuntimeError("FeetechMotorsBus not available")
+		FeetechMotorsBus, SCS_SERIES_BAUDRATE_TABLE = _load_feetech()
 		
 		# 모터 설정 (임시로 설정할 ID 사용)
 		motor_name = "motor"
@@ -279,8 +282,7 @@ class MotorSetupManager:
 		Returns:
 			리셋 결과 딕셔너리
 		"""
-		if not HAS_FEETECH:
-			raise RuntimeError("FeetechMotorsBus not available")
+		FeetechMotorsBus, SCS_SERIES_BAUDRATE_TABLE = _load_feetech()
 		
 		motor_name = "motor"
 		motors = {motor_name: (target_id, self.MOTOR_MODEL)}
@@ -382,8 +384,7 @@ class MotorSetupManager:
 		Returns:
 			모터 ID 확인 결과 딕셔너리
 		"""
-		if not HAS_FEETECH:
-			raise RuntimeError("FeetechMotorsBus not available")
+		FeetechMotorsBus, SCS_SERIES_BAUDRATE_TABLE = _load_feetech()
 		
 		# 임시 모터 설정 (ID를 모르므로 임의의 ID 사용)
 		motor_name = "motor"
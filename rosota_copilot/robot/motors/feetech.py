@@ -36,12 +36,27 @@ except ImportError:
 	import logging
 	logger = logging.getLogger(__name__)
 
+from ...observability.metrics import REGISTRY
 from .motor_utils import (
+	BUS_QUEUE_WAIT,
+	BUS_TRANSACTION_SECONDS,
+	BUS_TRANSACTIONS,
+	BusTiming,
 	RobotDeviceAlreadyConnectedError,
 	RobotDeviceNotConnectedError,
 	capture_timestamp_utc,
 )
 
+BUS_RETRIES = REGISTRY.counter(
+    "rosota_bus_retries_total", "Failed bus packets that were retried", ("op",)
+)
+BUS_COMM_FAILURES = REGISTRY.counter(
+    "rosota_bus_comm_failures_total", "Failed bus packets", ("op", "reason")
+)
+MOTOR_ERRORS = REGISTRY.counter(
+    "rosota_motor_errors_total", "Sync reads failed at this motor", ("motor",)
+)
+
 PROTOCOL_VERSION = 0
 BAUDRATE = 1_000_000
 TIMEOUT_MS = 1000
@@ -240,6 +255,28 @@ def assert_same_address(model_ctrl_table, motor_models, data_name):
         )
 
 
+def get_block_layout(model_ctrl_table, motor_models, data_names):
+    """Return `(start_addr, total_bytes, [(addr, bytes), ...])` for registers that must be
+    adjacent in the control table (e.g. P/D/I coefficients at 21-23), so they can be moved in
+    a single sync packet.
+    """
+    for data_name in data_names:
+        assert_same_address(model_ctrl_table, motor_models, data_name)
+
+    fields = [model_ctrl_table[motor_models[0]][data_name] for data_name in data_names]
+    start_addr = fields[0][0]
+    next_addr = start_addr
+    for data_name, (addr, bytes) in zip(data_names, fields, strict=True):
+        if addr != next_addr:
+            raise ValueError(
+                f"Registers {data_names} are not contiguous in the control table "
+                f"('{data_name}' is at address {addr}, expected {next_addr})."
+            )
+        next_addr = addr + bytes
+
+    return start_addr, next_addr - start_addr, fields
+
+
 class TorqueMode(enum.Enum):
     ENABLED = 1
     DISABLED = 0
@@ -337,6 +374,7 @@ class FeetechMotorsBus:
         self.task_queue = queue.Queue()
         self.worker_thread = None
         self._stop_event = threading.Event()
+        self._timing = threading.local()
 
     def _worker(self):
         """The single worker thread that processes all requests in FIFO order."""
@@ -350,6 +388,7 @@ class FeetechMotorsBus:
 
                 result = None
                 error = None
+                started = time.monotonic()
 
                 try:
                     # --- Task Dispatcher ---
@@ -365,13 +404,17 @@ class FeetechMotorsBus:
                         result = self._perform_read_with_motor_ids(*args, **kwargs)
                     elif action == "write_with_motor_ids":
                         self._perform_write_with_motor_ids(*args, **kwargs)
+                    elif action == "read_block":
+                        result = self._perform_read_block(*args, **kwargs)
+                    elif action == "write_block":
+                        self._perform_write_block(*args, **kwargs)
                     elif action == "set_bus_baudrate":
                         self._perform_set_bus_baudrate(*args, **kwargs)
 
                 except Exception as e:
                     error = e
 
-                result_queue.put((result, error))
+                result_queue.put((result, error, started, time.monotonic()))
 
             except queue.Empty:
                 continue
@@ -384,14 +427,25 @@ class FeetechMotorsBus:
         task_id = uuid4()
         result_queue = queue.Queue(maxsize=1)  # Per-task result channel
         task = (task_id, action, args, kwargs, result_queue)
+        submitted = time.monotonic()
         self.task_queue.put(task)
 
         # Block and wait for the result
-        result, error = result_queue.get()
+        result, error, started, finished = result_queue.get()
+        # Per calling thread, so the jog and state threads don't overwrite each other's timing
+        self._timing.last = BusTiming(submitted, started, finished)
+        BUS_TRANSACTIONS.labels(action, "error" if error else "ok").inc()
+        BUS_QUEUE_WAIT.labels(action).observe(started - submitted)
+        BUS_TRANSACTION_SECONDS.labels(action).observe(finished - started)
         if error:
             raise error
         return result
 
+    @property
+    def last_task_timing(self) -> Optional[BusTiming]:
+        """Queue/transmit timing of the calling thread's most recent bus task."""
+        return getattr(self._timing, "last", None)
+
     # --- Public-Facing API ---
     # These methods just submit tasks to the queue.
 
@@ -438,6 +492,22 @@ class FeetechMotorsBus:
             "write_with_motor_ids", args=args, kwargs=kwargs
         )
 
+    def read_block(self, data_names, motor_names=None):
+        """Read adjacent registers of every motor with one sync read.
+
+        Returns an int array of shape (num_motors, len(data_names)).
+        """
+        return self._submit_task_and_wait("read_block", args=(data_names, motor_names))
+
+    def write_block(self, data_names, values, motor_names=None):
+        """Write adjacent registers of every motor with one sync write.
+
+        `values` has shape (num_motors, len(data_names)).
+        """
+        return self._submit_task_and_wait(
+            "write_block", args=(data_names, values, motor_names)
+        )
+
     def set_bus_baudrate(self, baudrate):
         return self._submit_task_and_wait("set_bus_baudrate", args=(baudrate,))
 
@@ -776,6 +846,25 @@ class FeetechMotorsBus:
     # --- Private Implementation Methods (Worker-Thread Only) ---
     # These contain the actual hardware logic and are NOT called directly.
 
+    @staticmethod
+    def _record_comm_failure(op, comm, retried):
+        reason = "timeout" if comm == scs.COMM_RX_TIMEOUT else "error"
+        BUS_COMM_FAILURES.labels(op, reason).inc()
+        if retried:
+            BUS_RETRIES.labels(op).inc()
+
+    def _record_motor_errors(self, group, motor_ids, addr, length):
+        """Sync reads stop at the first motor that doesn't answer; charge the error to that motor."""
+        names = {idx: name for name, (idx, _) in self.motors.items()}
+        for idx in motor_ids:
+            try:
+                available = group.isAvailable(idx, addr, length)
+            except Exception:
+                available = False
+            if not available:
+                MOTOR_ERRORS.labels(names.get(idx, str(idx))).inc()
+                return
+
     def _perform_connect(self):
         self.port_handler = scs.PortHandler(self.port)
         self.port_handler.setPacketTimeoutMillis(TIMEOUT_MS)
@@ -803,12 +892,14 @@ class FeetechMotorsBus:
         for idx in motor_ids:
             group.addParam(idx)
 
-        for _ in range(num_retry):
+        for attempt in range(num_retry):
             comm = group.txRxPacket()
             if comm == scs.COMM_SUCCESS:
                 break
+            self._record_comm_failure("read", comm, attempt + 1 < num_retry)
 
         if comm != scs.COMM_SUCCESS:
+            self._record_motor_errors(group, motor_ids, addr, bytes)
             raise ConnectionError(
                 f"Read failed due to communication error on port {self.port_handler.port_name} for indices {motor_ids}: "
                 f"{self.packet_handler.getTxRxResult(comm)}"
@@ -859,12 +950,14 @@ class FeetechMotorsBus:
             for idx in motor_ids:
                 self.group_readers[group_key].addParam(idx)
 
-        for _ in range(NUM_READ_RETRY):
+        for attempt in range(NUM_READ_RETRY):
             comm = self.group_readers[group_key].txRxPacket()
             if comm == scs.COMM_SUCCESS:
                 break
+            self._record_comm_failure("read", comm, attempt + 1 < NUM_READ_RETRY)
 
         if comm != scs.COMM_SUCCESS:
+            self._record_motor_errors(self.group_readers[group_key], motor_ids, addr, bytes)
             raise ConnectionError(
                 f"Read failed due to communication error on port {self.port} for group_key {group_key}: "
                 f"{self.packet_handler.getTxRxResult(comm)}"
@@ -914,10 +1007,11 @@ class FeetechMotorsBus:
             data = convert_to_bytes(value, bytes, self.mock)
             group.addParam(idx, data)
 
-        for _ in range(num_retry):
+        for attempt in range(num_retry):
             comm = group.txPacket()
             if comm == scs.COMM_SUCCESS:
                 break
+            self._record_comm_failure("write", comm, attempt + 1 < num_retry)
 
         if comm != scs.COMM_SUCCESS:
             raise ConnectionError(
@@ -980,6 +1074,7 @@ class FeetechMotorsBus:
 
         comm = self.group_writers[group_key].txPacket()
         if comm != scs.COMM_SUCCESS:
+            self._record_comm_failure("write", comm, False)
             raise ConnectionError(
                 f"Write failed due to communication error on port {self.port} for group_key {group_key}: "
                 f"{self.packet_handler.getTxRxResult(comm)}"
@@ -996,6 +1091,100 @@ class FeetechMotorsBus:
         ts_utc_name = get_log_name("timestamp_utc", "write", data_name, motor_names)
         self.logs[ts_utc_name] = capture_timestamp_utc()
 
+    def _perform_read_block(
+        self, data_names, motor_names: Optional[Union[List[str], str]] = None
+    ):
+        if not self.is_connected:
+            raise RobotDeviceNotConnectedError(
+                f"FeetechMotorsBus({self.port}) is not connected. You need to run `motors_bus.connect()`."
+            )
+
+        if motor_names is None:
+            motor_names = self.motor_names
+
+        if isinstance(motor_names, str):
+            motor_names = [motor_names]
+
+        motor_ids = [self.motors[name][0] for name in motor_names]
+        models = [self.motors[name][1] for name in motor_names]
+        start_addr, total_bytes, fields = get_block_layout(
+            self.model_ctrl_table, models, data_names
+        )
+
+        group_key = get_group_sync_key("_".join(data_names), motor_names)
+        if group_key not in self.group_readers:
+            self.group_readers[group_key] = scs.GroupSyncRead(
+                self.port_handler, self.packet_handler, start_addr, total_bytes
+            )
+            for idx in motor_ids:
+                self.group_readers[group_key].addParam(idx)
+
+        for attempt in range(NUM_READ_RETRY):
+            comm = self.group_readers[group_key].txRxPacket()
+            if comm == scs.COMM_SUCCESS:
+                break
+            self._record_comm_failure("read_block", comm, attempt + 1 < NUM_READ_RETRY)
+
+        if comm != scs.COMM_SUCCESS:
+            self._record_motor_errors(self.group_readers[group_key], motor_ids, start_addr, total_bytes)
+            raise ConnectionError(
+                f"Read failed due to communication error on port {self.port} for group_key {group_key}: "
+                f"{self.packet_handler.getTxRxResult(comm)}"
+            )
+
+        values = [
+            [self.group_readers[group_key].getData(idx, addr, bytes) for addr, bytes in fields]
+            for idx in motor_ids
+        ]
+        return np.array(values, dtype=np.int64)
+
+    def _perform_write_block(
+        self,
+        data_names,
+        values,
+        motor_names: Optional[Union[List[str], str]] = None,
+    ):
+        if not self.is_connected:
+            raise RobotDeviceNotConnectedError(
+                f"FeetechMotorsBus({self.port}) is not connected. You need to run `motors_bus.connect()`."
+            )
+
+        if motor_names is None:
+            motor_names = self.motor_names
+
+        if isinstance(motor_names, str):
+            motor_names = [motor_names]
+
+        motor_ids = [self.motors[name][0] for name in motor_names]
+        models = [self.motors[name][1] for name in motor_names]
+        start_addr, total_bytes, fields = get_block_layout(
+            self.model_ctrl_table, models, data_names
+        )
+
+        values = np.asarray(values, dtype=np.int64).reshape(len(motor_ids), len(fields))
+
+        # Block writes are rare (configuration), so the packet is rebuilt each time.
+        group = scs.GroupSyncWrite(
+            self.port_handler, self.packet_handler, start_addr, total_bytes
+        )
+        for idx, row in zip(motor_ids, values.tolist(), strict=True):
+            data = []
+            for (_, bytes), value in zip(fields, row, strict=True):
+                data += convert_to_bytes(int(value), bytes, self.mock)
+            group.addParam(idx, data)
+
+        for attempt in range(NUM_WRITE_RETRY):
+            comm = group.txPacket()
+            if comm == scs.COMM_SUCCESS:
+                break
+            self._record_comm_failure("write_block", comm, attempt + 1 < NUM_WRITE_RETRY)
+
+        if comm != scs.COMM_SUCCESS:
+            raise ConnectionError(
+                f"Write failed due to communication error on port {self.port} for registers {data_names} "
+                f"of indices {motor_ids}: {self.packet_handler.getTxRxResult(comm)}"
+            )
+
     def _perform_set_bus_baudrate(self, baudrate):
         present_bus_baudrate = self.port_handler.getBaudRate()
         if present_bus_baudrate != baudrate:
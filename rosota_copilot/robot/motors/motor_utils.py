@@ -1,7 +1,18 @@
 import platform
 import time
 from datetime import datetime, timezone
-from typing import Callable
+from typing import Callable, NamedTuple
+
+from ...observability.metrics import REGISTRY
+
+# Shared by FeetechMotorsBus and ProcessMotorsBus (the parent side records calls to the child)
+BUS_TRANSACTIONS = REGISTRY.counter("rosota_bus_transactions_total", "Motor bus tasks", ("action", "result"))
+BUS_QUEUE_WAIT = REGISTRY.histogram(
+	"rosota_bus_queue_wait_seconds", "Time a bus task waited before it started", ("action",)
+)
+BUS_TRANSACTION_SECONDS = REGISTRY.histogram(
+	"rosota_bus_transaction_seconds", "Time spent executing a bus task", ("action",)
+)
 
 
 def capture_timestamp_utc() -> datetime:
@@ -21,6 +32,14 @@ def busy_wait(seconds: float) -> None:
 			time.sleep(seconds)
 
 
+class BusTiming(NamedTuple):
+	"""time.monotonic() stamps of one bus task."""
+
+	submitted: float  # put on the task queue
+	started: float  # picked up by the worker thread
+	finished: float  # serial transaction done
+
+
 class RobotDeviceNotConnectedError(Exception):
 	"""Exception raised when the robot device is not connected."""
 
@@ -0,0 +1,260 @@
+"""
+서브프로세스에서 실행되는 Feetech 버스
+
+FeetechMotorsBus를 자식 프로세스에 두고 파이프로 호출을 전달합니다.
+웹 서버(요청 파싱, Socket.IO JSON 인코딩, NumPy 연산)와 GIL을 공유하지 않으므로
+시리얼 타이밍 지터가 웹 부하와 무관해집니다.
+
+- FeetechMotorsBus와 같은 공개 API (connect/disconnect/read/write/read_block/...)
+- 자식 프로세스가 죽으면 자동으로 다시 띄우고 캘리브레이션/baudrate/연결 상태를 복원한 뒤 호출을 한 번 재시도
+"""
+import multiprocessing
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .motor_utils import (
+	BUS_QUEUE_WAIT,
+	BUS_TRANSACTION_SECONDS,
+	BUS_TRANSACTIONS,
+	BusTiming,
+	RobotDeviceAlreadyConnectedError,
+	RobotDeviceNotConnectedError,
+)
+
+
+def _bus_process_main(conn, bus_kwargs: Dict[str, Any]) -> None:
+	"""자식 프로세스 진입점: 요청을 받아 FeetechMotorsBus 메서드를 순서대로 실행"""
+	from .feetech import FeetechMotorsBus
+
+	bus = FeetechMotorsBus(**bus_kwargs)
+	while True:
+		try:
+			method, args, kwargs = conn.recv()
+		except (EOFError, OSError):
+			break
+		if method == "__shutdown__":
+			break
+
+		started = time.perf_counter()
+		result, error = None, None
+		try:
+			result = getattr(bus, method)(*args, **kwargs)
+		except Exception as e:
+			error = e
+		duration = time.perf_counter() - started
+
+		try:
+			conn.send((result, error, duration))
+		except Exception as e:
+			# 예외 객체가 pickle되지 않는 경우
+			conn.send((None, ConnectionError(f"{type(error or e).__name__}: {error or e}"), duration))
+
+	if bus.is_connected:
+		try:
+			bus.disconnect()
+		except Exception:
+			pass
+
+
+class ProcessMotorsBus:
+	"""
+	자식 프로세스에서 FeetechMotorsBus를 실행하는 프록시 (FeetechMotorsBus와 같은 생성자/API)
+
+	호출은 락으로 직렬화되며 (원래 버스의 단일 워커 스레드와 같은 FIFO 순서),
+	call_timeout 안에 응답이 없으면 자식을 재시작하고 ConnectionError를 발생시킵니다.
+	"""
+
+	def __init__(
+		self,
+		port: str,
+		motors: Dict[str, Tuple[int, str]],
+		extra_model_control_table: Optional[Dict[str, List[tuple]]] = None,
+		extra_model_resolution: Optional[Dict[str, int]] = None,
+		mock=False,
+		call_timeout: float = 10.0,
+		max_restarts: int = 5,
+	):
+		self.port = port
+		self.motors = motors
+		self.mock = mock
+		self.call_timeout = call_timeout
+		self.max_restarts = max_restarts
+		self._bus_kwargs = {
+			"port": port,
+			"motors": motors,
+			"extra_model_control_table": extra_model_control_table,
+			"extra_model_resolution": extra_model_resolution,
+			"mock": mock,
+		}
+
+		self.calibration = None
+		self.is_connected = False
+		self._baudrate = None
+		self._ctx = multiprocessing.get_context("spawn")
+		self._process = None
+		self._conn = None
+		self._lock = threading.Lock()
+		self.restarts = 0
+		self.last_call_duration = 0.0  # 자식 프로세스 안에서 측정한 마지막 호출 시간 (초)
+		self._timing = threading.local()
+
+	# --- 프로세스 관리 ---
+
+	@property
+	def process_alive(self) -> bool:
+		return self._process is not None and self._process.is_alive()
+
+	def _spawn(self) -> None:
+		parent_conn, child_conn = self._ctx.Pipe()
+		process = self._ctx.Process(
+			target=_bus_process_main,
+			args=(child_conn, self._bus_kwargs),
+			name=f"feetech-bus-{self.port}",
+			daemon=True,
+		)
+		process.start()
+		child_conn.close()
+		self._process = process
+		self._conn = parent_conn
+
+	def _terminate(self) -> None:
+		if self._conn is not None:
+			try:
+				self._conn.send(("__shutdown__", (), {}))
+			except Exception:
+				pass
+		if self._process is not None:
+			self._process.join(1.0)
+			if self._process.is_alive():
+				self._process.kill()
+				self._process.join(1.0)
+		if self._conn is not None:
+			self._conn.close()
+		self._process = None
+		self._conn = None
+
+	def _start(self) -> None:
+		"""자식 프로세스를 띄우고 현재 상태(캘리브레이션, 연결, baudrate) 적용"""
+		self._spawn()
+		if self.calibration is not None:
+			self._send("set_calibration", (self.calibration,), {})
+		if self.is_connected:
+			self._send("connect", (), {})
+			if self._baudrate is not None:
+				self._send("set_bus_baudrate", (self._baudrate,), {})
+
+	def _restart(self) -> None:
+		if self.restarts >= self.max_restarts:
+			raise ConnectionError(f"Bus process for {self.port} crashed {self.restarts} times, giving up")
+		self.restarts += 1
+		print(f"[ProcessMotorsBus] Restarting bus process for {self.port} (restart {self.restarts})")
+		self._terminate()
+		self._start()
+
+	def _send(self, method: str, args: tuple, kwargs: dict, submitted: Optional[float] = None):
+		self._conn.send((method, args, kwargs))
+		if not self._conn.poll(self.call_timeout):
+			raise TimeoutError(f"Bus process did not answer '{method}' within {self.call_timeout}s")
+		result, error, duration = self._conn.recv()
+		finished = time.monotonic()
+		self.last_call_duration = duration
+		if submitted is not None:
+			# 락 대기 + 파이프 왕복은 큐 대기로, 자식 안에서의 실행 시간은 전송으로 기록
+			self._timing.last = BusTiming(submitted, finished - duration, finished)
+			BUS_TRANSACTIONS.labels(method, "error" if error is not None else "ok").inc()
+			BUS_QUEUE_WAIT.labels(method).observe(max(0.0, finished - duration - submitted))
+			BUS_TRANSACTION_SECONDS.labels(method).observe(duration)
+		if error is not None:
+			raise error
+		return result
+
+	def _call(self, method: str, *args, **kwargs):
+		submitted = time.monotonic()
+		with self._lock:
+			if not self.process_alive:
+				if self._process is None:
+					self._start()
+				else:
+					self._restart()
+			try:
+				return self._send(method, args, kwargs, submitted)
+			except (EOFError, BrokenPipeError, ConnectionResetError, TimeoutError) as e:
+				# 자식 프로세스가 죽었거나 멈춤 - 재시작 후 한 번 재시도
+				print(f"[ProcessMotorsBus] Bus process failure during '{method}': {e}")
+				self._restart()
+				return self._send(method, args, kwargs, submitted)
+
+	@property
+	def last_task_timing(self) -> Optional[BusTiming]:
+		"""호출한 스레드의 마지막 버스 호출 시각 (FeetechMotorsBus.last_task_timing과 같음)"""
+		return getattr(self._timing, "last", None)
+
+	# --- FeetechMotorsBus와 같은 공개 API ---
+
+	def connect(self):
+		if self.is_connected:
+			raise RobotDeviceAlreadyConnectedError(f"ProcessMotorsBus({self.port}) is already connected.")
+		self._call("connect")
+		self.is_connected = True
+
+	def disconnect(self):
+		if not self.is_connected:
+			raise RobotDeviceNotConnectedError(f"ProcessMotorsBus({self.port}) is not connected.")
+		try:
+			self._call("disconnect")
+		finally:
+			self.is_connected = False
+			with self._lock:
+				self._terminate()
+
+	def read(self, data_name, motor_names=None):
+		return self._call("read", data_name, motor_names)
+
+	def write(self, data_name, values, motor_names=None):
+		return self._call("write", data_name, values, motor_names)
+
+	def read_with_motor_ids(self, motor_models, motor_ids, data_name, **kwargs):
+		return self._call("read_with_motor_ids", motor_models, motor_ids, data_name, **kwargs)
+
+	def write_with_motor_ids(self, motor_models, motor_ids, data_name, values, **kwargs):
+		return self._call("write_with_motor_ids", motor_models, motor_ids, data_name, values, **kwargs)
+
+	def read_block(self, data_names, motor_names=None):
+		return self._call("read_block", data_names, motor_names)
+
+	def write_block(self, data_names, values, motor_names=None):
+		return self._call("write_block", data_names, values, motor_names)
+
+	def set_bus_baudrate(self, baudrate):
+		self._call("set_bus_baudrate", baudrate)
+		self._baudrate = baudrate
+
+	def are_motors_configured(self):
+		return self._call("are_motors_configured")
+
+	def find_motor_indices(self, possible_ids=None, num_retry=2):
+		return self._call("find_motor_indices", possible_ids, num_retry)
+
+	def set_calibration(self, calibration: dict):
+		self.calibration = calibration
+		if self.process_alive:
+			self._call("set_calibration", calibration)
+
+	@property
+	def motor_names(self) -> list:
+		return list(self.motors.keys())
+
+	@property
+	def motor_models(self) -> list:
+		return [model for _, model in self.motors.values()]
+
+	@property
+	def motor_indices(self) -> list:
+		return [idx for idx, _ in self.motors.values()]
+
+	def __del__(self):
+		try:
+			self._terminate()
+		except Exception:
+			pass
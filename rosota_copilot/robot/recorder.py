@@ -3,13 +3,20 @@
 """
 import os
 import json
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from enum import Enum
 
-from ..config import RECORD_DIR
+from ..config import DATASET_DIR, PREVIEW_DIR, PROGRAM_DIR, RECORD_DIR, ensure_data_dirs
+from ..observability.metrics import REGISTRY
+
+RECORDER_SAMPLES = REGISTRY.counter("rosota_recorder_samples_total", "Recorded samples")
+RECORDER_BYTES = REGISTRY.counter("rosota_recorder_bytes_written_total", "Bytes written to recording files")
+
+MAX_MAPPED_RECORDINGS = 4
 
 
 class RecordMode(Enum):
@@ -21,73 +28,186 @@ class RecordMode(Enum):
 class Recorder:
 	"""로봇 동작 기록 및 재생 관리자"""
 	
-	def __init__(self, robot_adapter):
+	def __init__(
+		self,
+		robot_adapter,
+		chunk_rows: int = 256,
+		capture_rate_hz: float = 100.0,
+		action_source: Optional[Callable[[], Optional[Sequence[float]]]] = None,
+		replay_rate_hz: float = 50.0,
+		replay_max_velocity: float = 30.0,
+		compression: Optional[str] = None,
+	):
 		"""
 		Args:
 			robot_adapter: 로봇 어댑터 인스턴스
+			chunk_rows: 기록 파일 청크당 행 수 (청크가 찰 때마다 백그라운드 스레드가 디스크에 씀)
+			capture_rate_hz: 기본 캡처 주기 (30~200Hz)
+			action_source: KEYBOARD 모드에서 틱마다 명령 목표 위치를 얻는 함수 (예: 조그 목표)
+			replay_rate_hz: 재생 시 목표 위치 전송 주기
+			replay_max_velocity: 재생 시작/탐색 시 램프 이동 최대 속도 (deg/s)
+			compression: 기록 파일 청크 압축 ("zlib"/"lzma", None이면 원시 컬럼)
 		"""
 		self.robot_adapter = robot_adapter
+		self.chunk_rows = chunk_rows
+		self.compression = compression
+		self.capture_rate_hz = capture_rate_hz
+		self.action_source = action_source
 		self.is_recording = False
-		self.is_replaying = False
 		self.record_mode: Optional[RecordMode] = None
-		self.record_data: List[Dict[str, Any]] = []
-		self.start_time: Optional[float] = None
+		self.start_ns: Optional[int] = None  # time.perf_counter_ns() 기준 시작 시각
 		self.current_record_path: Optional[Path] = None
-		
-	def start_record(self, mode: RecordMode) -> bool:
+		self._writer = None  # recording.RecordingWriter (기록 중에만)
+		self._capture = None  # recording.capture.CaptureThread (캡처 기록 중에만)
+		self.last_capture_stats: Optional[Dict[str, Any]] = None
+		self._record_lock = threading.Lock()
+		self._catalog = None  # recording.RecordCatalog (첫 사용 시 생성)
+		self._replay = None  # recording.replay.ReplayEngine
+		# 재생 소유권: 파일 로딩 중(엔진 시작 전)에도 재생 중으로 보고해 다른 동작이 끼어들지 않게 함
+		self._replay_lock = threading.Lock()
+		self._replay_claimed = False
+		self._replay_cancelled = False
+		self.replay_rate_hz = replay_rate_hz
+		self.replay_max_velocity = replay_max_velocity
+		self._mapped: Dict[Path, Any] = {}  # 경로 -> ((mtime, size), recording.MappedRecording)
+		self._preview_locks: Dict[Path, threading.Lock] = {}  # 경로 -> 미리보기 생성 락 (기록별로 한 번에 하나만 생성)
+		self._preview_locks_guard = threading.Lock()
+		
+	@property
+	def catalog(self):
+		"""기록 카탈로그 (RECORD_DIR/catalog.json)"""
+		if self._catalog is None:
+			from ..recording.catalog import RecordCatalog
+			self._catalog = RecordCatalog(RECORD_DIR)
+		return self._catalog
+		
+	@property
+	def num_steps(self) -> int:
+		"""현재 기록의 행 수"""
+		return self._writer.num_rows if self._writer is not None else 0
+		
+	def start_record(
+		self,
+		mode: RecordMode,
+		rate_hz: Optional[float] = None,
+		capture: bool = True,
+		with_velocities: bool = False,
+	) -> bool:
 		"""
 		기록 시작
 		
 		Args:
 			mode: 기록 모드 (MANUAL 또는 KEYBOARD)
+			rate_hz: 캡처 주기 (None이면 capture_rate_hz, 30~200Hz로 제한)
+			capture: True면 캡처 스레드가 고정 주기로 샘플링, False면 record_step() 호출 시에만 기록
+			with_velocities: 조인트 속도 컬럼 포함 여부 (record_step으로만 기록 가능)
 		
 		Returns:
 			성공 여부
 		"""
+		# 라우트가 executor에서 호출하므로 동시 시작 요청은 직렬화 (두 번째는 is_recording을 보고 False)
+		with self._record_lock:
+			return self._start_record(mode, rate_hz, capture, with_velocities)
+	
+	def _start_record(self, mode: RecordMode, rate_hz: Optional[float], capture: bool, with_velocities: bool) -> bool:
+		from ..recording import RECORD_SUFFIX, RecordingWriter
+		from ..recording.capture import CaptureThread, clamp_rate
+		
 		if self.is_recording:
 			return False
 		
 		if not self.robot_adapter.connected:
 			return False
 		
+		initial_state = self.robot_adapter.get_state()
+		initial_positions = initial_state.get("joint_positions") or [0.0] * 6
+		
+		# 파일명 생성 (타임스탬프 기반) - 기록 시작과 동시에 파일을 만들고 청크 단위로 덧붙임
+		timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+		ensure_data_dirs()
+		filepath = RECORD_DIR / f"record_{mode.value}_{timestamp}{RECORD_SUFFIX}"
+		columns = ["positions"]
+		if with_velocities:
+			columns.append("velocities")
+		if mode == RecordMode.KEYBOARD and (self.action_source is not None or not capture):
+			columns.append("actions")
+		rate = clamp_rate(rate_hz or self.capture_rate_hz)
+		try:
+			self._writer = RecordingWriter(
+				filepath,
+				len(initial_positions),
+				metadata={
+					"mode": mode.value,
+					"created_at": datetime.now().isoformat(),
+					"robot_type": "SO Arm 100",
+					"joint_names": list(initial_state.get("joint_names") or []),
+					"clock": "perf_counter_ns",
+					"sample_rate_hz": rate if capture else None,
+				},
+				columns=columns,
+				chunk_rows=self.chunk_rows,
+				compression=self.compression,
+			)
+		except Exception as e:
+			print(f"[Recorder] Failed to create record file: {e}")
+			return False
+		
 		self.is_recording = True
 		self.record_mode = mode
-		self.record_data = []
-		self.start_time = time.time()
-		
-		# 초기 상태 기록
-		initial_state = self.robot_adapter.get_state()
-		self.record_data.append({
-			"timestamp": 0.0,
-			"joint_positions": initial_state.get("joint_positions", [0.0] * 6),
-			"action": None,  # Manual 모드에서는 action이 없음
-		})
+		self.current_record_path = filepath
+		self.catalog.active = filepath.name
+		self.last_capture_stats = None
+		
+		if capture:
+			# 첫 틱(t=0)부터 캡처 스레드가 기록
+			self._capture = CaptureThread(
+				self.robot_adapter.read_joint_positions,
+				self._writer,
+				rate_hz=rate,
+				action_source=self.action_source if mode == RecordMode.KEYBOARD else None,
+				on_samples=RECORDER_SAMPLES.inc,
+			)
+			self._capture.start()
+			self.start_ns = self._capture.start_ns
+		else:
+			# 초기 상태 기록 (Manual 모드에서는 action이 없음)
+			self.start_ns = time.perf_counter_ns()
+			self._append(0.0, initial_positions)
 		
 		return True
 	
-	def record_step(self, joint_positions: List[float], action: Optional[Dict[str, Any]] = None):
+	def _append(self, timestamp: float, joint_positions, velocities=None, action=None):
+		try:
+			self._writer.append(timestamp, joint_positions, velocities, action)
+		except Exception as e:
+			print(f"[Recorder] Failed to record step: {e}")
+			return
+		RECORDER_SAMPLES.inc()
+	
+	def record_step(
+		self,
+		joint_positions: Sequence[float],
+		action: Optional[Sequence[float]] = None,
+		velocities: Optional[Sequence[float]] = None,
+	):
 		"""
-		한 스텝 기록
+		한 스텝 기록 (capture=False로 시작한 경우 - 캡처 스레드가 돌고 있으면 무시)
 		
 		Args:
 			joint_positions: 현재 조인트 위치
-			action: 키보드 제어 액션 (KEYBOARD 모드일 때만)
+			action: 명령한 조인트 목표 위치 (KEYBOARD 모드일 때만 기록)
+			velocities: 조인트 속도 (with_velocities로 시작한 경우에만 기록)
 		"""
-		if not self.is_recording:
+		if not self.is_recording or self._capture is not None:
 			return
 		
-		timestamp = time.time() - self.start_time
-		
-		record_entry = {
-			"timestamp": timestamp,
-			"joint_positions": joint_positions.copy() if isinstance(joint_positions, list) else list(joint_positions),
-		}
+		timestamp = (time.perf_counter_ns() - self.start_ns) / 1e9
 		
 		# KEYBOARD 모드일 때만 action 기록
-		if self.record_mode == RecordMode.KEYBOARD and action:
-			record_entry["action"] = action
+		if self.record_mode != RecordMode.KEYBOARD:
+			action = None
 		
-		self.record_data.append(record_entry)
+		self._append(timestamp, joint_positions, velocities, action)
 	
 	def stop_record(self) -> Optional[Path]:
 		"""
@@ -100,35 +220,21 @@ class Recorder:
 			return None
 		
 		self.is_recording = False
+		self._stop_capture()
+		writer, self._writer = self._writer, None
+		self.catalog.active = None
 		
-		if len(self.record_data) < 2:  # 최소 2개 이상의 데이터 필요
-			self.record_data = []
+		if writer.num_rows < 2:  # 최소 2개 이상의 데이터 필요
+			writer.abort()
+			self.current_record_path = None
 			return None
 		
-		# 파일명 생성 (타임스탬프 기반)
-		timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-		mode_str = self.record_mode.value
-		filename = f"record_{mode_str}_{timestamp}.json"
-		filepath = RECORD_DIR / filename
-		
-		# 메타데이터와 함께 저장
-		record_file = {
-			"metadata": {
-				"mode": self.record_mode.value,
-				"created_at": datetime.now().isoformat(),
-				"duration": self.record_data[-1]["timestamp"],
-				"num_steps": len(self.record_data),
-				"robot_type": "SO Arm 100",
-			},
-			"data": self.record_data
-		}
-		
 		try:
-			with open(filepath, "w", encoding="utf-8") as f:
-				json.dump(record_file, f, indent=2)
-			
-			self.current_record_path = filepath
-			self.record_data = []
+			filepath = writer.close({"finished_at": datetime.now().isoformat()})
+			RECORDER_BYTES.inc(filepath.stat().st_size)
+			self.catalog.update(filepath)
+			# 미리보기 사이드카는 응답을 막지 않도록 백그라운드에서 생성
+			threading.Thread(target=self.build_preview, args=(filepath,), name="record-preview", daemon=True).start()
 			return filepath
 		except Exception as e:
 			print(f"[Recorder] Failed to save record: {e}")
@@ -138,9 +244,147 @@ class Recorder:
 		"""현재 기록 버리기"""
 		if self.is_recording:
 			self.is_recording = False
-			self.record_data = []
+			self._stop_capture()
+			writer, self._writer = self._writer, None
+			writer.abort()
+			self.catalog.active = None
 			self.current_record_path = None
 	
+	def _stop_capture(self):
+		if self._capture is not None:
+			capture, self._capture = self._capture, None
+			capture.stop()
+			self.last_capture_stats = capture.stats()
+	
+	def get_status(self) -> Dict[str, Any]:
+		"""기록 상태 (캡처 통계 포함 - 기록 중이 아니면 마지막 기록의 통계)"""
+		return {
+			"is_recording": self.is_recording,
+			"is_replaying": self.is_replaying,
+			"mode": self.record_mode.value if self.record_mode else None,
+			"filename": self.current_record_path.name if self.current_record_path else None,
+			"num_steps": self.num_steps,
+			"capture": self._capture.stats() if self._capture is not None else self.last_capture_stats,
+			"replay": self._replay.status() if self._replay is not None else None,
+		}
+	
+	def recover_records(self) -> List[Path]:
+		"""
+		비정상 종료로 마무리되지 않은 기록 파일 복구 (서버 시작 시 호출)
+		
+		Returns:
+			복구된 파일 경로 리스트
+		"""
+		from ..recording import RECORD_SUFFIX, RecordingReader, recover
+		
+		recovered = []
+		if not RECORD_DIR.exists():
+			return recovered
+		for filepath in RECORD_DIR.glob(f"record_*{RECORD_SUFFIX}"):
+			if self._writer is not None and filepath == self._writer.path:
+				continue
+			try:
+				if RecordingReader(filepath).complete:
+					continue
+				path = recover(filepath)
+				if path is not None:
+					print(f"[Recorder] Recovered incomplete record: {path.name}")
+					self.catalog.update(path)
+					self.build_preview(path)
+					recovered.append(path)
+			except Exception as e:
+				print(f"[Recorder] Failed to recover {filepath.name}: {e}")
+		return recovered
+	
+	def export_json(self, filepath: Path) -> Optional[Path]:
+		"""
+		기록 파일을 JSON으로 변환 (RECORD_DIR/exports/<같은 이름>.json)
+		
+		Args:
+			filepath: 기록 파일 경로 (.rec)
+		
+		Returns:
+			생성된 JSON 파일 경로 (실패 시 None)
+		"""
+		from ..recording import export_json
+		
+		try:
+			export_dir = RECORD_DIR / "exports"
+			export_dir.mkdir(parents=True, exist_ok=True)
+			return export_json(filepath, export_dir / Path(filepath).with_suffix(".json").name)
+		except Exception as e:
+			print(f"[Recorder] Failed to export record: {e}")
+			return None
+	
+	def _preview_lock(self, filepath: Path) -> threading.Lock:
+		with self._preview_locks_guard:
+			return self._preview_locks.setdefault(Path(filepath), threading.Lock())
+	
+	def build_preview(self, filepath: Path) -> Optional[Dict[str, Any]]:
+		"""
+		기록 미리보기 사이드카 생성 (PREVIEW_DIR/<기록 이름>.preview.npz)
+		
+		같은 기록의 생성은 기록별 락으로 직렬화 (저장 직후 백그라운드 생성과 조회 시 재생성이 겹치지 않음)
+		
+		Returns:
+			요약 통계 (실패 시 None)
+		"""
+		with self._preview_lock(filepath):
+			return self._build_preview(filepath)
+	
+	def _build_preview(self, filepath: Path) -> Optional[Dict[str, Any]]:
+		from ..recording.preview import build_preview, preview_path
+		
+		try:
+			return build_preview(filepath, preview_path(filepath, PREVIEW_DIR), getattr(self.robot_adapter, "joint_limits", None))
+		except Exception as e:
+			print(f"[Recorder] Failed to build preview for {Path(filepath).name}: {e}")
+			return None
+	
+	def get_preview(self, filepath: Path, width: Optional[int] = None) -> Dict[str, Any]:
+		"""
+		기록 미리보기 (요약 통계 + 차트 폭에 맞는 min/max/mean 레벨)
+		
+		사이드카가 없거나 기록보다 오래되었으면 다시 만듭니다.
+		"""
+		from ..recording.preview import preview_path, read_preview
+		
+		filepath = Path(filepath)
+		sidecar = preview_path(filepath, PREVIEW_DIR)
+		# 진행 중인 생성이 있으면 끝날 때까지 기다린 뒤 최신 여부 확인
+		with self._preview_lock(filepath):
+			if sidecar.exists():
+				preview = read_preview(sidecar, width)
+				if preview["stats"].get("source_mtime") == filepath.stat().st_mtime:
+					return preview
+			if self._build_preview(filepath) is None:
+				raise ValueError("Failed to build preview")
+		return read_preview(sidecar, width)
+	
+	def export_dataset(self, name: str, filepaths: Optional[List[Path]] = None, **options) -> Dict[str, Any]:
+		"""
+		기록들을 LeRobot 형식 데이터셋(DATASET_DIR/<name>)으로 내보내기 (이미 내보낸 에피소드는 건너뜀)
+		
+		Args:
+			name: 데이터셋 이름
+			filepaths: 기록 파일 경로들 (None이면 기록 중인 파일을 뺀 전체)
+			**options: recording.dataset.export_dataset 옵션 (fps, task, workers, force)
+		
+		Returns:
+			내보내기 요약
+		"""
+		from ..recording import RECORD_SUFFIX
+		from ..recording.dataset import export_dataset
+		
+		if filepaths is None:
+			# 기록 중인 파일만 제외 (current_record_path는 중지 후에도 마지막 저장 파일을 가리킴)
+			recording = self.current_record_path if self.is_recording else None
+			filepaths = [
+				path for path in sorted(RECORD_DIR.glob("record_*"))
+				if path.suffix in (RECORD_SUFFIX, ".json") and path != recording
+			]
+		return export_dataset(filepaths, DATASET_DIR / name, **options)
+	
 	def load_record(self, filepath: Path) -> Optional[Dict[str, Any]]:
 		"""
 		기록 파일 로드
@@ -151,119 +395,198 @@ class Recorder:
 		Returns:
 			로드된 데이터 (실패 시 None)
 		"""
+		from ..recording import RECORD_SUFFIX, to_record_dict
+		
 		try:
+			if filepath.suffix == RECORD_SUFFIX:
+				return to_record_dict(filepath)
 			with open(filepath, "r", encoding="utf-8") as f:
 				return json.load(f)
 		except Exception as e:
 			print(f"[Recorder] Failed to load record: {e}")
 			return None
 	
-	def replay(self, filepath: Path, speed: float = 1.0) -> bool:
+	def open_mapped(self, filepath: Path):
+		"""
+		메모리 맵으로 연 .rec 기록 (탐색/구간 조회용, 최근 MAX_MAPPED_RECORDINGS개를 열어 둠)
+		
+		Raises:
+			ValueError: .rec 기록이 아닌 경우 (기존 JSON 기록)
+		"""
+		from ..recording import RECORD_SUFFIX, MappedRecording
+		
+		filepath = Path(filepath)
+		if filepath.suffix != RECORD_SUFFIX:
+			raise ValueError("Only .rec recordings can be memory-mapped")
+		stat = filepath.stat()
+		key = (stat.st_mtime, stat.st_size)
+		cached = self._mapped.pop(filepath, None)
+		if cached is not None and cached[0] == key:
+			self._mapped[filepath] = cached
+			return cached[1]
+		mapped = MappedRecording(filepath)
+		self._mapped[filepath] = (key, mapped)
+		while len(self._mapped) > MAX_MAPPED_RECORDINGS:
+			self._mapped.pop(next(iter(self._mapped)))
+		return mapped
+	
+	def simplify_record(self, filepath: Path, save: bool = True, **options) -> Dict[str, Any]:
 		"""
-		기록 재생
+		기록을 키프레임 프로그램으로 단순화 (PROGRAM_DIR/<기록 이름>.program.json)
 		
 		Args:
 			filepath: 기록 파일 경로
-			speed: 재생 속도 배율 (1.0 = 정상 속도)
+			save: False면 저장하지 않고 보고서만 반환
+			**options: recording.simplify.simplify 옵션 (tolerance, rate_hz, stationary_tolerance, max_pause)
 		
 		Returns:
-			성공 여부
+			보고서 (키프레임 수, 감소율, 최대/RMS 오차, 저장했으면 program 경로)
 		"""
-		if self.is_replaying:
-			return False
-		
-		if not self.robot_adapter.connected:
-			return False
+		from ..recording.simplify import program_path, simplify_record
 		
-		record_data = self.load_record(filepath)
-		if not record_data:
-			return False
+		output = program_path(filepath, PROGRAM_DIR) if save else None
+		return simplify_record(filepath, output, **options)
+	
+	def list_programs(self) -> List[Dict[str, Any]]:
+		"""저장된 키프레임 프로그램 목록"""
+		from ..recording.simplify import PROGRAM_SUFFIX, load_program
 		
-		# 비동기로 재생 (별도 태스크에서 실행)
-		import asyncio
-		asyncio.create_task(self._replay_async(record_data, speed))
+		programs = []
+		for path in sorted(PROGRAM_DIR.glob(f"*{PROGRAM_SUFFIX}")) if PROGRAM_DIR.exists() else []:
+			try:
+				metadata = load_program(path)[2]
+			except Exception as e:
+				print(f"[Recorder] Failed to read program {path.name}: {e}")
+				continue
+			programs.append({
+				"filename": path.name,
+				"source": metadata.get("source"),
+				"created_at": metadata.get("created_at", ""),
+				"duration": metadata.get("duration", 0.0),
+				"keyframes": metadata.get("num_steps", 0),
+				"report": metadata.get("report", {}),
+			})
+		return programs
+	
+	def _load_columns(self, filepath: Path):
+		"""재생용 (timestamps, positions) 배열 (키프레임 프로그램은 키프레임 그대로 - 재생 엔진이 보간)"""
+		import numpy as np
+		from ..recording import RECORD_SUFFIX, MappedRecording
+		from ..recording.simplify import PROGRAM_SUFFIX, load_program
+		
+		if filepath.name.endswith(PROGRAM_SUFFIX):
+			timestamps, positions, _metadata = load_program(filepath)
+			return timestamps, positions
+		if filepath.suffix == RECORD_SUFFIX:
+			# positions 컬럼만 읽음 (actions/velocities는 건드리지 않음)
+			with MappedRecording(filepath) as mapped:
+				columns = mapped.rows(0, mapped.num_rows, ["positions"])
+				return np.array(columns["timestamp"]), np.array(columns["positions"])
+		# 기존 JSON 기록
+		data = (self.load_record(filepath) or {}).get("data", [])
+		timestamps = np.array([entry["timestamp"] for entry in data], dtype=np.float64)
+		positions = np.array([entry["joint_positions"] for entry in data], dtype=np.float64)
+		return timestamps, positions
+	
+	def claim_replay(self) -> bool:
+		"""
+		재생 소유권 선점 (이벤트 루프에서 파일 로딩을 executor로 넘기기 전에 호출)
+		선점한 뒤에는 replay(..., claimed=True)로 시작하거나 release_replay()로 놓아야 함
 		
-		return True
+		Returns:
+			선점 성공 여부 (이미 재생 중이거나 다른 요청이 선점했으면 False)
+		"""
+		with self._replay_lock:
+			if self._replay_claimed or (self._replay is not None and self._replay.running):
+				return False
+			self._replay_claimed = True
+			self._replay_cancelled = False
+			return True
 	
-	async def _replay_async(self, record_data: Dict[str, Any], speed: float):
-		"""비동기 재생 루프"""
-		self.is_replaying = True
+	def release_replay(self) -> None:
+		with self._replay_lock:
+			self._replay_claimed = False
+	
+	def replay(self, filepath: Path, speed: float = 1.0, loop: bool = False, start_time: float = 0.0, claimed: bool = False) -> bool:
+		"""
+		기록 재생 (재생 스레드가 제어 주기로 보간한 궤적을 절대 시각에 맞춰 전송)
 		
+		Args:
+			filepath: 기록 파일 경로
+			speed: 재생 속도 배율 (1.0 = 정상 속도)
+			loop: 끝나면 처음부터 반복
+			start_time: 시작 위치 (기록 시각, 초)
+			claimed: claim_replay()로 이미 소유권을 선점했는지
+		
+		Returns:
+			성공 여부
+		"""
+		from ..recording.replay import ReplayEngine
+		
+		if not claimed and not self.claim_replay():
+			return False
 		try:
-			data = record_data.get("data", [])
-			if len(data) < 2:
-				self.is_replaying = False
-				return
-			
-			# 첫 번째 위치로 이동
-			initial_positions = data[0]["joint_positions"]
-			for i, pos in enumerate(initial_positions):
-				if i < 6:
-					self.robot_adapter.move_joint_absolute(i, pos)
+			if not self.robot_adapter.connected:
+				return False
 			
-			await asyncio.sleep(1.0)  # 초기 이동 대기
+			engine = ReplayEngine(self.robot_adapter, rate_hz=self.replay_rate_hz, max_velocity=self.replay_max_velocity)
+			try:
+				timestamps, positions = self._load_columns(Path(filepath))
+				engine.load(timestamps, positions, filename=Path(filepath).name)
+			except Exception as e:
+				print(f"[Recorder] Failed to load record for replay: {e}")
+				return False
 			
-			# 재생 루프
-			for i in range(1, len(data)):
-				if not self.is_replaying:
-					break
-				
-				current = data[i]
-				prev = data[i - 1]
-				
-				# 시간 간격 계산
-				time_delta = (current["timestamp"] - prev["timestamp"]) / speed
-				
-				# 조인트 위치로 이동
-				positions = current["joint_positions"]
-				for joint_idx, target_pos in enumerate(positions):
-					if joint_idx < 6:
-						self.robot_adapter.move_joint_absolute(joint_idx, target_pos)
-				
-				# 다음 스텝까지 대기
-				await asyncio.sleep(max(0.01, time_delta))
-		
-		except Exception as e:
-			print(f"[Recorder] Replay error: {e}")
+			with self._replay_lock:
+				if self._replay_cancelled:
+					# 로딩 중에 stop_replay() (E-Stop 등)
+					return False
+				self._replay = engine
+				engine.start(speed=speed, loop=loop, start_time=start_time)
+			return True
 		finally:
-			self.is_replaying = False
+			self.release_replay()
+	
+	@property
+	def is_replaying(self) -> bool:
+		"""재생 중이거나 재생 시작 준비 중 (소유권 선점 후 로딩 중)"""
+		return self._replay_claimed or (self._replay is not None and self._replay.running)
+	
+	@property
+	def replay_engine(self):
+		"""현재(또는 마지막) 재생 엔진 (pause/resume/seek/set_speed, 없으면 None)"""
+		return self._replay
 	
 	def stop_replay(self):
-		"""재생 중지"""
-		self.is_replaying = False
+		"""재생 중지 (시작 준비 중이면 시작하지 않음)"""
+		with self._replay_lock:
+			if self._replay_claimed:
+				self._replay_cancelled = True
+		if self._replay is not None:
+			self._replay.stop()
 	
-	def list_records(self) -> List[Dict[str, Any]]:
+	def list_records(self, **filters) -> List[Dict[str, Any]]:
 		"""
-		저장된 기록 파일 목록 반환
+		저장된 기록 파일 목록 반환 (카탈로그 사용 - 파일 내용은 바뀐 파일만 읽음)
+		
+		Args:
+			filters: RecordCatalog.query() 인자 (offset, limit, sort, mode, ...)
 		
 		Returns:
 			기록 파일 정보 리스트
 		"""
-		records = []
+		return self.query_records(**filters)["records"]
+	
+	def query_records(self, **filters) -> Dict[str, Any]:
+		"""
+		기록 목록 페이지 조회
 		
+		Returns:
+			{"total": 필터 후 전체 개수, "records": 페이지 항목}
+		"""
 		if not RECORD_DIR.exists():
-			return records
-		
-		for filepath in sorted(RECORD_DIR.glob("record_*.json"), reverse=True):
-			try:
-				# 파일 메타데이터만 읽기 (전체 파일 로드하지 않음)
-				with open(filepath, "r", encoding="utf-8") as f:
-					data = json.load(f)
-					metadata = data.get("metadata", {})
-					
-					records.append({
-						"filename": filepath.name,
-						"filepath": str(filepath),
-						"mode": metadata.get("mode", "unknown"),
-						"created_at": metadata.get("created_at", ""),
-						"duration": metadata.get("duration", 0.0),
-						"num_steps": metadata.get("num_steps", 0),
-						"size": filepath.stat().st_size,
-					})
-			except Exception as e:
-				print(f"[Recorder] Failed to read record metadata: {e}")
-		
-		return records
+			return {"total": 0, "records": []}
+		return self.catalog.query(**filters)
 	
 	def delete_record(self, filepath: Path) -> bool:
 		"""
@@ -277,7 +600,15 @@ class Recorder:
 		"""
 		try:
 			if filepath.exists() and filepath.is_file():
+				from ..recording.preview import preview_path
+				
+				self._mapped.pop(filepath, None)
 				filepath.unlink()
+				with self._preview_lock(filepath):
+					preview_path(filepath, PREVIEW_DIR).unlink(missing_ok=True)
+				with self._preview_locks_guard:
+					self._preview_locks.pop(filepath, None)
+				self.catalog.remove(filepath)
 				return True
 			return False
 		except Exception as e:
@@ -47,6 +47,9 @@ class SOArm100Adapter:
 	JOINT_NAMES = list(MOTORS.keys())
 	SERVO_IDS = [v[0] for v in MOTORS.values()]
 	
+	# PID 계수 레지스터 순서 (주소 21-23: P, D, I - 연속된 레지스터)
+	PID_REGISTERS = ["P_Coefficient", "D_Coefficient", "I_Coefficient"]
+	
 	# 캘리브레이션 포지션 (phosphobot 참고, 라디안 단위)
 	CALIBRATION_POSITION = [
 		math.pi / 2,   # Joint 1: 90도
@@ -115,13 +118,14 @@ class SOArm100Adapter:
 				self.motors_bus.set_calibration(calibration_data)
 				print("FeetechMotorsBus calibration set")
 				
-				# 전압 감지 및 기본 설정 로드
+				# 전압 감지(그룹 읽기 1회) 및 기본 설정 로드(PID는 변경된 경우에만 sync write 1회)
 				voltage = self.detect_voltage()
 				self.load_default_config(voltage)
-				
+
 				# 연결 성공 후 토크 활성화 시도
+				# enable_torque()는 connected 플래그를 요구하므로 버스에 직접 한 번에 기록
 				try:
-					self.enable_torque()
+					self.motors_bus.write("Torque_Enable", 1)
 					print("Torque enabled for all servos")
 				except Exception as e:
 					print(f"Warning: Failed to enable torque: {e}. You may need to enable torque manually.")
@@ -445,20 +449,18 @@ class SOArm100Adapter:
 	def detect_voltage(self) -> str:
 		"""
 		로봇 전압 감지 (6V 또는 12V)
-		모든 모터의 전압을 읽어서 평균값으로 판단
+		모든 모터의 Present_Voltage를 한 번의 그룹 읽기로 읽어서 평균값으로 판단
+		connect() 도중에도 호출되므로 connected 플래그 대신 motors_bus 유무로 확인
 		"""
-		if not self.connected:
+		if not self.motors_bus:
 			return "6V"  # 기본값
 		
 		try:
-			voltages = []
-			for servo_id in self.SERVO_IDS:
-				voltage = self.read_motor_voltage(servo_id)
-				if voltage is not None:
-					voltages.append(voltage)
+			# Feetech 서보는 0.1V 단위로 저장하므로 10으로 나눔
+			voltages = np.asarray(self.motors_bus.read("Present_Voltage"), dtype=np.float32) / 10.0
 			
-			if voltages:
-				avg_voltage = np.mean(voltages)
+			if voltages.size:
+				avg_voltage = float(voltages.mean())
 				# 9V 이상이면 12V, 그 이하면 6V로 판단
 				detected = "12V" if avg_voltage >= 9.0 else "6V"
 				print(f"Detected voltage: {detected} (average: {avg_voltage:.2f}V)")
@@ -522,8 +524,11 @@ class SOArm100Adapter:
 		"""
 		설정 파일에서 PID 게인을 읽어서 모든 모터에 적용
 		phosphobot의 _set_pid_gains_motors 방식 참고
+		
+		P/D/I 레지스터(21-23)를 한 번의 그룹 읽기로 확인하고,
+		값이 다른 모터에만 한 번의 sync write로 기록 (모터별 쓰기/대기 없음)
 		"""
-		if not self.connected or not self.motors_bus:
+		if not self.motors_bus:
 			print("Cannot apply PID gains: robot not connected")
 			return False
 		
@@ -536,61 +541,39 @@ class SOArm100Adapter:
 			print(f"Invalid PID gains: expected 6, got {len(pid_gains)}")
 			return False
 		
-		# 토크가 활성화되어 있는지 확인
+		# 레지스터 순서(P, D, I)에 맞춘 목표값 (0-255 범위로 제한)
+		target = np.array([
+			[int(g.get("p_gain", 20)), int(g.get("d_gain", 32)), int(g.get("i_gain", 0))]
+			for g in pid_gains
+		], dtype=np.int64).clip(0, 255)
+		motor_names = list(self.MOTORS.keys())
+		
 		try:
-			torque_status = self.motors_bus.read(
-				"Torque_Enable", motor_names=list(self.MOTORS.keys())
-			)
-			# numpy array인 경우 all() 사용, 그렇지 않으면 직접 확인
-			if hasattr(torque_status, 'all'):
-				torque_enabled = torque_status.all() == 1
-			else:
-				torque_enabled = all(t == 1 for t in torque_status.values()) if isinstance(torque_status, dict) else False
+			current = self.motors_bus.read_block(self.PID_REGISTERS, motor_names=motor_names)
+			mismatched = np.flatnonzero((np.asarray(current) != target).any(axis=1))
 		except Exception as e:
-			print(f"Warning: Could not read torque status: {e}. Attempting to apply PID gains anyway.")
-			torque_enabled = True  # 일단 시도
-		
-		if not torque_enabled:
-			print("Warning: Torque is disabled. Enabling torque to apply PID gains...")
-			try:
-				self.enable_torque()
-				time.sleep(0.1)  # 토크 활성화 대기
-			except Exception as e:
-				print(f"Error enabling torque: {e}")
-				return False
+			print(f"Warning: Could not read PID gains: {e}. Writing all motors.")
+			mismatched = np.arange(len(motor_names))
 		
-		# 각 모터에 PID 게인 적용
-		success = True
-		for i, (motor_name, pid_gain) in enumerate(zip(self.MOTORS.keys(), pid_gains)):
-			try:
-				p_gain = int(pid_gain.get("p_gain", 20))
-				i_gain = int(pid_gain.get("i_gain", 0))
-				d_gain = int(pid_gain.get("d_gain", 32))
-				
-				# PID 게인 범위 확인 (0-255)
-				p_gain = max(0, min(255, p_gain))
-				i_gain = max(0, min(255, i_gain))
-				d_gain = max(0, min(255, d_gain))
-				
-				# FeetechMotorsBus를 사용하여 PID 게인 설정
-				self.motors_bus.write("P_Coefficient", p_gain, motor_names=[motor_name])
-				time.sleep(0.01)
-				self.motors_bus.write("I_Coefficient", i_gain, motor_names=[motor_name])
-				time.sleep(0.01)
-				self.motors_bus.write("D_Coefficient", d_gain, motor_names=[motor_name])
-				time.sleep(0.01)
-				
-				print(f"Applied PID gains to {motor_name} (Joint {i+1}): P={p_gain}, I={i_gain}, D={d_gain}")
-			except Exception as e:
-				print(f"Error applying PID gains to {motor_name}: {e}")
-				success = False
+		if mismatched.size == 0:
+			print("PID gains already match config, skipping write")
+			return True
 		
-		if success:
-			print("PID gains applied successfully to all motors")
-		else:
-			print("Warning: Some PID gains may not have been applied")
+		try:
+			self.motors_bus.write_block(
+				self.PID_REGISTERS,
+				target[mismatched],
+				motor_names=[motor_names[i] for i in mismatched],
+			)
+		except Exception as e:
+			print(f"Error applying PID gains: {e}")
+			return False
 		
-		return success
+		for i in mismatched:
+			p_gain, d_gain, i_gain = target[i]
+			print(f"Applied PID gains to {motor_names[i]} (Joint {i+1}): P={p_gain}, I={i_gain}, D={d_gain}")
+		print("PID gains applied successfully to all motors")
+		return True
 	
 	def set_pid_gains(self, joint_index: int, p_gain: int, i_gain: int, d_gain: int) -> bool:
 		"""
@@ -2,7 +2,6 @@
 SO-100 Robot Adapter (V2 - Simplified)
 완전히 새로 작성한 간단한 버전
 """
-import numpy as np
 from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
@@ -33,9 +32,11 @@ class SOArm100AdapterV2:
 		[-180.0, 180.0],  # gripper
 	]
 
-	def __init__(self):
+	def __init__(self, bus_in_subprocess: bool = False):
 		self.connected = False
 		self.motors_bus = None
+		# True면 버스를 자식 프로세스에서 실행 (웹 서버와 GIL 경합 없음, 크래시 시 자동 재시작)
+		self.bus_in_subprocess = bus_in_subprocess
 		self.port = None
 		self.baudrate = 115200
 		self.connection_info = None  # 연결 정보
@@ -55,8 +56,13 @@ class SOArm100AdapterV2:
 			
 			logger.info(f"[SOArmV2] Connecting to {port} at {self.baudrate} baud...")
 			
-			# FeetechMotorsBus 생성
-			self.motors_bus = FeetechMotorsBus(
+			# FeetechMotorsBus 생성 (옵션: 자식 프로세스에서 실행하는 같은 API의 프록시)
+			if self.bus_in_subprocess:
+				from .motors.process_bus import ProcessMotorsBus
+				bus_class = ProcessMotorsBus
+			else:
+				bus_class = FeetechMotorsBus
+			self.motors_bus = bus_class(
 				port=port,
 				motors=self.MOTORS,
 			)
@@ -124,6 +130,23 @@ class SOArm100AdapterV2:
 			logger.error(f"[SOArmV2] Error reading positions: {e}")
 			return False
 	
+	def read_joint_positions(self) -> Optional[List[float]]:
+		"""모든 조인트 위치를 한 번 읽어 반환 (실패 시 None, 기록 캡처용)"""
+		if not self._update_positions():
+			return None
+		return self._joint_positions.copy()
+	
+	def read_moving(self) -> Optional[List[bool]]:
+		"""모든 서보의 Moving 레지스터를 한 번의 sync read로 읽기 (실패 시 None, 홈 이동 도착 판정용)"""
+		if not self.connected or not self.motors_bus:
+			return None
+		try:
+			moving = self.motors_bus.read("Moving")
+			return [bool(m) for m in moving]
+		except Exception as e:
+			logger.debug(f"[SOArmV2] Error reading Moving register: {e}")
+			return None
+	
 	def get_joint_position(self, joint_index: int) -> Optional[float]:
 		"""특정 조인트의 현재 위치 읽기"""
 		if not self.connected or not self.motors_bus:
@@ -133,6 +156,8 @@ class SOArm100AdapterV2:
 			return None
 		
 		try:
+			import numpy as np  # 버스가 연결되어 있으면 이미 로드됨
+			
 			motor_name = self.JOINT_NAMES[joint_index]
 			position = self.motors_bus.read("Present_Position", motor_names=motor_name)
 			
@@ -183,6 +208,8 @@ class SOArm100AdapterV2:
 			return False
 		
 		try:
+			import numpy as np
+			
 			motor_name = self.JOINT_NAMES[joint_index]
 			
 			# 토크 확인 및 활성화
@@ -208,6 +235,53 @@ class SOArm100AdapterV2:
 			logger.error(f"[SOArmV2] Error moving joint {joint_index}: {e}")
 			return False
 	
+	def move_joints_absolute(self, targets: Dict[int, float]) -> bool:
+		"""
+		여러 조인트를 한 번의 sync write로 절대 위치 이동 (조그/궤적 스트리밍용)
+		
+		토크 확인을 하지 않으므로 호출 전에 토크가 켜져 있어야 함 (connect 시 활성화됨).
+		
+		Args:
+			targets: {조인트 인덱스: 목표 각도(도)}
+		
+		Returns:
+			성공 여부
+		"""
+		if not self.connected or not self.motors_bus:
+			logger.error("[SOArmV2] Robot not connected")
+			return False
+		if not targets:
+			return True
+		
+		motor_names = []
+		values = []
+		for joint_index, target_deg in sorted(targets.items()):
+			if joint_index < 0 or joint_index >= 6:
+				logger.error(f"[SOArmV2] Invalid joint index: {joint_index}")
+				return False
+			limits = self.joint_limits[joint_index]
+			if target_deg < min(limits) or target_deg > max(limits):
+				logger.warning(f"[SOArmV2] Joint {joint_index} target {target_deg:.2f}° exceeds limits {limits}")
+				return False
+			motor_names.append(self.JOINT_NAMES[joint_index])
+			values.append(target_deg)
+		
+		try:
+			self.motors_bus.write("Goal_Position", values, motor_names=motor_names)
+			for joint_index, target_deg in targets.items():
+				self._joint_positions[joint_index] = target_deg
+			return True
+		except Exception as e:
+			logger.error(f"[SOArmV2] Error moving joints {list(targets)}: {e}")
+			return False
+	
+	@property
+	def last_bus_timing(self):
+		"""호출한 스레드의 마지막 버스 작업 시각 (submitted, started, finished) - 지연 추적용"""
+		if self.motors_bus is None:
+			return None
+		return getattr(self.motors_bus, "last_task_timing", None)
+	
 	def move_joint_delta(self, joint_index: int, delta_deg: float) -> bool:
 		"""
 		조인트를 상대 위치로 이동
@@ -0,0 +1,215 @@
+"""
+로봇 상태 발행자
+시리얼 버스 읽기를 asyncio 이벤트 루프 밖의 전용 스레드에서 수행하고,
+읽은 상태를 시퀀스 번호가 붙은 불변 스냅샷으로 발행합니다.
+"""
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional
+
+from ..observability.metrics import REGISTRY
+
+STATE_POLLS = REGISTRY.counter("rosota_state_polls_total", "State snapshots published", ("connected",))
+STATE_READ_SECONDS = REGISTRY.histogram("rosota_state_read_seconds", "get_state() duration per snapshot")
+STATE_LISTENER_ERRORS = REGISTRY.counter("rosota_state_listener_errors_total", "Snapshot listener exceptions")
+
+
+def _freeze(value: Any) -> Any:
+	"""리스트/딕셔너리를 튜플/읽기 전용 매핑으로 변환 (스냅샷 불변성 보장)"""
+	if isinstance(value, dict):
+		return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+	if isinstance(value, (list, tuple)):
+		return tuple(_freeze(v) for v in value)
+	return value
+
+
+def _thaw(value: Any) -> Any:
+	"""_freeze의 역변환 (JSON 직렬화용)"""
+	if isinstance(value, Mapping):
+		return {k: _thaw(v) for k, v in value.items()}
+	if isinstance(value, tuple):
+		return [_thaw(v) for v in value]
+	return value
+
+
+class StateSnapshot(NamedTuple):
+	"""한 번의 버스 읽기 결과 (불변)"""
+	seq: int  # 발행 순서 (1부터 증가)
+	timestamp: float  # 읽기 완료 시각 (time.time())
+	monotonic: float  # 읽기 완료 시각 (time.monotonic(), 나이 계산용)
+	read_duration: float  # get_state() 소요 시간 (초)
+	connected: bool
+	state: Mapping[str, Any]
+
+	def age(self) -> float:
+		"""스냅샷 생성 후 경과 시간 (초)"""
+		return time.monotonic() - self.monotonic
+
+	def to_payload(self) -> Dict[str, Any]:
+		"""Socket.IO/HTTP 응답용 딕셔너리 (매번 새로 생성)"""
+		payload = _thaw(self.state)
+		payload["seq"] = self.seq
+		payload["timestamp"] = self.timestamp
+		return payload
+
+
+class StatePublisher:
+	"""
+	전용 스레드에서 로봇 상태를 주기적으로 읽어 최신 스냅샷을 발행
+
+	- 버스 I/O(재시도/타임아웃 포함)가 이벤트 루프를 막지 않음
+	- 소비자는 latest만 읽으므로 느린 소비자가 생산자를 막지 않음 (latest-wins)
+	- 리스너는 생산자 스레드에서 호출되므로 가볍게 유지해야 함
+	  (asyncio 쪽은 loop.call_soon_threadsafe로 깨우기만 할 것)
+	- 상태가 필요한 소비자(클라이언트 구독, 제어 루프, 레코더 등)는 acquire()로 수요를 등록하고,
+	  폴링 주기는 등록된 요청 주기 중 최댓값을 따름. 수요가 없으면 버스를 전혀 읽지 않음
+	"""
+
+	def __init__(self, robot_adapter, rate_hz: float = 20.0, max_rate_hz: float = 50.0):
+		self.robot = robot_adapter
+		self.default_rate_hz = rate_hz
+		self.max_rate_hz = max_rate_hz
+		self.interval = 1.0 / rate_hz
+		self._demands: Dict[str, float] = {}
+		self._latest: Optional[StateSnapshot] = None
+		self._seq = 0
+		self._listeners: List[Callable[[StateSnapshot], None]] = []
+		self._condition = threading.Condition()
+		self._stop_event = threading.Event()
+		self._wake = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+
+	@property
+	def running(self) -> bool:
+		return self._thread is not None and self._thread.is_alive()
+
+	@property
+	def active(self) -> bool:
+		"""실제로 버스를 폴링 중인지 (스레드 실행 중이고 수요가 있음)"""
+		return self.running and bool(self._demands)
+
+	@property
+	def demands(self) -> Dict[str, float]:
+		"""등록된 수요 {이름: 요청 주기(Hz)}"""
+		return dict(self._demands)
+
+	def acquire(self, name: str, rate_hz: Optional[float] = None) -> None:
+		"""
+		상태 수요 등록/갱신
+		같은 이름으로 다시 호출하면 요청 주기만 갱신됨
+		"""
+		rate = min(self.max_rate_hz, rate_hz or self.default_rate_hz)
+		with self._condition:
+			if self._demands.get(name) == rate:
+				return
+			self._demands[name] = rate
+			self.interval = 1.0 / max(self._demands.values())
+		self._wake.set()
+
+	def release(self, name: str) -> None:
+		"""상태 수요 해제 (남은 수요가 없으면 폴링 중지)"""
+		with self._condition:
+			if self._demands.pop(name, None) is None:
+				return
+			if self._demands:
+				self.interval = 1.0 / max(self._demands.values())
+		self._wake.set()
+
+	@property
+	def latest(self) -> Optional[StateSnapshot]:
+		"""가장 최근 스냅샷 (없으면 None)"""
+		return self._latest
+
+	def add_listener(self, callback: Callable[[StateSnapshot], None]) -> None:
+		"""새 스냅샷 발행 시 호출될 콜백 등록"""
+		self._listeners.append(callback)
+
+	def remove_listener(self, callback: Callable[[StateSnapshot], None]) -> None:
+		if callback in self._listeners:
+			self._listeners.remove(callback)
+
+	def start(self) -> None:
+		if self.running:
+			return
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self._run, name="state-publisher", daemon=True)
+		self._thread.start()
+
+	def stop(self, timeout: float = 2.0) -> None:
+		self._stop_event.set()
+		self._wake.set()
+		with self._condition:
+			self._condition.notify_all()
+		if self._thread:
+			self._thread.join(timeout)
+		self._thread = None
+
+	def wait_for_next(self, after_seq: int, timeout: Optional[float] = None) -> Optional[StateSnapshot]:
+		"""after_seq 이후의 스냅샷이 발행될 때까지 대기 (스레드 소비자용)"""
+		with self._condition:
+			self._condition.wait_for(
+				lambda: self._stop_event.is_set() or (self._latest is not None and self._latest.seq > after_seq),
+				timeout,
+			)
+			return self._latest
+
+	def poll_once(self) -> Optional[StateSnapshot]:
+		"""버스를 한 번 읽어 스냅샷 발행 (생산자 스레드에서 호출)"""
+		started = time.monotonic()
+		connected = bool(self.robot.connected)
+		if connected:
+			state = self.robot.get_state()
+			state["connection"] = self.robot.connection_info
+		else:
+			# 연결되지 않은 경우에도 상태 전송 (연결 해제 알림)
+			state = {"status": "Disconnected", "connection": None}
+		finished = time.monotonic()
+
+		with self._condition:
+			self._seq += 1
+			snapshot = StateSnapshot(
+				seq=self._seq,
+				timestamp=time.time(),
+				monotonic=finished,
+				read_duration=finished - started,
+				connected=connected,
+				state=_freeze(state),
+			)
+			self._latest = snapshot
+			self._condition.notify_all()
+		STATE_POLLS.labels("true" if connected else "false").inc()
+		STATE_READ_SECONDS.observe(snapshot.read_duration)
+
+		for callback in list(self._listeners):
+			try:
+				callback(snapshot)
+			except Exception as e:
+				STATE_LISTENER_ERRORS.inc()
+				print(f"[StatePublisher] Listener error: {e}")
+		return snapshot
+
+	def _run(self) -> None:
+		next_tick = time.monotonic()
+		while not self._stop_event.is_set():
+			if not self._demands:
+				# 수요 없음 - 버스 폴링 중지하고 acquire()/stop()까지 대기
+				self._wake.wait()
+				self._wake.clear()
+				next_tick = time.monotonic()
+				continue
+
+			try:
+				self.poll_once()
+			except Exception as e:
+				print(f"State update error: {e}")
+
+			# 절대 시각 기준 스케줄링 (읽기 시간이 주기를 넘으면 바로 다음 읽기)
+			next_tick += self.interval
+			now = time.monotonic()
+			if next_tick < now:
+				next_tick = now
+			if self._wake.wait(next_tick - now):
+				# 수요/주기 변경 - 새 주기로 즉시 다시 스케줄
+				self._wake.clear()
+				next_tick = time.monotonic()
@@ -0,0 +1,265 @@
+"""
+시리얼 포트 핫플러그 감시
+
+전용 스레드에서 /dev 변화를 감시해 USB 시리얼 포트의 추가/제거 이벤트를 발행합니다.
+- Linux: inotify (/dev의 IN_CREATE/IN_DELETE)로 즉시 깨어나고, 사용할 수 없으면 짧은 주기로 폴링
+- macOS: /dev 목록 폴링 (os.listdir만 사용, pyserial 열거 없음)
+- Windows: serial.tools.list_ports.comports() 폴링
+포트 메타데이터(VID/PID/설명)는 포트가 나타날 때 한 번만 읽어 캐시합니다.
+"""
+import ctypes
+import ctypes.util
+import os
+import platform
+import select
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+from .usb_scanner import SO100_PIDS
+
+# inotify 상수 (linux/inotify.h)
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+# 핫플러그 대상 포트 이름 (내장 UART인 ttyS*는 제외)
+_LINUX_PREFIXES = ("ttyUSB", "ttyACM")
+_MAC_PREFIXES = ("cu.usbserial", "cu.usbmodem", "cu.wchusbserial", "cu.SLAB_USBtoUART")
+
+
+class PortInfo(NamedTuple):
+	"""캐시된 시리얼 포트 메타데이터"""
+	device: str
+	vid: Optional[int] = None
+	pid: Optional[int] = None
+	description: str = ""
+	serial_number: Optional[str] = None
+
+	@property
+	def is_robot(self) -> bool:
+		"""SO-100 보드(CH340, PID 21971/29987)인지"""
+		return self.pid in SO100_PIDS
+
+	def to_dict(self) -> Dict:
+		return {
+			"port": self.device,
+			"vid": self.vid,
+			"pid": self.pid,
+			"description": self.description,
+			"serial_number": self.serial_number,
+			"is_robot": self.is_robot,
+		}
+
+
+class HotplugEvent(NamedTuple):
+	action: str  # "add" | "remove"
+	port: PortInfo
+	timestamp: float
+
+
+def list_port_names() -> Set[str]:
+	"""현재 존재하는 USB 시리얼 포트 경로 (메타데이터 없이, 가볍게)"""
+	system = platform.system()
+	if system == "Windows":
+		try:
+			import serial.tools.list_ports
+			return {p.device for p in serial.tools.list_ports.comports()}
+		except ImportError:
+			return set()
+
+	prefixes = _MAC_PREFIXES if system == "Darwin" else _LINUX_PREFIXES
+	try:
+		return {os.path.join("/dev", name) for name in os.listdir("/dev") if name.startswith(prefixes)}
+	except OSError:
+		return set()
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+	try:
+		with open(path, "r") as f:
+			return f.read().strip()
+	except OSError:
+		return None
+
+
+def _describe_linux(device: str) -> Optional[PortInfo]:
+	"""sysfs에서 USB 디스크립터 읽기 (/sys/class/tty/<name>/device에서 상위로 idVendor를 찾음)"""
+	sys_dev = os.path.join("/sys/class/tty", os.path.basename(device), "device")
+	if not os.path.exists(sys_dev):
+		return None
+	path = os.path.realpath(sys_dev)
+	while path and path != "/":
+		vid = _read_sysfs(os.path.join(path, "idVendor"))
+		if vid is not None:
+			pid = _read_sysfs(os.path.join(path, "idProduct"))
+			return PortInfo(
+				device=device,
+				vid=int(vid, 16),
+				pid=int(pid, 16) if pid else None,
+				description=_read_sysfs(os.path.join(path, "product")) or "USB Serial Port",
+				serial_number=_read_sysfs(os.path.join(path, "serial")),
+			)
+		path = os.path.dirname(path)
+	return None
+
+
+def describe_port(device: str) -> PortInfo:
+	"""포트 메타데이터 조회 (Linux는 sysfs, 그 외는 pyserial)"""
+	if platform.system() == "Linux":
+		info = _describe_linux(device)
+		if info is not None:
+			return info
+	try:
+		import serial.tools.list_ports
+		for port_info in serial.tools.list_ports.comports():
+			if port_info.device == device:
+				return PortInfo(
+					device=device,
+					vid=port_info.vid,
+					pid=port_info.pid,
+					description=port_info.description or "",
+					serial_number=port_info.serial_number,
+				)
+	except ImportError:
+		pass
+	return PortInfo(device=device, description="USB Serial Port")
+
+
+class _Inotify:
+	"""ctypes 기반 최소 inotify 래퍼 (/dev 항목 생성/삭제만 감시)"""
+
+	def __init__(self, path: str):
+		libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+		self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+		if self.fd < 0:
+			raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+		if libc.inotify_add_watch(self.fd, path.encode(), _IN_CREATE | _IN_DELETE) < 0:
+			os.close(self.fd)
+			raise OSError(ctypes.get_errno(), f"inotify_add_watch({path}) failed")
+
+	def wait(self, timeout: float) -> bool:
+		"""이벤트가 오면 모두 비우고 True, 타임아웃이면 False"""
+		ready, _, _ = select.select([self.fd], [], [], timeout)
+		if not ready:
+			return False
+		try:
+			while os.read(self.fd, 4096):
+				pass
+		except BlockingIOError:
+			pass
+		return True
+
+	def close(self):
+		os.close(self.fd)
+
+
+class SerialHotplugWatcher:
+	"""
+	USB 시리얼 포트 추가/제거 감시 스레드
+
+	리스너는 감시 스레드에서 HotplugEvent와 함께 호출되므로 가볍게 유지해야 함
+	(asyncio 쪽은 loop.call_soon_threadsafe로 넘길 것)
+	"""
+
+	def __init__(self, poll_interval: float = 0.25, settle_delay: float = 0.05):
+		self.poll_interval = poll_interval
+		self.settle_delay = settle_delay  # 노드 생성 직후 udev 권한 설정을 기다리는 시간
+		self._ports: Dict[str, PortInfo] = {}
+		self._listeners: List[Callable[[HotplugEvent], None]] = []
+		self._lock = threading.Lock()
+		self._stop_event = threading.Event()
+		self._thread: Optional[threading.Thread] = None
+		self._inotify: Optional[_Inotify] = None
+		self.backend = "poll"
+
+	@property
+	def running(self) -> bool:
+		return self._thread is not None and self._thread.is_alive()
+
+	@property
+	def ports(self) -> Dict[str, PortInfo]:
+		"""캐시된 현재 포트 목록"""
+		with self._lock:
+			return dict(self._ports)
+
+	def robot_candidates(self) -> List[PortInfo]:
+		"""로봇일 가능성이 높은 순서의 포트 목록 (PID 일치 우선, 그 다음 나머지 USB 포트)"""
+		ports = sorted(self.ports.values(), key=lambda p: p.device)
+		return [p for p in ports if p.is_robot] + [p for p in ports if not p.is_robot]
+
+	def add_listener(self, callback: Callable[[HotplugEvent], None]) -> None:
+		self._listeners.append(callback)
+
+	def remove_listener(self, callback: Callable[[HotplugEvent], None]) -> None:
+		if callback in self._listeners:
+			self._listeners.remove(callback)
+
+	def start(self) -> None:
+		if self.running:
+			return
+		self._stop_event.clear()
+		# 시작 시점의 포트는 이벤트 없이 캐시만 채움 (초기 연결은 호출자가 robot_candidates()로 수행)
+		self._rescan(emit=False)
+		if platform.system() == "Linux":
+			try:
+				self._inotify = _Inotify("/dev")
+				self.backend = "inotify"
+			except (OSError, AttributeError) as e:
+				print(f"[Hotplug] inotify unavailable ({e}), falling back to polling")
+		self._thread = threading.Thread(target=self._run, name="serial-hotplug", daemon=True)
+		self._thread.start()
+
+	def stop(self, timeout: float = 2.0) -> None:
+		self._stop_event.set()
+		if self._thread:
+			self._thread.join(timeout)
+		self._thread = None
+
+	def _rescan(self, emit: bool = True) -> None:
+		current = list_port_names()
+		with self._lock:
+			known = set(self._ports)
+		removed = known - current
+		added = current - known
+
+		events = []
+		for device in sorted(removed):
+			with self._lock:
+				info = self._ports.pop(device)
+			events.append(HotplugEvent("remove", info, time.time()))
+		for device in sorted(added):
+			info = describe_port(device)
+			with self._lock:
+				self._ports[device] = info
+			events.append(HotplugEvent("add", info, time.time()))
+
+		if not emit:
+			return
+		for event in events:
+			for callback in list(self._listeners):
+				try:
+					callback(event)
+				except Exception as e:
+					print(f"[Hotplug] Listener error: {e}")
+
+	def _run(self) -> None:
+		inotify = self._inotify
+		try:
+			while not self._stop_event.is_set():
+				if inotify is not None:
+					# 이벤트가 없어도 주기적으로 재확인 (놓친 이벤트/stop 확인용)
+					if inotify.wait(1.0):
+						time.sleep(self.settle_delay)
+				else:
+					self._stop_event.wait(self.poll_interval)
+				try:
+					self._rescan()
+				except Exception as e:
+					print(f"[Hotplug] Scan error: {e}")
+		finally:
+			if inotify is not None:
+				inotify.close()
+				self._inotify = None
+				self.backend = "poll"
@@ -2,9 +2,19 @@
 USB 포트 스캔 및 로봇 자동 감지
 """
 import platform
-from typing import List, Optional, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 import subprocess
 
+# SO-100은 CH340 칩셋을 사용하며 PID가 21971 또는 29987
+SO100_PIDS = (21971, 29987)
+
+# 핸드셰이크 탐색 기본값 (SO-100 모터 ID 1~6, STS3215 기본 baudrate 우선)
+PROBE_MOTOR_IDS = tuple(range(1, 7))
+PROBE_BAUDRATES = (1_000_000, 500_000, 115_200)
+PROBE_TIMEOUT_MS = 30
+
 
 def scan_serial_ports() -> List[Dict[str, str]]:
 	"""
@@ -94,32 +104,172 @@ def scan_serial_ports() -> List[Dict[str, str]]:
 	return ports
 
 
-def detect_robot_port() -> Optional[str]:
+def _candidate_ports() -> List[str]:
+	"""탐색 대상 포트 (Linux 내장 UART ttyS*는 제외)"""
+	return [
+		p["port"] for p in scan_serial_ports()
+		if not p["port"].startswith("/dev/ttyS")
+	]
+
+
+def _port_usb_ids() -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+	"""포트별 (VID, PID), pyserial이 없으면 빈 딕셔너리"""
+	try:
+		import serial.tools.list_ports
+		return {p.device: (p.vid, p.pid) for p in serial.tools.list_ports.comports()}
+	except ImportError:
+		return {}
+
+
+def _probe_port(
+	port: str,
+	motor_ids: Tuple[int, ...],
+	baudrates: Tuple[int, ...],
+	timeout_ms: int,
+) -> Optional[Dict]:
+	"""
+	포트 하나를 열어 baudrate별로 모터 ID를 ping
+	응답한 모터가 있는 첫 baudrate의 결과를 반환 (응답이 없으면 None)
+	"""
+	import scservo_sdk as scs
+	from .motors.feetech import PROTOCOL_VERSION
+	
+	started = time.monotonic()
+	port_handler = scs.PortHandler(port)
+	packet_handler = scs.PacketHandler(PROTOCOL_VERSION)
+	try:
+		if not port_handler.openPort():
+			return None
+		port_handler.setPacketTimeoutMillis(timeout_ms)
+		for baudrate in baudrates:
+			if not port_handler.setBaudRate(baudrate):
+				continue
+			found = {}
+			for motor_id in motor_ids:
+				model_number, comm, _error = packet_handler.ping(port_handler, motor_id)
+				if comm == scs.COMM_SUCCESS:
+					found[motor_id] = model_number
+			if found:
+				return {
+					"port": port,
+					"baudrate": baudrate,
+					"motor_ids": sorted(found),
+					"model_numbers": found,
+					"elapsed": time.monotonic() - started,
+				}
+		return None
+	except Exception as e:
+		# 다른 프로세스가 점유 중이거나 권한 없음 등
+		print(f"[Probe] {port}: {e}")
+		return None
+	finally:
+		try:
+			port_handler.closePort()
+		except Exception:
+			pass
+
+
+def probe_ports(
+	ports: Optional[Iterable[str]] = None,
+	motor_ids: Iterable[int] = PROBE_MOTOR_IDS,
+	baudrates: Iterable[int] = PROBE_BAUDRATES,
+	timeout_ms: int = PROBE_TIMEOUT_MS,
+	motors: Optional[Dict[str, Tuple[int, str]]] = None,
+	exclude: Iterable[str] = (),
+) -> List[Dict]:
+	"""
+	후보 포트들을 병렬로 열어 Feetech 버스가 실제로 응답하는지 확인
+	
+	각 포트는 별도 스레드에서 짧은 타임아웃으로 motor_ids를 ping하므로
+	전체 소요 시간은 포트 수의 합이 아니라 가장 느린 포트 하나에 비례합니다.
+	
+	Args:
+		ports: 탐색할 포트 (None이면 USB 시리얼 포트 전체)
+		motor_ids: ping할 모터 ID (기본: 1~6)
+		baudrates: 시도할 baudrate (앞쪽 우선)
+		timeout_ms: ping 1회 패킷 타임아웃
+		motors: 로봇 모터 맵 {이름: (id, 모델)} - 지정하면 결과에 이름별 응답 여부 포함
+		exclude: 제외할 포트 (예: 이미 연결되어 열려 있는 포트)
+	
+	Returns:
+		응답이 확인된 포트 목록 (응답 모터 수, SO-100 PID 일치, 포트 이름 순으로 정렬)
+		[{"port", "baudrate", "motor_ids", "model_numbers", "motors", "complete", "vid", "pid", "is_robot", "elapsed"}]
+	
+	Raises:
+		ImportError: scservo_sdk가 설치되지 않은 경우
+	"""
+	import scservo_sdk  # noqa: F401 - 스레드를 띄우기 전에 의존성 확인
+	
+	ports = list(ports) if ports is not None else _candidate_ports()
+	ports = [p for p in ports if p not in set(exclude)]
+	if not ports:
+		return []
+	motor_ids = tuple(motor_ids)
+	baudrates = tuple(baudrates)
+	
+	with ThreadPoolExecutor(max_workers=len(ports), thread_name_prefix="port-probe") as pool:
+		results = list(pool.map(lambda port: _probe_port(port, motor_ids, baudrates, timeout_ms), ports))
+	
+	usb_ids = _port_usb_ids()
+	verified = []
+	for result in results:
+		if result is None:
+			continue
+		vid, pid = usb_ids.get(result["port"], (None, None))
+		result["vid"] = vid
+		result["pid"] = pid
+		result["is_robot"] = pid in SO100_PIDS
+		if motors is not None:
+			result["motors"] = {name: motor_id in result["model_numbers"] for name, (motor_id, _model) in motors.items()}
+			result["complete"] = all(result["motors"].values())
+		else:
+			result["complete"] = len(result["motor_ids"]) == len(motor_ids)
+		verified.append(result)
+	
+	verified.sort(key=lambda r: (-len(r["motor_ids"]), not r["is_robot"], r["port"]))
+	return verified
+
+
+def detect_robot_port(exclude: Iterable[str] = ()) -> Optional[str]:
 	"""
 	SO-100 로봇 포트 자동 감지
-	PID 기반 감지: CH340 칩셋 (PID 21971 또는 29987)
+	1. 핸드셰이크 탐색: 후보 포트를 병렬로 열어 모터 ID 1~6이 응답하는 포트 (probe_ports)
+	2. PID 기반 감지: CH340 칩셋 (PID 21971 또는 29987)
 	phosphobot의 SO100Hardware.from_port 방식 참고
+	
+	Args:
+		exclude: 열지도 반환하지도 않을 포트 (예: 이미 연결되어 버스가 사용 중인 포트)
 	"""
+	exclude = set(exclude)
+	try:
+		verified = probe_ports(exclude=exclude)
+		if verified:
+			best = verified[0]
+			print(f"SO-100 verified on {best['port']} (motors: {best['motor_ids']}, {best['baudrate']} baud)")
+			return best["port"]
+		# 응답하는 버스가 없어도 전원이 꺼져 있을 수 있으므로 아래 휴리스틱으로 계속
+	except ImportError:
+		pass
+	
 	try:
 		import serial.tools.list_ports
 	except ImportError:
 		# pyserial이 없으면 기본 방식 사용
-		ports = scan_serial_ports()
+		ports = [p for p in scan_serial_ports() if p["port"] not in exclude]
 		if ports:
 			return ports[0]["port"]
 		return None
 	
-	# SO-100은 CH340 칩셋을 사용하며 PID가 21971 또는 29987
-	SO100_PIDS = [21971, 29987]
-	
 	# PID 기반 감지
 	for port_info in serial.tools.list_ports.comports():
+		if port_info.device in exclude:
+			continue
 		if hasattr(port_info, 'pid') and port_info.pid in SO100_PIDS:
 			print(f"SO-100 detected on {port_info.device} (PID: {port_info.pid})")
 			return port_info.device
 	
 	# PID 기반 감지 실패 시, 포트 이름으로 감지 시도
-	ports = scan_serial_ports()
+	ports = [p for p in scan_serial_ports() if p["port"] not in exclude]
 	for port_info in ports:
 		port_name = port_info.get("port", "").lower()
 		description = port_info.get("description", "").lower()
@@ -3,22 +3,33 @@ import asyncio
 import socketio
 from socketio.async_server import AsyncServer
 from socketio.asgi import ASGIApp
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Request
+from fastapi.responses import Response
 from starlette.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from .api.routes import api_router
+from .api.ws_control import ws_router
+from .api.assets import AssetPipeline
 from .robot.so_arm_v2 import SOArm100AdapterV2
 from .robot.keyboard_control import KeyboardController
 from .robot.calibration import CalibrationManager
-from .robot.motor_setup import MotorSetupManager
-from .config import DEFAULT_CONFIG
+from .robot.recorder import Recorder
+from .robot.state_publisher import StatePublisher
+from .robot.usb_hotplug import SerialHotplugWatcher
+from .streaming import STATE_FORMAT_VERSION, StateBroadcaster
+from .observability import CommandTracer
+from .observability.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY
+from .config import DEFAULT_CONFIG, ensure_data_dirs
 
 load_dotenv()
 
 # Global robot instances
-robot_adapter = SOArm100AdapterV2()
+# import 시점에 만들어도 되는 이유: 아래 객체들의 생성자는 설정 값과 빈 상태만 잡고
+# 포트 열기/파일 I/O/스레드 시작/numpy import를 하지 않음 (전부 합쳐 1ms 미만).
+# 버스 연결, 데이터 디렉토리 생성, 퍼블리셔/핫플러그/공유 메모리 스레드는 startup 이후에 시작.
+# 라우트와 Socket.IO 핸들러가 모듈 전역으로 참조하므로 lifespan으로 옮기지 않음
+# (지연 import는 python -m rosota_copilot.observability.startup으로 확인)
+robot_adapter = SOArm100AdapterV2(bus_in_subprocess=DEFAULT_CONFIG["robot"]["bus_in_subprocess"])
 
 # Socket.IO는 나중에 정의되므로, 전역 변수로 접근
 sio = None
@@ -48,11 +59,83 @@ def calibration_log_callback(message: str, level: str = "info"):
 		print(f"[{level.upper()}] {message}")
 
 calibration_manager = CalibrationManager(robot_adapter, log_callback=calibration_log_callback)
-keyboard_controller = KeyboardController(robot_adapter)
-motor_setup_manager = MotorSetupManager()
+
+# 버스 읽기는 전용 스레드에서 수행 (이벤트 루프 블로킹 방지)
+# 구독자/소비자가 acquire()로 수요를 등록했을 때만 폴링 (주기는 요청 중 최댓값)
+state_publisher = StatePublisher(
+	robot_adapter,
+	DEFAULT_CONFIG["robot"]["state_update_rate"],
+	DEFAULT_CONFIG["robot"]["max_state_update_rate"],
+)
+# 캘리브레이션 범위 측정은 발행 스냅샷으로 추적 (측정 단계 동안만 수요 등록)
+calibration_manager.attach_publisher(state_publisher, DEFAULT_CONFIG["calibration"]["tracking_rate_hz"])
+calibration_manager.home_options = {
+	"max_velocity": DEFAULT_CONFIG["calibration"]["home_max_velocity"],
+	"rate_hz": DEFAULT_CONFIG["calibration"]["home_rate_hz"],
+	"tolerance": DEFAULT_CONFIG["calibration"]["home_tolerance"],
+	"settle_timeout": DEFAULT_CONFIG["calibration"]["home_settle_timeout"],
+}
+
+# 키 입력 → 버스 쓰기 → 텔레메트리까지 구간별 지연 추적
+command_tracer = CommandTracer(state_publisher)
+keyboard_controller = KeyboardController(
+	robot_adapter,
+	jog_rate_hz=DEFAULT_CONFIG["control"]["jog_rate_hz"],
+	jog_velocity=DEFAULT_CONFIG["control"]["jog_velocity"],
+	tracer=command_tracer,
+)
+
+# 동작 기록 (캡처 스레드가 고정 주기로 샘플링, KEYBOARD 모드 action은 조그 목표 위치)
+recorder = Recorder(
+	robot_adapter,
+	chunk_rows=DEFAULT_CONFIG["recording"]["chunk_rows"],
+	compression=DEFAULT_CONFIG["recording"]["compression"],
+	capture_rate_hz=DEFAULT_CONFIG["recording"]["capture_rate_hz"],
+	action_source=lambda: keyboard_controller.jog_targets,
+	replay_rate_hz=DEFAULT_CONFIG["recording"]["replay_rate_hz"],
+	replay_max_velocity=DEFAULT_CONFIG["limits"]["max_joint_velocity"],
+)
+
+
+def motion_owner():
+	"""로봇을 단독으로 움직이는 동작 (홈 이동/재생) - 그동안 조그/속도/위치/슬라이더 명령은 거부"""
+	homing = calibration_manager.homing
+	if homing is not None and homing.running:
+		return "Homing"
+	if recorder.is_replaying:
+		return "Replay"
+	return None
+
+
+keyboard_controller.motion_guard = motion_owner
+# E-Stop은 조그뿐 아니라 재생/홈 이동도 멈춤 (해제 전까지 새 이동은 _check_motion_allowed에서 거부)
+keyboard_controller.add_estop_callback(recorder.stop_replay)
+keyboard_controller.add_estop_callback(calibration_manager.cancel_home)
+
+# USB 시리얼 핫플러그 감시 (포트 추가/제거 시 즉시 연결/해제)
+hotplug_watcher = SerialHotplugWatcher()
+robot_connect_lock = asyncio.Lock()
+# 자동 연결 실패 후 재시도 (케이블은 꽂혀 있지만 서보 전원 꺼짐/포트 사용 중/권한 지연 등)
+RECONNECT_MIN_DELAY = 2.0  # 초
+RECONNECT_MAX_DELAY = 60.0  # 초
+reconnect_task = None
+
+# 로컬 프로세스용 공유 메모리 텔레메트리/명령 링 (설정으로 활성화)
+shm_bridge = None
+if DEFAULT_CONFIG["ipc"]["shared_memory"]:
+	from .ipc import SharedMemoryBridge
+	shm_bridge = SharedMemoryBridge(
+		state_publisher,
+		robot_adapter,
+		name=DEFAULT_CONFIG["ipc"]["shared_memory_name"],
+		n_joints=len(robot_adapter.JOINT_NAMES),
+		rate_hz=DEFAULT_CONFIG["ipc"]["shared_memory_rate"],
+		motion_guard=lambda: "E-Stop" if keyboard_controller.estop_active else motion_owner(),
+	)
 
 # State update task
 state_update_task = None
+calibration_realtime_task = None
 
 
 def create_app() -> FastAPI:
@@ -68,6 +151,8 @@ def create_app() -> FastAPI:
 
 	# REST routes
 	app.include_router(api_router, prefix="/api")
+	# 저지연 바이너리 제어 (raw WebSocket)
+	app.include_router(ws_router)
 
 	# Static & templates
 	# PyInstaller로 패키징된 경우 환경 변수에서 경로 가져오기
@@ -78,23 +163,42 @@ def create_app() -> FastAPI:
 	else:
 		static_dir = os.path.join(os.path.dirname(__file__), "static")
 		templates_dir = os.path.join(os.path.dirname(__file__), "templates")
-	app.mount("/static", StaticFiles(directory=static_dir), name="static")
+	# 메모리 캐시 + 사전 압축(gzip/br) + ETag, index.html은 해시 URL로 정적 파일 참조
+	assets = AssetPipeline(
+		static_dir,
+		[
+			os.path.join(templates_dir, "index.html"),
+			# PyInstaller로 패키징된 경우 대체 경로
+			os.path.join(os.path.dirname(__file__), "templates", "index.html"),
+		],
+		dev_mode=DEFAULT_CONFIG["server"]["assets_dev_mode"],
+	)
+	app.state.assets = assets
 
 	# Share instances via app.state
 	app.state.robot_adapter = robot_adapter
 	app.state.keyboard_controller = keyboard_controller
 	app.state.calibration_manager = calibration_manager
-	app.state.motor_setup_manager = motor_setup_manager
+	# motor_setup_manager는 모터 설정 API를 처음 호출할 때 생성 (api/routes.py)
+	app.state.state_publisher = state_publisher
+	app.state.hotplug_watcher = hotplug_watcher
+	app.state.shm_bridge = shm_bridge
+	app.state.command_tracer = command_tracer
+	app.state.recorder = recorder
 
 	# Basic index
-	@app.get("/", response_class=HTMLResponse)
-	async def index():
-		index_path = os.path.join(templates_dir, "index.html")
-		if not os.path.exists(index_path):
-			# PyInstaller로 패키징된 경우 대체 경로 시도
-			index_path = os.path.join(os.path.dirname(__file__), "templates", "index.html")
-		with open(index_path, "r", encoding="utf-8") as f:
-			return HTMLResponse(f.read())
+	@app.get("/")
+	async def index(request: Request):
+		return assets.index_response(request)
+
+	@app.get("/static/{path:path}")
+	async def static_file(path: str, request: Request):
+		return assets.static_response(path, request)
+
+	# Prometheus 스크레이프 (버스/제어 루프/상태 스트리밍/레코더 메트릭)
+	@app.get("/metrics")
+	async def metrics():
+		return Response(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
 
 	return app
 
@@ -103,36 +207,71 @@ def create_app() -> FastAPI:
 sio = AsyncServer(cors_allowed_origins="*", async_mode="asgi")
 socket_app = ASGIApp(sio)
 
+# 클라이언트별 상태 구독 (형식/주기/필드, 송신 버퍼가 밀린 클라이언트는 프레임 생략)
+# - JSON: state:update (연결 시 기본 구독)
+# - 바이너리: state:subscribe {format: "binary"} 후 state:meta + state:frame (델타 프레임)
+state_broadcaster = StateBroadcaster(sio, state_publisher, DEFAULT_CONFIG["robot"]["state_update_rate"])
+
+# /metrics 스크레이프 시점에 계산되는 서버 게이지
+SOCKETIO_CLIENTS = REGISTRY.gauge("rosota_socketio_clients", "Connected Socket.IO clients")
+REGISTRY.gauge("rosota_state_subscribers", "Clients subscribed to the state stream").set_function(
+	lambda: len(state_broadcaster.subscriptions)
+)
+REGISTRY.gauge("rosota_state_snapshot_age_seconds", "Age of the latest state snapshot").set_function(
+	lambda: state_publisher.latest.age() if state_publisher.latest else None
+)
+REGISTRY.gauge("rosota_state_poll_rate_hz", "Current bus polling rate (0 when idle)").set_function(
+	lambda: 1.0 / state_publisher.interval if state_publisher.active else 0.0
+)
+REGISTRY.gauge("rosota_robot_connected", "1 if the robot is connected").set_function(
+	lambda: 1.0 if robot_adapter.connected else 0.0
+)
+
 
 async def state_update_loop():
-	"""주기적으로 로봇 상태를 브로드캐스트"""
-	update_rate = DEFAULT_CONFIG["robot"]["state_update_rate"]
-	interval = 1.0 / update_rate
-	
-	while True:
-		try:
-			if robot_adapter.connected:
-				state = robot_adapter.get_state()
-				# 연결 정보 추가
-				state["connection"] = robot_adapter.connection_info
-				await sio.emit("state:update", state)
-			else:
-				# 연결되지 않은 경우에도 상태 전송 (연결 해제 알림)
-				await sio.emit("state:update", {
-					"status": "Disconnected",
-					"connection": None
-				})
-			await asyncio.sleep(interval)
-		except Exception as e:
-			print(f"State update error: {e}")
+	"""
+	최신 상태 스냅샷을 구독자별로 전송
+	버스 읽기는 StatePublisher 스레드가 담당하고, 이 코루틴은 직렬화/전송만 수행
+	"""
+	await state_broadcaster.run()
+
+
+async def calibration_realtime_loop():
+	"""
+	캘리브레이션 범위 측정 중 추적 상태를 UI 주기로 전송 (calibration:realtime)
+	min/max는 발행 스레드가 스냅샷마다 갱신하므로 여기서는 최신 값만 직렬화 (버스 읽기 없음)
+	"""
+	loop = asyncio.get_running_loop()
+	updated = asyncio.Event()
+	interval = 1.0 / DEFAULT_CONFIG["calibration"]["realtime_ui_rate_hz"]
+
+	def on_snapshot(_snapshot):
+		# 생산자 스레드에서 호출됨 - 측정 중일 때만 이벤트 루프를 깨움
+		if calibration_manager.tracking:
+			loop.call_soon_threadsafe(updated.set)
+
+	state_publisher.add_listener(on_snapshot)
+	try:
+		while True:
+			await updated.wait()
+			updated.clear()
+			try:
+				await sio.emit("calibration:realtime", calibration_manager.realtime_status())
+			except Exception as e:
+				print(f"[Server] Calibration realtime emit error: {e}")
 			await asyncio.sleep(interval)
+	finally:
+		state_publisher.remove_listener(on_snapshot)
 
 
 def bind_socketio_events():
 	@sio.event
 	async def connect(sid, environ):
 		"""클라이언트 연결 시 호출"""
+		SOCKETIO_CLIENTS.inc()
 		try:
+			# 기본은 JSON 상태 스트림 (state:subscribe로 형식/주기/필드 변경 가능)
+			state_broadcaster.subscribe(sid)
 			await sio.emit("server:hello", {"message": "Rosota Copilot connected"}, to=sid)
 			print(f"[Server] Client connected: {sid}")
 			print(f"[Server] Socket.IO server ready. Client SID: {sid}")
@@ -145,63 +284,91 @@ def bind_socketio_events():
 	@sio.event
 	async def disconnect(sid):
 		"""클라이언트 연결 해제 시 호출"""
+		state_broadcaster.unsubscribe(sid)
+		SOCKETIO_CLIENTS.dec()
+		# keyup을 받지 못한 채 끊기면 조그가 계속되지 않도록 이 클라이언트가 누른 키만 해제
+		keyboard_controller.release_keys(sid)
 		print(f"[Server] Client disconnected: {sid}")
 
+	@sio.on("state:subscribe")
+	async def handle_state_subscribe(sid, data):
+		"""
+		상태 스트림 구독/변경
+		data: {"format": "binary" | "json", "version": 1, "rate": 10, "fields": ["joint_positions", ...]}
+		rate가 0이면 구독 해제
+		"""
+		data = data or {}
+		if data.get("rate") == 0:
+			state_broadcaster.unsubscribe(sid)
+			return {"ok": True, "subscribed": False}
+		try:
+			subscription = state_broadcaster.subscribe(sid, data)
+		except (TypeError, ValueError) as e:
+			await sio.emit("robot:error", {"message": str(e)}, to=sid)
+			return {"ok": False, "error": str(e)}
+		
+		# 바이너리는 정적 메타데이터와 현재 상태 전체 프레임을 이 클라이언트에게만 한 번 전송
+		await state_broadcaster.send_initial(subscription)
+		result = {"ok": True, "subscribed": True, "format": subscription.format, "rate": subscription.rate_hz}
+		if subscription.format == "binary":
+			result["version"] = STATE_FORMAT_VERSION
+		return result
+
+	@sio.on("state:unsubscribe")
+	async def handle_state_unsubscribe(sid, data=None):
+		"""상태 스트림 구독 해제 (예: 탭이 숨겨졌을 때)"""
+		state_broadcaster.unsubscribe(sid)
+		return {"ok": True, "subscribed": False}
+
 	@sio.on("control:key")
 	async def handle_control_key(sid, data):
-		"""키보드 입력 처리"""
+		"""
+		키보드 입력 처리
+		Joint 이동 키는 keydown/keyup으로 눌린 축 상태만 바꾸고, 실제 이동은 조그 스레드가 수행
+		"""
 		try:
 			key = data.get("key", "").lower()
 			event_type = data.get("event_type", "keydown")
-			timestamp = data.get("timestamp", 0)
-			
-			# 디버깅 로그
-			print(f"[Server] Received control:key event - key: '{key}', event_type: '{event_type}', "
-			      f"running: {keyboard_controller.running}, connected: {robot_adapter.connected}, "
-			      f"timestamp: {timestamp}")
 			
 			if not robot_adapter.connected:
-				print(f"[Server] Robot not connected, ignoring key '{key}'")
-				await sio.emit("control:response", {
-					"action": "error",
-					"message": "Robot not connected"
-				}, to=sid)
+				if event_type == "keydown":
+					await sio.emit("control:response", {
+						"action": "error",
+						"message": "Robot not connected"
+					}, to=sid)
 				return
 			
 			if not keyboard_controller.running and key not in ["m", " "]:
-				# 제어가 시작되지 않았을 때는 로그만 남기고 응답은 보내지 않음 (너무 많은 메시지 방지)
-				print(f"[Server] Keyboard controller not running, ignoring key '{key}' (except m/space)")
+				# 제어가 시작되지 않았을 때는 응답을 보내지 않음 (너무 많은 메시지 방지)
 				return
 			
-			# 키보드 컨트롤러로 처리
-			print(f"[Server] Calling keyboard_controller.handle_key_event('{key}', '{event_type}')")
-			print(f"[Server] Controller state: running={keyboard_controller.running}, mode={keyboard_controller.mode.value}, estop={keyboard_controller.estop_active}")
-			result = keyboard_controller.handle_key_event(key, event_type)
-			
+			# 조그 keydown은 버스 쓰기/텔레메트리까지 추적 (처리 직후 첫 조그 틱을 놓치지 않도록 먼저 등록)
+			jog = keyboard_controller.JOG_KEYS.get(key) if event_type == "keydown" else None
+			trace = command_tracer.begin(
+				f"{sid}:{data.get('trace_id', '')}",
+				f"{key}:{event_type}",
+				data.get("timestamp"),
+				joint=jog[0] if jog else None,
+			)
+			result = keyboard_controller.handle_key_event(key, event_type, owner=sid)
+			command_tracer.handled(trace, result)
 			if result:
-				# 디버깅 로그
-				print(f"[Server] Key event result: {result}")
 				await sio.emit("control:response", result, to=sid)
 				
 				# 모드 변경 시 모든 클라이언트에 알림
 				if result.get("action") == "mode_change":
 					await sio.emit("control:response", result)
-			else:
-				# 결과가 None인 경우 (무시된 키) - 로그만 남기고 응답은 보내지 않음
-				if event_type == "keydown":
-					print(f"[Server] Key '{key}' was ignored (not in mapping or debounced)")
-					# 키가 매핑에 있는지 확인
-					if key in keyboard_controller.key_mapping:
-						print(f"[Server] Key '{key}' is in mapping but returned None. Check mode/running/estop.")
-					else:
-						print(f"[Server] Key '{key}' is not in key_mapping")
-					# 응답은 보내지 않음 (너무 많은 메시지 방지)
 		except Exception as e:
 			import traceback
 			traceback.print_exc()
 			print(f"[Server] Control key error: {e}")
 			await sio.emit("robot:error", {"message": str(e)}, to=sid)
 
+	@sio.on("control:release")
+	async def handle_control_release(sid, data=None):
+		"""이 클라이언트가 누른 키 해제 (브라우저 포커스 이탈 등으로 keyup을 놓친 경우)"""
+		keyboard_controller.release_keys(sid)
+
 	@sio.on("control:slider")
 	async def handle_control_slider(sid, data):
 		"""슬라이더 제어 처리"""
@@ -221,6 +388,11 @@ def bind_socketio_events():
 				}, to=sid)
 				return
 			
+			owner = "E-Stop" if keyboard_controller.estop_active else motion_owner()
+			if owner is not None:
+				await sio.emit("robot:error", {"message": f"{owner} active, slider ignored"}, to=sid)
+				return
+			
 			# 조인트를 절대 위치로 이동
 			success = robot_adapter.move_joint_absolute(joint_index, target_position)
 			
@@ -265,85 +437,202 @@ def asgi():
 	return star
 
 
-async def auto_connect_robot():
-	"""USB 포트를 스캔하여 로봇 자동 연결"""
-	from .robot.usb_scanner import detect_robot_port
+def _pick_hotplug_candidate():
+	"""캐시된 USB 포트를 병렬 핸드셰이크로 확인해 가장 유력한 포트 선택 (executor에서 실행)"""
+	from .robot.usb_scanner import probe_ports
 	
-	if robot_adapter.connected:
-		return
-	
-	# USB 포트 스캔 및 자동 연결 시도
-	port = detect_robot_port()
-	if port:
+	candidates = hotplug_watcher.robot_candidates()
+	if not candidates:
+		return None
+	try:
+		verified = probe_ports([p.device for p in candidates], motors=robot_adapter.MOTORS)
+		if verified:
+			return verified[0]["port"]
+	except ImportError:
+		pass
+	# 응답하는 버스가 없으면 (전원 꺼짐 등) PID 일치 우선 순서로 선택
+	return candidates[0].device
+
+
+def _has_robot_candidate() -> bool:
+	"""로봇일 수 있는 포트가 남아 있는지 (다른 장치로 확인된 포트 제외, executor에서 실행)"""
+	if hotplug_watcher.running:
+		return any(p.is_robot or p.pid is None for p in hotplug_watcher.ports.values())
+	from .robot.usb_scanner import detect_robot_port
+	return detect_robot_port() is not None
+
+
+def schedule_reconnect():
+	"""재시도 루프가 돌고 있지 않으면 시작"""
+	global reconnect_task
+	if reconnect_task is None or reconnect_task.done():
+		reconnect_task = asyncio.create_task(reconnect_loop())
+
+
+async def reconnect_loop():
+	"""연결될 때까지 후보 포트가 남아 있는 동안 지수 백오프로 자동 연결 재시도"""
+	loop = asyncio.get_running_loop()
+	delay = RECONNECT_MIN_DELAY
+	while not robot_adapter.connected:
+		await asyncio.sleep(delay)
+		if robot_adapter.connected:
+			return
+		if not await loop.run_in_executor(None, _has_robot_candidate):
+			# 포트가 사라짐 - 다시 꽂히면 핫플러그 add 이벤트로 연결
+			print("[Server] No robot port left, stopping reconnect attempts")
+			return
+		print(f"[Server] Retrying robot auto-connect (backoff {delay:.0f}s)")
+		if await auto_connect_robot(retry=False):
+			return
+		delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+
+async def auto_connect_robot(port: str = None, retry: bool = True) -> bool:
+	"""
+	로봇 자동 연결 (연결되면 True)
+	port를 지정하지 않으면 핫플러그 감시자의 캐시된 포트 목록(PID 일치 우선)에서 후보를 고름
+	연결(버스 초기화/재시도)은 이벤트 루프를 막지 않도록 executor에서 수행
+	retry가 True면 후보 포트에 연결하지 못했을 때 백오프 재시도 예약 (schedule_reconnect)
+	"""
+	loop = asyncio.get_running_loop()
+	async with robot_connect_lock:
+		if robot_adapter.connected:
+			return True
+		
+		if port is None:
+			if hotplug_watcher.running:
+				port = await loop.run_in_executor(None, _pick_hotplug_candidate)
+			else:
+				from .robot.usb_scanner import detect_robot_port
+				port = await loop.run_in_executor(None, detect_robot_port)
+		if not port:
+			print("No robot port detected")
+			return False
+		
 		print(f"Auto-detected robot port: {port}")
 		try:
-			success = robot_adapter.connect(port=port)
-			if success:
-				print(f"Auto-connected to robot on {port}")
-				# 캘리브레이션 매니저에 로봇 어댑터 연결
-				calibration_manager.robot = robot_adapter
-				
-				# 캘리브레이션 데이터 자동 로드 (조인트 제한값 업데이트)
-				try:
-					from .config import CALIBRATION_DIR
-					import os
-					calib_file = os.path.join(CALIBRATION_DIR, "calibration.json")
-					if os.path.exists(calib_file):
-						calibration_manager.load(calib_file)
-						print(f"[Server] Calibration data loaded from {calib_file}")
-				except Exception as e:
-					# 캘리브레이션 파일이 없거나 로드 실패해도 연결은 성공
-					print(f"[Server] Warning: Could not load calibration data: {e}")
-					import traceback
-					traceback.print_exc()
-				
-				# 모든 클라이언트에 연결 상태 알림
-				try:
-					await sio.emit("robot:auto_connected", {
-						"port": port,
-						"status": "Connected"
-					})
-				except Exception as e:
-					print(f"[Server] Warning: Could not emit auto_connected event: {e}")
-			else:
+			success = await loop.run_in_executor(None, lambda: robot_adapter.connect(port=port))
+			if not success:
 				print(f"Failed to auto-connect to {port}")
+				if retry:
+					schedule_reconnect()
+				return False
+			
+			print(f"Auto-connected to robot on {port}")
+			# 캘리브레이션 매니저에 로봇 어댑터 연결
+			calibration_manager.robot = robot_adapter
+			
+			# 캘리브레이션 데이터 자동 로드 (조인트 제한값 업데이트)
+			try:
+				from .config import CALIBRATION_DIR
+				calib_file = os.path.join(CALIBRATION_DIR, "calibration.json")
+				if os.path.exists(calib_file):
+					calibration_manager.load(calib_file)
+					print(f"[Server] Calibration data loaded from {calib_file}")
+			except Exception as e:
+				# 캘리브레이션 파일이 없거나 로드 실패해도 연결은 성공
+				print(f"[Server] Warning: Could not load calibration data: {e}")
+				import traceback
+				traceback.print_exc()
+			
+			# 모든 클라이언트에 연결 상태 알림
+			try:
+				await sio.emit("robot:auto_connected", {
+					"port": port,
+					"status": "Connected"
+				})
+			except Exception as e:
+				print(f"[Server] Warning: Could not emit auto_connected event: {e}")
+			return True
 		except Exception as e:
 			print(f"Auto-connect error: {e}")
 			import traceback
 			traceback.print_exc()
-	else:
-		print("No robot port detected")
+			if retry:
+				schedule_reconnect()
+			return robot_adapter.connected
+
+
+async def handle_hotplug_event(event):
+	"""USB 시리얼 포트 추가/제거 처리 (감시 스레드에서 이벤트 루프로 전달됨)"""
+	device = event.port.device
+	print(f"[Hotplug] {event.action}: {device} (VID: {event.port.vid}, PID: {event.port.pid})")
+	await sio.emit("usb:hotplug", {"action": event.action, **event.port.to_dict()})
+	
+	if event.action == "remove":
+		if robot_adapter.connected and robot_adapter.port == device:
+			# 케이블이 빠짐 - 조그를 멈추고 즉시 연결 해제
+			keyboard_controller.release_all()
+			await asyncio.get_running_loop().run_in_executor(None, robot_adapter.disconnect)
+			await sio.emit("robot:disconnected", {"port": device, "reason": "unplugged"})
+		return
+	
+	# PID를 알 수 없는 포트도 시도 (메타데이터를 못 읽는 환경), 다른 장치로 확인된 포트는 제외
+	if not robot_adapter.connected and (event.port.is_robot or event.port.pid is None):
+		await auto_connect_robot(device)
 
 
 async def startup():
 	"""서버 시작 시 실행"""
-	global state_update_task
-	# 상태 업데이트 태스크 시작
+	global state_update_task, calibration_realtime_task
+	ensure_data_dirs()
+	# 정적 파일 읽기/압축을 첫 요청 전에 백그라운드에서 (brotli 최고 압축은 수백 ms 걸릴 수 있음)
+	asyncio.get_running_loop().run_in_executor(None, app.state.assets.preload)
+	# 비정상 종료로 마무리되지 않은 기록 파일 복구
+	asyncio.get_running_loop().run_in_executor(None, recorder.recover_records)
+	# 상태 업데이트 태스크 시작 (발행 스레드 + 브로드캐스트 코루틴)
 	state_update_task = asyncio.create_task(state_update_loop())
+	calibration_realtime_task = asyncio.create_task(calibration_realtime_loop())
+	state_publisher.start()
+	command_tracer.start()
 	print("State update loop started")
+	if shm_bridge is not None:
+		try:
+			shm_bridge.start()
+		except Exception as e:
+			print(f"[Server] Warning: Could not start shared memory bridge: {e}")
 	
-	# USB 자동 연결 시도
-	await auto_connect_robot()
+	# USB 핫플러그 감시 시작 (주기적 블로킹 스캔 대신 포트 추가/제거 이벤트로 연결/해제)
+	loop = asyncio.get_running_loop()
 	
-	# 주기적으로 USB 포트 스캔 (5초마다)
-	async def periodic_scan():
-		while True:
-			await asyncio.sleep(5)  # 5초마다 스캔
-			if not robot_adapter.connected:
-				await auto_connect_robot()
+	def on_hotplug(event):
+		# 감시 스레드에서 호출됨 - 이벤트 루프로 넘기기만 함
+		loop.call_soon_threadsafe(lambda: asyncio.ensure_future(handle_hotplug_event(event)))
 	
-	asyncio.create_task(periodic_scan())
+	hotplug_watcher.add_listener(on_hotplug)
+	
+	def on_home_progress(status):
+		# 홈 이동 스레드에서 호출됨 - 이벤트 루프에서 calibration:home 전송
+		loop.call_soon_threadsafe(lambda: asyncio.ensure_future(sio.emit("calibration:home", status)))
+	
+	calibration_manager.home_progress_callback = on_home_progress
+	hotplug_watcher.start()
+	print(f"USB hotplug watcher started ({hotplug_watcher.backend})")
+	
+	# 이미 꽂혀 있는 로봇에 자동 연결 시도 (포트 확인/버스 초기화를 기다리지 않고 바로 리스닝 시작)
+	asyncio.create_task(auto_connect_robot())
 
 
 async def shutdown():
 	"""서버 종료 시 실행"""
-	global state_update_task
-	if state_update_task:
-		state_update_task.cancel()
-		try:
-			await state_update_task
-		except asyncio.CancelledError:
-			pass
+	global state_update_task, calibration_realtime_task
+	for task in (state_update_task, calibration_realtime_task, reconnect_task):
+		if task:
+			task.cancel()
+			try:
+				await task
+			except asyncio.CancelledError:
+				pass
+	if shm_bridge is not None:
+		shm_bridge.stop()
+	recorder.stop_replay()
+	calibration_manager.cancel_home()
+	if recorder.is_recording:
+		# 기록 중이면 저장하고 종료 (캡처/쓰기 스레드 정리)
+		recorder.stop_record()
+	command_tracer.stop()
+	state_publisher.stop()
+	hotplug_watcher.stop()
 	if robot_adapter.connected:
 		robot_adapter.disconnect()
 	print("Server shutdown complete")
@@ -354,6 +643,8 @@ if __name__ == "__main__":
 
 	host = os.environ.get("HOST", "0.0.0.0")
 	port = int(os.environ.get("PORT", "8000"))  # 80는 권한 이슈 있을 수 있어 기본 8000
+	# 개발 실행: 템플릿/정적 파일 수정이 새로고침만으로 반영되도록 (reload 워커 프로세스에 상속)
+	os.environ.setdefault("ROSOTA_DEV", "1")
 	# reload를 사용하려면 import 문자열을 전달해야 함
 	# asgi()는 팩토리이므로 --factory/factory=True 필요
 	uvicorn.run("rosota_copilot.server:asgi", host=host, port=port, reload=True, factory=True)
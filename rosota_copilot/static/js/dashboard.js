@@ -47,9 +47,9 @@
 	
 	// 키보드 텔레옵 상태
 	const pressedKeys = new Set();
-	const keyPressTimes = new Map(); // 키를 누른 시간
-	let controlLoopInterval = null;
-	const CONTROL_LOOP_INTERVAL = 50; // 50ms마다 명령 전송 (20Hz)
+	// 키를 누르고 있는 동안의 이동은 서버 조그 루프가 고정 주기로 수행 (keydown/keyup만 전송)
+	let controlLoopActive = false;
+	let controlTraceSeq = 0;
 
 	// 번역 데이터 (먼저 선언되어야 함)
 	const translations = {
@@ -776,24 +776,57 @@
 		}
 	}
 
-	// Home button
+	// Home button (서버 백그라운드 이동, 진행 중에는 다시 누르면 취소)
+	let homingActive = false;
+	
+	function setHomingActive(active) {
+		homingActive = active;
+		if (!homeBtn) return;
+		if (active) {
+			if (!homeBtn.dataset.originalText) {
+				homeBtn.dataset.originalText = homeBtn.textContent;
+			}
+			homeBtn.textContent = "Cancel Home";
+		} else if (homeBtn.dataset.originalText) {
+			homeBtn.textContent = homeBtn.dataset.originalText;
+			delete homeBtn.dataset.originalText;
+		}
+	}
+	
 	homeBtn?.addEventListener("click", async () => {
-		setButtonLoading(homeBtn, true);
+		const url = homingActive ? "/api/calibration/home/cancel" : "/api/calibration/home";
+		homeBtn.disabled = true;
 		try {
-			log("Starting home movement...", "info");
-			const res = await fetch("/api/calibration/home", { method: "POST" });
+			if (!homingActive) {
+				log("Starting home movement...", "info");
+			}
+			const res = await fetch(url, { method: "POST" });
 			const json = await res.json();
 			if (json.ok) {
-				log(json.message || "Home movement completed", "success");
+				log(json.message, "info");
+				if (json.status) {
+					setHomingActive(json.status.running);
+				}
 			} else {
 				log(`Home failed: ${json.detail || json.error}`, "error");
 			}
 		} catch (error) {
 			log(`Home error: ${error.message}`, "error");
 		} finally {
-			setButtonLoading(homeBtn, false);
+			homeBtn.disabled = false;
 		}
 	});
+	
+	// 홈 이동 진행 상황 (planning → moving → settling → done/timeout/cancelled/error)
+	socket.on("calibration:home", (status) => {
+		if (status.running) {
+			setHomingActive(true);
+			return;
+		}
+		setHomingActive(false);
+		const level = status.phase === "done" ? "success" : status.phase === "cancelled" ? "info" : "error";
+		log(`Home ${status.phase}: ${status.message}`, level);
+	});
 
 	// Zero button
 	zeroBtn?.addEventListener("click", async () => {
@@ -949,68 +982,37 @@
 	}
 
 	// 키보드 텔레옵 제어 루프
+	// 실제 적분/전송은 서버 조그 스레드가 담당하므로, 여기서는 활성 상태와 눌린 키만 관리
 	function startControlLoop() {
-		if (controlLoopInterval) {
-			console.log("[Frontend] Control loop already running");
+		if (controlLoopActive) {
 			return;
 		}
-		
-		console.log(`[Frontend] Starting control loop. controlRunning=${controlRunning}, isConnected=${isConnected}, socket.connected=${socket.connected}`);
-		
-		controlLoopInterval = setInterval(() => {
-			if (!controlRunning || !isConnected) {
-				if (!controlRunning) console.log("[Frontend] Control loop: controlRunning is false");
-				if (!isConnected) console.log("[Frontend] Control loop: isConnected is false");
-				return;
-			}
-			
-			if (!socket.connected) {
-				console.error("[Frontend] Control loop: Socket.IO not connected!");
-				return;
-			}
-			
-			// 누른 키가 있으면 명령 전송
-			if (pressedKeys.size > 0) {
-				// 각 키에 대해 명령 전송
-				// 디바운스: 같은 키를 너무 빠르게 보내지 않도록
-				const now = Date.now();
-				pressedKeys.forEach((key) => {
-					const lastSent = keyPressTimes.get(key) || 0;
-					// 제어 루프에서는 40ms마다만 보냄 (디바운스 30ms보다 크게)
-					if (now - lastSent >= 40) {
-						const payload = {
-							key: key,
-							event_type: "keydown",
-							timestamp: now,
-						};
-						console.log(`[Frontend] Control loop: Emitting key '${key}' (lastSent: ${lastSent}, now: ${now}, diff: ${now - lastSent}ms)`);
-						socket.emit("control:key", payload);
-						keyPressTimes.set(key, now);
-					} else {
-						console.log(`[Frontend] Control loop: Key '${key}' debounced (lastSent: ${lastSent}, now: ${now}, diff: ${now - lastSent}ms)`);
-					}
-				});
-			}
-		}, CONTROL_LOOP_INTERVAL);
-		
+		controlLoopActive = true;
 		log("Control loop started", "info");
-		console.log("[Frontend] Control loop started successfully");
 	}
 
-	function stopControlLoop() {
-		if (controlLoopInterval) {
-			clearInterval(controlLoopInterval);
-			controlLoopInterval = null;
-			log("Control loop stopped", "info");
-		}
-		// 모든 키 시각적 피드백 해제
+	function releaseAllKeys() {
+		// 모든 키 시각적 피드백 해제 + 서버 조그 정지
 		pressedKeys.forEach((key) => {
 			updateKeyVisualFeedback(key, false);
 		});
+		if (pressedKeys.size > 0 && socket.connected) {
+			socket.emit("control:release");
+		}
 		pressedKeys.clear();
-		keyPressTimes.clear();
 	}
 
+	function stopControlLoop() {
+		if (controlLoopActive) {
+			controlLoopActive = false;
+			log("Control loop stopped", "info");
+		}
+		releaseAllKeys();
+	}
+
+	// 포커스를 잃으면 keyup이 오지 않으므로 눌린 키를 모두 해제
+	window.addEventListener("blur", releaseAllKeys);
+
 	// 키 입력 필터링: 무시할 키 목록
 	const IGNORED_KEYS = new Set([
 		"meta", "control", "alt", "shift", "capslock", "tab", "escape",
@@ -1037,6 +1039,11 @@
 			e.preventDefault();
 		}
 
+		// 브라우저 키 반복은 무시 (키를 누르고 있는 상태는 서버가 추적)
+		if (e.repeat) {
+			return;
+		}
+
 		// Normalize key: e.code를 사용하여 물리적 키 감지 (한글 입력 모드에서도 작동)
 		let key = null;
 		
@@ -1094,33 +1101,19 @@
 			return;
 		}
 
-		// 키 상태 추적
+		// 키 상태 추적 (브라우저 키 반복은 보내지 않음 - 누르고 있는 동안의 이동은 서버가 수행)
 		if (!pressedKeys.has(key)) {
 			pressedKeys.add(key);
 			updateKeyVisualFeedback(key, true);
 			
-			// 즉시 명령 전송 (첫 키 입력) - 제어 루프를 기다리지 않고 즉시 전송
-			const payload = {
+			socket.emit("control:key", {
 				key: key,
 				event_type: "keydown",
 				timestamp: Date.now(),
-			};
-			console.log(`[Frontend] Emitting control:key event (immediate):`, payload);
-			console.log(`[Frontend] Socket.IO state: connected=${socket.connected}, id=${socket.id}`);
-			
-			try {
-				socket.emit("control:key", payload);
-				console.log(`[Frontend] control:key event emitted successfully for key '${key}'`);
-			} catch (error) {
-				console.error(`[Frontend] Error emitting control:key event:`, error);
-			}
-			
-			// 제어 루프 디바운스를 위해 시간 기록
-			keyPressTimes.set(key, Date.now());
+				trace_id: ++controlTraceSeq,  // 서버 지연 추적 (/api/control/traces)
+			});
 			
 			log(`Key pressed: ${key.toUpperCase()}`, "info");
-		} else {
-			console.log(`[Frontend] Key '${key}' already in pressedKeys, will be sent by control loop`);
 		}
 	});
 
@@ -1167,13 +1160,13 @@
 		// 키 상태 해제
 		if (pressedKeys.has(key)) {
 			pressedKeys.delete(key);
-			keyPressTimes.delete(key);
 			updateKeyVisualFeedback(key, false);
 			
 			socket.emit("control:key", {
 				key: key,
 				event_type: "keyup",
 				timestamp: Date.now(),
+				trace_id: ++controlTraceSeq,  // 서버 지연 추적 (/api/control/traces)
 			});
 			
 			// keyup은 로그에 남기지 않음 (너무 많은 로그 방지)
@@ -1183,6 +1176,13 @@
 	// Socket.IO events
 	socket.on("connect", () => {
 		log("WebSocket connected", "success");
+		// 컴팩트 바이너리 상태 스트림 구독 (정적 메타데이터는 state:meta로 한 번만 수신)
+		// 탭이 숨겨진 상태로 연결되면 보일 때까지 구독하지 않음
+		if (!document.hidden) {
+			socket.emit("state:subscribe", stateSubscription);
+		} else {
+			socket.emit("state:unsubscribe");
+		}
 		console.log(`[Frontend] Socket.IO connected. Socket ID: ${socket.id}, connected: ${socket.connected}`);
 	});
 
@@ -1228,23 +1228,11 @@
 		log(`Server: ${data.message}`, "info");
 	});
 
-	socket.on("state:update", (data) => {
+	// 상태 업데이트 처리 (JSON state:update와 바이너리 state:frame 공통)
+	function handleStateUpdate(data) {
 		if (data.joint_positions) {
 			updateJointDisplay(data.joint_positions);
 			updateSliders(data.joint_positions);
-			// 튜토리얼 페이지의 실시간 조인트 정보도 업데이트
-			// startTutorialRealtimeUpdate()가 이미 interval로 업데이트하고 있지만,
-			// state:update 이벤트가 더 빠르게 올 수 있으므로 여기서도 업데이트
-			if (tutorialWizardActive && tutorialWizardRealtimeInfo) {
-				const isVisible = tutorialWizardRealtimeInfo.style.display !== "none" && 
-				                  tutorialWizardRealtimeInfo.offsetParent !== null;
-				if (isVisible) {
-					// updateTutorialRealtimeInfoFromState는 API를 호출하므로,
-					// 대신 직접 updateTutorialRealtimePositions를 호출
-					// (이미 interval로 호출되고 있지만, 더 빠른 업데이트를 위해)
-					updateTutorialRealtimePositions();
-				}
-			}
 		}
 		// 조인트 제한 범위 처리
 		let limitsArray = null;
@@ -1290,6 +1278,105 @@
 			} : null;
 			updateStatus(data.status, data.status === "Connected", connectionInfo);
 		}
+	}
+
+	socket.on("state:update", handleStateUpdate);
+
+	// 탭이 숨겨지면 구독 해제 (구독자가 없으면 서버가 버스 폴링을 멈춤), 다시 보이면 재구독
+	document.addEventListener("visibilitychange", () => {
+		if (!socket.connected) return;
+		if (document.hidden) {
+			socket.emit("state:unsubscribe");
+		} else {
+			socket.emit("state:subscribe", stateSubscription);
+		}
+	});
+
+	// 바이너리 상태 스트림 (format version 1, 서버 streaming/codec.py와 동일한 레이아웃)
+	// 헤더: u8 version, u8 flags, u16 meta_version, u32 seq, f64 timestamp, u16 mask (little-endian)
+	// 본문: mask 비트 순서대로 조인트 위치 int16 (centidegree)
+	const STATE_FORMAT_VERSION = 1;
+	const STATE_FRAME_HEADER_SIZE = 18;
+	const STATE_FLAG_KEYFRAME = 0x01;
+	const STATE_FLAG_CONNECTED = 0x02;
+	// 상태 스트림 구독 옵션 (rate: Hz, 서버 최대 주기로 제한됨)
+	const stateSubscription = { format: "binary", version: STATE_FORMAT_VERSION, rate: 20 };
+	const streamState = {
+		metaVersion: -1,
+		scale: 100,
+		meta: null,
+		positions: [],
+		connected: null,
+	};
+
+	function decodeStateFrame(buffer) {
+		const view = ArrayBuffer.isView(buffer)
+			? new DataView(buffer.buffer, buffer.byteOffset, buffer.byteLength)
+			: new DataView(buffer);
+		const version = view.getUint8(0);
+		if (version !== STATE_FORMAT_VERSION) {
+			throw new Error(`Unsupported state frame version: ${version}`);
+		}
+		const flags = view.getUint8(1);
+		const mask = view.getUint16(16, true);
+		const values = [];
+		let offset = STATE_FRAME_HEADER_SIZE;
+		for (let i = 0; i < 16; i++) {
+			if (mask & (1 << i)) {
+				values.push([i, view.getInt16(offset, true)]);
+				offset += 2;
+			}
+		}
+		return {
+			keyframe: (flags & STATE_FLAG_KEYFRAME) !== 0,
+			connected: (flags & STATE_FLAG_CONNECTED) !== 0,
+			metaVersion: view.getUint16(2, true),
+			seq: view.getUint32(4, true),
+			timestamp: view.getFloat64(8, true),
+			values,
+		};
+	}
+
+	socket.on("state:meta", (msg) => {
+		if (msg.format_version !== STATE_FORMAT_VERSION) {
+			console.warn(`[Stream] Unsupported state format ${msg.format_version}, falling back to JSON`);
+			stateSubscription.format = "json";
+			socket.emit("state:subscribe", stateSubscription);
+			return;
+		}
+		streamState.metaVersion = msg.meta_version;
+		streamState.scale = msg.scale || 100;
+		streamState.meta = msg.state || {};
+		streamState.connected = null;
+		// 정적 메타데이터 (조인트 제한값, 연결 정보, 상태) 반영
+		handleStateUpdate(streamState.meta);
+	});
+
+	socket.on("state:frame", (buffer) => {
+		let frame;
+		try {
+			frame = decodeStateFrame(buffer);
+		} catch (error) {
+			console.error("[Stream] Failed to decode state frame:", error);
+			return;
+		}
+		if (frame.keyframe) {
+			streamState.positions = [];
+		}
+		frame.values.forEach(([index, value]) => {
+			streamState.positions[index] = value / streamState.scale;
+		});
+		const update = {};
+		if (streamState.positions.length > 0) {
+			update.joint_positions = streamState.positions.slice();
+		}
+		// 연결 상태는 바뀔 때만 반영
+		if (frame.connected !== streamState.connected) {
+			streamState.connected = frame.connected;
+			update.status = frame.connected ? "Connected" : "Disconnected";
+			update.connection = frame.connected ? streamState.meta?.connection : null;
+		}
+		handleStateUpdate(update);
 	});
 
 		socket.on("control:response", (data) => {
@@ -1364,6 +1451,16 @@
 		log(data.message || "", data.level || "info");
 	});
 
+	// 캘리브레이션 범위 측정 실시간 정보 수신 (서버가 텔레메트리 스냅샷마다 min/max 추적, UI 주기로 푸시)
+	socket.on("calibration:realtime", (status) => {
+		if (realtimeUpdateActive && wizardActive) {
+			updateRealtimeInfo(status);
+		}
+		if (tutorialRealtimeUpdateActive && tutorialWizardActive) {
+			updateTutorialRealtimeInfo(status);
+		}
+	});
+
 	// Sidebar menu navigation
 	const menuItems = document.querySelectorAll(".menu-item");
 	const contentSections = document.querySelectorAll(".content-section");
@@ -1406,6 +1503,18 @@
 		log(`Auto-connect failed: ${data.message || "Unknown error"}`, "error");
 	});
 	
+	socket.on("robot:disconnected", (data) => {
+		updateStatus("Disconnected", false);
+		log(`Robot disconnected (${data.reason || "unknown"}): ${data.port}`, "warning");
+	});
+
+	socket.on("usb:hotplug", (data) => {
+		console.log("[Hotplug]", data);
+		if (data.action === "add" && data.is_robot) {
+			log(`Robot USB port detected: ${data.port}`, "info");
+		}
+	});
+	
 	socket.on("robot:auto_connect_attempt", (data) => {
 		console.log("[Auto-connect] Attempting to connect:", data);
 		log(`Attempting to auto-connect to robot...`, "info");
@@ -1427,7 +1536,7 @@
 	const wizardJointsList = document.getElementById("wizard-joints-list");
 	
 	let wizardActive = false;
-	let realtimeUpdateInterval = null;
+	let realtimeUpdateActive = false;
 	
 	showWizardBtn?.addEventListener("click", () => {
 		wizardCard.style.display = "block";
@@ -1631,28 +1740,18 @@
 		}
 	}
 	
-	// 실시간 업데이트 시작
+	// 실시간 업데이트 시작 (초기 상태는 한 번 조회, 이후는 calibration:realtime 이벤트)
 	function startRealtimeUpdate() {
-		stopRealtimeUpdate(); // 기존 인터벌 정리
-		
-		// 즉시 한 번 실행
+		realtimeUpdateActive = true;
 		updateRealtimePositions();
-		
-		// 100ms마다 업데이트
-		realtimeUpdateInterval = setInterval(() => {
-			updateRealtimePositions();
-		}, 100);
 	}
 	
 	// 실시간 업데이트 중지
 	function stopRealtimeUpdate() {
-		if (realtimeUpdateInterval) {
-			clearInterval(realtimeUpdateInterval);
-			realtimeUpdateInterval = null;
-		}
+		realtimeUpdateActive = false;
 	}
 	
-	// 실시간 위치 정보 업데이트
+	// 실시간 위치 정보 조회
 	async function updateRealtimePositions() {
 		if (!wizardActive) {
 			stopRealtimeUpdate();
@@ -1678,8 +1777,6 @@
 			return;
 		}
 		
-		console.log("[Wizard] Updating realtime info:", status);
-		
 		const jointNames = status.joint_names || ["shoulder_pan", "shoulder_lift", "elbow_flex", "wrist_flex", "wrist_roll", "gripper"];
 		const positions = status.realtime_current_positions || status.positions || [];
 		const realtimeMin = status.realtime_min_positions || status.min_positions || [];
@@ -1937,7 +2034,7 @@
 	const tutorialWizardJointsList = document.getElementById("tutorial-wizard-joints-list");
 	
 	let tutorialWizardActive = false;
-	let tutorialRealtimeUpdateInterval = null;
+	let tutorialRealtimeUpdateActive = false;
 	
 	// 튜토리얼 캘리브레이션 마법사: Start
 	tutorialWizardStartBtn?.addEventListener("click", async () => {
@@ -2130,21 +2227,14 @@
 		}
 	}
 	
+	// 초기 상태는 한 번 조회, 이후는 calibration:realtime 이벤트로 갱신
 	function startTutorialRealtimeUpdate() {
-		console.log("[Tutorial] Starting realtime update interval");
-		stopTutorialRealtimeUpdate();
+		tutorialRealtimeUpdateActive = true;
 		updateTutorialRealtimePositions();
-		tutorialRealtimeUpdateInterval = setInterval(() => {
-			updateTutorialRealtimePositions();
-		}, 100);
-		console.log("[Tutorial] Realtime update interval started:", tutorialRealtimeUpdateInterval);
 	}
 	
 	function stopTutorialRealtimeUpdate() {
-		if (tutorialRealtimeUpdateInterval) {
-			clearInterval(tutorialRealtimeUpdateInterval);
-			tutorialRealtimeUpdateInterval = null;
-		}
+		tutorialRealtimeUpdateActive = false;
 	}
 	
 	async function updateTutorialRealtimePositions() {
@@ -2182,8 +2272,6 @@
 			return;
 		}
 		
-		console.log("[Tutorial] Updating realtime info:", status);
-		
 		tutorialWizardJointsList.innerHTML = "";
 		
 		const jointNames = status.joint_names || ["shoulder_pan", "shoulder_lift", "elbow", "wrist_1", "wrist_2", "gripper"];
@@ -2234,50 +2322,6 @@
 			
 			tutorialWizardJointsList.appendChild(jointItem);
 		}
-		
-		console.log("[Tutorial] Realtime info updated successfully");
-	}
-	
-	// state:update 이벤트에서 받은 데이터로 튜토리얼 실시간 정보 업데이트
-	// 캘리브레이션 마법사가 활성화되어 있을 때만 업데이트
-	async function updateTutorialRealtimeInfoFromState(data) {
-		if (!tutorialWizardJointsList || !data.joint_positions || !tutorialWizardActive) return;
-		
-		// 캘리브레이션 마법사 상태를 API에서 가져와서 min/max 정보도 표시
-		try {
-			const res = await fetch("/api/calibration/wizard/realtime");
-			const json = await res.json();
-			
-			if (json.ok && json.status) {
-				// API에서 받은 상태 정보 사용 (min/max 포함)
-				updateTutorialRealtimeInfo(json.status);
-			} else {
-				// API 실패 시 state:update 데이터만 사용
-				tutorialWizardJointsList.innerHTML = "";
-				const jointNames = ["shoulder_pan", "shoulder_lift", "elbow", "wrist_1", "wrist_2", "gripper"];
-				
-				for (let i = 0; i < 6; i++) {
-					const jointItem = document.createElement("div");
-					jointItem.style.padding = "8px";
-					jointItem.style.background = "var(--bg-secondary)";
-					jointItem.style.borderRadius = "4px";
-					
-					const jointName = jointNames[i] || `Joint ${i + 1}`;
-					const current = data.joint_positions[i] ?? 0;
-					
-					let infoText = `<strong>${jointName}</strong><br>`;
-					infoText += `Current: ${(current * 180 / Math.PI).toFixed(1)}°`;
-					
-					jointItem.innerHTML = infoText;
-					jointItem.style.fontSize = "12px";
-					jointItem.style.color = "var(--text-primary)";
-					
-					tutorialWizardJointsList.appendChild(jointItem);
-				}
-			}
-		} catch (error) {
-			console.error("[Tutorial] Failed to update realtime info from state:", error);
-		}
 	}
 	
 	// 튜토리얼 키보드 제어 연결
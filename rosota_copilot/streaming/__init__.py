@@ -0,0 +1,19 @@
+"""
+Socket.IO 실시간 상태 스트리밍
+"""
+from .codec import (
+	STATE_FORMAT_VERSION,
+	StateFrameEncoder,
+	decode_frame,
+	split_state,
+)
+from .subscriptions import StateBroadcaster, StateSubscription
+
+__all__ = [
+	"STATE_FORMAT_VERSION",
+	"StateBroadcaster",
+	"StateFrameEncoder",
+	"StateSubscription",
+	"decode_frame",
+	"split_state",
+]
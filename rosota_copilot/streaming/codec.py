@@ -0,0 +1,159 @@
+"""
+컴팩트 바이너리 상태 프레임 코덱 (format version 1)
+
+조인트 이름/제한값 같은 정적 메타데이터는 구독 시(그리고 바뀔 때만) JSON으로 한 번 보내고,
+매 틱에는 조인트 위치만 작은 바이너리 프레임으로 보냅니다.
+
+프레임 레이아웃 (little-endian):
+	u8   version       STATE_FORMAT_VERSION
+	u8   flags         bit0 = keyframe (모든 조인트 포함), bit1 = robot connected
+	u16  meta_version  이 프레임이 참조하는 메타데이터 버전
+	u32  seq           StateSnapshot.seq
+	f64  timestamp     읽기 시각 (unix seconds)
+	u16  mask          bit i = 조인트 i 값 포함
+	i16  values[...]   포함된 조인트의 위치 (centidegree, mask 비트 순서)
+
+데드밴드 이내로 변하지 않은 조인트는 생략되며, 클라이언트는 마지막 값을 유지합니다.
+값은 절대값이므로 프레임 하나를 놓쳐도 오차가 누적되지 않고, 주기적 keyframe으로 재동기화합니다.
+"""
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+STATE_FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<BBHIdH")
+FLAG_KEYFRAME = 0x01
+FLAG_CONNECTED = 0x02
+
+MAX_JOINTS = 16
+SCALE = 100  # centidegree
+INT16_MIN = -32768
+INT16_MAX = 32767
+
+# 매 틱 바뀌는 필드 (나머지는 메타데이터로 취급)
+_FRAME_FIELDS = ("joint_positions", "seq", "timestamp")
+
+
+def split_state(payload: Dict[str, Any]) -> Tuple[List[float], Dict[str, Any]]:
+	"""상태 딕셔너리를 (조인트 위치, 메타데이터)로 분리"""
+	positions = list(payload.get("joint_positions") or [])
+	meta = {k: v for k, v in payload.items() if k not in _FRAME_FIELDS}
+	return positions, meta
+
+
+def _quantize(positions: Sequence[float]) -> List[int]:
+	return [
+		max(INT16_MIN, min(INT16_MAX, int(round(float(p) * SCALE))))
+		for p in positions[:MAX_JOINTS]
+	]
+
+
+class StateFrameEncoder:
+	"""
+	구독자 그룹 하나를 위한 인코더
+	마지막으로 보낸 값을 기억해서 데드밴드 이상 바뀐 조인트만 프레임에 포함
+	"""
+
+	def __init__(self, deadband_deg: float = 0.05, keyframe_interval: int = 40):
+		self.deadband = max(0, int(round(deadband_deg * SCALE)))
+		self.keyframe_interval = keyframe_interval
+		self.meta_version = 0
+		self._meta: Optional[Dict[str, Any]] = None
+		self._sent: List[Optional[int]] = []
+		self._frames_since_keyframe = 0
+
+	def update_meta(self, meta: Dict[str, Any]) -> bool:
+		"""메타데이터가 바뀌었으면 버전을 올리고 True 반환"""
+		if meta == self._meta:
+			return False
+		self._meta = meta
+		self.meta_version = (self.meta_version + 1) & 0xFFFF
+		# 메타데이터가 바뀌면 (조인트 수가 바뀌었을 수 있으므로) 다음 프레임은 keyframe
+		self._sent = []
+		return True
+
+	def meta_message(self) -> Dict[str, Any]:
+		"""구독/변경 시 보내는 JSON 메타데이터 메시지"""
+		return {
+			"format_version": STATE_FORMAT_VERSION,
+			"meta_version": self.meta_version,
+			"scale": SCALE,
+			"state": self._meta or {},
+		}
+
+	def reset(self) -> None:
+		"""다음 프레임을 keyframe으로 강제"""
+		self._sent = []
+
+	def encode(
+		self,
+		positions: Sequence[float],
+		seq: int,
+		timestamp: float,
+		connected: bool = True,
+	) -> Optional[bytes]:
+		"""
+		변경된 조인트만 담은 프레임 생성
+		바뀐 값이 없고 keyframe 차례도 아니면 None (전송 생략)
+		"""
+		values = _quantize(positions)
+		keyframe = (
+			len(self._sent) != len(values)
+			or self._frames_since_keyframe >= self.keyframe_interval
+		)
+		if keyframe:
+			self._sent = [None] * len(values)
+
+		mask = 0
+		payload: List[int] = []
+		for i, value in enumerate(values):
+			last = self._sent[i]
+			if keyframe or last is None or abs(value - last) > self.deadband:
+				mask |= 1 << i
+				payload.append(value)
+				self._sent[i] = value
+
+		if not mask and not keyframe:
+			return None
+
+		self._frames_since_keyframe = 0 if keyframe else self._frames_since_keyframe + 1
+		flags = (FLAG_KEYFRAME if keyframe else 0) | (FLAG_CONNECTED if connected else 0)
+		return _pack(flags, self.meta_version, seq, timestamp, mask, payload)
+
+	def encode_keyframe(
+		self,
+		positions: Sequence[float],
+		seq: int,
+		timestamp: float,
+		connected: bool = True,
+	) -> bytes:
+		"""참조 상태를 바꾸지 않는 전체 프레임 (새 구독자 초기화용)"""
+		values = _quantize(positions)
+		mask = (1 << len(values)) - 1
+		flags = FLAG_KEYFRAME | (FLAG_CONNECTED if connected else 0)
+		return _pack(flags, self.meta_version, seq, timestamp, mask, values)
+
+
+def _pack(flags: int, meta_version: int, seq: int, timestamp: float, mask: int, values: List[int]) -> bytes:
+	header = HEADER.pack(STATE_FORMAT_VERSION, flags, meta_version, seq & 0xFFFFFFFF, timestamp, mask)
+	return header + struct.pack(f"<{len(values)}h", *values)
+
+
+def decode_frame(data: bytes) -> Dict[str, Any]:
+	"""
+	프레임 디코딩 (Python 클라이언트/디버깅용, dashboard.js의 decodeStateFrame과 동일)
+	joint_positions는 {조인트 인덱스: 도} 형태로 포함된 조인트만 반환
+	"""
+	version, flags, meta_version, seq, timestamp, mask = HEADER.unpack_from(data, 0)
+	if version != STATE_FORMAT_VERSION:
+		raise ValueError(f"Unsupported state frame version: {version}")
+	indices = [i for i in range(MAX_JOINTS) if mask & (1 << i)]
+	values = struct.unpack_from(f"<{len(indices)}h", data, HEADER.size)
+	return {
+		"keyframe": bool(flags & FLAG_KEYFRAME),
+		"connected": bool(flags & FLAG_CONNECTED),
+		"meta_version": meta_version,
+		"seq": seq,
+		"timestamp": timestamp,
+		"joint_positions": {i: v / SCALE for i, v in zip(indices, values)},
+	}
@@ -0,0 +1,95 @@
+"""
+/ws/control 바이너리 명령/응답 코덱 (format version 1)
+
+명령 (클라이언트 → 서버, little-endian):
+	u8   version     CONTROL_FORMAT_VERSION
+	u8   kind        0 = 절대 위치(deg), 1 = 속도(deg/s), 2 = 정지
+	u16  mask        bit i = 조인트 i 포함
+	u32  seq         클라이언트 시퀀스 번호
+	f64  client_ts   클라이언트 시각 (초, 응답에 그대로 돌려줌)
+	f32  values[...] 포함된 조인트 값 (mask 비트 순서)
+
+응답 ack (서버 → 클라이언트):
+	u8   version
+	u8   kind        명령의 kind
+	u16  status      STATUS_*
+	u32  seq         명령의 seq
+	f64  client_ts   명령의 client_ts
+	f64  server_recv 서버 수신 시각 (unix)
+	f64  bus_write   버스 쓰기 완료 시각 (unix, 쓰지 않았으면 0 - 속도 명령은 조그 루프가 기록)
+
+표준 라이브러리만 사용하므로 스크립트에서 그대로 import해 쓸 수 있습니다.
+"""
+import struct
+from typing import Dict, NamedTuple
+
+CONTROL_FORMAT_VERSION = 1
+
+COMMAND_HEADER = struct.Struct("<BBHId")
+ACK = struct.Struct("<BBHIddd")
+
+KIND_POSITION = 0
+KIND_VELOCITY = 1
+KIND_STOP = 2
+
+STATUS_OK = 0
+STATUS_SUPERSEDED = 1  # 더 새로운 명령이 와서 적용되지 않음 (latest-wins)
+STATUS_REJECTED = 2  # 제한 초과/E-Stop 등으로 거부
+STATUS_NOT_CONNECTED = 3
+STATUS_MALFORMED = 4
+
+MAX_JOINTS = 16
+
+
+class ControlCommand(NamedTuple):
+	kind: int
+	seq: int
+	client_ts: float
+	values: Dict[int, float]  # {조인트 인덱스: 값}
+
+
+class ControlAck(NamedTuple):
+	kind: int
+	status: int
+	seq: int
+	client_ts: float
+	server_recv: float
+	bus_write: float
+
+
+def encode_command(kind: int, values: Dict[int, float], seq: int, client_ts: float) -> bytes:
+	mask = 0
+	for index in values:
+		if not 0 <= index < MAX_JOINTS:
+			raise ValueError(f"Joint index out of range: {index}")
+		mask |= 1 << index
+	ordered = [float(values[i]) for i in range(MAX_JOINTS) if mask & (1 << i)]
+	header = COMMAND_HEADER.pack(CONTROL_FORMAT_VERSION, kind, mask, seq & 0xFFFFFFFF, client_ts)
+	return header + struct.pack(f"<{len(ordered)}f", *ordered)
+
+
+def decode_command(data: bytes) -> ControlCommand:
+	if len(data) < COMMAND_HEADER.size:
+		raise ValueError("Command frame too short")
+	version, kind, mask, seq, client_ts = COMMAND_HEADER.unpack_from(data, 0)
+	if version != CONTROL_FORMAT_VERSION:
+		raise ValueError(f"Unsupported control format version: {version}")
+	if kind not in (KIND_POSITION, KIND_VELOCITY, KIND_STOP):
+		raise ValueError(f"Unknown command kind: {kind}")
+	indices = [i for i in range(MAX_JOINTS) if mask & (1 << i)]
+	expected = COMMAND_HEADER.size + 4 * len(indices)
+	if len(data) != expected:
+		raise ValueError(f"Command frame size {len(data)} != {expected}")
+	values = struct.unpack_from(f"<{len(indices)}f", data, COMMAND_HEADER.size)
+	return ControlCommand(kind, seq, client_ts, dict(zip(indices, values)))
+
+
+def encode_ack(kind: int, status: int, seq: int, client_ts: float, server_recv: float, bus_write: float = 0.0) -> bytes:
+	return ACK.pack(CONTROL_FORMAT_VERSION, kind, status, seq & 0xFFFFFFFF, client_ts, server_recv, bus_write)
+
+
+def decode_ack(data: bytes) -> ControlAck:
+	version, kind, status, seq, client_ts, server_recv, bus_write = ACK.unpack(data)
+	if version != CONTROL_FORMAT_VERSION:
+		raise ValueError(f"Unsupported control format version: {version}")
+	return ControlAck(kind, status, seq, client_ts, server_recv, bus_write)
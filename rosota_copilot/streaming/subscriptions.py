@@ -0,0 +1,227 @@
+"""
+클라이언트별 상태 구독 관리 및 브로드캐스트
+
+각 Socket.IO 클라이언트는 state:subscribe로 형식(json/binary), 주기(Hz), 필드를 선택합니다.
+브로드캐스터는 StatePublisher가 새 스냅샷을 낼 때마다 전송 시점이 된 클라이언트에게만 보내고,
+송신 버퍼가 밀린 클라이언트는 그 틱을 건너뜁니다 (latest-wins: 다음 전송 때 최신 스냅샷을 받음).
+구독자가 하나도 없으면 StatePublisher 수요를 해제해 버스 폴링이 멈춥니다.
+"""
+import asyncio
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from ..observability.metrics import REGISTRY
+from .codec import STATE_FORMAT_VERSION, StateFrameEncoder, split_state
+
+STATE_UPDATE_EVENT = "state:update"
+STATE_META_EVENT = "state:meta"
+STATE_FRAME_EVENT = "state:frame"
+
+# JSON 페이로드에 항상 포함되는 필드
+_ALWAYS_FIELDS = ("seq", "timestamp")
+
+SOCKETIO_EMITS = REGISTRY.counter("rosota_socketio_emits_total", "State events sent to Socket.IO clients", ("event",))
+SOCKETIO_BYTES = REGISTRY.counter(
+	"rosota_socketio_bytes_sent_total", "Payload bytes of binary state frames (JSON events are not sized)", ("event",)
+)
+STATE_FRAMES_DROPPED = REGISTRY.counter(
+	"rosota_state_frames_dropped_total", "State frames skipped because a client's send queue was backed up"
+)
+
+
+class StateSubscription:
+	"""한 클라이언트의 상태 구독 설정 및 전송 상태"""
+
+	def __init__(self, sid: str, fmt: str, rate_hz: float, fields: Optional[FrozenSet[str]]):
+		self.sid = sid
+		self.format = fmt
+		self.rate_hz = rate_hz
+		self.interval = 1.0 / rate_hz
+		self.fields = fields
+		self.encoder = StateFrameEncoder() if fmt == "binary" else None
+		self.next_due = 0.0
+		self.last_seq = 0
+		self.sent = 0
+		self.dropped = 0
+
+	def filter(self, data: Dict[str, Any]) -> Dict[str, Any]:
+		if self.fields is None:
+			return data
+		return {k: v for k, v in data.items() if k in self.fields or k in _ALWAYS_FIELDS}
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			"sid": self.sid,
+			"format": self.format,
+			"rate_hz": self.rate_hz,
+			"fields": sorted(self.fields) if self.fields is not None else None,
+			"sent": self.sent,
+			"dropped": self.dropped,
+		}
+
+
+class StateBroadcaster:
+	"""
+	StatePublisher 스냅샷을 구독 클라이언트별 주기/형식으로 전송
+
+	Args:
+		sio: python-socketio AsyncServer
+		publisher: StatePublisher
+		default_rate_hz: state:subscribe에서 rate를 생략했을 때의 주기
+		max_queued_packets: 이보다 많은 패킷이 송신 대기 중이면 해당 클라이언트는 이번 틱 생략
+	"""
+
+	DEMAND_NAME = "clients"
+
+	def __init__(self, sio, publisher, default_rate_hz: float = 20.0, max_queued_packets: int = 2):
+		self.sio = sio
+		self.publisher = publisher
+		self.default_rate_hz = default_rate_hz
+		self.max_queued_packets = max_queued_packets
+		self.subscriptions: Dict[str, StateSubscription] = {}
+
+	# ---- 구독 관리 ----
+
+	def subscribe(self, sid: str, options: Optional[Dict[str, Any]] = None) -> StateSubscription:
+		"""
+		구독 등록/변경
+		options: {"format": "json"|"binary", "version": 1, "rate": Hz, "fields": [...]}
+		"""
+		options = options or {}
+		fmt = options.get("format", "json")
+		if fmt not in ("json", "binary"):
+			raise ValueError(f"Unsupported state format: {fmt}")
+		version = options.get("version", STATE_FORMAT_VERSION)
+		if fmt == "binary" and version != STATE_FORMAT_VERSION:
+			raise ValueError(f"Unsupported state format version {version} (server: {STATE_FORMAT_VERSION})")
+
+		rate = float(options.get("rate") or self.default_rate_hz)
+		rate = max(0.5, min(self.publisher.max_rate_hz, rate))
+
+		fields = options.get("fields")
+		fields = frozenset(fields) if fields else None
+
+		subscription = StateSubscription(sid, fmt, rate, fields)
+		self.subscriptions[sid] = subscription
+		self._update_demand()
+		return subscription
+
+	def unsubscribe(self, sid: str) -> None:
+		if self.subscriptions.pop(sid, None) is not None:
+			self._update_demand()
+
+	def _update_demand(self) -> None:
+		if self.subscriptions:
+			self.publisher.acquire(self.DEMAND_NAME, max(s.rate_hz for s in self.subscriptions.values()))
+		else:
+			# 구독자가 없으면 (다른 수요가 없을 때) 버스 폴링 중지
+			self.publisher.release(self.DEMAND_NAME)
+
+	def stats(self) -> Iterable[Dict[str, Any]]:
+		return [s.to_dict() for s in self.subscriptions.values()]
+
+	# ---- 전송 ----
+
+	async def _emit(self, event: str, data: Any, to: str) -> None:
+		await self.sio.emit(event, data, to=to)
+		SOCKETIO_EMITS.labels(event).inc()
+		# 바이너리 프레임만 크기를 셈 - JSON은 Socket.IO가 직렬화하므로 크기를 알려면 한 번 더 인코딩해야 함
+		if isinstance(data, (bytes, bytearray)):
+			SOCKETIO_BYTES.labels(event).inc(len(data))
+
+	async def send_initial(self, subscription: StateSubscription) -> None:
+		"""바이너리 구독 직후 정적 메타데이터와 전체 프레임을 한 번 전송"""
+		snapshot = self.publisher.latest
+		if snapshot is None or subscription.encoder is None:
+			return
+		positions, meta = self._split(snapshot, snapshot.to_payload())
+		subscription.encoder.update_meta(subscription.filter(meta))
+		await self._emit(STATE_META_EVENT, subscription.encoder.meta_message(), to=subscription.sid)
+		frame = subscription.encoder.encode(positions, snapshot.seq, snapshot.timestamp, snapshot.connected)
+		if frame is not None:
+			await self._emit(STATE_FRAME_EVENT, frame, to=subscription.sid)
+		subscription.last_seq = snapshot.seq
+		subscription.next_due = time.monotonic() + subscription.interval
+
+	async def run(self) -> None:
+		"""새 스냅샷마다 전송 시점이 된 구독자에게 전송 (이벤트 루프에서 실행)"""
+		loop = asyncio.get_running_loop()
+		snapshot_ready = asyncio.Event()
+
+		def on_snapshot(_snapshot):
+			# 생산자 스레드에서 호출됨 - 이벤트 루프를 깨우기만 함
+			loop.call_soon_threadsafe(snapshot_ready.set)
+
+		self.publisher.add_listener(on_snapshot)
+		last_seq = 0
+		try:
+			while True:
+				await snapshot_ready.wait()
+				snapshot_ready.clear()
+				snapshot = self.publisher.latest
+				if snapshot is None or snapshot.seq == last_seq:
+					continue
+				last_seq = snapshot.seq
+				try:
+					await self.deliver(snapshot)
+				except Exception as e:
+					print(f"State update error: {e}")
+		finally:
+			self.publisher.remove_listener(on_snapshot)
+
+	async def deliver(self, snapshot) -> None:
+		now = time.monotonic()
+		# 폴링 주기의 절반까지는 일찍 보내도 됨 (틱 지터 흡수)
+		tolerance = self.publisher.interval / 2
+		payload = None
+		split = None
+		json_cache: Dict[Optional[FrozenSet[str]], Dict[str, Any]] = {}  # 필드 집합 -> 필터링된 페이로드
+
+		for subscription in list(self.subscriptions.values()):
+			if now < subscription.next_due - tolerance or snapshot.seq == subscription.last_seq:
+				continue
+			if self._queued_packets(subscription.sid) > self.max_queued_packets:
+				# 송신 버퍼가 밀림 - 이번 프레임은 버리고 다음 틱에 최신 스냅샷 전송
+				subscription.dropped += 1
+				STATE_FRAMES_DROPPED.inc()
+				continue
+
+			if payload is None:
+				payload = snapshot.to_payload()
+
+			if subscription.format == "binary":
+				if split is None:
+					split = self._split(snapshot, payload)
+				positions, meta = split
+				encoder = subscription.encoder
+				if encoder.update_meta(subscription.filter(meta)):
+					await self._emit(STATE_META_EVENT, encoder.meta_message(), to=subscription.sid)
+				frame = encoder.encode(positions, snapshot.seq, snapshot.timestamp, snapshot.connected)
+				if frame is not None:
+					await self._emit(STATE_FRAME_EVENT, frame, to=subscription.sid)
+			else:
+				data = json_cache.get(subscription.fields)
+				if data is None:
+					data = json_cache[subscription.fields] = subscription.filter(payload)
+				await self._emit(STATE_UPDATE_EVENT, data, to=subscription.sid)
+
+			subscription.sent += 1
+			subscription.last_seq = snapshot.seq
+			# 격자 유지 (조금 일찍 보낸 경우), 늦었거나 첫 전송이면 지금부터 한 주기 뒤
+			subscription.next_due = max(subscription.next_due, now) + subscription.interval
+
+	@staticmethod
+	def _split(snapshot, payload):
+		"""바이너리 구독자용 (조인트 위치, 메타데이터) 분리"""
+		positions, meta = split_state(payload)
+		meta["status"] = meta.get("status") or ("Connected" if snapshot.connected else "Disconnected")
+		return positions, meta
+
+	def _queued_packets(self, sid: str) -> int:
+		"""Engine.IO 소켓 송신 큐 길이 (알 수 없으면 0)"""
+		try:
+			eio_sid = self.sio.manager.eio_sid_from_sid(sid, "/")
+			socket = self.sio.eio.sockets.get(eio_sid)
+			return socket.queue.qsize() if socket is not None else 0
+		except Exception:
+			return 0